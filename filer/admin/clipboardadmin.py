@@ -1,16 +1,26 @@
+import mimetypes
+import os
+
 from django.contrib import admin, messages
 from django.core.exceptions import ValidationError
 from django.forms.models import modelform_factory
-from django.http import JsonResponse
+from django.http import Http404, HttpResponse, HttpResponseBadRequest, JsonResponse
+from django.shortcuts import get_object_or_404
 from django.urls import path, reverse
+from django.utils.cache import add_never_cache_headers
 from django.utils.translation import gettext_lazy as _
 from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_http_methods, require_POST
 
 from .. import settings as filer_settings
-from ..models import Clipboard, ClipboardItem, Folder
+from ..metadata import get_metadata, read_metadata, record_upload
+from ..models import Clipboard, ClipboardItem, Folder, UploadSession
+from ..models.uploadmodels import UploadConflict
 from ..settings import FILER_THUMBNAIL_ICON_SIZE
-from ..utils.files import handle_request_files_upload, handle_upload
+from ..uploadhandler import Sha1UploadHandler
+from ..utils.files import UploadException, handle_request_files_upload, handle_upload
 from ..utils.loader import load_model
+from ..utils.zip import is_zip, iter_zip
 from ..validation import validate_upload
 from . import views
 
@@ -20,6 +30,9 @@ NO_FOLDER_ERROR = _("Can't find folder to upload. Please refresh and try again")
 NO_PERMISSIONS_FOR_FOLDER = _(
     "Can't use this folder, Permission Denied. Please select another folder."
 )
+INVALID_UPLOAD = _("The file name or size of the upload is missing or invalid.")
+UPLOAD_TOO_LARGE = _("The file exceeds the maximal file size of %(size)s MB.")
+INCOMPLETE_UPLOAD = _("The upload is incomplete. Please resume it.")
 
 
 Image = load_model(filer_settings.FILER_IMAGE_MODEL)
@@ -54,6 +67,15 @@ class ClipboardAdmin(admin.ModelAdmin):
             path('operations/upload/no_folder/',
                  ajax_upload,
                  name='filer-ajax_upload'),
+            path('operations/upload/<int:folder_id>/sessions/',
+                 create_upload_session,
+                 name='filer-create_upload_session'),
+            path('operations/upload/no_folder/sessions/',
+                 create_upload_session,
+                 name='filer-create_upload_session'),
+            path('operations/upload/sessions/<uuid:session_id>/',
+                 upload_session_view,
+                 name='filer-upload_session'),
         ] + super().get_urls()
 
     def get_model_perms(self, *args, **kwargs):
@@ -67,41 +89,170 @@ class ClipboardAdmin(admin.ModelAdmin):
         }
 
 
-@csrf_exempt
-def ajax_upload(request, folder_id=None):
+def _get_upload_folder(request, folder_id):
     """
-    Receives an upload from the uploader. Receives only one file at a time.
+    Returns the folder to upload to and an error message if the user may not
+    upload there.
     """
-
     if not request.user.has_perm("filer.add_file"):
-        messages.error(request, NO_PERMISSIONS)
-        return JsonResponse({'error': NO_PERMISSIONS})
+        return None, NO_PERMISSIONS
 
     if folder_id:
         try:
             # Get folder
             folder = Folder.objects.get(pk=folder_id)
         except Folder.DoesNotExist:
-            messages.error(request, NO_FOLDER_ERROR)
-            return JsonResponse({'error': NO_FOLDER_ERROR})
+            return None, NO_FOLDER_ERROR
     else:
         folder = Folder.objects.filter(pk=request.session.get('filer_last_folder_id', 0)).first()
 
     # check permissions
     if folder and not folder.has_add_children_permission(request):
-        messages.error(request, NO_PERMISSIONS_FOR_FOLDER)
-        return JsonResponse({'error': NO_PERMISSIONS_FOR_FOLDER})
+        return None, NO_PERMISSIONS_FOR_FOLDER
+    return folder, None
+
+
+@csrf_exempt
+def ajax_upload(request, folder_id=None):
+    """
+    Receives an upload from the uploader. Receives only one file at a time.
+    """
+    folder, error = _get_upload_folder(request, folder_id)
+    if error:
+        messages.error(request, error)
+        return JsonResponse({'error': error})
 
+    # Hash the file while it is received instead of reading it again afterwards
+    sha1_handler = Sha1UploadHandler.install(request)
     if len(request.FILES) == 1:
         # don't check if request is ajax or not, just grab the file
         upload, filename, is_raw, mime_type = handle_request_files_upload(request)
     else:
         # else process the request as usual
         upload, filename, is_raw, mime_type = handle_upload(request)
-    # TODO: Deprecated/refactor
-    # Get clipboad
-    # clipboard = Clipboard.objects.get_or_create(user=request.user)[0]
+    if sha1_handler:
+        sha1_handler.annotate(upload)
+    return _save_upload(request, folder, upload, filename, mime_type)
+
 
+@csrf_exempt
+@require_POST
+def create_upload_session(request, folder_id=None):
+    """
+    Starts a resumable upload of the file ``filename`` of ``size`` bytes (see
+    ``FILER_UPLOADER_CHUNK_SIZE``). The data is then sent to the returned URL:
+
+    * ``PATCH`` appends the request body at the ``Upload-Offset`` header,
+    * ``HEAD`` returns the offset to resume an interrupted upload at,
+    * ``POST`` creates the file once all data has been received,
+    * ``DELETE`` cancels the upload.
+    """
+    if not filer_settings.FILER_UPLOADER_CHUNK_SIZE:
+        raise Http404
+
+    folder, error = _get_upload_folder(request, folder_id)
+    if error:
+        messages.error(request, error)
+        return JsonResponse({'error': error})
+
+    filename = os.path.basename(request.POST.get('filename', ''))
+    try:
+        size = int(request.POST['size'])
+    except (KeyError, ValueError):
+        size = -1
+    if not filename or len(filename) > UploadSession._meta.get_field('filename').max_length or size < 0:
+        return JsonResponse({'error': str(INVALID_UPLOAD)}, status=400)
+    max_size = filer_settings.FILER_UPLOADER_MAX_FILE_SIZE
+    if max_size and size > max_size * 1024 * 1024:
+        return JsonResponse({'error': str(UPLOAD_TOO_LARGE % {'size': max_size})}, status=413)
+
+    UploadSession.objects.delete_expired()
+    upload_session = UploadSession.objects.create(
+        owner=request.user,
+        folder=folder,
+        filename=filename,
+        size=size,
+    )
+    url = reverse('admin:filer-upload_session', args=(upload_session.pk,))
+    response = JsonResponse({'url': url, 'offset': upload_session.offset}, status=201)
+    response['Location'] = url
+    return response
+
+
+@csrf_exempt
+@require_http_methods(['HEAD', 'PATCH', 'POST', 'DELETE'])
+def upload_session_view(request, session_id):
+    """
+    Receives the data of a resumable upload, see ``create_upload_session``.
+    """
+    if not filer_settings.FILER_UPLOADER_CHUNK_SIZE:
+        raise Http404
+    upload_session = get_object_or_404(UploadSession, pk=session_id, owner_id=request.user.pk)
+    if upload_session.is_expired():
+        upload_session.discard()
+        raise Http404
+
+    if request.method == 'POST':
+        return _finish_upload_session(request, upload_session)
+    if request.method == 'DELETE':
+        upload_session.discard()
+        return HttpResponse(status=204)
+
+    response = HttpResponse(status=204)
+    if request.method == 'PATCH':
+        # Permissions may have been revoked since the upload started
+        error = _check_upload_session_permissions(request, upload_session)
+        if error:
+            upload_session.discard()
+            return JsonResponse({'error': error}, status=403)
+        try:
+            offset = int(request.headers['Upload-Offset'])
+        except (KeyError, ValueError):
+            return HttpResponseBadRequest("Upload-Offset header missing or invalid.")
+        try:
+            upload_session.append(request, offset)
+        except UploadConflict as error:
+            response = HttpResponse(str(error), status=409, content_type='text/plain')
+    response['Upload-Offset'] = upload_session.offset
+    response['Upload-Length'] = upload_session.size
+    add_never_cache_headers(response)
+    return response
+
+
+def _check_upload_session_permissions(request, upload_session):
+    """
+    Returns an error message if the user may no longer upload to the folder
+    of ``upload_session``.
+    """
+    if not request.user.has_perm("filer.add_file"):
+        return NO_PERMISSIONS
+    folder = upload_session.folder
+    if folder and not folder.has_add_children_permission(request):
+        return NO_PERMISSIONS_FOR_FOLDER
+    return None
+
+
+def _finish_upload_session(request, upload_session):
+    if not upload_session.is_complete:
+        return JsonResponse({'error': str(INCOMPLETE_UPLOAD)}, status=409)
+
+    folder = upload_session.folder
+    error = _check_upload_session_permissions(request, upload_session)
+    if error:
+        messages.error(request, error)
+        return JsonResponse({'error': error})
+
+    mime_type = mimetypes.guess_type(upload_session.filename)[0] or 'application/octet-stream'
+    # Moved into the storage if possible, without reading it again
+    upload = upload_session.get_upload(mime_type)
+    try:
+        return _save_upload(request, folder, upload, upload_session.filename, mime_type)
+    finally:
+        upload.close()
+        upload_session.discard()
+
+
+def _get_upload_form(request, upload, filename, mime_type):
     # find the file type
     for filer_class in filer_settings.FILER_FILE_MODELS:
         FileSubClass = load_model(filer_class)
@@ -116,10 +267,36 @@ def ajax_upload(request, folder_id=None):
                           {'file': upload})
     uploadform.request = request
     uploadform.instance.mime_type = mime_type
+    return uploadform
+
+
+def _refresh_metadata(file_obj, upload):
+    if get_metadata(upload) is None:
+        # A validator rewrote the upload, e.g. to strip its EXIF data
+        read_metadata(upload)
+        file_obj.file_data_changed()
+
+
+def _save_upload(request, folder, upload, filename, mime_type):
+    """
+    Creates a file of the matching file model in ``folder`` from ``upload``,
+    returns the response to the uploader.
+    """
+    if filer_settings.FILER_UPLOADER_EXTRACT_ZIP and is_zip(filename, mime_type):
+        return _save_zip_upload(request, folder, upload, filename)
+
+    # TODO: Deprecated/refactor
+    # Get clipboad
+    # clipboard = Clipboard.objects.get_or_create(user=request.user)[0]
+
+    # Read once for all consumers, see filer.metadata
+    read_metadata(upload)
+    uploadform = _get_upload_form(request, upload, filename, mime_type)
     if uploadform.is_valid():
         try:
             validate_upload(filename, upload, request.user, mime_type)
             file_obj = uploadform.save(commit=False)
+            _refresh_metadata(file_obj, upload)
             # Enforce the FILER_IS_PUBLIC_DEFAULT
             file_obj.is_public = filer_settings.FILER_IS_PUBLIC_DEFAULT
         except ValidationError as error:
@@ -127,6 +304,7 @@ def ajax_upload(request, folder_id=None):
             return JsonResponse({'error': str(error)})
         file_obj.folder = folder
         file_obj.save()
+        record_upload(upload)
         # TODO: Deprecated/refactor
         # clipboard_item = ClipboardItem(
         #     clipboard=clipboard, file=file_obj)
@@ -160,3 +338,53 @@ def ajax_upload(request, folder_id=None):
             ', '.join(errors)) for errors in list(uploadform.errors.values())
         ])
         return JsonResponse({'error': str(form_errors)}, status=200)
+
+
+def _save_zip_upload(request, folder, upload, filename):
+    """
+    Extracts the files of the uploaded .zip archive ``upload`` one at a time
+    into ``folder``, in subfolders following the directories of the archive.
+    Files which do not validate are skipped and reported.
+    """
+    file_count = 0
+    errors = []
+    subfolders = {(): folder}
+    try:
+        for member, folder_names in iter_zip(upload):
+            # Folders are only created within the folder uploaded to
+            folder_names = tuple(folder_names) if folder else ()
+            for depth in range(1, len(folder_names) + 1):
+                if folder_names[:depth] not in subfolders:
+                    subfolders[folder_names[:depth]] = Folder.objects.get_or_create(
+                        name=folder_names[depth - 1],
+                        parent=subfolders[folder_names[:depth - 1]],
+                        trashed_at__isnull=True,
+                        defaults={'owner': request.user},
+                    )[0]
+            mime_type = member.content_type
+            read_metadata(member)
+            uploadform = _get_upload_form(request, member, member.name, mime_type)
+            try:
+                if not uploadform.is_valid():
+                    raise ValidationError([error for error_list in uploadform.errors.values() for error in error_list])
+                validate_upload(member.name, member, request.user, mime_type)
+            except ValidationError as error:
+                errors.extend(error.messages)
+                continue
+            file_obj = uploadform.save(commit=False)
+            _refresh_metadata(file_obj, member)
+            # Enforce the FILER_IS_PUBLIC_DEFAULT
+            file_obj.is_public = filer_settings.FILER_IS_PUBLIC_DEFAULT
+            file_obj.folder = subfolders[folder_names]
+            file_obj.save()
+            record_upload(member)
+            file_count += 1
+    except UploadException as error:
+        errors.append(str(error))
+
+    for error in errors:
+        messages.error(request, error)
+    data = {'label': filename, 'file_count': file_count}
+    if errors:
+        data['error'] = '; '.join(errors)
+    return JsonResponse(data)
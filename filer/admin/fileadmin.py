@@ -7,19 +7,22 @@ from django.contrib.staticfiles.storage import staticfiles_storage
 from django.http import Http404, HttpResponse, HttpResponseRedirect
 from django.shortcuts import get_object_or_404
 from django.urls import path, reverse
+from django.utils.cache import add_never_cache_headers
 from django.utils.safestring import mark_safe
-from django.utils.timezone import now
 from django.utils.translation import gettext as _
 
 from easy_thumbnails.engine import NoSourceGenerator
 from easy_thumbnails.exceptions import InvalidImageFormatError
 from easy_thumbnails.files import get_thumbnailer
-from easy_thumbnails.models import Thumbnail as EasyThumbnail
 from easy_thumbnails.options import ThumbnailOptions
 
 from .. import settings
 from ..models import BaseImage, File
 from ..settings import DEFERRED_THUMBNAIL_SIZES
+from ..thumbnail_locks import get_thumbnail_lock
+from ..thumbnail_queue import get_placeholder_url, get_thumbnail_queue
+from ..trash import trash
+from ..utils.filer_easy_thumbnails import ThumbnailRenderError, get_thumbnail_index_key
 from ..utils.loader import load_model
 from .permissions import PrimitivePermissionAwareModelAdmin
 from .tools import AdminContext, admin_url_params_encoded, popup_status
@@ -145,6 +148,12 @@ class FileAdmin(PrimitivePermissionAwareModelAdmin):
             request=request, context=context, add=add, change=change,
             form_url=form_url, obj=obj)
 
+    def delete_model(self, request, obj):
+        if settings.FILER_ENABLE_TRASH and obj.trashed_at is None:
+            trash(files=[obj])
+        else:
+            super().delete_model(request, obj)
+
     def delete_view(self, request, object_id, extra_context=None):
         """
         Overrides the default to enable redirecting to the directory view after
@@ -216,13 +225,46 @@ class FileAdmin(PrimitivePermissionAwareModelAdmin):
 
         try:
             thumbnailer = get_thumbnailer(file)
-            thumbnail_options = ThumbnailOptions({'size': (size, size), "crop": True})
-            thumbnail = thumbnailer.get_thumbnail(thumbnail_options, generate=True)
-            # Touch thumbnail to allow it to be prefetched for directory listing
-            EasyThumbnail.objects.filter(name=thumbnail.name).update(modified=now())
-            return HttpResponseRedirect(thumbnail.url)
+            # The listing asks for the 1x and 2x variants of an icon separately: render both at once
+            sizes = [size] + [other for other in (2 * size, size // 2) if other in DEFERRED_THUMBNAIL_SIZES]
+            options_list = [ThumbnailOptions({'size': (s, s), "crop": True}) for s in sizes]
+            lock = None
+            if thumbnailer.get_thumbnail(options_list[0], generate=False) is None:
+                queue = get_thumbnail_queue()
+                if queue is not None:
+                    # Serve a placeholder until a worker has generated the thumbnail
+                    queue.enqueue(file, options_list)
+                    return self.placeholder_response()
+                lock = get_thumbnail_lock(thumbnailer.thumbnail_storage)
+            try:
+                if lock is None:
+                    thumbnails = thumbnailer.render_thumbnails(options_list, generate=True)
+                else:
+                    # Render the thumbnail once, even if several requests ask for it at the same time
+                    with lock.hold(thumbnailer.get_thumbnail_name(options_list[0])) as acquired:
+                        if not acquired:
+                            # Another worker is still rendering it
+                            return self.placeholder_response()
+                        # Renders nothing if the thumbnails were rendered while waiting for the lock
+                        thumbnails = thumbnailer.render_thumbnails(options_list, generate=True)
+            except ThumbnailRenderError as error:
+                # The other resolutions are served all the same
+                thumbnails = error.thumbnails
+            # Index the thumbnails (even if they already existed) for the directory listing
+            file.index_thumbnails({
+                get_thumbnail_index_key(options): thumbnail.name
+                for options, thumbnail in zip(options_list, thumbnails) if thumbnail
+            })
+            if thumbnails[0] is None:
+                return HttpResponseRedirect(staticfiles_storage.url('filer/icons/file-missing.svg'))
+            return HttpResponseRedirect(thumbnails[0].url)
         except (InvalidImageFormatError, NoSourceGenerator, OSError):
             return HttpResponseRedirect(staticfiles_storage.url('filer/icons/file-missing.svg'))
 
+    def placeholder_response(self):
+        response = HttpResponseRedirect(get_placeholder_url())
+        add_never_cache_headers(response)
+        return response
+
 
 FileAdmin.fieldsets = FileAdmin.build_fieldsets()
@@ -1,7 +1,8 @@
+import functools
 import itertools
 import os
 import re
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
 from urllib.parse import quote as urlquote
 from urllib.parse import unquote as urlunquote
 
@@ -10,11 +11,13 @@ from django import forms
 from django.conf import settings as django_settings
 from django.contrib import messages
 from django.contrib.admin import helpers
+from django.contrib.admin.models import DELETION, LogEntry
+from django.contrib.admin.options import get_content_type_for_model
 from django.contrib.admin.utils import capfirst, quote, unquote
 from django.core.exceptions import PermissionDenied, ValidationError
 from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
 from django.db import models, router
-from django.db.models import Case, F, OuterRef, Subquery, When
+from django.db.models import Case, F, FilteredRelation, Q, When
 from django.db.models.functions import Coalesce, Lower
 from django.http import HttpResponse, HttpResponseRedirect
 from django.shortcuts import get_object_or_404
@@ -26,26 +29,28 @@ from django.utils.safestring import mark_safe
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import ngettext_lazy
 
-from easy_thumbnails.models import Thumbnail
-
 from .. import settings
 from ..cache import clear_folder_permission_cache
-from ..models import File, Folder, FolderPermission, FolderRoot, ImagesWithMissingData, UnsortedImages, tools
+from ..deletion import delete_files_and_folders
+from ..models import (
+    File, Folder, FolderPermission, FolderRoot, ImagesWithMissingData, SearchIndex, Trash, UnsortedImages, tools,
+)
+from ..search import get_owner_search_fields, get_search_backend
 from ..settings import (
     FILER_IMAGE_MODEL, FILER_PAGINATE_BY, FILER_TABLE_ICON_SIZE, FILER_THUMBNAIL_ICON_SIZE, TABLE_LIST_TYPE,
 )
 from ..thumbnail_processors import normalize_subject_location
+from ..trash import restore, trash
 from ..utils.compatibility import get_delete_permission
-from ..utils.filer_easy_thumbnails import FilerActionThumbnailer
+from ..utils.filer_easy_thumbnails import FilerActionThumbnailer, get_thumbnail_index_key
 from ..utils.loader import load_model
 from . import views
 from .forms import CopyFilesAndFoldersForm, RenameFilesForm, ResizeImagesForm
 from .patched.admin_utils import get_deleted_objects
 from .permissions import PrimitivePermissionAwareModelAdmin
 from .tools import (
-    AdminContext, admin_url_params_encoded, check_files_edit_permissions, check_files_read_permissions,
-    check_folder_edit_permissions, check_folder_read_permissions, get_directory_listing_type, popup_status,
-    userperms_for_request,
+    AdminContext, DirectoryListingItems, admin_url_params_encoded, check_items_permission, get_directory_listing_type,
+    has_items_permission, popup_status, userperms_for_request,
 )
 
 
@@ -68,7 +73,7 @@ class FolderAdmin(PrimitivePermissionAwareModelAdmin):
     search_fields = ['name']
     autocomplete_fields = ['owner']
     save_as = True  # see ImageAdmin
-    actions = ['delete_files_or_folders', 'move_files_and_folders',
+    actions = ['delete_files_or_folders', 'restore_files_and_folders', 'move_files_and_folders',
                'copy_files_and_folders', 'resize_images', 'rename_files']
 
     if DJANGO_VERSION >= (5, 2):
@@ -246,6 +251,11 @@ class FolderAdmin(PrimitivePermissionAwareModelAdmin):
                  self.admin_site.admin_view(self.directory_listing),
                  {'viewtype': 'unfiled_images'},
                  name='filer-directory_listing-unfiled_images'),
+
+            path('trash/',
+                 self.admin_site.admin_view(self.directory_listing),
+                 {'viewtype': 'trash'},
+                 name='filer-directory_listing-trash'),
         ] + super().get_urls()
 
     # custom views
@@ -259,10 +269,12 @@ class FolderAdmin(PrimitivePermissionAwareModelAdmin):
             # pass user in the class invocation, so that we can get
             # access to the current user instance in the class
             folder = UnsortedImages(user=request.user)
+        elif viewtype == 'trash':
+            folder = Trash()
         elif viewtype == 'last':
             last_folder_id = request.session.get('filer_last_folder_id')
             try:
-                self.get_queryset(request).get(id=last_folder_id)
+                self.get_queryset(request).get(id=last_folder_id, trashed_at__isnull=True)
             except self.model.DoesNotExist:
                 url = reverse('admin:filer-directory_listing-root')
                 url = f"{url}{admin_url_params_encoded(request)}"
@@ -273,18 +285,18 @@ class FolderAdmin(PrimitivePermissionAwareModelAdmin):
         elif folder_id is None:
             folder = FolderRoot()
         else:
-            folder = get_object_or_404(self.get_queryset(request), id=folder_id)
+            folder = get_object_or_404(self.get_queryset(request), id=folder_id, trashed_at__isnull=True)
         request.session['filer_last_folder_id'] = folder_id
 
         list_type = get_directory_listing_type(request) or settings.FILER_FOLDER_ADMIN_DEFAULT_LIST_TYPE
         if list_type == TABLE_LIST_TYPE:
             # Prefetch thumbnails for table view
-            size = f"{FILER_TABLE_ICON_SIZE}x{FILER_TABLE_ICON_SIZE}"
-            size_x2 = f"{2 * FILER_TABLE_ICON_SIZE}x{2 * FILER_TABLE_ICON_SIZE}"
+            size = (FILER_TABLE_ICON_SIZE, FILER_TABLE_ICON_SIZE)
+            size_x2 = (2 * FILER_TABLE_ICON_SIZE, 2 * FILER_TABLE_ICON_SIZE)
         else:
             # Prefetch thumbnails for thumbnail view
-            size = f"{FILER_THUMBNAIL_ICON_SIZE}x{FILER_THUMBNAIL_ICON_SIZE}"
-            size_x2 = f"{2 * FILER_THUMBNAIL_ICON_SIZE}x{2 * FILER_THUMBNAIL_ICON_SIZE}"
+            size = (FILER_THUMBNAIL_ICON_SIZE, FILER_THUMBNAIL_ICON_SIZE)
+            size_x2 = (2 * FILER_THUMBNAIL_ICON_SIZE, 2 * FILER_THUMBNAIL_ICON_SIZE)
 
         # Check actions to see if any are available on this changelist
         actions = self.get_actions(request)
@@ -312,16 +324,17 @@ class FolderAdmin(PrimitivePermissionAwareModelAdmin):
 
         if len(search_terms) > 0:
             if folder and limit_search_to_folder and not folder.is_root:
-                desc_folder_ids = folder.get_descendants_ids()
                 # Do not include current folder itself in search results.
-                folder_qs = Folder.objects.filter(pk__in=desc_folder_ids)
+                folder_qs = Folder.objects.descendants_of(folder)
                 # Limit search results to files in the current folder or any
                 # nested folder.
-                file_qs = File.objects.filter(folder_id__in=desc_folder_ids + [folder.pk])
+                file_qs = File.objects.filter(
+                    folder__in=Folder.objects.descendants_of(folder, include_self=True).values('pk'),
+                )
             else:
                 folder_qs = self.get_queryset(request)
                 file_qs = File.objects.all()
-            folder_qs = self.filter_folder(folder_qs, search_terms).prefetch_related("children", "all_files")
+            folder_qs = self.filter_folder(folder_qs, search_terms)
             file_qs = self.filter_file(file_qs, search_terms)
 
             show_result_count = True
@@ -329,8 +342,12 @@ class FolderAdmin(PrimitivePermissionAwareModelAdmin):
             folder_qs = folder.children.all()
             file_qs = folder.files.all()
             show_result_count = False
+        # Items in the trash are only listed in the trash
+        in_trash = getattr(folder, 'is_trash', False)
+        folder_qs = folder_qs.filter(trashed_at__isnull=not in_trash)
+        file_qs = file_qs.filter(trashed_at__isnull=not in_trash)
 
-        folder_qs = folder_qs.order_by('name').select_related("owner")
+        folder_qs = folder_qs.order_by('name', 'pk').select_related("owner").with_paths()
         order_by = request.GET.get('order_by', None)
         order_by_annotation = None
         if order_by is None:
@@ -345,43 +362,40 @@ class FolderAdmin(PrimitivePermissionAwareModelAdmin):
         order_by = order_by.split(',') if order_by else []
         order_by = [field for field in order_by
                     if re.sub(r'^-', '', field) in self.order_by_file_fields]
+        # The primary key makes the order unique for the LIMIT/OFFSET pagination
         if len(order_by) > 0:
-            file_qs = file_qs.order_by(*order_by)
+            file_qs = file_qs.order_by(*order_by, 'pk')
         elif order_by_annotation:
-            file_qs = file_qs.order_by(order_by_annotation)
+            file_qs = file_qs.order_by(order_by_annotation, 'pk')
 
         if folder.is_root and not search_mode:
             virtual_items = folder.virtual_folders
         else:
             virtual_items = []
 
-        perms = FolderPermission.objects.get_read_id_list(request.user)
-        if perms != 'All':
+        if request.user.is_superuser or not settings.FILER_ENABLE_PERMISSIONS:
+            root_exclude_kwargs = {'parent__isnull': False}
+        else:
+            # Permissions are resolved by the database as a subquery, independent of the number of folders
+            readable_folders = Folder.objects.readable_by(request.user).values('pk')
             file_qs = file_qs.filter(
-                models.Q(folder__id__in=perms)
+                models.Q(folder__in=readable_folders)
                 | models.Q(folder_id__isnull=True)
                 | models.Q(owner=request.user)
             )
-            folder_qs = folder_qs.filter(models.Q(id__in=perms) | models.Q(owner=request.user))
-            root_exclude_kwargs = {'parent__isnull': False, 'parent__id__in': perms}
-        else:
-            root_exclude_kwargs = {'parent__isnull': False}
-        if folder.is_root:
+            folder_qs = folder_qs.filter(id__in=readable_folders)
+            root_exclude_kwargs = {'parent__isnull': False, 'parent__in': readable_folders}
+        if isinstance(folder, FolderRoot):
             folder_qs = folder_qs.exclude(**root_exclude_kwargs)
 
-        # Annotate thumbnail status
-        thumbnail_qs = (
-            Thumbnail.objects
-            .filter(
-                source__name=OuterRef("file"),
-                modified__gte=F("source__modified"),
-            )
-            .exclude(name__contains="upscale")  # TODO: Check WHY not used by directory listing
-            .order_by("-modified")
-        )
+        # Annotate the names of indexed thumbnails with one indexed join each
+        thumbnail_key = get_thumbnail_index_key({'size': size, 'crop': True})
+        thumbnailx2_key = get_thumbnail_index_key({'size': size_x2, 'crop': True})
         file_qs = file_qs.annotate(
-            thumbnail_name=Subquery(thumbnail_qs.filter(name__contains=f"__{size}_").values_list("name")[:1]),
-            thumbnailx2_name=Subquery(thumbnail_qs.filter(name__contains=f"__{size_x2}_").values_list("name")[:1])
+            thumbnail_entry=FilteredRelation('thumbnail_index', condition=Q(thumbnail_index__key=thumbnail_key)),
+            thumbnailx2_entry=FilteredRelation('thumbnail_index', condition=Q(thumbnail_index__key=thumbnailx2_key)),
+            thumbnail_name=F('thumbnail_entry__name'),
+            thumbnailx2_name=F('thumbnailx2_entry__name'),
         ).select_related("owner")
 
         try:
@@ -394,7 +408,9 @@ class FolderAdmin(PrimitivePermissionAwareModelAdmin):
         except:  # noqa
             permissions = {}
 
-        items = list(itertools.chain(folder_qs, file_qs))
+        # Counted rather than taken from the folder statistics, so that no item
+        # becomes unreachable if the statistics are off
+        items = DirectoryListingItems(folder_qs, file_qs)
         paginator = Paginator(items, FILER_PAGINATE_BY)
 
         # Are we moving to clipboard?
@@ -467,6 +483,7 @@ class FolderAdmin(PrimitivePermissionAwareModelAdmin):
             'uploader_connections': settings.FILER_UPLOADER_CONNECTIONS,
             'max_files': settings.FILER_UPLOADER_MAX_FILES,
             'max_filesize': settings.FILER_UPLOADER_MAX_FILE_SIZE,
+            'chunk_size': settings.FILER_UPLOADER_CHUNK_SIZE,
             'permissions': permissions,
             'permstest': userperms_for_request(folder, request),
             'current_url': request.path,
@@ -476,6 +493,8 @@ class FolderAdmin(PrimitivePermissionAwareModelAdmin):
             'show_result_count': show_result_count,
             'folder_children': folder_qs,
             'folder_files': file_qs,
+            'folder_children_count': items.folder_count,
+            'folder_files_count': items.file_count,
             'thumbnail_size': FILER_TABLE_ICON_SIZE if list_type == TABLE_LIST_TYPE else FILER_THUMBNAIL_ICON_SIZE,
             'limit_search_to_folder': limit_search_to_folder,
             'is_popup': popup_status(request),
@@ -508,6 +527,9 @@ class FolderAdmin(PrimitivePermissionAwareModelAdmin):
             else:
                 return "%s__icontains" % field_name
 
+        backend = self.get_search_backend()
+        if backend is not None and list(self.search_fields) == ['name']:
+            return qs.filter(pk__in=backend.search(SearchIndex.FOLDER, terms))
         for term in terms:
             filters = models.Q()
             for filter_ in self.search_fields:
@@ -518,6 +540,9 @@ class FolderAdmin(PrimitivePermissionAwareModelAdmin):
         return qs
 
     def filter_file(self, qs, terms=()):
+        backend = self.get_search_backend()
+        if backend is not None:
+            return qs.filter(pk__in=backend.search(SearchIndex.FILE, terms))
         for term in terms:
             filters = (models.Q(name__icontains=term)
                        | models.Q(description__icontains=term)
@@ -542,6 +567,17 @@ class FolderAdmin(PrimitivePermissionAwareModelAdmin):
             if isinstance(field, models.CharField) and field.name != 'password'
         ]
 
+    def get_search_backend(self):
+        """
+        Returns the backend of the search index, or ``None`` if the search has
+        to query the tables because the index is disabled or this admin
+        searches fields other than the indexed ones.
+        """
+        backend = get_search_backend()
+        if backend is not None and list(self.owner_search_fields) == get_owner_search_fields():
+            return backend
+        return None
+
     def get_owner_filter_lookups(self):
         return [
             f'owner__{field}__icontains'
@@ -638,6 +674,8 @@ class FolderAdmin(PrimitivePermissionAwareModelAdmin):
 
         if 'delete_selected' in actions:
             del actions['delete_selected']
+        if not settings.FILER_ENABLE_TRASH and 'restore_files_and_folders' in actions:
+            del actions['restore_files_and_folders']
         return actions
 
     def move_to_clipboard(self, request, files_queryset, folders_queryset):
@@ -654,8 +692,7 @@ class FolderAdmin(PrimitivePermissionAwareModelAdmin):
 
         clipboard = tools.get_user_clipboard(request.user)
 
-        check_files_edit_permissions(request, files_queryset)
-        check_folder_edit_permissions(request, folders_queryset)
+        check_items_permission(request, files_queryset, folders_queryset, 'edit')
 
         # TODO: Display a confirmation page if moving more than X files to
         # clipboard?
@@ -670,7 +707,7 @@ class FolderAdmin(PrimitivePermissionAwareModelAdmin):
         def move_folders(folders):
             for f in folders:
                 move_files(f.files)
-                move_folders(f.children.all())
+                move_folders(f.children.filter(trashed_at__isnull=True))
 
         move_files(files_queryset)
         move_folders(folders_queryset)
@@ -697,8 +734,7 @@ class FolderAdmin(PrimitivePermissionAwareModelAdmin):
         if request.method != 'POST' or not permissions_enabled:
             return None
 
-        check_files_edit_permissions(request, files_queryset)
-        check_folder_edit_permissions(request, folders_queryset)
+        check_items_permission(request, files_queryset, folders_queryset, 'edit')
 
         # We define it like that so that we can modify it inside the
         # set_files function
@@ -714,7 +750,7 @@ class FolderAdmin(PrimitivePermissionAwareModelAdmin):
         def set_folders(folders):
             for f in folders:
                 set_files(f.files)
-                set_folders(f.children.all())
+                set_folders(f.children.filter(trashed_at__isnull=True))
 
         set_files(files_queryset)
         set_folders(folders_queryset)
@@ -738,6 +774,21 @@ class FolderAdmin(PrimitivePermissionAwareModelAdmin):
 
     files_set_public.short_description = _("Disable permissions for selected files")
 
+    def _log_deletions(self, request, queryset):
+        if DJANGO_VERSION >= (5, 1):
+            self.log_deletions(request, queryset)
+        else:
+            LogEntry.objects.bulk_create([
+                LogEntry(
+                    user_id=request.user.pk,
+                    content_type_id=get_content_type_for_model(obj).pk,
+                    object_id=str(obj.pk),
+                    object_repr=force_str(obj)[:200],
+                    action_flag=DELETION,
+                )
+                for obj in queryset
+            ])
+
     def delete_files_or_folders(self, request, files_queryset, folders_queryset):
         """
         Action which deletes the selected files and/or folders.
@@ -760,12 +811,21 @@ class FolderAdmin(PrimitivePermissionAwareModelAdmin):
         # file and folder (and their descendants). Without this, a user with
         # only read access to a folder could delete its contents when the
         # optional per-folder permission system is enabled.
-        check_files_edit_permissions(request, files_queryset)
-        check_folder_edit_permissions(request, folders_queryset)
+        check_items_permission(request, files_queryset, folders_queryset, 'edit')
 
         current_folder = self._get_current_action_folder(
             request, files_queryset, folders_queryset)
 
+        if settings.FILER_ENABLE_TRASH:
+            # Items in the trash are deleted for good, the others are moved there
+            trashable_files = files_queryset.filter(trashed_at__isnull=True)
+            trashable_folders = folders_queryset.filter(trashed_at__isnull=True)
+            files_queryset = files_queryset.filter(trashed_at__isnull=False)
+            folders_queryset = folders_queryset.filter(trashed_at__isnull=False)
+        else:
+            trashable_files = files_queryset.none()
+            trashable_folders = folders_queryset.none()
+
         all_protected = []
 
         # Populate deletable_objects, a data structure of all related objects
@@ -778,8 +838,13 @@ class FolderAdmin(PrimitivePermissionAwareModelAdmin):
         all_protected.extend(protected_files)
         all_protected.extend(protected_folders)
 
-        all_deletable_objects = [deletable_files, deletable_folders]
+        all_deletable_objects = [objects for objects in (deletable_files, deletable_folders) if objects]
         all_perms_needed = perms_needed_files.union(perms_needed_folders)
+        # Trashed items keep their contents and related objects
+        all_trashable_objects = [
+            f"{capfirst(obj._meta.verbose_name)}: {obj}"
+            for obj in itertools.chain(trashable_folders, trashable_files)
+        ]
 
         # The user has already confirmed the deletion. Do the deletion and
         # return a None to display the change list view again.
@@ -788,43 +853,18 @@ class FolderAdmin(PrimitivePermissionAwareModelAdmin):
                 raise PermissionDenied
             n = files_queryset.count() + folders_queryset.count()
             if n:
-                # delete all explicitly selected files
-                if DJANGO_VERSION >= (5, 1):
-                    self.log_deletions(request, files_queryset)
-                    # Still need to delete files individually (not only the database entries)
-                    for f in files_queryset:
-                        f.delete()
-                else:
-                    for f in files_queryset:
-                        self.log_deletion(request, f, force_str(f))
-                        f.delete()
-                # delete all files in all selected folders and their children
-                # This would happen automatically by ways of the delete
-                # cascade, but then the individual .delete() methods won't be
-                # called and the files won't be deleted from the filesystem.
-                folder_ids = set()
-                for folder in folders_queryset:
-                    folder_ids.add(folder.id)
-                    folder_ids.update(folder.get_descendants_ids())
-                if DJANGO_VERSION >= (5, 1):
-                    qs = File.objects.filter(folder__in=folder_ids)
-                    self.log_deletions(request, qs)
-                    # Still need to delete files individually (not only the database entries)
-                    for f in qs:
-                        f.delete()
-                else:
-                    for f in File.objects.filter(folder__in=folder_ids):
-                        self.log_deletion(request, f, force_str(f))
-                        f.delete()
-                # delete all folders
-                if DJANGO_VERSION >= (5, 1):
-                    self.log_deletions(request, files_queryset)
-                    folders_queryset.delete()
-                else:
-                    for f in folders_queryset:
-                        self.log_deletion(request, f, force_str(f))
-                        f.delete()
+                # Deletes the files in the selected folders and their
+                # subfolders too (not only the database entries, as the
+                # delete cascade would), see filer.deletion
+                delete_files_and_folders(
+                    files=files_queryset, folders=folders_queryset,
+                    log_deletions=functools.partial(self._log_deletions, request),
+                )
                 self.message_user(request, _("Successfully deleted %(count)d files and/or folders.") % {"count": n, })
+            n = len(all_trashable_objects)
+            if n:
+                trash(files=trashable_files, folders=trashable_folders)
+                self.message_user(request, _("Moved %(count)d files and/or folders to the trash.") % {"count": n, })
             # Return None to display the change list page again.
             return None
 
@@ -839,8 +879,9 @@ class FolderAdmin(PrimitivePermissionAwareModelAdmin):
             "instance": current_folder,
             "breadcrumbs_action": _("Delete files and/or folders"),
             "deletable_objects": all_deletable_objects,
-            "files_queryset": files_queryset,
-            "folders_queryset": folders_queryset,
+            "trashable_objects": all_trashable_objects,
+            "files_queryset": list(itertools.chain(files_queryset, trashable_files)),
+            "folders_queryset": list(itertools.chain(folders_queryset, trashable_folders)),
             "perms_lacking": all_perms_needed,
             "protected": all_protected,
             "opts": opts,
@@ -860,6 +901,32 @@ class FolderAdmin(PrimitivePermissionAwareModelAdmin):
 
     delete_files_or_folders.short_description = _("Delete selected files and/or folders")
 
+    def restore_files_and_folders(self, request, files_queryset, folders_queryset):
+        """
+        Action which restores the selected files and/or folders from the trash.
+        """
+        if not self.has_delete_permission(request):
+            raise PermissionDenied
+        check_items_permission(request, files_queryset, folders_queryset, 'edit')
+        files_queryset = files_queryset.filter(trashed_at__isnull=False)
+        folders_queryset = folders_queryset.filter(trashed_at__isnull=False)
+        file_count, folder_count = restore(files=files_queryset, folders=folders_queryset)
+        if file_count or folder_count:
+            self.message_user(request, _("Successfully restored %(files)d files and %(folders)d folders.") % {
+                "files": file_count,
+                "folders": folder_count,
+            })
+        # Items in a folder which is still in the trash are not restored
+        skipped = files_queryset.count() + folders_queryset.count()
+        if skipped:
+            self.message_user(request, _(
+                "%(count)d files and/or folders were not restored because their folder is in the trash. "
+                "Restore the folder instead."
+            ) % {"count": skipped}, messages.WARNING)
+        return None
+
+    restore_files_and_folders.short_description = _("Restore selected files and/or folders from the trash")
+
     # Copied from django.contrib.admin.util
     def _format_callback(self, obj, user, admin_site, perms_needed):
         has_admin = obj.__class__ in admin_site._registry
@@ -881,22 +948,13 @@ class FolderAdmin(PrimitivePermissionAwareModelAdmin):
             return f'{capfirst(opts.verbose_name)}: {force_str(obj)}'
 
     def _check_copy_perms(self, request, files_queryset, folders_queryset):
-        try:
-            check_files_read_permissions(request, files_queryset)
-            check_folder_read_permissions(request, folders_queryset)
-        except PermissionDenied:
-            return True
-        return False
+        return not has_items_permission(request, files_queryset, folders_queryset, 'read')
 
     def _check_move_perms(self, request, files_queryset, folders_queryset):
-        try:
-            check_files_read_permissions(request, files_queryset)
-            check_folder_read_permissions(request, folders_queryset)
-            check_files_edit_permissions(request, files_queryset)
-            check_folder_edit_permissions(request, folders_queryset)
-        except PermissionDenied:
-            return True
-        return False
+        return not (
+            has_items_permission(request, files_queryset, folders_queryset, 'read')
+            and has_items_permission(request, files_queryset, folders_queryset, 'edit')
+        )
 
     def _get_current_action_folder(self, request, files_queryset,
                                    folders_queryset):
@@ -910,7 +968,7 @@ class FolderAdmin(PrimitivePermissionAwareModelAdmin):
     def _list_folders_to_copy_or_move(self, request, folders):
         for fo in folders:
             yield self._format_callback(fo, request.user, self.admin_site, set())
-            children = list(self._list_folders_to_copy_or_move(request, fo.children.all()))
+            children = list(self._list_folders_to_copy_or_move(request, fo.children.filter(trashed_at__isnull=True)))
             children.extend([self._format_callback(f, request.user, self.admin_site, set()) for f in sorted(fo.files)])
             if children:
                 yield children
@@ -920,7 +978,8 @@ class FolderAdmin(PrimitivePermissionAwareModelAdmin):
         to_copy_or_move.extend([self._format_callback(f, request.user, self.admin_site, set()) for f in sorted(files_queryset)])
         return to_copy_or_move
 
-    def _list_all_destination_folders_recursive(self, request, folders_queryset, current_folder, folders, allow_self, level):
+    def _list_all_destination_folders_recursive(self, request, folders_queryset, current_folder, folders, allow_self,
+                                                level, children=None):
         for fo in folders:
             if not allow_self and fo in folders_queryset:
                 # We do not allow moving to selected folders or their descendants
@@ -932,15 +991,26 @@ class FolderAdmin(PrimitivePermissionAwareModelAdmin):
             # We do not allow copying/moving back to the folder itself
             enabled = (allow_self or fo != current_folder) and fo.has_add_children_permission(request)
             yield (fo, (mark_safe(("&nbsp;&nbsp;" * level) + force_str(fo)), enabled))
-            yield from self._list_all_destination_folders_recursive(request, folders_queryset, current_folder, fo.children.all(), allow_self, level + 1)
+            subfolders = fo.children.filter(trashed_at__isnull=True) if children is None else children[fo.pk]
+            yield from self._list_all_destination_folders_recursive(
+                request, folders_queryset, current_folder, subfolders, allow_self, level + 1, children,
+            )
 
     def _list_all_destination_folders(self, request, folders_queryset, current_folder, allow_self):
-        root_folders = self.get_queryset(request).filter(parent__isnull=True).order_by('name')
-        return list(self._list_all_destination_folders_recursive(request, folders_queryset, current_folder, root_folders, allow_self, 0))
+        # Fetch the whole tree (including the logical paths used as labels) at once
+        children = defaultdict(list)
+        for folder in self.get_queryset(request).filter(trashed_at__isnull=True).order_by('name').with_paths():
+            children[folder.parent_id].append(folder)
+        return list(self._list_all_destination_folders_recursive(
+            request, folders_queryset, current_folder, children[None], allow_self, 0, children,
+        ))
 
     def _move_files_and_folders_impl(self, files_queryset, folders_queryset, destination):
-        files_queryset.update(folder=destination)
-        folders_queryset.update(parent=destination)
+        files_queryset.move_to(destination)
+        for folder in folders_queryset:
+            # Saving each folder keeps the materialized tree path of its subtree in sync
+            folder.parent = destination
+            folder.save()
 
     def move_files_and_folders(self, request, files_queryset, folders_queryset):
         opts = self.model._meta
@@ -1024,7 +1094,9 @@ class FolderAdmin(PrimitivePermissionAwareModelAdmin):
         return n
 
     def _rename_folder(self, folder, form_data, global_counter):
-        return self._rename_files_impl(folder.files.all(), folder.children.all(), form_data, global_counter)
+        return self._rename_files_impl(
+            folder.files.all(), folder.children.filter(trashed_at__isnull=True), form_data, global_counter,
+        )
 
     def _rename_files_impl(self, files_queryset, folders_queryset, form_data, global_counter):
         n = 0
@@ -1092,13 +1164,12 @@ class FolderAdmin(PrimitivePermissionAwareModelAdmin):
 
         filename = self._generate_new_filename(file_obj.file.name, suffix)
 
+        file_obj._file_data_changed_hint = False  # no need to update size, sha1, etc.
+        file_obj.file = file_obj._copy_file(filename)
         # Due to how inheritance works, we have to set both pk and id to None
         file_obj.pk = None
         file_obj.id = None
-        file_obj.save()
         file_obj.folder = destination
-        file_obj._file_data_changed_hint = False  # no need to update size, sha1, etc.
-        file_obj.file = file_obj._copy_file(filename)
         file_obj.original_filename = self._generate_new_filename(file_obj.original_filename, suffix)
         file_obj.save()
 
@@ -1138,7 +1209,9 @@ class FolderAdmin(PrimitivePermissionAwareModelAdmin):
             perm.folder = folder
             perm.save()
 
-        return 1 + self._copy_files_and_folders_impl(old_folder.files.all(), old_folder.children.all(), folder, suffix, overwrite)
+        return 1 + self._copy_files_and_folders_impl(
+            old_folder.files.all(), old_folder.children.filter(trashed_at__isnull=True), folder, suffix, overwrite,
+        )
 
     def _copy_files_and_folders_impl(self, files_queryset, folders_queryset, destination, suffix, overwrite):
         n = self._copy_files(files_queryset, destination, suffix, overwrite)
@@ -1212,17 +1285,14 @@ class FolderAdmin(PrimitivePermissionAwareModelAdmin):
     copy_files_and_folders.short_description = _("Copy selected files and/or folders")
 
     def _check_resize_perms(self, request, files_queryset, folders_queryset):
-        try:
-            check_files_read_permissions(request, files_queryset)
-            check_folder_read_permissions(request, folders_queryset)
-            check_files_edit_permissions(request, files_queryset)
-        except PermissionDenied:
-            return True
-        return False
+        return not (
+            has_items_permission(request, files_queryset, folders_queryset, 'read')
+            and has_items_permission(request, files_queryset, None, 'edit')
+        )
 
     def _list_folders_to_resize(self, request, folders):
         for fo in folders:
-            children = list(self._list_folders_to_resize(request, fo.children.all()))
+            children = list(self._list_folders_to_resize(request, fo.children.filter(trashed_at__isnull=True)))
             children.extend([self._format_callback(f, request.user, self.admin_site, set()) for f in sorted(fo.files) if isinstance(f, Image)])
             if children:
                 yield self._format_callback(fo, request.user, self.admin_site, set())
@@ -1249,6 +1319,8 @@ class FolderAdmin(PrimitivePermissionAwareModelAdmin):
     def _resize_image(self, image, form_data):
         original_width = float(image.width)
         original_height = float(image.height)
+        # Copies referencing the same stored file keep it
+        image._unshare_file()
         thumbnailer = FilerActionThumbnailer(file=image.file, name=image.file.name, source_storage=image.file.source_storage, thumbnail_storage=image.file.source_storage)
         # This should overwrite the original image
         new_image = thumbnailer.get_thumbnail({
@@ -1283,7 +1355,7 @@ class FolderAdmin(PrimitivePermissionAwareModelAdmin):
         return n
 
     def _resize_folder(self, folder, form_data):
-        return self._resize_images_impl(folder.files.all(), folder.children.all(), form_data)
+        return self._resize_images_impl(folder.files.all(), folder.children.filter(trashed_at__isnull=True), form_data)
 
     def _resize_images_impl(self, files_queryset, folders_queryset, form_data):
         n = self._resize_images(files_queryset, form_data)
@@ -1,10 +1,12 @@
 from django import VERSION as django_version
 from django.contrib import admin
 from django.contrib.auth import get_user_model
+from django.db.models import Prefetch
 from django.utils.translation import gettext_lazy as _
 
 from .. import settings
 from ..cache import clear_folder_permission_cache
+from ..models import Folder
 
 
 class PermissionAdmin(admin.ModelAdmin):
@@ -35,7 +37,7 @@ class PermissionAdmin(admin.ModelAdmin):
 
     def get_queryset(self, request):
         qs = super().get_queryset(request)
-        return qs.prefetch_related("group", "folder")
+        return qs.prefetch_related("group", Prefetch("folder", queryset=Folder.objects.with_paths()))
 
     def get_model_perms(self, request):
         # don't display the permissions admin if permissions are disabled.
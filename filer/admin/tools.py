@@ -1,8 +1,12 @@
+from functools import cached_property
+
 from django.contrib.admin.options import IS_POPUP_VAR
 from django.core.exceptions import PermissionDenied
+from django.db.models import Q, QuerySet
 from django.utils.http import urlencode
 
 from .. import settings
+from ..models import File, Folder
 
 
 ALLOWED_PICK_TYPES = ('folder', 'file')
@@ -36,6 +40,49 @@ def check_folder_read_permissions(request, folders):
         check_folder_read_permissions(request, f.children.all())
 
 
+def get_denied_items(request, files, folders, permission):
+    """
+    Returns the items the user of ``request`` lacks ``permission`` (``"read"``
+    or ``"edit"``) on, as a ``(files, folders)`` tuple of querysets. The
+    selected ``folders`` are checked together with all their subfolders and
+    files.
+
+    Unlike the ``check_*_permissions`` functions above, this does not walk the
+    folder tree: the affected subtree is resolved in SQL, so the number of
+    queries does not depend on the size of the selection.
+    """
+    user = request.user
+    if isinstance(files, QuerySet):
+        selected_files = files.values('pk')
+    else:
+        selected_files = [f.pk for f in files]
+    folders = Folder.objects.subtrees_of(folders if folders is not None else [])
+    files = File.objects.filter(Q(pk__in=selected_files) | Q(folder__in=folders.values('pk')))
+
+    denied_folders = folders.exclude(pk__in=Folder.objects.with_permission(user, permission).values('pk'))
+    denied_files = files.exclude(pk__in=File.objects.with_permission(user, permission).values('pk'))
+    if permission == 'edit':
+        if not user.has_perm('filer.change_folder'):
+            denied_folders = folders
+        if not user.has_perm('filer.change_file'):
+            denied_files = files
+    return denied_files, denied_folders
+
+
+def has_items_permission(request, files, folders, permission):
+    """
+    Returns ``True`` if the user of ``request`` has ``permission`` on all
+    ``files``, ``folders`` and the content of ``folders``.
+    """
+    denied_files, denied_folders = get_denied_items(request, files, folders, permission)
+    return not (denied_folders.exists() or denied_files.exists())
+
+
+def check_items_permission(request, files, folders, permission):
+    if not has_items_permission(request, files, folders, permission):
+        raise PermissionDenied
+
+
 def userperms_for_request(item, request):
     r = []
     ps = ['read', 'edit', 'add_children']
@@ -106,6 +153,66 @@ def admin_url_params_encoded(request, first_separator='?', params=None):
     return f'{first_separator}{params}'
 
 
+def order_by_with_pk(queryset):
+    """
+    Appends the primary key to the ordering of ``queryset`` so that rows with
+    equal sort keys keep their order from one LIMIT/OFFSET slice to the next.
+    """
+    ordering = list(queryset.query.order_by or queryset.model._meta.ordering)
+    if not {'pk', '-pk'}.intersection(item for item in ordering if isinstance(item, str)):
+        ordering.append('pk')
+    return queryset.order_by(*ordering)
+
+
+class DirectoryListingItems:
+    """
+    The folders followed by the files of a directory listing as a lazy
+    sequence for ``Paginator``.
+
+    Slicing only fetches the items of the requested slice, using LIMIT/OFFSET
+    on the folder and file querysets, so a page never instantiates the whole
+    folder. The counts are taken from COUNT queries unless given.
+    """
+    def __init__(self, folders, files, folder_count=None, file_count=None):
+        self.folders = order_by_with_pk(folders)
+        self.files = order_by_with_pk(files)
+        if folder_count is not None:
+            self.folder_count = folder_count
+        if file_count is not None:
+            self.file_count = file_count
+
+    @cached_property
+    def folder_count(self):
+        return self.folders.count()
+
+    @cached_property
+    def file_count(self):
+        return self.files.count()
+
+    def count(self):
+        return self.folder_count + self.file_count
+
+    __len__ = count
+
+    def __getitem__(self, key):
+        if not isinstance(key, slice):
+            if key < 0:
+                key += len(self)
+            items = self[key:key + 1]
+            if not items:
+                raise IndexError("Directory listing index out of range")
+            return items[0]
+        start, stop, step = key.indices(len(self))
+        if step != 1:
+            raise ValueError("Directory listings only support contiguous slices")
+        items = []
+        if start < self.folder_count:
+            items.extend(self.folders[start:min(stop, self.folder_count)])
+        if stop > self.folder_count:
+            items.extend(self.files[max(start - self.folder_count, 0):stop - self.folder_count])
+        return items
+
+
 class AdminContext(dict):
     def __init__(self, request):
         super().__init__()
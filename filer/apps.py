@@ -59,9 +59,62 @@ class FilerConfig(AppConfig):
                         raise ImproperlyConfigured(f"""filer: could not import validator "{item}".""")
             self.FILE_VALIDATORS[mime_type] = functions
 
+    def connect_permission_cache_signals(self):
+        """Invalidate cached folder permissions when the group membership of a user changes"""
+        from django.contrib.auth import get_user_model
+        from django.db.models.signals import m2m_changed
+
+        from .models.foldermodels import invalidate_folder_permission_cache_on_group_change
+
+        groups = getattr(get_user_model(), 'groups', None)
+        if groups is not None:  # Custom user models do not need to have groups
+            m2m_changed.connect(
+                invalidate_folder_permission_cache_on_group_change,
+                sender=groups.through,
+                dispatch_uid='filer_user_groups_changed',
+            )
+
+    def connect_search_index_signals(self):
+        """Keep the search index of files and folders up to date"""
+        from django.apps import apps
+        from django.contrib.auth import get_user_model
+        from django.db.models.signals import post_delete, post_save, pre_save
+
+        from .models import File, Folder
+        from .search import (
+            remember_owner_search_text, remove_from_search_index, update_owner_search_index, update_search_index,
+        )
+
+        for model in apps.get_models():
+            if issubclass(model, (File, Folder)):
+                post_save.connect(
+                    update_search_index,
+                    sender=model,
+                    dispatch_uid=f'filer_search_index_{model._meta.label_lower}',
+                )
+        for model in (File, Folder):
+            post_delete.connect(
+                remove_from_search_index,
+                sender=model,
+                dispatch_uid=f'filer_search_index_remove_{model._meta.label_lower}',
+            )
+        # The documents contain the text fields of the owner
+        pre_save.connect(
+            remember_owner_search_text,
+            sender=get_user_model(),
+            dispatch_uid='filer_search_index_owner_text',
+        )
+        post_save.connect(
+            update_owner_search_index,
+            sender=get_user_model(),
+            dispatch_uid='filer_search_index_owner',
+        )
+
     def ready(self):
         # Make webp MIME type known to python (needed for python < 3.11)
         mimetypes.add_type("image/webp", ".webp")
         #
         self.resolve_validators()
         self.register_optional_heif_supprt()
+        self.connect_permission_cache_signals()
+        self.connect_search_index_signals()
@@ -1,21 +1,67 @@
+import time
 import typing
 
 from django.core.cache import cache
 from django.db.models import Model
 
+from .utils.idset import IdSet
+
 
 UserModel = typing.TypeVar('UserModel', bound=Model)
 
+FOLDER_PERMISSION_VERSION_KEY = "filer:perm_version"
+FOLDER_TREE_VERSION_KEY = "filer:folder_tree_version"
+
+# Number of permission version bumps made by this process
+_folder_permission_generation = 0
+
+
+def get_folder_permission_version() -> int:
+    """
+    Returns the current version of all folder permission cache entries.
+
+    The version is part of every permission cache key. Bumping it with
+    ``bump_folder_permission_version`` invalidates the cached permissions of all
+    users at once, without having to know which keys exist.
+
+    Returns:
+    int: The current folder permission version.
+    """
+    return _get_version(FOLDER_PERMISSION_VERSION_KEY)
+
+
+def bump_folder_permission_version() -> None:
+    """
+    Invalidates the cached folder permissions of all users, e.g., after a folder
+    permission, a folder or the group membership of a user has changed.
+    """
+    global _folder_permission_generation
+    _folder_permission_generation += 1
+    _bump_version(FOLDER_PERMISSION_VERSION_KEY)
+
+
+def get_folder_permission_generation() -> int:
+    """
+    Returns the number of times this process has invalidated the cached folder
+    permissions.
+
+    Unlike ``get_folder_permission_version`` this does not hit the cache, so it
+    is cheap enough to validate permissions memoized for the current request
+    on every permission check.
+
+    Returns:
+    int: The process-local folder permission generation.
+    """
+    return _folder_permission_generation
+
 
 def get_folder_perm_cache_key(user: UserModel, permission: str) -> str:
     """
     Generates a unique cache key for a given user and permission.
 
-    The key is a string in the format "filer:perm:<permission>", i.e. it does not
-    contain the user id. This will be sufficient for most use cases.
-
-    Patch this method to include the user id in the cache key if necessary, e.g.,
-    for far more than 1,000 admin users to make the cached unit require less memory.
+    The key is a string in the format "filer:perm:<version>:<permission>:<user id>".
+    Each user has their own cache entry, so that reading or updating the
+    permissions of one user never touches the entries of other users.
 
     Parameters:
     user (UserModel): The user for whom the cache key is being generated.
@@ -26,14 +72,15 @@ def get_folder_perm_cache_key(user: UserModel, permission: str) -> str:
     Returns:
     str: The generated cache key.
     """
-    return f"filer:perm:{permission}"
+    return f"filer:perm:{get_folder_permission_version()}:{permission}:{user.pk}"
 
 
-def get_folder_permission_cache(user: UserModel, permission: str) -> typing.Optional[typing.Set[int]]:
+def get_folder_permission_cache(user: UserModel, permission: str) -> typing.Optional[IdSet]:
     """
     Retrieves the cached folder permissions for a given user and permission.
 
-    If the cache value exists, it returns the permissions for the user.
+    If the cache value exists, it returns the permissions for the user. Note that
+    an empty set is a valid cached value (the user has no permission at all).
     If the cache value does not exist, it returns None.
 
     Parameters:
@@ -43,12 +90,9 @@ def get_folder_permission_cache(user: UserModel, permission: str) -> typing.Opti
     permission (str): The permission for which the permissions are being retrieved.
 
     Returns:
-    set or None: The permissions for the user, or None if no cache value exists.
+    IdSet or None: The permissions for the user, or None if no cache value exists.
     """
-    cache_value = cache.get(get_folder_perm_cache_key(user, permission))
-    if cache_value:
-        return cache_value.get(user.pk, None)
-    return None
+    return cache.get(get_folder_perm_cache_key(user, permission))
 
 
 def clear_folder_permission_cache(user: UserModel, permission: typing.Optional[str] = None) -> None:
@@ -57,6 +101,7 @@ def clear_folder_permission_cache(user: UserModel, permission: typing.Optional[s
 
     If a specific permission is provided, it clears the cache for that permission only.
     If no specific permission is provided, it clears the cache for all permissions.
+    To clear the cached permissions of all users use ``bump_folder_permission_version``.
 
     Parameters:
     user (UserModel): The user for whom the permissions are being cleared.
@@ -65,27 +110,110 @@ def clear_folder_permission_cache(user: UserModel, permission: typing.Optional[s
     permission (str, optional): The specific permission to clear. Defaults to None.
     """
     if permission is None:
-        for perm in ['can_read', 'can_edit', 'can_add_children']:
-            cache.delete(get_folder_perm_cache_key(user, perm))
+        cache.delete_many([
+            get_folder_perm_cache_key(user, perm) for perm in ['can_read', 'can_edit', 'can_add_children']
+        ])
     else:
         cache.delete(get_folder_perm_cache_key(user, permission))
 
 
-def update_folder_permission_cache(user: UserModel, permission: str, id_list: typing.Set[int]) -> None:
+def update_folder_permission_cache(user: UserModel, permission: str,
+                                   id_list: typing.Union[IdSet, typing.Iterable[int]]) -> None:
     """
     Updates the cached folder permissions for a given user and permission.
 
-    It first retrieves the current permissions from the cache (or an empty dictionary if none exist).
-    Then it updates the permissions for the user with the provided list of IDs.
-    Finally, it sets the updated permissions back into the cache.
+    The permissions are stored in the user's own cache entry. No other user's
+    entry is read or written, so concurrent updates cannot overwrite each other.
+    Ids are stored as a compressed ``IdSet`` of id runs.
 
     Parameters:
     user (UserModel): The user for whom the permissions are being updated.
         The `user` can be an instance of the default `django.contrib.auth.models.User`
         or any custom user model specified by `AUTH_USER_MODEL` in the settings.
     permission (str): The permission to update.
-    id_list (set): The set of IDs to set as the new permissions.
+    id_list (IdSet or iterable): The IDs to set as the new permissions.
+    """
+    if not isinstance(id_list, IdSet):
+        id_list = IdSet(id_list)
+    cache.set(get_folder_perm_cache_key(user, permission), id_list)
+
+
+def _get_version(key: str) -> int:
+    version = cache.get(key)
+    if version is None:
+        # A time-based start value makes sure no key of an evicted version is reused
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key, 0)
+    return version
+
+
+def _bump_version(key: str) -> None:
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), timeout=None)
+
+
+def get_folder_tree_version() -> int:
+    """
+    Returns the current version of the folder tree.
+
+    The version is part of every cache key derived from the folder tree, e.g.,
+    the ancestors of a folder. Bumping it invalidates all those keys at once.
+
+    Returns:
+    int: The current folder tree version.
+    """
+    return _get_version(FOLDER_TREE_VERSION_KEY)
+
+
+def bump_folder_tree_version() -> None:
+    """
+    Invalidates all cached folder tree information, e.g., after a folder has been
+    created, renamed, moved or deleted.
+    """
+    _bump_version(FOLDER_TREE_VERSION_KEY)
+
+
+def get_folder_ancestors_cache_key(parent_id: int, version: int) -> str:
+    """
+    Generates the cache key for the ancestor list of all children of a folder.
+
+    Parameters:
+    parent_id (int): The id of the folder whose children share the ancestor list.
+    version (int): The folder tree version as returned by ``get_folder_tree_version``.
+
+    Returns:
+    str: The generated cache key.
+    """
+    return f"filer:ancestors:{version}:{parent_id}"
+
+
+def get_folder_ancestors_cache(parent_ids: typing.Iterable[int]) -> typing.Dict[int, list]:
+    """
+    Retrieves the cached ancestor lists for the given parent folder ids.
+
+    Parameters:
+    parent_ids (iterable): The ids of the parent folders.
+
+    Returns:
+    dict: Maps each parent id found in the cache to the list of folders from the
+        root down to and including the parent.
+    """
+    version = get_folder_tree_version()
+    keys = {get_folder_ancestors_cache_key(parent_id, version): parent_id for parent_id in parent_ids}
+    return {keys[key]: value for key, value in cache.get_many(keys).items()}
+
+
+def update_folder_ancestors_cache(ancestors: typing.Dict[int, list]) -> None:
+    """
+    Stores ancestor lists as returned by ``get_folder_ancestors_cache``.
+
+    Parameters:
+    ancestors (dict): Maps parent folder ids to the list of folders from the root
+        down to and including the parent.
     """
-    perms = cache.get(get_folder_perm_cache_key(user, permission)) or {}
-    perms[user.pk] = set(id_list)
-    cache.set(get_folder_perm_cache_key(user, permission), perms)
+    version = get_folder_tree_version()
+    cache.set_many({
+        get_folder_ancestors_cache_key(parent_id, version): value for parent_id, value in ancestors.items()
+    })
@@ -0,0 +1,176 @@
+"""
+Deletion of many files and folders at once.
+
+Deleting a file with ``File.delete()`` checks whether other files reference
+its stored file and deletes it from the storage right away, and the folder
+statistics and the search index are updated once per file.
+``delete_files_and_folders`` deletes whole folder trees instead:
+
+* the files of the folder subtrees are found with a single query and their
+  rows are deleted in batches,
+* the folder statistics and the search index are updated once at the end (see
+  ``FolderManager.deferred_statistics`` and ``filer.search.deferred_removal``),
+* whether the stored files are still referenced, e.g., by deduplicated files,
+  is checked with one query per batch,
+* the stored files and their thumbnails are deleted in the background once the
+  transaction is committed, by a pool of ``FILER_DELETE_WORKERS`` threads, so
+  that the request does not wait for the storage.
+
+The rows of the files are deleted with ``QuerySet.delete()``, which does not
+call ``delete()`` on the instances. Files of models which override
+``delete()`` are therefore deleted one by one with their ``delete()``.
+"""
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.db import models, router, transaction
+from django.db.models import Q
+
+from easy_thumbnails.models import Source, Thumbnail
+from easy_thumbnails.utils import get_storage_hash
+
+from . import settings as filer_settings
+from .models import File, Folder
+from .search import deferred_removal
+
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+# Storage deletions submitted by this process and not yet done
+_pending = set()
+
+
+def _get_pks(objects):
+    if isinstance(objects, models.QuerySet):
+        return objects.values('pk')
+    return [getattr(obj, 'pk', obj) for obj in objects]
+
+
+def _get_file_models_with_delete():
+    """
+    Returns the file models whose ``delete()`` differs from ``File.delete()``.
+    """
+    return [model for model in apps.get_models() if issubclass(model, File) and model.delete is not File.delete]
+
+
+def delete_files_and_folders(files=(), folders=(), log_deletions=None, batch_size=500):
+    """
+    Deletes ``files`` and ``folders`` with all their contents. Both may be
+    querysets or iterables of instances or ids. ``log_deletions(queryset)`` is
+    called with every batch of files and with the selected folders before they
+    are deleted. Returns the number of deleted files and folders.
+    """
+    using = router.db_for_write(File)
+    with transaction.atomic(using=using):
+        subtrees = Folder.objects.subtrees_of(folders)
+        # Only used to update the statistics of the remaining ancestors at the end
+        tree_paths = dict(subtrees.values_list('pk', 'tree_path'))
+        file_ids = list(
+            File.objects.filter(Q(pk__in=_get_pks(files)) | Q(folder__in=subtrees.values('pk')))
+            .order_by('pk').values_list('pk', flat=True)
+        )
+        stored = set()
+        models_with_delete = _get_file_models_with_delete()
+        if models_with_delete:
+            content_types = ContentType.objects.get_for_models(*models_with_delete, for_concrete_models=False)
+        with Folder.objects.deferred_statistics(tree_paths), deferred_removal():
+            for start in range(0, len(file_ids), batch_size):
+                batch = File.objects.filter(pk__in=file_ids[start:start + batch_size])
+                if log_deletions is not None:
+                    log_deletions(batch)
+                if models_with_delete:
+                    for file in batch.filter(polymorphic_ctype__in=content_types.values()):
+                        file.delete()
+                stored.update(batch.exclude(file='').values_list('file', 'is_public'))
+                batch.non_polymorphic().delete()
+            if tree_paths:
+                if log_deletions is not None:
+                    log_deletions(Folder.objects.filter(pk__in=_get_pks(folders)))
+                Folder.objects.filter(pk__in=subtrees.values('pk')).delete()
+
+        # Stored files shared with remaining files, e.g., deduplicated ones, are kept
+        stored = sorted(stored)
+        unreferenced = []
+        for start in range(0, len(stored), batch_size):
+            chunk = stored[start:start + batch_size]
+            referenced = set(
+                File.objects.filter(file__in={name for name, is_public in chunk}).values_list('file', 'is_public')
+            )
+            unreferenced.extend(item for item in chunk if item not in referenced)
+        if unreferenced:
+            transaction.on_commit(functools.partial(delete_stored_files, unreferenced), using=using)
+    return len(file_ids), len(tree_paths)
+
+
+def _delete_thumbnail_records(field_file, names, batch_size=500):
+    """
+    Deletes the easy-thumbnails records of the sources ``names`` and returns
+    the names of their thumbnails in the thumbnail storage.
+    """
+    source_hash = get_storage_hash(field_file.source_storage)
+    thumbnail_hash = get_storage_hash(field_file.thumbnail_storage)
+    thumbnails = []
+    for start in range(0, len(names), batch_size):
+        sources = Source.objects.filter(storage_hash=source_hash, name__in=names[start:start + batch_size])
+        thumbnails.extend(
+            Thumbnail.objects.filter(source__in=sources, storage_hash=thumbnail_hash).values_list('name', flat=True)
+        )
+        sources.delete()
+    return thumbnails
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=filer_settings.FILER_DELETE_WORKERS, thread_name_prefix='filer-delete',
+            )
+        return _executor
+
+
+def _delete_stored_file(storage, name):
+    try:
+        storage.delete(name)
+    except Exception as error:
+        logger.error("Could not delete the stored file %s: %s", name, error)
+
+
+def delete_stored_files(files):
+    """
+    Deletes the stored files ``files``, a list of ``(name, is_public)``
+    pairs, and their thumbnails. The thumbnail records are deleted right away;
+    the storages are accessed in the background by ``FILER_DELETE_WORKERS``
+    threads shared by the process, and failures are logged. Use
+    ``wait_for_stored_file_deletions`` to wait for them.
+    """
+    deletions = []
+    for is_public in (True, False):
+        names = [name for name, public in files if public == is_public]
+        if not names:
+            continue
+        # Provides the storages like the field file of such a file
+        field_file = File(is_public=is_public).file
+        deletions.extend((field_file.source_storage, name) for name in names)
+        deletions.extend(
+            (field_file.thumbnail_storage, name) for name in _delete_thumbnail_records(field_file, names)
+        )
+    executor = _get_executor()
+    for storage, name in deletions:
+        future = executor.submit(_delete_stored_file, storage, name)
+        _pending.add(future)
+        future.add_done_callback(_pending.discard)
+
+
+def wait_for_stored_file_deletions(timeout=None):
+    """
+    Waits until the stored files this process scheduled for deletion are
+    deleted, or ``timeout`` seconds have passed.
+    """
+    wait(list(_pending), timeout=timeout)
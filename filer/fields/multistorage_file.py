@@ -10,7 +10,7 @@ from easy_thumbnails import fields as easy_thumbnails_fields
 from easy_thumbnails import files as easy_thumbnails_files
 
 from .. import settings as filer_settings
-from ..utils.filer_easy_thumbnails import ThumbnailerNameMixin
+from ..utils.filer_easy_thumbnails import ThumbnailerNameMixin, ThumbnailIndexMixin, ThumbnailRenderMixin
 
 
 STORAGES = {
@@ -65,7 +65,7 @@ class MultiStorageFileDescriptor(FileDescriptor):
                 getattr(instance, callback_attr)()
 
 
-class MultiStorageFieldFile(ThumbnailerNameMixin,
+class MultiStorageFieldFile(ThumbnailIndexMixin, ThumbnailRenderMixin, ThumbnailerNameMixin,
                             easy_thumbnails_files.ThumbnailerFieldFile):
     def __init__(self, instance, field, name):
         """
@@ -0,0 +1,30 @@
+import os
+import time
+
+from django.core.management.base import BaseCommand
+
+from filer import settings as filer_settings
+from filer.models.uploadmodels import UploadSession, get_staging_dir
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete resumable uploads which did not receive any data for FILER_UPLOADER_SESSION_EXPIRY "
+        "seconds, and staged data left without an upload."
+    )
+
+    def handle(self, *args, **options):
+        sessions = UploadSession.objects.delete_expired()
+
+        orphans = 0
+        staging_dir = get_staging_dir()
+        known = {f'{pk.hex}.part' for pk in UploadSession.objects.values_list('pk', flat=True)}
+        expired_before = time.time() - filer_settings.FILER_UPLOADER_SESSION_EXPIRY
+        for entry in os.scandir(staging_dir):
+            if entry.name.endswith('.part') and entry.name not in known and entry.stat().st_mtime < expired_before:
+                os.remove(entry.path)
+                orphans += 1
+
+        if options.get('verbosity'):
+            self.stdout.write(f"Deleted {sessions} expired upload(s) and {orphans} orphaned staging file(s).\n")
+            self.stdout.flush()
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from filer.deletion import wait_for_stored_file_deletions
+from filer.trash import purge_trash
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete the files and folders which have been in the trash for FILER_TRASH_RETENTION_DAYS days, "
+        "along with their stored files and thumbnails."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            help="Delete what has been in the trash for this many days instead.",
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help="Number of files deleted per query (default: 500).",
+        )
+
+    def handle(self, *args, **options):
+        files, folders = purge_trash(days=options['days'], batch_size=options['batch_size'])
+        # The stored files are deleted in the background
+        wait_for_stored_file_deletions()
+        if options.get('verbosity'):
+            self.stdout.write(f"Deleted {files} file(s) and {folders} folder(s) from the trash.\n")
+            self.stdout.flush()
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from filer.search import get_search_backend
+
+
+class Command(BaseCommand):
+    help = "Recreate the search index of all files and folders used by the admin search."
+
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        if backend is None:
+            raise CommandError("The search index is disabled (FILER_SEARCH_BACKEND).")
+        changed = backend.rebuild()
+        if options.get('verbosity'):
+            self.stdout.write(f"Updated the search index of {changed} file(s) and folder(s).\n")
+            self.stdout.flush()
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from filer.models.foldermodels import Folder
+
+
+class Command(BaseCommand):
+    help = "Recompute the file count, subfolder count and size statistics of all folders."
+
+    def handle(self, *args, **options):
+        changed = Folder.objects.rebuild_statistics()
+        if options.get('verbosity'):
+            self.stdout.write(f"Corrected statistics of {changed} folder(s).\n")
+            self.stdout.flush()
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from filer.models.foldermodels import Folder
+
+
+class Command(BaseCommand):
+    help = "Recompute the materialized tree path of all folders from their parent relation."
+
+    def handle(self, *args, **options):
+        changed = Folder.objects.rebuild_tree_paths()
+        if options.get('verbosity'):
+            self.stdout.write(f"Rebuilt tree path of {changed} folder(s).\n")
+            self.stdout.flush()
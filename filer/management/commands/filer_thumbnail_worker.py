@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+
+from filer.thumbnail_queue import DatabaseQueue
+
+
+class Command(BaseCommand):
+    help = "Generate the thumbnails queued in the database (FILER_THUMBNAIL_QUEUE = DatabaseQueue)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help="Exit as soon as the queue is empty instead of waiting for new jobs.",
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=10,
+            help="Number of jobs claimed at a time (default: 10).",
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=1.0,
+            help="Seconds to wait before polling an empty queue again (default: 1).",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            processed = DatabaseQueue().work(
+                batch_size=options['batch_size'], interval=options['interval'], once=options['once'],
+            )
+        except KeyboardInterrupt:
+            return
+        if options.get('verbosity'):
+            self.stdout.write(f"Processed {processed} thumbnail job(s).\n")
+            self.stdout.flush()
@@ -1,9 +1,172 @@
-from django.core.management.base import BaseCommand
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
 
-from filer.models.imagemodels import Image
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.models import Count, Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from easy_thumbnails.alias import aliases as thumbnail_aliases
+from easy_thumbnails.signals import thumbnail_created
+
+from filer import settings as filer_settings
+from filer.models.abstract import BaseImage
+from filer.utils.filer_easy_thumbnails import get_thumbnail_index_key
+from filer.utils.loader import load_model
+
+
+def get_image_model():
+    return load_model(filer_settings.FILER_IMAGE_MODEL)
+
+
+def generate_chunk(pks, thumbnail_options):
+    """
+    Generates the thumbnails of the images ``pks``. Runs in the worker
+    processes, hence a module level function. Returns the number of images,
+    generated thumbnails, bytes of the source images decoded and errors.
+    """
+    generated = []
+
+    def count_thumbnail(sender, **kwargs):
+        generated.append(sender)
+
+    thumbnail_created.connect(count_thumbnail)
+    images = decoded = errors = 0
+    try:
+        for image in get_image_model().objects.filter(pk__in=pks).order_by('pk'):
+            images += 1
+            before = len(generated)
+            try:
+                image.render_thumbnails(thumbnail_options.values())
+            except Exception:
+                # The thumbnails which could be rendered are indexed all the same
+                errors += 1
+            if len(generated) > before:
+                decoded += image._file_size or 0
+    finally:
+        thumbnail_created.disconnect(count_thumbnail)
+    return images, len(generated), decoded, errors
+
+
+def split_list(value):
+    return [item.strip() for item in value.split(',') if item.strip()] if value else None
 
 
 class Command(BaseCommand):
+    help = "Generate the admin thumbnails and icons of all images."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help="Number of processes generating thumbnails (default: 1).",
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=100,
+            help="Number of images handed to a process at a time (default: 100).",
+        )
+        parser.add_argument(
+            '--sizes',
+            help="Comma separated icon sizes to generate, e.g. \"32,64\" "
+                 "(default: FILER_ADMIN_ICON_SIZES unless --aliases is given).",
+        )
+        parser.add_argument(
+            '--aliases',
+            help="Comma separated thumbnails to generate: names of BaseImage.DEFAULT_THUMBNAILS or of "
+                 "easy-thumbnails' THUMBNAIL_ALIASES (default: all DEFAULT_THUMBNAILS unless --sizes is given).",
+        )
+        parser.add_argument(
+            '--only-missing',
+            action='store_true',
+            help="Skip images for which all requested thumbnails are recorded in the thumbnail index.",
+        )
+        parser.add_argument(
+            '--since',
+            help="Only process images modified at or after this date or datetime (ISO 8601).",
+        )
+        parser.add_argument(
+            '--checkpoint',
+            help="File to record progress in. If it exists, processing resumes after the last "
+                 "completed image. It is removed once all images have been processed.",
+        )
+
+    def get_thumbnail_options(self, sizes, aliases):
+        if sizes is None and aliases is None:
+            sizes, aliases = filer_settings.FILER_ADMIN_ICON_SIZES, list(BaseImage.DEFAULT_THUMBNAILS)
+        thumbnail_options = {}
+        for alias in aliases or []:
+            options = BaseImage.DEFAULT_THUMBNAILS.get(alias) or thumbnail_aliases.get(alias)
+            if options is None:
+                raise CommandError(f"Unknown thumbnail alias \"{alias}\".")
+            thumbnail_options[alias] = dict(options)
+        for size in sizes or []:
+            try:
+                size = int(size)
+            except ValueError:
+                raise CommandError(f"Invalid icon size \"{size}\".")
+            thumbnail_options[str(size)] = {'size': (size, size), 'crop': True, 'upscale': True}
+        return thumbnail_options
+
+    def get_queryset(self, thumbnail_options, only_missing, since):
+        queryset = get_image_model().objects.non_polymorphic()
+        if since:
+            since_datetime = parse_datetime(since)
+            if since_datetime is None:
+                since_date = parse_date(since)
+                if since_date is None:
+                    raise CommandError(f"Invalid date \"{since}\".")
+                since_datetime = datetime.combine(since_date, datetime.min.time())
+            if timezone.is_naive(since_datetime):
+                since_datetime = timezone.make_aware(since_datetime)
+            queryset = queryset.filter(modified_at__gte=since_datetime)
+        if only_missing:
+            keys = {get_thumbnail_index_key(options) for options in thumbnail_options.values()}
+            queryset = queryset.alias(
+                indexed_thumbnails=Count('thumbnail_index', filter=Q(thumbnail_index__key__in=keys)),
+            ).filter(indexed_thumbnails__lt=len(keys))
+        return queryset
+
+    def read_checkpoint(self, path):
+        if not path or not os.path.exists(path):
+            return 0
+        with open(path) as checkpoint:
+            return json.load(checkpoint)['last_pk']
+
+    def write_checkpoint(self, path, last_pk):
+        if path:
+            with open(f'{path}.tmp', 'w') as checkpoint:
+                json.dump({'last_pk': last_pk}, checkpoint)
+            os.replace(f'{path}.tmp', path)
+
+    def iter_chunks(self, queryset, last_pk, chunk_size):
+        """
+        Yields the pks of the images in chunks, using the last pk of a chunk
+        to select the next one instead of an offset.
+        """
+        while True:
+            pks = list(queryset.filter(pk__gt=last_pk).order_by('pk').values_list('pk', flat=True)[:chunk_size])
+            if not pks:
+                return
+            yield pks
+            last_pk = pks[-1]
+
+    def submit(self, executor, pks, thumbnail_options):
+        """
+        Returns the last pk of the chunk and its result, or a future of the
+        result if the chunk is processed by a worker process.
+        """
+        if executor is None:
+            return pks[-1], generate_chunk(pks, thumbnail_options)
+        return pks[-1], executor.submit(generate_chunk, pks, thumbnail_options)
 
     def handle(self, *args, **options):
         """
@@ -11,18 +174,56 @@ class Command(BaseCommand):
 
         NOTE: To keep memory consumption stable avoid iteration over the Image queryset
         """
-        pks = Image.objects.all().values_list('id', flat=True)
-        total = len(pks)
-        for idx, pk in enumerate(pks):
-            image = None
-            try:
-                image = Image.objects.get(pk=pk)
-                self.stdout.write(u'Processing image {0} / {1} {2}'.format(idx + 1, total, image))
-                self.stdout.flush()
-                image.thumbnails
-                image.icons
-            except IOError as e:
-                self.stderr.write('Failed to generate thumbnails: {0}'.format(str(e)))
-                self.stderr.flush()
-            finally:
-                del image
+        thumbnail_options = self.get_thumbnail_options(split_list(options['sizes']), split_list(options['aliases']))
+        queryset = self.get_queryset(thumbnail_options, options['only_missing'], options['since'])
+        checkpoint = options['checkpoint']
+        last_pk = self.read_checkpoint(checkpoint)
+        total = queryset.filter(pk__gt=last_pk).count()
+        if last_pk:
+            self.stdout.write(f"Resuming after image {last_pk}.")
+        chunks = self.iter_chunks(queryset, last_pk, options['chunk_size'])
+
+        workers = max(options['workers'], 1)
+        if workers > 1:
+            # Worker processes must not share the database connections of this process
+            connections.close_all()
+            # Processes which are spawned rather than forked start without Django being set up
+            executor = ProcessPoolExecutor(max_workers=workers, initializer=django.setup)
+        else:
+            executor = None
+
+        started = time.monotonic()
+        images = thumbnails = decoded = errors = 0
+        pending = deque()
+        try:
+            while True:
+                # Keep every worker busy, but do not queue up all chunks at once
+                while len(pending) < 2 * workers:
+                    pks = next(chunks, None)
+                    if pks is None:
+                        break
+                    pending.append(self.submit(executor, pks, thumbnail_options))
+                if not pending:
+                    break
+                # Chunks are collected in order, so the checkpoint never skips an unfinished chunk
+                chunk_last_pk, result = pending.popleft()
+                if executor is not None:
+                    result = result.result()
+                images, thumbnails, decoded, errors = (
+                    total_value + value for total_value, value in zip((images, thumbnails, decoded, errors), result)
+                )
+                self.write_checkpoint(checkpoint, chunk_last_pk)
+                if options['verbosity']:
+                    elapsed = max(time.monotonic() - started, 1e-6)
+                    self.stdout.write(
+                        f"Processed {images} / {total} images, generated {thumbnails} thumbnails "
+                        f"({images / elapsed:.1f} images/s, {decoded / elapsed / 1024 ** 2:.1f} MB/s decoded)"
+                    )
+                    self.stdout.flush()
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+        if errors:
+            self.stderr.write(f"Failed to generate thumbnails of {errors} image(s).")
+        if checkpoint and os.path.exists(checkpoint):
+            os.remove(checkpoint)
@@ -1,5 +1,6 @@
 import os
 
+from django.core.exceptions import ValidationError
 from django.core.files import File as DjangoFile
 from django.core.management.base import BaseCommand
 
@@ -7,6 +8,8 @@ from ...models.filemodels import File
 from ...models.foldermodels import Folder
 from ...settings import FILER_IMAGE_MODEL, FILER_IS_PUBLIC_DEFAULT
 from ...utils.loader import load_model
+from ...utils.zip import is_zip, iter_zip
+from ...validation import validate_upload
 
 
 Image = load_model(FILER_IMAGE_MODEL)
@@ -35,7 +38,8 @@ class FileImporter:
                 original_filename=file_obj.name,
                 file=file_obj,
                 folder=folder,
-                is_public=FILER_IS_PUBLIC_DEFAULT)
+                is_public=FILER_IS_PUBLIC_DEFAULT,
+                trashed_at__isnull=True)
             if created:
                 self.image_created += 1
         else:
@@ -43,7 +47,8 @@ class FileImporter:
                 original_filename=file_obj.name,
                 file=file_obj,
                 folder=folder,
-                is_public=FILER_IS_PUBLIC_DEFAULT)
+                is_public=FILER_IS_PUBLIC_DEFAULT,
+                trashed_at__isnull=True)
             if created:
                 self.file_created += 1
         if self.verbosity >= 2:
@@ -66,7 +71,9 @@ class FileImporter:
             return None
         current_parent = None
         for folder_name in folder_names:
-            current_parent, created = Folder.objects.get_or_create(name=folder_name, parent=current_parent)
+            current_parent, created = Folder.objects.get_or_create(
+                name=folder_name, parent=current_parent, trashed_at__isnull=True,
+            )
             if created:
                 self.folder_created += 1
                 if self.verbosity >= 2:
@@ -88,6 +95,9 @@ class FileImporter:
         if self.verbosity >= 1:
             print("Import the folders and files in %s" % (path,))
         root_folder_name = os.path.basename(path)
+        if os.path.isfile(path) and is_zip(path):
+            self.import_zip(path, base_folder)
+            return
         for root, dirs, files in os.walk(path):
             rel_folders = root.partition(path)[2].strip(os.path.sep).split(os.path.sep)
             while '' in rel_folders:
@@ -104,6 +114,28 @@ class FileImporter:
         if self.verbosity >= 1:
             print(('folder_created #%s / file_created #%s / ' + 'image_created #%s') % (self.folder_created, self.file_created, self.image_created))
 
+    def import_zip(self, path, base_folder=None):
+        """
+        Imports the files of the .zip archive at ``path`` one at a time into a
+        folder named like the archive, recreating its directory structure.
+        """
+        folder_name = os.path.splitext(os.path.basename(path))[0]
+        base_folder_names = base_folder.split('/') if base_folder else []
+        with open(path, 'rb') as archive:
+            for upload, folder_names in iter_zip(archive):
+                folder = self.get_or_create_folder(base_folder_names + [folder_name] + folder_names)
+                try:
+                    validate_upload(upload.name, upload, None, upload.content_type)
+                except ValidationError as error:
+                    if self.verbosity >= 1:
+                        print("Skipped %s: %s" % (os.path.join(*folder_names, upload.name), '; '.join(error.messages)))
+                    continue
+                self.import_file(file_obj=upload, folder=folder)
+        if self.verbosity >= 1:
+            print('folder_created #%s / file_created #%s / image_created #%s' % (
+                self.folder_created, self.file_created, self.image_created,
+            ))
+
 
 class Command(BaseCommand):
     """
@@ -111,6 +143,7 @@ class Command(BaseCommand):
 
         manage.py --path=/tmp/assets/images
         manage.py --path=/tmp/assets/news --folder=images
+        manage.py --path=/tmp/assets/archive.zip --folder=images
     """
     def add_arguments(self, parser):
         parser.add_argument(
@@ -118,7 +151,7 @@ class Command(BaseCommand):
             action='store',
             dest='path',
             required=True,
-            help='Import files located in the path into django-filer'
+            help='Import files located in the path, or in the .zip archive at the path, into django-filer'
         )
 
         parser.add_argument(
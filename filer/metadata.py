@@ -0,0 +1,240 @@
+"""
+Metadata of uploaded files, read in a single pass over their content.
+
+Without it, every consumer of an upload opens and reads it on its own:
+``File`` hashes it, ``BaseImage`` decodes its header for the dimensions and
+the transparency, and ``Image`` opens it once more for the EXIF date taken.
+``read_metadata`` reads the upload once instead, hashing the content (unless
+the digest was computed while the upload was received, see
+``filer.uploadhandler``) and parsing the header of images, and attaches the
+resulting ``UploadMetadata`` to the upload for those consumers to share.
+
+Validators rewriting an upload (e.g. ``strip_exif``) make its metadata stale,
+``get_metadata`` then returns ``None`` until ``read_metadata`` is called again.
+
+The uploaded file is wrapped to count the bytes read from it by anyone, which
+``record_upload`` adds to ``get_upload_stats()`` and reports with the
+``upload_read`` signal, so that a consumer reading uploads again shows up.
+"""
+import hashlib
+import io
+import mimetypes
+import threading
+from collections import Counter
+
+from django.core.files.base import ContentFile
+from django.dispatch import Signal
+
+import easy_thumbnails.utils
+from easy_thumbnails.VIL import Image as VILImage
+
+from .utils.compatibility import PILImage
+from .utils.pil_exif import get_date_taken, get_exif
+
+
+#: Bytes at the start of an upload kept to parse the header of images. This
+#: covers the EXIF data of JPEG files, which is limited to 64 KB.
+HEADER_SIZE = 256 * 1024
+
+CHUNK_SIZE = 64 * 1024
+
+#: Sent for each upload saved, with the arguments ``name``, ``size`` and
+#: ``bytes_read`` (by all consumers, including the storage)
+upload_read = Signal()
+
+_stats = Counter()
+_stats_lock = threading.Lock()
+
+
+def get_upload_stats():
+    """
+    Returns the upload statistics of this process: the number of
+    ``uploads``, their total size in ``bytes`` and the ``bytes_read`` from
+    them.
+    """
+    with _stats_lock:
+        return dict(_stats)
+
+
+class MeteredFile:
+    """
+    Wraps the file of an upload, counting the bytes read from it and the
+    writes to it.
+    """
+    def __init__(self, file):
+        self._file = file
+        self.bytes_read = 0
+        self.writes = 0
+
+    def __getattr__(self, name):
+        return getattr(self._file, name)
+
+    def __iter__(self):
+        return iter(self.readline, b'')
+
+    def read(self, *args):
+        data = self._file.read(*args)
+        self.bytes_read += len(data)
+        return data
+
+    def readline(self, *args):
+        data = self._file.readline(*args)
+        self.bytes_read += len(data)
+        return data
+
+    def readinto(self, buffer):
+        size = self._file.readinto(buffer)
+        self.bytes_read += size or 0
+        return size
+
+    def write(self, data):
+        self.writes += 1
+        return self._file.write(data)
+
+    def truncate(self, *args):
+        self.writes += 1
+        return self._file.truncate(*args)
+
+
+class UploadMetadata:
+    """
+    The metadata of an upload. The image attributes are ``None`` (and
+    ``transparent`` is ``False``) for files which are not images. ``exif``
+    holds the decoded EXIF tags, without binary values like the maker notes.
+    """
+    def __init__(self, size, sha1, mime_type, width=None, height=None, transparent=False, exif=None,
+                 date_taken=None, bytes_read=0):
+        self.size = size
+        self.sha1 = sha1
+        self.mime_type = mime_type
+        self.width = width
+        self.height = height
+        self.transparent = transparent
+        self.exif = exif or {}
+        self.date_taken = date_taken
+        #: The bytes read to collect the metadata
+        self.bytes_read = bytes_read
+        self._writes = 0
+
+    def __repr__(self):
+        return f'<UploadMetadata: {self.mime_type}, {self.size} bytes>'
+
+
+def _get_meter(upload):
+    if not isinstance(upload.file, MeteredFile):
+        upload.file = MeteredFile(upload.file)
+    return upload.file
+
+
+def _read_image(upload, header, is_complete, guessed_type):
+    """
+    Returns the MIME type, the dimensions, the transparency and the EXIF data
+    of an image, parsed from the ``header`` of the upload where possible.
+    """
+    if b'<svg' in header[:4096].lower() or guessed_type == 'image/svg+xml':
+        try:
+            svg_image = VILImage.load(ContentFile(header) if is_complete else upload)
+            width, height = svg_image.size
+        except Exception:
+            width, height = None, None
+        return 'image/svg+xml', width, height, True, {}
+
+    try:
+        pil_image = PILImage.open(io.BytesIO(header))
+    except Exception:
+        if is_complete or not (guessed_type or '').startswith('image/'):
+            return None, None, None, False, {}
+        # The header of the image exceeds HEADER_SIZE
+        upload.seek(0)
+        try:
+            pil_image = PILImage.open(upload)
+        except Exception:
+            return None, None, None, False, {}
+    exif = {tag: value for tag, value in get_exif(pil_image).items() if not isinstance(value, bytes)}
+    return (
+        PILImage.MIME.get(pil_image.format),
+        *pil_image.size,
+        easy_thumbnails.utils.is_transparent(pil_image),
+        exif,
+    )
+
+
+def read_metadata(upload):
+    """
+    Reads the metadata of the uploaded file ``upload`` in one pass, sets it
+    as ``metadata`` and the SHA-1 digest as ``sha1`` on the upload, and
+    returns it. The content is only hashed if the upload has no ``sha1`` yet,
+    otherwise just its header is read.
+    """
+    meter = _get_meter(upload)
+    bytes_read = meter.bytes_read
+    # A digest set before the upload was rewritten is outdated
+    sha1 = getattr(upload, 'sha1', None) if not meter.writes else None
+
+    upload.seek(0)
+    header = upload.read(HEADER_SIZE)
+    if sha1 and upload.size is not None:
+        size = upload.size
+    else:
+        sha = hashlib.sha1(header)
+        size = len(header)
+        while True:
+            data = upload.read(CHUNK_SIZE)
+            if not data:
+                break
+            sha.update(data)
+            size += len(data)
+        sha1 = sha.hexdigest()
+
+    guessed_type = mimetypes.guess_type(upload.name or '')[0]
+    mime_type, width, height, transparent, exif = _read_image(upload, header, size <= len(header), guessed_type)
+    upload.seek(0)
+
+    metadata = UploadMetadata(
+        size=size,
+        sha1=sha1,
+        mime_type=mime_type or guessed_type or 'application/octet-stream',
+        width=width,
+        height=height,
+        transparent=transparent,
+        exif=exif,
+        date_taken=get_date_taken(exif),
+        bytes_read=meter.bytes_read - bytes_read,
+    )
+    metadata._writes = meter.writes
+    upload.metadata = metadata
+    upload.sha1 = sha1
+    upload.size = size
+    return metadata
+
+
+def get_metadata(file):
+    """
+    Returns the metadata read from the upload behind ``file`` (an uploaded
+    file or the field file it was assigned to), or ``None`` if it was not
+    read or the upload was rewritten since.
+    """
+    upload = getattr(file, '_file', file)
+    metadata = getattr(upload, 'metadata', None)
+    if metadata is None or getattr(upload.file, 'writes', 0) != metadata._writes:
+        return None
+    return metadata
+
+
+def get_bytes_read(upload):
+    """
+    Returns the bytes read from the uploaded file ``upload`` since its
+    metadata was first read.
+    """
+    return getattr(upload.file, 'bytes_read', 0)
+
+
+def record_upload(upload):
+    """
+    Adds the bytes read from ``upload`` to the statistics, once it was saved.
+    """
+    size = getattr(upload, 'size', None) or 0
+    bytes_read = get_bytes_read(upload)
+    with _stats_lock:
+        _stats.update(uploads=1, bytes=size, bytes_read=bytes_read)
+    upload_read.send(sender=upload.__class__, name=upload.name, size=size, bytes_read=bytes_read)
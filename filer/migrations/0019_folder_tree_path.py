@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:16
+
+from django.db import migrations, models
+
+
+def populate_tree_paths(apps, schema_editor):
+    Folder = apps.get_model('filer', 'Folder')
+    parents = dict(Folder.objects.values_list('id', 'parent_id'))
+    paths = {}
+
+    def compute_path(folder_id):
+        if folder_id not in paths:
+            chain = [folder_id]
+            parent_id = parents.get(folder_id)
+            while parent_id is not None and parent_id not in paths:
+                chain.append(parent_id)
+                parent_id = parents.get(parent_id)
+            path = paths[parent_id] + f"{parent_id}/" if parent_id is not None else "/"
+            for node_id in reversed(chain):
+                paths[node_id] = path
+                path = f"{path}{node_id}/"
+        return paths[folder_id]
+
+    folders = []
+    for folder in Folder.objects.only('id', 'tree_path').iterator():
+        folder.tree_path = compute_path(folder.id)
+        folders.append(folder)
+    Folder.objects.bulk_update(folders, ['tree_path'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('filer', '0018_alter_file_options'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='folder',
+            name='tree_path',
+            field=models.CharField(db_index=True, default='/', editable=False, help_text='Materialized path of ancestor ids, e.g. "/1/5/".', max_length=255, verbose_name='tree path'),
+        ),
+        migrations.RunPython(populate_tree_paths, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:20
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def populate_statistics(apps, schema_editor):
+    Folder = apps.get_model('filer', 'Folder')
+    File = apps.get_model('filer', 'File')
+    fields = ['_file_count', '_size', '_children_count', '_total_file_count', '_total_size', '_total_children_count']
+    folders = {folder.id: folder for folder in Folder.objects.only('id', 'tree_path')}
+    for folder in folders.values():
+        for field in fields:
+            setattr(folder, field, 0)
+    file_stats = (
+        File.objects.filter(folder__isnull=False).order_by()
+        .values_list('folder_id').annotate(count=Count('pk'), size=Sum('_file_size'))
+    )
+    for folder_id, count, size in file_stats:
+        folders[folder_id]._file_count = count
+        folders[folder_id]._size = size or 0
+    children_stats = Folder.objects.filter(parent__isnull=False).order_by().values_list('parent_id').annotate(count=Count('pk'))
+    for folder_id, count in children_stats:
+        folders[folder_id]._children_count = count
+    for folder in folders.values():
+        ancestor_ids = [int(pk) for pk in folder.tree_path.strip('/').split('/') if pk]
+        for ancestor in [folders[pk] for pk in ancestor_ids if pk in folders] + [folder]:
+            ancestor._total_file_count += folder._file_count
+            ancestor._total_size += folder._size
+            ancestor._total_children_count += folder._children_count
+    Folder.objects.bulk_update(folders.values(), fields, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('filer', '0019_folder_tree_path'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='folder',
+            name='_children_count',
+            field=models.IntegerField(default=0, editable=False, verbose_name='subfolder count'),
+        ),
+        migrations.AddField(
+            model_name='folder',
+            name='_file_count',
+            field=models.IntegerField(default=0, editable=False, verbose_name='file count'),
+        ),
+        migrations.AddField(
+            model_name='folder',
+            name='_size',
+            field=models.BigIntegerField(default=0, editable=False, verbose_name='size'),
+        ),
+        migrations.AddField(
+            model_name='folder',
+            name='_total_children_count',
+            field=models.IntegerField(default=0, editable=False, verbose_name='total subfolder count'),
+        ),
+        migrations.AddField(
+            model_name='folder',
+            name='_total_file_count',
+            field=models.IntegerField(default=0, editable=False, verbose_name='total file count'),
+        ),
+        migrations.AddField(
+            model_name='folder',
+            name='_total_size',
+            field=models.BigIntegerField(default=0, editable=False, verbose_name='total size'),
+        ),
+        migrations.RunPython(populate_statistics, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:35
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('filer', '0020_folder_statistics'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ThumbnailIndex',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=255, verbose_name='options key')),
+                ('name', models.CharField(max_length=255, verbose_name='thumbnail name')),
+                ('modified', models.DateTimeField(default=django.utils.timezone.now, verbose_name='modified')),
+                ('file', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='thumbnail_index', to='filer.file', verbose_name='file')),
+            ],
+            options={
+                'verbose_name': 'thumbnail index entry',
+                'verbose_name_plural': 'thumbnail index entries',
+                'constraints': [models.UniqueConstraint(fields=('file', 'key'), name='filer_thumbnailindex_file_key')],
+            },
+        ),
+    ]
@@ -0,0 +1,78 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:38
+
+import django.db.models.deletion
+from django.db import migrations, models, transaction
+
+
+FTS_TABLE = 'filer_searchindex_fts'
+TABLE = 'filer_searchindex'
+
+
+def create_fulltext_index(apps, schema_editor):
+    """
+    Creates the FTS5 table of the SQLite search backend. The documents are
+    added by ``filer_rebuild_search_index``.
+    """
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    statements = [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+        f"document, tokenize='trigram', content='{TABLE}', content_rowid='id')",
+        f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_insert AFTER INSERT ON {TABLE} BEGIN "
+        f"INSERT INTO {FTS_TABLE}(rowid, document) VALUES (new.id, new.document); END",
+        f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_delete AFTER DELETE ON {TABLE} BEGIN "
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, document) VALUES ('delete', old.id, old.document); END",
+        f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_update AFTER UPDATE ON {TABLE} BEGIN "
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, document) VALUES ('delete', old.id, old.document); "
+        f"INSERT INTO {FTS_TABLE}(rowid, document) VALUES (new.id, new.document); END",
+    ]
+    try:
+        with transaction.atomic(using=schema_editor.connection.alias):
+            for statement in statements:
+                schema_editor.execute(statement)
+    except Exception:
+        # SQLite < 3.34 or compiled without FTS5
+        pass
+
+
+def remove_fulltext_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        schema_editor.execute(f'DROP TABLE IF EXISTS {FTS_TABLE}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('filer', '0021_thumbnailindex'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchIndex',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('file', 'file'), ('folder', 'folder')], max_length=10, verbose_name='kind')),
+                ('object_id', models.PositiveIntegerField(verbose_name='object id')),
+                ('document', models.TextField(blank=True, verbose_name='document')),
+            ],
+            options={
+                'verbose_name': 'search index entry',
+                'verbose_name_plural': 'search index entries',
+                'constraints': [models.UniqueConstraint(fields=('kind', 'object_id'), name='filer_searchindex_kind_object')],
+            },
+        ),
+        migrations.CreateModel(
+            name='SearchTrigram',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('trigram', models.CharField(max_length=3, verbose_name='trigram')),
+                ('entry', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='trigrams', to='filer.searchindex', verbose_name='search index entry')),
+            ],
+            options={
+                'verbose_name': 'search trigram',
+                'verbose_name_plural': 'search trigrams',
+                'indexes': [models.Index(fields=['trigram', 'entry'], name='filer_searchtrigram_lookup')],
+            },
+        ),
+        migrations.RunPython(create_fulltext_index, remove_fulltext_index),
+    ]
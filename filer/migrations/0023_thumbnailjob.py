@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:43
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('filer', '0022_searchindex_searchtrigram'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ThumbnailJob',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=255, verbose_name='options key')),
+                ('options', models.JSONField(verbose_name='thumbnail options')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='created at')),
+                ('claimed_at', models.DateTimeField(blank=True, null=True, verbose_name='claimed at')),
+                ('file', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='thumbnail_jobs', to='filer.file', verbose_name='file')),
+            ],
+            options={
+                'verbose_name': 'thumbnail job',
+                'verbose_name_plural': 'thumbnail jobs',
+                'constraints': [models.UniqueConstraint(fields=('file', 'key'), name='filer_thumbnailjob_file_key')],
+            },
+        ),
+    ]
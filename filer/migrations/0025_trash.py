@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('filer', '0024_uploadsession'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='folder',
+            unique_together=set(),
+        ),
+        migrations.AddField(
+            model_name='file',
+            name='trashed_at',
+            field=models.DateTimeField(blank=True, db_index=True, editable=False, null=True, verbose_name='trashed at'),
+        ),
+        migrations.AddField(
+            model_name='folder',
+            name='trashed_at',
+            field=models.DateTimeField(blank=True, db_index=True, editable=False, null=True, verbose_name='trashed at'),
+        ),
+        migrations.AddConstraint(
+            model_name='folder',
+            constraint=models.UniqueConstraint(condition=models.Q(('trashed_at__isnull', True)), fields=('parent', 'name'), name='filer_folder_unique_name'),
+        ),
+    ]
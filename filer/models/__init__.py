@@ -2,5 +2,7 @@ from .clipboardmodels import *  # noqa
 from .filemodels import *  # noqa
 from .foldermodels import *  # noqa
 from .imagemodels import *  # noqa
+from .searchmodels import *  # noqa
 from .thumbnailoptionmodels import *  # noqa
+from .uploadmodels import *  # noqa
 from .virtualitems import *  # noqa
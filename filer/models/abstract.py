@@ -13,8 +13,9 @@ from easy_thumbnails.VIL import Image as VILImage
 from PIL.Image import MAX_IMAGE_PIXELS
 
 from .. import settings as filer_settings
+from ..metadata import get_metadata
 from ..utils.compatibility import PILImage
-from ..utils.filer_easy_thumbnails import FilerThumbnailer
+from ..utils.filer_easy_thumbnails import FilerThumbnailer, ThumbnailRenderError, get_thumbnail_index_key
 from ..utils.pil_exif import get_exif_for_file
 from .filemodels import File
 
@@ -118,7 +119,12 @@ class BaseImage(File):
 
     def file_data_changed(self, post_init=False):
         attrs_updated = super().file_data_changed(post_init=post_init)
-        if attrs_updated:
+        metadata = get_metadata(self.file) if attrs_updated else None
+        if metadata is not None and metadata.width is not None:
+            # Parsed along with the upload, see filer.metadata
+            self._width, self._height = metadata.width, metadata.height
+            self._transparent = metadata.transparent
+        elif attrs_updated:
             try:
                 try:
                     imgfile = self.file.file
@@ -178,7 +184,16 @@ class BaseImage(File):
 
     def save(self, *args, **kwargs):
         self.has_all_mandatory_data = self._check_validity()
+        moved = self.pk is not None and self._old_is_public != self.is_public
         super().save(*args, **kwargs)
+        if moved:
+            # File.save() removed the index entries of the thumbnails in the other
+            # storage. Without a queue, they are generated again when requested.
+            from ..thumbnail_queue import get_thumbnail_queue
+
+            queue = get_thumbnail_queue()
+            if queue is not None:
+                queue.enqueue(self, list(self._get_icon_thumbnails().values()))
 
     def _check_validity(self):
         if not self.name:
@@ -193,6 +208,9 @@ class BaseImage(File):
 
     @cached_property
     def exif(self):
+        metadata = get_metadata(self.file)
+        if metadata is not None:
+            return metadata.exif
         try:
             return get_exif_for_file(self.file)
         except Exception:
@@ -239,26 +257,75 @@ class BaseImage(File):
     def height(self):
         return self._height or 0.0
 
-    def _generate_thumbnails(self, required_thumbnails):
+    def render_thumbnails(self, thumbnail_options_list, generate=True):
+        """
+        Returns a thumbnail for each of the thumbnail options and records them
+        in the thumbnail index. Missing thumbnails are rendered in one pass over
+        the decoded source image, or are ``None`` if ``generate`` is ``False``.
+        Options without a subject location use the one of the image.
+        """
+        thumbnail_options_list = [
+            dict({'subject_location': self.subject_location}, **options) for options in thumbnail_options_list
+        ]
+
+        def index(thumbnails):
+            self.index_thumbnails({
+                get_thumbnail_index_key(options): thumbnail.name
+                for options, thumbnail in zip(thumbnail_options_list, thumbnails) if thumbnail
+            })
+
+        try:
+            thumbnails = self.file.render_thumbnails(thumbnail_options_list, generate=generate)
+        except ThumbnailRenderError as error:
+            # The thumbnails which could be rendered are indexed all the same
+            index(error.thumbnails)
+            raise
+        index(thumbnails)
+        return thumbnails
+
+    def _generate_thumbnails(self, required_thumbnails, defer=True):
+        """
+        Returns the urls of the thumbnails, generating missing ones. If
+        ``defer`` is set and a thumbnail queue is configured, missing
+        thumbnails are enqueued instead and a placeholder url is returned.
+        """
+        from ..thumbnail_queue import get_placeholder_url, get_thumbnail_queue
+
+        queue = get_thumbnail_queue() if defer else None
         _thumbnails = {}
-        for name, opts in required_thumbnails.items():
-            try:
-                opts.update({'subject_location': self.subject_location})
-                thumb = self.file.get_thumbnail(opts)
+        for opts in required_thumbnails.values():
+            opts.update({'subject_location': self.subject_location})
+        failed = set()
+        try:
+            thumbnails = self.render_thumbnails(required_thumbnails.values(), generate=queue is None)
+        except Exception as e:
+            # catch exception and manage it. We can re-raise it for debugging
+            # purposes and/or just logging it, provided user configured
+            # proper logging configuration
+            if filer_settings.FILER_ENABLE_LOGGING:
+                logger.error('Error while generating thumbnail: %s', e)
+            if filer_settings.FILER_DEBUG:
+                raise
+            if not isinstance(e, ThumbnailRenderError):
+                return _thumbnails
+            # The other thumbnails are still returned
+            thumbnails = e.thumbnails
+            failed = set(e.errors)
+        missing = []
+        for index, ((name, opts), thumb) in enumerate(zip(required_thumbnails.items(), thumbnails)):
+            if index in failed:
+                continue
+            if thumb is None:
+                missing.append(opts)
+                _thumbnails[name] = get_placeholder_url()
+            else:
                 _thumbnails[name] = thumb.url
-            except Exception as e:
-                # catch exception and manage it. We can re-raise it for debugging
-                # purposes and/or just logging it, provided user configured
-                # proper logging configuration
-                if filer_settings.FILER_ENABLE_LOGGING:
-                    logger.error('Error while generating thumbnail: %s', e)
-                if filer_settings.FILER_DEBUG:
-                    raise
+        if missing:
+            queue.enqueue(self, missing)
         return _thumbnails
 
-    @property
-    def icons(self):
-        required_thumbnails = {
+    def _get_icon_thumbnails(self):
+        return {
             size: {
                 'size': (int(size), int(size)),
                 'crop': True,
@@ -266,7 +333,10 @@ class BaseImage(File):
                 'subject_location': self.subject_location,
             }
             for size in filer_settings.FILER_ADMIN_ICON_SIZES}
-        return self._generate_thumbnails(required_thumbnails)
+
+    @property
+    def icons(self):
+        return self._generate_thumbnails(self._get_icon_thumbnails())
 
     @property
     def thumbnails(self):
@@ -278,5 +348,6 @@ class BaseImage(File):
             file=self.file, name=self.file.name,
             source_storage=self.file.source_storage,
             thumbnail_storage=self.file.thumbnail_storage,
-            thumbnail_basedir=self.file.thumbnail_basedir)
+            thumbnail_basedir=self.file.thumbnail_basedir,
+            instance=self)
         return tn
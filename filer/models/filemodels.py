@@ -5,9 +5,12 @@ from datetime import datetime, timezone
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.core.files.base import ContentFile
-from django.db import models
+from django.db import connections, models, router, transaction
+from django.db.models import DEFERRED, Count, Q, Sum
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
 from django.urls import NoReverseMatch, reverse
+from django.utils import timezone as django_timezone
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
@@ -17,6 +20,9 @@ from polymorphic.query import PolymorphicQuerySet
 
 from .. import settings as filer_settings
 from ..fields.multistorage_file import MultiStorageFileField
+from ..metadata import get_metadata
+from ..storage import copy_file, move_file
+from ..utils.generate_filename import content_addressed
 from . import mixins
 from .foldermodels import Folder
 
@@ -27,6 +33,45 @@ class FileQuerySet(PolymorphicQuerySet):
         fields.update(["_file_size", "sha1", "is_public"])
         return super().only(*fields)
 
+    def with_permission(self, user, permission):
+        """
+        Returns the files on which ``user`` has ``permission`` (``"read"``,
+        ``"edit"`` or ``"add_children"``) as a single query, following the same
+        rules as ``File.has_generic_permission``.
+        """
+        if not user.is_authenticated:
+            return self.none()
+        if user.is_superuser:
+            return self.all()
+        if not filer_settings.FILER_ENABLE_PERMISSIONS:
+            # Files without a folder remain restricted to their owner
+            return self.filter(Q(owner=user) | Q(folder__isnull=False))
+        return self.filter(Q(owner=user) | Q(folder__in=Folder.objects.with_permission(user, permission)))
+
+    def readable_by(self, user):
+        return self.with_permission(user, 'read')
+
+    def editable_by(self, user):
+        return self.with_permission(user, 'edit')
+
+    def move_to(self, folder):
+        """
+        Moves all files of the queryset into ``folder`` with a single UPDATE
+        and keeps the folder statistics in sync.
+        """
+        folder_id = folder.pk if folder else None
+        with transaction.atomic(using=router.db_for_write(self.model)):
+            moved = list(
+                self.exclude(folder_id=folder_id).order_by().non_polymorphic()
+                .values_list('folder_id').annotate(count=Count('pk'), size=Sum('_file_size'))
+            )
+            if moved:
+                ThumbnailIndex.objects.filter(file__in=self.exclude(folder_id=folder_id).values('pk')).delete()
+            self.update(folder=folder)
+            for source_id, count, size in moved:
+                Folder.objects.update_statistics(source_id, file_count=-count, size=-(size or 0))
+                Folder.objects.update_statistics(folder_id, file_count=count, size=size or 0)
+
 
 class FileManager(PolymorphicManager):
     queryset_class = FileQuerySet
@@ -43,6 +88,15 @@ class FileManager(PolymorphicManager):
     def find_duplicates(self, file_obj):
         return [i for i in self.exclude(pk=file_obj.pk).filter(sha1=file_obj.sha1)]
 
+    def with_permission(self, user, permission):
+        return self.get_queryset().with_permission(user, permission)
+
+    def readable_by(self, user):
+        return self.get_queryset().readable_by(user)
+
+    def editable_by(self, user):
+        return self.get_queryset().editable_by(user)
+
 
 def is_public_default():
     # not using this setting directly as `is_public` default value
@@ -149,6 +203,15 @@ class File(PolymorphicModel, mixins.IconsMixin):
         default='application/octet-stream',
     )
 
+    # Set while the file is in the trash, see filer.trash
+    trashed_at = models.DateTimeField(
+        _("trashed at"),
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=True,
+    )
+
     objects = FileManager()
 
     class Meta:
@@ -171,7 +234,11 @@ class File(PolymorphicModel, mixins.IconsMixin):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._old_is_public = self.is_public
+        # Values as stored in the database, used to keep folder statistics in sync
+        self._old_folder_id = self.__dict__.get('folder_id', DEFERRED)
+        self._old_file_size = self.__dict__.get('_file_size', DEFERRED)
         self.file_data_changed(post_init=True)
+        self._thumbnails_changed = False
 
     @cached_property
     def mime_maintype(self):
@@ -197,18 +264,31 @@ class File(PolymorphicModel, mixins.IconsMixin):
             # When called from __init__, only update if values are empty.
             # This makes sure that nothing is done when instantiated from db.
             return False
+        # thumbnails of the previous file must not be looked up anymore
+        self._thumbnails_changed = True
         # cache the file size
         try:
             self._file_size = self.file.size
         except:   # noqa
             self._file_size = None
-        # generate SHA1 hash
-        try:
-            self.generate_sha1()
-        except Exception:
-            self.sha1 = ''
+        # generate SHA1 hash, unless it was computed while the file was uploaded
+        # (see filer.uploadhandler.Sha1UploadHandler and filer.metadata)
+        metadata = get_metadata(self.file)
+        sha1 = metadata.sha1 if metadata else getattr(getattr(self.file, '_file', None), 'sha1', None)
+        if sha1:
+            self.sha1 = sha1
+        else:
+            try:
+                self.generate_sha1()
+            except Exception:
+                self.sha1 = ''
         try:
-            self.mime_type = mimetypes.guess_type(self.file.name)[0] or 'application/octet-stream'
+            self.mime_type = (
+                mimetypes.guess_type(self.file.name)[0]
+                # sniffed from the content for names without a known extension
+                or (metadata.mime_type if metadata else None)
+                or 'application/octet-stream'
+            )
         except Exception:
             # Cannot find new mime-type? Keep existing
             pass
@@ -220,8 +300,12 @@ class File(PolymorphicModel, mixins.IconsMixin):
         Move the file from src to dst.
         """
         src_file_name = self.file.name
-        dst_file_name = self._meta.get_field('file').generate_filename(
-            self, self.original_filename)
+        deduplicate = filer_settings.FILER_DEDUPLICATE_FILES and self.sha1
+        if deduplicate:
+            dst_file_name = self._get_content_addressed_name()
+        else:
+            dst_file_name = self._meta.get_field('file').generate_filename(
+                self, self.original_filename)
 
         if self.is_public:
             src_storage = self.file.storages['private']
@@ -230,22 +314,27 @@ class File(PolymorphicModel, mixins.IconsMixin):
             src_storage = self.file.storages['public']
             dst_storage = self.file.storages['private']
 
-        # delete the thumbnail
-        # We are toggling the is_public to make sure that easy_thumbnails can
-        # delete the thumbnails
-        self.is_public = not self.is_public
-        self.file.delete_thumbnails()
-        self.is_public = not self.is_public
-        src_file = src_storage.open(src_file_name)
-        # This is needed because most of the remote File Storage backend do not
-        # open the file.
-        # Context manager closes file after reading contents
-        with src_file.open() as f:
-            content_file = ContentFile(f.read())
+        # The source file stays in place for the other files referencing it
+        src_referenced = self._is_file_referenced(src_file_name, not self.is_public)
+        if not src_referenced:
+            # delete the thumbnail
+            # We are toggling the is_public to make sure that easy_thumbnails can
+            # delete the thumbnails
+            self.is_public = not self.is_public
+            self.file.delete_thumbnails()
+            self.is_public = not self.is_public
+        self._thumbnails_changed = True
         # hint file_data_changed callback that data is actually unchanged
         self._file_data_changed_hint = False
-        self.file = dst_storage.save(dst_file_name, content_file)
-        src_storage.delete(src_file_name)
+        if deduplicate and self._is_stored(dst_storage, dst_file_name):
+            self.file = dst_file_name
+            if not src_referenced:
+                src_storage.delete(src_file_name)
+        elif src_referenced:
+            self.file = copy_file(src_storage, src_file_name, dst_storage, dst_file_name)
+        else:
+            # Renamed on the local file system, streamed between other storages
+            self.file = move_file(src_storage, src_file_name, dst_storage, dst_file_name)
 
     def _copy_file(self, destination, overwrite=False):
         """
@@ -259,17 +348,62 @@ class File(PolymorphicModel, mixins.IconsMixin):
             raise NotImplementedError
 
         src_file_name = self.file.name
+        if filer_settings.FILER_DEDUPLICATE_FILES and self.sha1 or filer_settings.FILER_COPY_MODE == 'reference':
+            # The copy references the same file
+            return src_file_name
         storage = self.file.storages['public' if self.is_public else 'private']
+        return copy_file(storage, src_file_name, storage, destination, link=filer_settings.FILER_COPY_MODE == 'link')
 
-        src_file = storage.open(src_file_name)
+    def _unshare_file(self):
+        """
+        Gives the file a copy of its stored file of its own if other files
+        reference it, e.g., copies in the "reference" ``FILER_COPY_MODE``,
+        before it is changed.
+        """
+        if not self._is_file_referenced(self.file.name, self.is_public):
+            return
+        storage = self.file.storages['public' if self.is_public else 'private']
+        file_name = self._meta.get_field('file').generate_filename(self, self.original_filename)
+        # hint file_data_changed callback that data is actually unchanged
+        self._file_data_changed_hint = False
+        self.file = copy_file(storage, self.file.name, storage, file_name)
+
+    def _get_content_addressed_name(self):
+        """
+        Returns the name of the file in the storage if files are deduplicated
+        (see ``FILER_DEDUPLICATE_FILES``), derived from its SHA-1 digest.
+        """
+        name = content_addressed(self, self.file.name)
+        storage_settings = filer_settings.FILER_STORAGES['public' if self.is_public else 'private']['main']
+        prefix = storage_settings.get('UPLOAD_TO_PREFIX')
+        return os.path.join(prefix, name) if prefix else name
+
+    def _is_stored(self, storage, name):
+        # Guards against reusing a file of another size, in the unlikely case of a collision
         try:
-            # This is needed because most of the remote File Storage backend do not
-            # open the file. Re-opening would create a value error.
-            src_file.open()
-        except ValueError:  # pragma: no cover
-            # If a validation error is raised, the file is already open.
-            pass
-        return storage.save(destination, ContentFile(src_file.read()))
+            return storage.exists(name) and storage.size(name) == self._file_size
+        except (OSError, NotImplementedError):
+            return False
+
+    def _deduplicate_file(self):
+        """
+        Stores a new file under the name derived from its content, or references
+        the stored file with the same content instead of storing it again.
+        """
+        name = self._get_content_addressed_name()
+        storage = self.file.storage
+        if not self._is_stored(storage, name):
+            self.file.file.seek(0)
+            name = storage.save(name, self.file.file)
+        self.file.name = name
+        self.file._committed = True
+
+    def _is_file_referenced(self, name, is_public):
+        """
+        Returns whether files other than this one reference the file ``name``
+        in the public or private storage.
+        """
+        return File.objects.filter(file=name, is_public=is_public).exclude(pk=self.pk).exists()
 
     def generate_sha1(self):
         sha = hashlib.sha1()
@@ -296,14 +430,46 @@ class File(PolymorphicModel, mixins.IconsMixin):
         if self._old_is_public != self.is_public and self.pk:
             self._move_file()
             self._old_is_public = self.is_public
-        super().save(*args, **kwargs)
+        if filer_settings.FILER_DEDUPLICATE_FILES and self.file and not self.file._committed and self.sha1:
+            self._deduplicate_file()
+        with transaction.atomic(using=router.db_for_write(File, instance=self)):
+            adding = self.pk is None
+            if not adding and DEFERRED in (self._old_folder_id, self._old_file_size):
+                self._old_folder_id, self._old_file_size = File.objects.non_polymorphic().filter(
+                    pk=self.pk).values_list('folder_id', '_file_size').first() or (None, None)
+            super().save(*args, **kwargs)
+            self._update_folder_statistics(adding)
+            if not adding and (self._thumbnails_changed or self._old_folder_id != self.folder_id):
+                ThumbnailIndex.objects.filter(file=self).delete()
+        self._thumbnails_changed = False
+        self._old_folder_id = self.folder_id
+        self._old_file_size = self._file_size
     save.alters_data = True
 
+    def _update_folder_statistics(self, adding):
+        size = self._file_size or 0
+        if adding:
+            Folder.objects.update_statistics(self.folder_id, file_count=1, size=size)
+        elif self._old_folder_id != self.folder_id:
+            Folder.objects.update_statistics(self._old_folder_id, file_count=-1, size=-(self._old_file_size or 0))
+            Folder.objects.update_statistics(self.folder_id, file_count=1, size=size)
+        elif (self._old_file_size or 0) != size:
+            Folder.objects.update_statistics(self.folder_id, size=size - (self._old_file_size or 0))
+
+    def index_thumbnails(self, thumbnails):
+        """
+        Records the given ``{options key: thumbnail name}`` in the thumbnail
+        index of this file.
+        """
+        if self.pk is not None and thumbnails:
+            ThumbnailIndex.objects.record(self.pk, thumbnails)
+
     def delete(self, *args, **kwargs):
         # Delete the model before the file
         super().delete(*args, **kwargs)
-        # Delete the file if there are no other Files referencing it.
-        if not File.objects.filter(file=self.file.name, is_public=self.is_public).exists():
+        # Delete the file if there are no other Files referencing it, e.g.,
+        # deduplicated files with the same content (see FILER_DEDUPLICATE_FILES).
+        if not self._is_file_referenced(self.file.name, self.is_public):
             self.file.delete(False)
     delete.alters_data = True
 
@@ -440,3 +606,126 @@ class File(PolymorphicModel, mixins.IconsMixin):
     @property
     def duplicates(self):
         return File.objects.find_duplicates(self)
+
+
+class ThumbnailIndexManager(models.Manager):
+    def record(self, file_id, thumbnails):
+        """
+        Inserts or updates the ``{options key: thumbnail name}`` entries of the
+        file ``file_id`` with a single query.
+        """
+        modified = django_timezone.now()
+        connection = connections[router.db_for_write(self.model)]
+        unique_fields = ['file', 'key'] if connection.features.supports_update_conflicts_with_target else None
+        self.bulk_create(
+            [self.model(file_id=file_id, key=key, name=name, modified=modified) for key, name in thumbnails.items()],
+            update_conflicts=True, unique_fields=unique_fields, update_fields=['name', 'modified'],
+        )
+
+
+class ThumbnailIndex(models.Model):
+    """
+    Maps a file and the key of a set of thumbnail options (see
+    ``filer.utils.filer_easy_thumbnails.get_thumbnail_index_key``) to the name
+    of the generated thumbnail. The directory listing looks up the icons of a
+    page with an indexed join on this table instead of searching
+    easy-thumbnails' thumbnails by name.
+
+    Entries are written whenever filer generates or serves a thumbnail and
+    removed when the file is replaced or moved.
+    """
+    file = models.ForeignKey(
+        File,
+        related_name='thumbnail_index',
+        on_delete=models.CASCADE,
+        verbose_name=_("file"),
+    )
+
+    key = models.CharField(
+        _("options key"),
+        max_length=255,
+    )
+
+    name = models.CharField(
+        _("thumbnail name"),
+        max_length=255,
+    )
+
+    modified = models.DateTimeField(
+        _("modified"),
+        default=django_timezone.now,
+    )
+
+    objects = ThumbnailIndexManager()
+
+    class Meta:
+        app_label = 'filer'
+        verbose_name = _("thumbnail index entry")
+        verbose_name_plural = _("thumbnail index entries")
+        constraints = [
+            models.UniqueConstraint(fields=['file', 'key'], name='filer_thumbnailindex_file_key'),
+        ]
+
+    def __str__(self):
+        return self.name
+
+
+class ThumbnailJob(models.Model):
+    """
+    A thumbnail waiting to be generated by the database backed thumbnail queue
+    (see ``filer.thumbnail_queue.DatabaseQueue``). There is at most one job per
+    file and set of thumbnail options; a job is claimed by a worker by setting
+    ``claimed_at`` and deleted once the thumbnail has been generated, or once
+    it has failed too often.
+    """
+    file = models.ForeignKey(
+        File,
+        related_name='thumbnail_jobs',
+        on_delete=models.CASCADE,
+        verbose_name=_("file"),
+    )
+
+    key = models.CharField(
+        _("options key"),
+        max_length=255,
+    )
+
+    options = models.JSONField(
+        _("thumbnail options"),
+    )
+
+    created_at = models.DateTimeField(
+        _("created at"),
+        default=django_timezone.now,
+    )
+
+    claimed_at = models.DateTimeField(
+        _("claimed at"),
+        null=True,
+        blank=True,
+    )
+
+    attempts = models.PositiveSmallIntegerField(
+        _("failed attempts"),
+        default=0,
+    )
+
+    class Meta:
+        app_label = 'filer'
+        verbose_name = _("thumbnail job")
+        verbose_name_plural = _("thumbnail jobs")
+        constraints = [
+            models.UniqueConstraint(fields=['file', 'key'], name='filer_thumbnailjob_file_key'),
+        ]
+
+    def __str__(self):
+        return f'{self.file_id} {self.key}'
+
+
+@receiver(pre_delete, sender=File, dispatch_uid='filer_file_statistics')
+def update_statistics_on_file_delete(sender, instance, **kwargs):
+    # Sent once per file, also for subclasses (as the parent model) and for queryset deletes.
+    # Files in the trash have been subtracted when they were trashed.
+    if instance.trashed_at is not None:
+        return
+    Folder.objects.update_statistics(instance.folder_id, file_count=-1, size=-(instance._file_size or 0))
@@ -1,8 +1,17 @@
+import itertools
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+
 from django.conf import settings
 from django.contrib.auth import models as auth_models
 from django.core.exceptions import ValidationError
-from django.db import models
-from django.db.models import Q
+from django.db import IntegrityError, connections, models, router, transaction
+from django.db.models import DEFERRED, Case, Count, Exists, F, Max, OuterRef, Q, Sum, Value, When
+from django.db.models.functions import Concat, Length, Substr
+from django.db.models.lookups import Contains, StartsWith
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
 from django.urls import reverse
 from django.utils.functional import cached_property
 from django.utils.html import format_html, format_html_join
@@ -10,7 +19,11 @@ from django.utils.translation import gettext
 from django.utils.translation import gettext_lazy as _
 
 from .. import settings as filer_settings
-from ..cache import get_folder_permission_cache, update_folder_permission_cache
+from ..cache import (
+    bump_folder_permission_version, bump_folder_tree_version, get_folder_ancestors_cache, get_folder_permission_cache,
+    get_folder_permission_generation, update_folder_ancestors_cache, update_folder_permission_cache,
+)
+from ..utils.idset import IdSet
 from . import mixins
 
 
@@ -36,49 +49,364 @@ class FolderPermissionManager(models.Manager):
         if user.is_superuser or not filer_settings.FILER_ENABLE_PERMISSIONS:
             return 'All'
         cached_id_list = get_folder_permission_cache(user, attr)
-        if cached_id_list:
+        if cached_id_list is not None:
             return cached_id_list
 
-        allow_list = set()
-        deny_list = set()
-        group_ids = user.groups.all().values_list('id', flat=True)
-        q = Q(user=user) | Q(group__in=group_ids) | Q(everybody=True)
-        perms = self.filter(q)
+        if self.applicable_to(user).filter(folder__isnull=True, **{attr: FolderPermission.ALLOW}).exists():
+            # Granted on all folders: only keep the (usually few) denied ones
+            denied = Folder.objects.filter(
+                Exists(Folder.objects.get_permission_rules(user).filter(**{attr: FolderPermission.DENY}))
+            )
+            id_list = IdSet(denied.values_list('id', flat=True), inverted=True)
+        else:
+            # Deny has precedence over allow
+            id_list = IdSet(
+                Folder.objects.filter(Folder.objects.get_permission_filter(user, attr)).values_list('id', flat=True)
+            )
+        update_folder_permission_cache(user, attr, id_list)
+        return id_list
 
-        for perm in perms:
-            p = getattr(perm, attr)
+    def get_id_list_for_request(self, request, permission_type):
+        """
+        Returns the id list of ``permission_type`` (``"read"``, ``"edit"`` or
+        ``"add_children"``) for the user of ``request``. It is resolved once per
+        request and shared by all folder and file instances checked during it.
+        Permission changes made by this process invalidate the memo.
+        """
+        memo = request.__dict__.get('_filer_permissions')
+        generation = get_folder_permission_generation()
+        if memo is None or memo['user'] != request.user.pk or memo['generation'] != generation:
+            memo = request._filer_permissions = {'user': request.user.pk, 'generation': generation}
+        if permission_type not in memo:
+            memo[permission_type] = getattr(self, f"get_{permission_type}_id_list")(request.user)
+        return memo[permission_type]
+
+    def applicable_to(self, user):
+        """
+        Returns the permissions granted to ``user`` directly, through one of
+        their groups or to everybody.
+        """
+        return self.filter(Q(user=user) | Q(group__in=user.groups.values('pk')) | Q(everybody=True))
 
-            if p is None:
-                # Not allow nor deny, we continue with the next permission
-                continue
 
-            if not perm.folder:
-                assert perm.type == FolderPermission.ALL
+STATISTICS_FIELDS = [
+    '_file_count', '_size', '_children_count', '_total_file_count', '_total_size', '_total_children_count',
+]
 
-                if p == FolderPermission.ALLOW:
-                    allow_list.update(Folder.objects.all().values_list('id', flat=True))
-                else:
-                    deny_list.update(Folder.objects.all().values_list('id', flat=True))
 
-                continue
+# Statistics changes collected by FolderManager.deferred_statistics()
+_deferred = threading.local()
 
-            folder_id = perm.folder.id
 
-            if p == FolderPermission.ALLOW:
-                allow_list.add(folder_id)
-            else:
-                deny_list.add(folder_id)
+def parse_tree_path(tree_path):
+    """
+    Returns the list of folder ids encoded in a ``tree_path``, root first.
+    """
+    return [int(pk) for pk in tree_path.strip('/').split('/') if pk]
 
-            if perm.type in [FolderPermission.ALL, FolderPermission.CHILDREN]:
-                if p == FolderPermission.ALLOW:
-                    allow_list.update(perm.folder.get_descendants_ids())
-                else:
-                    deny_list.update(perm.folder.get_descendants_ids())
 
-        # Deny has precedence over allow
-        id_list = allow_list - deny_list
-        update_folder_permission_cache(user, attr, id_list)
-        return id_list
+class FolderQuerySet(models.QuerySet):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._with_paths = False
+
+    def _clone(self):
+        clone = super()._clone()
+        clone._with_paths = self._with_paths
+        return clone
+
+    def _fetch_all(self):
+        fill_paths = self._with_paths and self._result_cache is None
+        super()._fetch_all()
+        if fill_paths:
+            self.fill_logical_paths(self._result_cache)
+
+    def get_permission_filter(self, user, attr):
+        """
+        Returns a boolean expression that is true for all folders on which the
+        FolderPermission rules grant ``attr`` (e.g., ``"can_read"``) to ``user``.
+        Rules of type ALL or CHILDREN are matched against the tree path, and
+        DENY takes precedence over ALLOW. Ownership is not taken into account.
+        """
+        rules = self.get_permission_rules(user)
+        return (
+            Exists(rules.filter(**{attr: FolderPermission.ALLOW}))
+            & ~Exists(rules.filter(**{attr: FolderPermission.DENY}))
+        )
+
+    def get_permission_rules(self, user):
+        """
+        Returns the permissions of ``user`` that apply to the folder referenced
+        by ``OuterRef('pk')``. Only usable as a subquery of a folder queryset.
+        """
+        # Descendants of the rule's folder have a tree path starting with the
+        # rule folder's children path, e.g. "/1/5/" for folder 5 in folder 1
+        children_tree_path = Concat('folder__tree_path', 'folder_id', Value('/'), output_field=models.CharField())
+        return FolderPermission.objects.applicable_to(user).filter(
+            Q(folder__isnull=True)
+            | Q(folder=OuterRef('pk'))
+            | Q(
+                StartsWith(OuterRef('tree_path'), children_tree_path),
+                type__in=[FolderPermission.ALL, FolderPermission.CHILDREN],
+            )
+        )
+
+    def with_permission(self, user, permission):
+        """
+        Returns the folders on which ``user`` has ``permission`` (``"read"``,
+        ``"edit"`` or ``"add_children"``) as a single query, following the same
+        rules as ``Folder.has_generic_permission``.
+        """
+        if not user.is_authenticated:
+            return self.none()
+        if user.is_superuser or not filer_settings.FILER_ENABLE_PERMISSIONS:
+            return self.all()
+        return self.filter(Q(owner=user) | self.get_permission_filter(user, f"can_{permission}"))
+
+    def readable_by(self, user):
+        return self.with_permission(user, 'read')
+
+    def editable_by(self, user):
+        return self.with_permission(user, 'edit')
+
+    def update_statistics(self, folder_id, file_count=0, size=0, children_count=0,
+                          total_file_count=None, total_size=None, total_children_count=None):
+        """
+        Adds the given deltas to the direct counters of the folder ``folder_id``
+        and to the recursive totals of that folder and all its ancestors. The
+        totals default to the deltas of the direct counters.
+        """
+        total_file_count = file_count if total_file_count is None else total_file_count
+        total_size = size if total_size is None else total_size
+        total_children_count = children_count if total_children_count is None else total_children_count
+        if folder_id is None or not any((file_count, size, children_count,
+                                         total_file_count, total_size, total_children_count)):
+            return
+        deferred = getattr(_deferred, 'statistics', None)
+        if deferred is not None:
+            tree_paths, changes = deferred
+            if folder_id not in tree_paths:
+                tree_paths[folder_id] = (
+                    self.model.objects.filter(pk=folder_id).values_list('tree_path', flat=True).first()
+                )
+            if tree_paths[folder_id] is None:
+                return
+            for ancestor_id in parse_tree_path(tree_paths[folder_id]) + [folder_id]:
+                deltas = changes[ancestor_id]
+                if ancestor_id == folder_id:
+                    deltas[0] += file_count
+                    deltas[1] += size
+                    deltas[2] += children_count
+                deltas[3] += total_file_count
+                deltas[4] += total_size
+                deltas[5] += total_children_count
+            return
+        tree_path = self.model.objects.filter(pk=folder_id).values_list('tree_path', flat=True).first()
+        if tree_path is None:
+            # The folder has been deleted
+            return
+
+        def direct(field, delta):
+            output_field = self.model._meta.get_field(field)
+            return Case(When(pk=folder_id, then=F(field) + delta), default=F(field), output_field=output_field)
+
+        self.model.objects.filter(pk__in=parse_tree_path(tree_path) + [folder_id]).update(
+            _file_count=direct('_file_count', file_count),
+            _size=direct('_size', size),
+            _children_count=direct('_children_count', children_count),
+            _total_file_count=F('_total_file_count') + total_file_count,
+            _total_size=F('_total_size') + total_size,
+            _total_children_count=F('_total_children_count') + total_children_count,
+        )
+
+    @contextmanager
+    def deferred_statistics(self, tree_paths=None):
+        """
+        Collects the changes of ``update_statistics()`` within the block and
+        applies them when it ends, with one update per distinct change rather
+        than two queries per call. ``tree_paths`` may map the ids of folders
+        to their known tree paths, e.g., of a subtree about to be deleted.
+        The changes are dropped if the block raises an exception.
+        """
+        if getattr(_deferred, 'statistics', None) is not None:
+            # Applied by the outermost block
+            _deferred.statistics[0].update(tree_paths or {})
+            yield
+            return
+        changes = defaultdict(lambda: [0] * len(STATISTICS_FIELDS))
+        _deferred.statistics = (dict(tree_paths or {}), changes)
+        try:
+            yield
+        finally:
+            _deferred.statistics = None
+        folder_ids = defaultdict(list)
+        for folder_id, deltas in changes.items():
+            if any(deltas):
+                folder_ids[tuple(deltas)].append(folder_id)
+        for deltas, ids in folder_ids.items():
+            # Deleted folders are not updated
+            self.model.objects.filter(pk__in=ids).update(**{
+                field: F(field) + delta for field, delta in zip(STATISTICS_FIELDS, deltas) if delta
+            })
+
+    def rebuild_statistics(self, batch_size=1000):
+        """
+        Recomputes the file, subfolder and size counters of all folders from
+        scratch. Returns the number of folders whose counters were corrected.
+        """
+        from .filemodels import File
+
+        stats = {
+            folder_id: dict.fromkeys(STATISTICS_FIELDS, 0)
+            for folder_id in self.model.objects.values_list('id', flat=True)
+        }
+        tree_paths = dict(self.model.objects.values_list('id', 'tree_path'))
+        # Items count in their folder unless they were trashed on their own,
+        # see filer.trash
+        trashed_at = dict(self.model.objects.values_list('id', 'trashed_at'))
+        file_stats = (
+            File.objects.non_polymorphic().filter(folder__isnull=False).order_by()
+            .values_list('folder_id', 'trashed_at').annotate(count=Count('pk'), size=Sum('_file_size'))
+        )
+        for folder_id, file_trashed_at, count, size in file_stats:
+            if file_trashed_at != trashed_at.get(folder_id):
+                continue
+            stats[folder_id]['_file_count'] += count
+            stats[folder_id]['_size'] += size or 0
+        children_stats = (
+            self.model.objects.filter(parent__isnull=False).order_by()
+            .values_list('parent_id', 'trashed_at').annotate(count=Count('pk'))
+        )
+        for folder_id, child_trashed_at, count in children_stats:
+            if child_trashed_at != trashed_at.get(folder_id):
+                continue
+            stats[folder_id]['_children_count'] += count
+        for folder_id, tree_path in tree_paths.items():
+            child_id = None
+            for ancestor_id in [folder_id] + parse_tree_path(tree_path)[::-1]:
+                if child_id is not None and trashed_at.get(child_id) != trashed_at.get(ancestor_id):
+                    # Not counted above a folder trashed on its own
+                    break
+                child_id = ancestor_id
+                if ancestor_id not in stats:
+                    continue
+                stats[ancestor_id]['_total_file_count'] += stats[folder_id]['_file_count']
+                stats[ancestor_id]['_total_size'] += stats[folder_id]['_size']
+                stats[ancestor_id]['_total_children_count'] += stats[folder_id]['_children_count']
+
+        changed = []
+        for folder in self.model.objects.only('id', *STATISTICS_FIELDS).iterator():
+            values = stats[folder.id]
+            if any(getattr(folder, field) != value for field, value in values.items()):
+                for field, value in values.items():
+                    setattr(folder, field, value)
+                changed.append(folder)
+        self.model.objects.bulk_update(changed, STATISTICS_FIELDS, batch_size=batch_size)
+        return len(changed)
+
+    def with_paths(self):
+        """
+        Returns a queryset whose folders come with their ``logical_path``
+        already set, resolving the ancestors of all folders at once.
+        """
+        clone = self._chain()
+        clone._with_paths = True
+        return clone
+
+    def get_ancestors_map(self, folders):
+        """
+        Returns a dict mapping the parent ids of the given folders to the list
+        of folders from the root down to and including that parent. Ancestors
+        are read from the cache or fetched with a single query.
+        """
+        tree_paths = {
+            folder.parent_id: folder.tree_path for folder in folders if folder.parent_id is not None
+        }
+        ancestors = get_folder_ancestors_cache(tree_paths.keys())
+        missing = {
+            parent_id: parse_tree_path(tree_path)
+            for parent_id, tree_path in tree_paths.items() if parent_id not in ancestors
+        }
+        if missing:
+            ancestor_ids = set(itertools.chain.from_iterable(missing.values()))
+            fetched = self.model.objects.in_bulk(ancestor_ids)
+            resolved = {
+                parent_id: [fetched[pk] for pk in chain]
+                for parent_id, chain in missing.items()
+                if chain and chain[-1] == parent_id and all(pk in fetched for pk in chain)
+            }
+            update_folder_ancestors_cache(resolved)
+            ancestors.update(resolved)
+        return ancestors
+
+    def fill_logical_paths(self, folders):
+        """
+        Sets ``logical_path`` on all given folders (and their ancestors).
+        """
+        folders = [folder for folder in folders if isinstance(folder, Folder)]
+        ancestors = self.get_ancestors_map(folders)
+        for chain in ancestors.values():
+            for index, ancestor in enumerate(chain):
+                ancestor.logical_path = chain[:index]
+        for folder in folders:
+            if folder.parent_id is None:
+                folder.logical_path = []
+            elif folder.parent_id in ancestors:
+                folder.logical_path = list(ancestors[folder.parent_id])
+
+    def descendants_of(self, folder, include_self=False):
+        """
+        Returns all folders below ``folder`` in a single query using the
+        materialized ``tree_path``.
+        """
+        q = Q(tree_path__startswith=folder.get_children_tree_path())
+        if include_self:
+            q |= Q(pk=folder.pk)
+        return self.filter(q)
+
+    def subtrees_of(self, folders):
+        """
+        Returns ``folders`` together with all their descendants in a single
+        query. ``folders`` may be a queryset or an iterable of folders or ids.
+        """
+        if isinstance(folders, models.QuerySet):
+            roots = self.model.objects.filter(pk__in=folders.values('pk'))
+        else:
+            roots = self.model.objects.filter(pk__in=[getattr(folder, 'pk', folder) for folder in folders])
+        below_root = roots.filter(
+            Contains(OuterRef('tree_path'), Concat(Value('/'), 'pk', Value('/'), output_field=models.CharField()))
+        )
+        return self.filter(Q(pk__in=roots.values('pk')) | Exists(below_root))
+
+    def rebuild_tree_paths(self, batch_size=1000):
+        """
+        Recomputes ``tree_path`` for all folders from their ``parent`` relation.
+        Returns the number of folders whose path had to be corrected.
+        """
+        parents = dict(self.model.objects.values_list('id', 'parent_id'))
+        paths = {}
+
+        def compute_path(folder_id):
+            chain = []
+            parent_id = parents.get(folder_id)
+            while parent_id is not None and parent_id not in paths:
+                chain.append(parent_id)
+                parent_id = parents.get(parent_id)
+            path = paths[parent_id] + f"{parent_id}/" if parent_id is not None else "/"
+            for ancestor_id in reversed(chain):
+                paths[ancestor_id] = path
+                path = f"{path}{ancestor_id}/"
+            return path
+
+        changed = []
+        for folder in self.model.objects.only('id', 'tree_path').iterator():
+            path = compute_path(folder.id)
+            paths[folder.id] = path
+            if folder.tree_path != path:
+                folder.tree_path = path
+                changed.append(folder)
+        self.model.objects.bulk_update(changed, ['tree_path'], batch_size=batch_size)
+        return len(changed)
 
 
 class Folder(models.Model, mixins.IconsMixin):
@@ -134,8 +462,37 @@ class Folder(models.Model, mixins.IconsMixin):
         auto_now=True,
     )
 
+    tree_path = models.CharField(
+        _('tree path'),
+        max_length=255,
+        default='/',
+        editable=False,
+        db_index=True,
+        help_text=_('Materialized path of ancestor ids, e.g. "/1/5/".'),
+    )
+
+    # Denormalized statistics, maintained by Folder.objects.update_statistics()
+    _file_count = models.IntegerField(_('file count'), default=0, editable=False)
+    _size = models.BigIntegerField(_('size'), default=0, editable=False)
+    _children_count = models.IntegerField(_('subfolder count'), default=0, editable=False)
+    _total_file_count = models.IntegerField(_('total file count'), default=0, editable=False)
+    _total_size = models.BigIntegerField(_('total size'), default=0, editable=False)
+    _total_children_count = models.IntegerField(_('total subfolder count'), default=0, editable=False)
+
+    # Set while the folder is in the trash, see filer.trash
+    trashed_at = models.DateTimeField(_('trashed at'), null=True, blank=True, editable=False, db_index=True)
+
+    objects = FolderQuerySet.as_manager()
+
     class Meta:
-        unique_together = (('parent', 'name'),)
+        constraints = [
+            # Folders in the trash do not block their names
+            models.UniqueConstraint(
+                fields=['parent', 'name'],
+                condition=Q(trashed_at__isnull=True),
+                name='filer_folder_unique_name',
+            ),
+        ]
         ordering = ('name',)
         permissions = (("can_use_directory_listing",
                         "Can use directory listing"),)
@@ -143,23 +500,174 @@ class Folder(models.Model, mixins.IconsMixin):
         verbose_name = _("Folder")
         verbose_name_plural = _("Folders")
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Not loaded for instances fetched with .only() or .defer()
+        self._old_parent_id = self.__dict__.get('parent_id', DEFERRED)
+        self._old_name = self.__dict__.get('name', DEFERRED)
+
     def __str__(self):
         return self.pretty_logical_path
 
     def __repr__(self):
         return f'<{self.__class__.__name__}(pk={self.pk}): {self.pretty_logical_path}>'
 
+    def save(self, *args, **kwargs):
+        using = kwargs.get('using') or router.db_for_write(Folder, instance=self)
+        with transaction.atomic(using=using):
+            if not connections[using].features.supports_partial_indexes:
+                # The database ignores the conditional unique constraint on the name
+                self.check_unique_name(using)
+            renamed = self._is_renamed(kwargs.get('update_fields'))
+            tree_changed = self._save_and_update_tree(*args, **kwargs)
+        if tree_changed or renamed:
+            # Cached ancestor lists only depend on the names and the parents,
+            # saving other fields, e.g., the statistics, keeps them valid
+            bump_folder_tree_version()
+        if tree_changed:
+            # Permissions of type CHILDREN or ALL extend to new or moved folders
+            bump_folder_permission_version()
+        self._old_name = self.__dict__.get('name', DEFERRED)
+    save.alters_data = True
+
+    def _is_renamed(self, update_fields=None):
+        """
+        Returns whether saving the folder changes the name it was loaded with.
+        """
+        if self.pk is None or 'name' not in self.__dict__:
+            return False
+        if update_fields is not None and 'name' not in update_fields:
+            return False
+        return self._old_name != self.name
+
+    def _save_and_update_tree(self, *args, **kwargs):
+        """
+        Saves the folder and keeps the tree paths and the statistics of the
+        tree in sync. Returns whether the folder was added or moved.
+        """
+        adding = self.pk is None
+        moved = False
+        old_children_path = None
+        if not adding and 'parent_id' in self.__dict__ and self._old_parent_id != self.parent_id:
+            # The instance may be stale, the stored parent and path are authoritative
+            stored = Folder.objects.filter(pk=self.pk).values_list('parent_id', 'tree_path').first()
+            if stored is not None and stored[0] != self.parent_id:
+                moved = True
+                self._old_parent_id = stored[0]
+                old_children_path = f"{stored[1]}{self.pk}/"
+        if adding or moved:
+            if self.parent_id is None:
+                self.tree_path = '/'
+            else:
+                # Read the parent's path from the database, the parent instance may be stale
+                parent_path = Folder.objects.filter(pk=self.parent_id).values_list('tree_path', flat=True).first()
+                self.tree_path = f"{parent_path or '/'}{self.parent_id}/"
+            self.check_tree_path_length(old_children_path)
+        if not self._state.adding and kwargs.get('update_fields') is None and not kwargs.get('force_insert'):
+            # Never overwrite the statistics maintained by update_statistics(),
+            # nor the tree path of an unmoved folder, with stale values
+            excluded = set(STATISTICS_FIELDS) | self.get_deferred_fields()
+            if not moved:
+                excluded.add('tree_path')
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in excluded and field.attname not in excluded
+            ]
+        super().save(*args, **kwargs)
+        if adding:
+            Folder.objects.update_statistics(self.parent_id, children_count=1)
+        elif moved:
+            totals = Folder.objects.filter(pk=self.pk).values(
+                '_total_file_count', '_total_size', '_total_children_count').get()
+            for parent_id, sign in ((self._old_parent_id, -1), (self.parent_id, 1)):
+                Folder.objects.update_statistics(
+                    parent_id,
+                    children_count=sign,
+                    total_file_count=sign * totals['_total_file_count'],
+                    total_size=sign * totals['_total_size'],
+                    total_children_count=sign * (totals['_total_children_count'] + 1),
+                )
+        if old_children_path is not None:
+            # Rewrite the path prefix of the whole subtree in one UPDATE
+            Folder.objects.filter(tree_path__startswith=old_children_path).update(
+                tree_path=Concat(
+                    Value(self.get_children_tree_path()),
+                    Substr('tree_path', len(old_children_path) + 1),
+                    output_field=models.CharField(),
+                )
+            )
+        self._old_parent_id = self.parent_id
+        return adding or moved
+
+    def check_unique_name(self, using=None):
+        """
+        Raises ``IntegrityError`` if another folder outside the trash has the
+        name of this folder in the same parent, like the ``filer_folder_unique_name``
+        constraint does on databases supporting conditional constraints.
+        """
+        if self.trashed_at is not None or self.__dict__.get('parent_id') is None or 'name' not in self.__dict__:
+            return
+        siblings = Folder.objects.using(using).filter(
+            parent_id=self.parent_id, name=self.name, trashed_at__isnull=True,
+        )
+        if self.pk is not None:
+            siblings = siblings.exclude(pk=self.pk)
+        if siblings.exists():
+            raise IntegrityError(f'A folder named "{self.name}" already exists in folder {self.parent_id}.')
+
+    def check_tree_path_length(self, old_children_path=None):
+        """
+        Raises ``ValidationError`` if the ``tree_path`` of this folder, or of
+        its descendants once moved from ``old_children_path``, does not fit
+        into the column: the tree would be too deep.
+        """
+        max_length = self._meta.get_field('tree_path').max_length
+        length = len(self.tree_path)
+        if old_children_path is not None:
+            longest = Folder.objects.filter(tree_path__startswith=old_children_path).aggregate(
+                longest=Max(Length('tree_path')),
+            )['longest']
+            if longest is not None:
+                length = longest - len(old_children_path) + len(self.get_children_tree_path())
+        if length > max_length:
+            raise ValidationError(
+                _('The folder tree is too deep, the tree path of "%(name)s" would exceed %(max_length)d characters.'),
+                code='tree_too_deep',
+                params={'name': self.name, 'max_length': max_length},
+            )
+
+    def get_children_tree_path(self):
+        """
+        Returns the ``tree_path`` prefix shared by all descendants of this folder.
+        """
+        return f"{self.tree_path}{self.pk}/"
+
     @property
     def file_count(self):
-        if not hasattr(self, '_file_count_cache'):
-            self._file_count_cache = self.files.count()
-        return self._file_count_cache
+        return self._file_count
 
     @property
     def children_count(self):
-        if not hasattr(self, '_children_count_cache'):
-            self._children_count_cache = self.children.count()
-        return self._children_count_cache
+        return self._children_count
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def total_file_count(self):
+        """Number of files in this folder and all its subfolders"""
+        return self._total_file_count
+
+    @property
+    def total_children_count(self):
+        """Number of all subfolders, including nested ones"""
+        return self._total_children_count
+
+    @property
+    def total_size(self):
+        """Size in bytes of all files in this folder and all its subfolders"""
+        return self._total_size
 
     @property
     def item_count(self):
@@ -167,7 +675,7 @@ class Folder(models.Model, mixins.IconsMixin):
 
     @property
     def files(self):
-        return self.all_files.all()
+        return self.all_files.filter(trashed_at__isnull=True)
 
     @cached_property
     def logical_path(self):
@@ -175,18 +683,20 @@ class Folder(models.Model, mixins.IconsMixin):
         Gets logical path of the folder in the tree structure.
         Used to generate breadcrumbs
         """
+        if self.parent_id is None:
+            return []
+        if self.pk is not None and self._old_parent_id == self.parent_id:
+            chain = Folder.objects.get_ancestors_map([self]).get(self.parent_id)
+            if chain is not None:
+                return list(chain)
+        # Unsaved or inconsistent tree path: walk up the parents
         folder_path = []
-        if self.parent:
-            folder_path.extend(self.parent.logical_path)
-            folder_path.append(self.parent)
+        folder_path.extend(self.parent.logical_path)
+        folder_path.append(self.parent)
         return folder_path
 
     def get_descendants_ids(self):
-        desc = []
-        for child in self.children.all():
-            desc.append(child.id)
-            desc.extend(child.get_descendants_ids())
-        return desc
+        return list(Folder.objects.descendants_of(self).values_list('id', flat=True))
 
     @property
     def pretty_logical_path(self):
@@ -214,26 +724,8 @@ class Folder(models.Model, mixins.IconsMixin):
         elif user == self.owner:
             return True
         else:
-            if not hasattr(self, "permission_cache") or\
-               permission_type not in self.permission_cache or \
-               request.user.pk != self.permission_cache['user'].pk:
-                if not hasattr(self, "permission_cache") or request.user.pk != self.permission_cache['user'].pk:
-                    self.permission_cache = {
-                        'user': request.user,
-                    }
-
-                # This calls methods on the manager i.e. get_read_id_list()
-                func = getattr(FolderPermission.objects,
-                               "get_%s_id_list" % permission_type)
-                permission = func(user)
-                if permission == "All":
-                    self.permission_cache[permission_type] = True
-                    self.permission_cache['read'] = True
-                    self.permission_cache['edit'] = True
-                    self.permission_cache['add_children'] = True
-                else:
-                    self.permission_cache[permission_type] = self.id in permission
-            return self.permission_cache[permission_type]
+            permission = FolderPermission.objects.get_id_list_for_request(request, permission_type)
+            return permission == 'All' or self.id in permission
 
     def get_admin_change_url(self):
         return reverse('admin:filer_folder_change', args=(self.id,))
@@ -249,12 +741,21 @@ class Folder(models.Model, mixins.IconsMixin):
 
     def contains_folder(self, folder_name):
         try:
-            self.children.get(name=folder_name)
+            self.children.get(name=folder_name, trashed_at__isnull=True)
             return True
         except Folder.DoesNotExist:
             return False
 
 
+@receiver(pre_delete, sender=Folder, dispatch_uid='filer_folder_statistics')
+def update_statistics_on_folder_delete(sender, instance, **kwargs):
+    # pre_delete: when a subtree is deleted, the parents are still present.
+    # Folders in the trash have been subtracted when they were trashed.
+    if instance.trashed_at is not None:
+        return
+    Folder.objects.update_statistics(instance.parent_id, children_count=-1)
+
+
 class FolderPermission(models.Model):
     ALL = 0
     THIS = 1
@@ -406,3 +907,16 @@ class FolderPermission(models.Model):
         return format_html_join(", ", '{}', ((p,) for p in perms))
 
     what.short_description = _("What")
+
+
+@receiver(post_save, sender=FolderPermission, dispatch_uid='filer_folder_permission_saved')
+@receiver(post_delete, sender=FolderPermission, dispatch_uid='filer_folder_permission_deleted')
+@receiver(post_delete, sender=Folder, dispatch_uid='filer_folder_deleted')
+def invalidate_folder_permission_cache(sender, **kwargs):
+    bump_folder_permission_version()
+
+
+def invalidate_folder_permission_cache_on_group_change(sender, action, **kwargs):
+    # Connected to the user model's groups relation in FilerConfig.ready()
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        bump_folder_permission_version()
@@ -1,11 +1,11 @@
 import logging
-from datetime import datetime
 
-from django.conf import settings
 from django.db import models
-from django.utils.timezone import get_current_timezone, make_aware, now
+from django.utils.timezone import now
 from django.utils.translation import gettext_lazy as _
 
+from ..metadata import get_metadata
+from ..utils.pil_exif import get_date_taken
 from .abstract import BaseImage
 
 
@@ -44,23 +44,12 @@ class Image(BaseImage):
 
     def save(self, *args, **kwargs):
         if self.date_taken is None:
-            try:
-                exif_date = self.exif.get('DateTimeOriginal', None)
-                if exif_date is not None:
-                    d, t = exif_date.split(" ")
-                    year, month, day = d.split(':')
-                    hour, minute, second = t.split(':')
-                    if getattr(settings, "USE_TZ", False):
-                        tz = get_current_timezone()
-                        self.date_taken = make_aware(datetime(
-                            int(year), int(month), int(day),
-                            int(hour), int(minute), int(second)), tz)
-                    else:
-                        self.date_taken = datetime(
-                            int(year), int(month), int(day),
-                            int(hour), int(minute), int(second))
-            except Exception:
-                pass
+            metadata = get_metadata(self.file)
+            if metadata is not None:
+                # Read along with the upload, see filer.metadata
+                self.date_taken = metadata.date_taken
+            else:
+                self.date_taken = get_date_taken(self.exif)
         if self.date_taken is None:
             self.date_taken = now()
         super().save(*args, **kwargs)
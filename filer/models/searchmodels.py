@@ -0,0 +1,72 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class SearchIndex(models.Model):
+    """
+    The searchable text of a file or folder, normalized to lower case. The
+    admin search matches its terms against these documents through the
+    configured search backend (see ``filer.search``) instead of scanning the
+    file, folder and user tables.
+    """
+    FILE = 'file'
+    FOLDER = 'folder'
+    KIND_CHOICES = (
+        (FILE, _('file')),
+        (FOLDER, _('folder')),
+    )
+
+    kind = models.CharField(
+        _("kind"),
+        max_length=10,
+        choices=KIND_CHOICES,
+    )
+
+    object_id = models.PositiveIntegerField(
+        _("object id"),
+    )
+
+    document = models.TextField(
+        _("document"),
+        blank=True,
+    )
+
+    class Meta:
+        app_label = 'filer'
+        verbose_name = _("search index entry")
+        verbose_name_plural = _("search index entries")
+        constraints = [
+            models.UniqueConstraint(fields=['kind', 'object_id'], name='filer_searchindex_kind_object'),
+        ]
+
+    def __str__(self):
+        return f'{self.kind} {self.object_id}'
+
+
+class SearchTrigram(models.Model):
+    """
+    The trigrams of a search index document, used by the database independent
+    ``TrigramSearchBackend``.
+    """
+    entry = models.ForeignKey(
+        SearchIndex,
+        related_name='trigrams',
+        on_delete=models.CASCADE,
+        verbose_name=_("search index entry"),
+    )
+
+    trigram = models.CharField(
+        _("trigram"),
+        max_length=3,
+    )
+
+    class Meta:
+        app_label = 'filer'
+        verbose_name = _("search trigram")
+        verbose_name_plural = _("search trigrams")
+        indexes = [
+            models.Index(fields=['trigram', 'entry'], name='filer_searchtrigram_lookup'),
+        ]
+
+    def __str__(self):
+        return self.trigram
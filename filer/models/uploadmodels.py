@@ -0,0 +1,254 @@
+import hashlib
+import os
+import tempfile
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from .. import settings as filer_settings
+from .foldermodels import Folder
+
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # Not available on Windows
+    fcntl = None
+
+
+__all__ = ['UploadSession']
+
+
+def get_staging_dir():
+    """
+    Returns the directory the chunks of resumable uploads are written to
+    (``FILER_UPLOADER_STAGING_DIR``).
+    """
+    directory = filer_settings.FILER_UPLOADER_STAGING_DIR or os.path.join(
+        settings.FILE_UPLOAD_TEMP_DIR or tempfile.gettempdir(), 'filer-uploads',
+    )
+    os.makedirs(directory, exist_ok=True)
+    return directory
+
+
+class UploadConflict(Exception):
+    """
+    A chunk does not continue the upload at its current offset, or another
+    request is writing to the same upload.
+    """
+
+
+# The SHA-1 state of the uploads received by this process, keyed by session
+# id, as (offset, digest). Hash objects cannot be stored in the database, so a
+# chunk received by another process hashes the staged data again once.
+_digests = OrderedDict()
+_digests_lock = threading.Lock()
+_MAX_DIGESTS = 256
+
+
+class StagedUpload(UploadedFile):
+    """
+    The completely received file of an upload session. As with Django's
+    ``TemporaryUploadedFile``, ``FileSystemStorage`` moves it into place
+    instead of copying its content.
+    """
+    def __init__(self, path, name, content_type, size, sha1):
+        super().__init__(open(path, 'rb'), name, content_type, size)
+        self.sha1 = sha1
+
+    def temporary_file_path(self):
+        return self.file.name
+
+    def close(self):
+        try:
+            return self.file.close()
+        except FileNotFoundError:
+            # The file was moved into the storage
+            pass
+
+
+class UploadSessionManager(models.Manager):
+    def expired(self):
+        """
+        Returns the sessions which did not receive any data for
+        ``FILER_UPLOADER_SESSION_EXPIRY`` seconds.
+        """
+        expiry = timedelta(seconds=filer_settings.FILER_UPLOADER_SESSION_EXPIRY)
+        return self.filter(updated_at__lt=timezone.now() - expiry)
+
+    def delete_expired(self):
+        """
+        Deletes the expired sessions and their staged data, returns their
+        number.
+        """
+        count = 0
+        for upload_session in self.expired():
+            upload_session.discard()
+            count += 1
+        return count
+
+
+class UploadSession(models.Model):
+    """
+    A resumable upload from the uploader. Its data is received in chunks,
+    appended to a staging file (see ``FILER_UPLOADER_STAGING_DIR``) and hashed
+    on the way. Once ``offset`` reaches ``size``, the staging file becomes the
+    file of a new ``File``.
+    """
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False,
+    )
+
+    owner = models.ForeignKey(
+        getattr(settings, 'AUTH_USER_MODEL', 'auth.User'),
+        related_name='filer_upload_sessions',
+        on_delete=models.CASCADE,
+        verbose_name=_("owner"),
+    )
+
+    folder = models.ForeignKey(
+        Folder,
+        related_name='upload_sessions',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        verbose_name=_("folder"),
+    )
+
+    filename = models.CharField(
+        _("file name"),
+        max_length=255,
+    )
+
+    size = models.BigIntegerField(
+        _("size"),
+    )
+
+    offset = models.BigIntegerField(
+        _("offset"),
+        default=0,
+    )
+
+    created_at = models.DateTimeField(
+        _("created at"),
+        default=timezone.now,
+    )
+
+    updated_at = models.DateTimeField(
+        _("updated at"),
+        default=timezone.now,
+        db_index=True,
+    )
+
+    objects = UploadSessionManager()
+
+    class Meta:
+        app_label = 'filer'
+        verbose_name = _("upload session")
+        verbose_name_plural = _("upload sessions")
+
+    def __str__(self):
+        return f'{self.filename} ({self.offset}/{self.size})'
+
+    @property
+    def path(self):
+        return os.path.join(get_staging_dir(), f'{self.pk.hex}.part')
+
+    @property
+    def is_complete(self):
+        return self.offset == self.size
+
+    def is_expired(self):
+        return self.updated_at < timezone.now() - timedelta(seconds=filer_settings.FILER_UPLOADER_SESSION_EXPIRY)
+
+    def save(self, *args, **kwargs):
+        if self._state.adding:
+            open(self.path, 'xb').close()
+        super().save(*args, **kwargs)
+
+    def _get_digest(self):
+        with _digests_lock:
+            offset, digest = _digests.pop(self.pk, (None, None))
+        if offset == self.offset:
+            return digest
+        # Hash the data received by another process
+        digest = hashlib.sha1()
+        with open(self.path, 'rb') as staged:
+            remaining = self.offset
+            while remaining:
+                data = staged.read(min(remaining, 64 * 1024))
+                if not data:
+                    raise UploadConflict("The staged data is shorter than the offset.")
+                digest.update(data)
+                remaining -= len(data)
+        return digest
+
+    def _set_digest(self, digest):
+        with _digests_lock:
+            _digests[self.pk] = (self.offset, digest)
+            while len(_digests) > _MAX_DIGESTS:
+                _digests.popitem(last=False)
+
+    def append(self, stream, offset, chunk_size=64 * 1024):
+        """
+        Appends the data read from ``stream`` at ``offset``, which must be the
+        current offset of the upload, and returns the new offset. Data received
+        before the stream broke off is kept, so the upload resumes from there.
+        """
+        with open(self.path, 'r+b') as staged:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(staged, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    raise UploadConflict("Another request is writing to this upload.")
+            # Another request may have appended before the lock was acquired
+            self.offset = UploadSession.objects.values_list('offset', flat=True).get(pk=self.pk)
+            if offset != self.offset:
+                raise UploadConflict(f"The upload continues at offset {self.offset}.")
+            digest = self._get_digest()
+            staged.seek(self.offset)
+            # Drop the data of a request which failed after writing
+            staged.truncate()
+            try:
+                while self.offset < self.size:
+                    data = stream.read(min(chunk_size, self.size - self.offset))
+                    if not data:
+                        break
+                    staged.write(data)
+                    digest.update(data)
+                    self.offset += len(data)
+            finally:
+                staged.flush()
+                self.updated_at = timezone.now()
+                UploadSession.objects.filter(pk=self.pk).update(offset=self.offset, updated_at=self.updated_at)
+                self._set_digest(digest)
+        return self.offset
+
+    def get_upload(self, content_type):
+        """
+        Returns the received file as an uploaded file with its SHA-1 digest
+        set, see ``File.file_data_changed``.
+        """
+        digest = self._get_digest()
+        return StagedUpload(self.path, self.filename, content_type, self.size, digest.hexdigest())
+
+    def discard(self):
+        """
+        Deletes the session and its staged data.
+        """
+        with _digests_lock:
+            _digests.pop(self.pk, None)
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        self.delete()
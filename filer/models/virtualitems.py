@@ -1,3 +1,4 @@
+from django.db.models import Q
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
@@ -83,6 +84,31 @@ class ImagesWithMissingData(DummyFolder):
             'admin:filer-directory_listing-images_with_missing_data')
 
 
+class Trash(DummyFolder):
+    """
+    Lists the files and folders in the trash, except for those trashed along
+    with a folder, see filer.trash.
+    """
+    name = _("Trash")
+    is_root = True
+    is_trash = True
+
+    @property
+    def children(self):
+        return Folder.objects.filter(trashed_at__isnull=False).filter(
+            Q(parent__isnull=True) | Q(parent__trashed_at__isnull=True)
+        )
+
+    @property
+    def files(self):
+        return File.objects.filter(trashed_at__isnull=False).filter(
+            Q(folder__isnull=True) | Q(folder__trashed_at__isnull=True)
+        )
+
+    def get_admin_directory_listing_url_path(self):
+        return reverse('admin:filer-directory_listing-trash')
+
+
 class FolderRoot(DummyFolder):
     name = _('root')
     is_root = True
@@ -91,13 +117,15 @@ class FolderRoot(DummyFolder):
 
     @property
     def virtual_folders(self):
+        if filer_settings.FILER_ENABLE_TRASH:
+            return [UnsortedImages(), Trash()]
         return [UnsortedImages()]
 
     @property
     def children(self):
         if filer_settings.FILER_ENABLE_PERMISSIONS:
-            return Folder.objects.all()
-        return Folder.objects.filter(parent__isnull=True)
+            return Folder.objects.filter(trashed_at__isnull=True)
+        return Folder.objects.filter(parent__isnull=True, trashed_at__isnull=True)
     parent_url = None
 
     def contains_folder(self, folder_name):
@@ -0,0 +1,392 @@
+"""
+Search index for the admin file and folder search.
+
+The searchable text of every file and folder (its names, description and the
+text fields of its owner) is kept as a lower case document in ``SearchIndex``.
+A search backend matches the search terms against these documents with an
+index:
+
+* ``SQLiteSearchBackend`` uses an FTS5 table with the trigram tokenizer,
+* ``TrigramSearchBackend`` keeps the trigrams of the documents in a table of
+  its own and works on every database,
+* ``PostgresSearchBackend`` uses a ``tsvector`` GIN index. It matches the
+  beginning of words rather than any part of the text and is therefore only
+  used if configured explicitly.
+
+The backend is configured with ``FILER_SEARCH_BACKEND``. The documents are
+updated whenever a file or folder, or the user owning it, is saved or deleted.
+They are created, e.g., after enabling the index, and can be recreated with the
+``filer_rebuild_search_index`` management command.
+"""
+import functools
+import re
+import threading
+from contextlib import contextmanager
+
+from django.contrib.auth import get_user_model
+from django.db import connections, models, router, transaction
+from django.db.models import Count
+from django.db.models.expressions import RawSQL
+
+from . import settings as filer_settings
+from .models import File, Folder, SearchIndex, SearchTrigram
+from .utils.loader import load_object
+
+
+# Backends used by "auto", which match any part of the text on every database
+BACKENDS = {
+    'sqlite': 'filer.search.SQLiteSearchBackend',
+}
+FTS_TABLE = 'filer_searchindex_fts'
+
+# Documents to remove collected by deferred_removal()
+_deferred = threading.local()
+
+
+def get_owner_search_fields(user_model=None):
+    """
+    Returns the names of the text fields of the user model which are part of
+    the documents, i.e., all CharFields except for the password.
+    """
+    user_model = user_model or get_user_model()
+    return [
+        field.name for field in user_model._meta.fields
+        if isinstance(field, models.CharField) and field.name != 'password'
+    ]
+
+
+def build_document(*values):
+    return ' '.join(str(value) for value in values if value).lower()
+
+
+def get_trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def get_search_backend():
+    """
+    Returns the search backend configured with ``FILER_SEARCH_BACKEND``, or
+    ``None`` if the admin search does not use an index. ``"auto"`` picks the
+    built-in backend of the database.
+    """
+    path = filer_settings.FILER_SEARCH_BACKEND
+    if not path:
+        return None
+    if path == 'auto':
+        vendor = connections[router.db_for_read(SearchIndex)].vendor
+        path = BACKENDS.get(vendor, 'filer.search.TrigramSearchBackend')
+    return _load_backend(path)
+
+
+@functools.lru_cache
+def _load_backend(path):
+    return load_object(path)()
+
+
+def update_search_index(sender, instance, raw=False, **kwargs):
+    backend = get_search_backend()
+    if backend is not None and not raw:
+        if isinstance(instance, Folder):
+            backend.update(SearchIndex.FOLDER, Folder.objects.filter(pk=instance.pk))
+        else:
+            backend.update(SearchIndex.FILE, File.objects.filter(pk=instance.pk))
+
+
+def _get_owner_update_fields(sender, update_fields):
+    fields = get_owner_search_fields(sender)
+    if update_fields is not None:
+        # e.g. only the last_login of every login
+        fields = [field for field in fields if field in update_fields]
+    return fields
+
+
+def remember_owner_search_text(sender, instance, raw=False, update_fields=None, **kwargs):
+    """
+    Stores the indexed text fields of a user as they are in the database before
+    the user is saved, to tell whether the user's documents have to change.
+    """
+    fields = _get_owner_update_fields(sender, update_fields)
+    if get_search_backend() is None or raw or instance.pk is None or not fields:
+        return
+    instance._filer_search_text = (
+        sender._default_manager.filter(pk=instance.pk).values_list(*fields).first()
+    )
+
+
+def update_owner_search_index(sender, instance, created=False, raw=False, update_fields=None, **kwargs):
+    """
+    Updates the documents of the files and folders of a user whose text fields
+    changed. The documents are updated once the transaction is committed.
+    """
+    backend = get_search_backend()
+    fields = _get_owner_update_fields(sender, update_fields)
+    if backend is None or raw or created or not fields:
+        return
+    previous = instance.__dict__.pop('_filer_search_text', None)
+    if previous == tuple(getattr(instance, field) for field in fields):
+        # e.g. the user change form saved without changing the name or email
+        return
+    transaction.on_commit(
+        functools.partial(_update_owner_documents, backend, instance.pk),
+        using=router.db_for_write(SearchIndex),
+    )
+
+
+def _update_owner_documents(backend, owner_id):
+    backend.update_in_batches(SearchIndex.FILE, File.objects.filter(owner_id=owner_id))
+    backend.update_in_batches(SearchIndex.FOLDER, Folder.objects.filter(owner_id=owner_id))
+
+
+def remove_from_search_index(sender, instance, **kwargs):
+    kind = SearchIndex.FOLDER if isinstance(instance, Folder) else SearchIndex.FILE
+    removals = getattr(_deferred, 'removals', None)
+    if removals is not None:
+        removals.add((kind, instance.pk))
+        return
+    backend = get_search_backend()
+    if backend is not None:
+        backend.remove(kind, [instance.pk])
+
+
+@contextmanager
+def deferred_removal(batch_size=1000):
+    """
+    Collects the documents of the files and folders deleted within the block
+    and removes them in batches when it ends.
+    """
+    if getattr(_deferred, 'removals', None) is not None:
+        # Removed by the outermost block
+        yield
+        return
+    removals = _deferred.removals = set()
+    try:
+        yield
+    finally:
+        _deferred.removals = None
+    backend = get_search_backend()
+    if backend is None:
+        return
+    for kind in (SearchIndex.FILE, SearchIndex.FOLDER):
+        object_ids = sorted(pk for removal_kind, pk in removals if removal_kind == kind)
+        for start in range(0, len(object_ids), batch_size):
+            backend.remove(kind, object_ids[start:start + batch_size])
+
+
+class SearchBackend:
+    """
+    Base class of the search backends. It keeps the documents up to date and
+    matches terms with ``LIKE`` on the documents, which is used for terms the
+    index cannot handle.
+    """
+    #: Terms shorter than this are matched without the index
+    min_term_length = 3
+
+    @classmethod
+    def install(cls, schema_editor):
+        """
+        Creates the database objects the backend needs in addition to the
+        ``SearchIndex`` table. Returns ``True`` if the index is maintained by
+        the database itself.
+        """
+        return False
+
+    def get_documents(self, kind, queryset):
+        """
+        Yields ``(object id, document)`` for the files or folders of
+        ``queryset``.
+        """
+        owner_fields = [f'owner__{field}' for field in get_owner_search_fields()]
+        if kind == SearchIndex.FILE:
+            fields = ['name', 'original_filename', 'description']
+            queryset = queryset.non_polymorphic()
+        else:
+            fields = ['name']
+        for pk, *values in queryset.order_by().values_list('pk', *fields, *owner_fields).iterator():
+            yield pk, build_document(*values)
+
+    def update(self, kind, queryset):
+        """
+        Updates the documents of the files or folders of ``queryset``.
+        """
+        documents = dict(self.get_documents(kind, queryset))
+        with transaction.atomic(using=router.db_for_write(SearchIndex)):
+            existing = {
+                entry.object_id: entry
+                for entry in SearchIndex.objects.filter(kind=kind, object_id__in=documents)
+            }
+            changed = [entry for entry in existing.values() if entry.document != documents[entry.object_id]]
+            for entry in changed:
+                entry.document = documents[entry.object_id]
+            SearchIndex.objects.bulk_update(changed, ['document'])
+            created = [pk for pk in documents if pk not in existing]
+            SearchIndex.objects.bulk_create(
+                SearchIndex(kind=kind, object_id=pk, document=documents[pk]) for pk in created
+            )
+            if changed or created:
+                object_ids = [entry.object_id for entry in changed] + created
+                self.update_entries(SearchIndex.objects.filter(kind=kind, object_id__in=object_ids))
+        return len(changed) + len(created)
+
+    def update_in_batches(self, kind, queryset, batch_size=1000):
+        """
+        Updates the documents of the files or folders of ``queryset``
+        ``batch_size`` at a time. Returns the number of documents which had to
+        be created or updated.
+        """
+        changed = 0
+        pks = list(queryset.order_by('pk').values_list('pk', flat=True))
+        for start in range(0, len(pks), batch_size):
+            changed += self.update(kind, queryset.filter(pk__in=pks[start:start + batch_size]))
+        return changed
+
+    def update_entries(self, entries):
+        """
+        Hook for backends which maintain an index of their own.
+        """
+
+    def remove(self, kind, object_ids):
+        SearchIndex.objects.filter(kind=kind, object_id__in=object_ids).delete()
+
+    def rebuild(self, batch_size=1000):
+        """
+        Recreates the documents of all files and folders. Returns the number of
+        documents which had to be created or updated.
+        """
+        changed = 0
+        for kind, queryset in ((SearchIndex.FILE, File.objects.all()), (SearchIndex.FOLDER, Folder.objects.all())):
+            SearchIndex.objects.filter(kind=kind).exclude(object_id__in=queryset.values('pk')).delete()
+            changed += self.update_in_batches(kind, queryset, batch_size)
+        return changed
+
+    def match(self, entries, term):
+        """
+        Restricts the ``SearchIndex`` queryset ``entries`` to the documents
+        containing ``term``.
+        """
+        return entries.filter(document__contains=term)
+
+    def search(self, kind, terms):
+        """
+        Returns the ids of the files or folders whose document contains all
+        ``terms``, as a subquery.
+        """
+        entries = SearchIndex.objects.filter(kind=kind)
+        for term in terms:
+            term = term.strip().lower()
+            if term:
+                entries = self.match(entries, term)
+        return entries.values('object_id')
+
+
+class TrigramSearchBackend(SearchBackend):
+    """
+    Database independent backend. The trigrams of every document are stored in
+    ``SearchTrigram``; a term is looked up by its trigrams and the candidates
+    are checked for the complete term.
+    """
+    def update_entries(self, entries):
+        SearchTrigram.objects.filter(entry__in=entries).delete()
+        SearchTrigram.objects.bulk_create(
+            SearchTrigram(entry=entry, trigram=trigram)
+            for entry in entries for trigram in get_trigrams(entry.document)
+        )
+
+    def rebuild(self, batch_size=1000):
+        changed = super().rebuild(batch_size)
+        # Documents which were indexed while another backend was in use
+        missing = list(
+            SearchIndex.objects.exclude(pk__in=SearchTrigram.objects.values('entry')).exclude(document='')
+            .values_list('pk', flat=True)
+        )
+        for start in range(0, len(missing), batch_size):
+            self.update_entries(SearchIndex.objects.filter(pk__in=missing[start:start + batch_size]))
+        return changed
+
+    def match(self, entries, term):
+        if len(term) < self.min_term_length:
+            return super().match(entries, term)
+        trigrams = get_trigrams(term)
+        candidates = (
+            SearchTrigram.objects.filter(trigram__in=trigrams).values('entry')
+            .annotate(matches=Count('trigram', distinct=True)).filter(matches=len(trigrams))
+        )
+        return super().match(entries.filter(pk__in=candidates.values('entry')), term)
+
+
+class SQLiteSearchBackend(SearchBackend):
+    """
+    Backend for SQLite using an FTS5 table with the trigram tokenizer, which
+    is kept in sync with the documents by triggers.
+    """
+    @classmethod
+    def install(cls, schema_editor):
+        table = SearchIndex._meta.db_table
+        statements = [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+            f"document, tokenize='trigram', content='{table}', content_rowid='id')",
+            f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_insert AFTER INSERT ON {table} BEGIN "
+            f"INSERT INTO {FTS_TABLE}(rowid, document) VALUES (new.id, new.document); END",
+            f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_delete AFTER DELETE ON {table} BEGIN "
+            f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, document) VALUES ('delete', old.id, old.document); END",
+            f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_update AFTER UPDATE ON {table} BEGIN "
+            f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, document) VALUES ('delete', old.id, old.document); "
+            f"INSERT INTO {FTS_TABLE}(rowid, document) VALUES (new.id, new.document); END",
+        ]
+        try:
+            with transaction.atomic(using=schema_editor.connection.alias):
+                for statement in statements:
+                    schema_editor.execute(statement)
+        except Exception:
+            # SQLite < 3.34 or compiled without FTS5
+            return False
+        return True
+
+    def is_installed(self):
+        if not hasattr(self, '_installed'):
+            connection = connections[router.db_for_read(SearchIndex)]
+            self._installed = FTS_TABLE in connection.introspection.table_names()
+        return self._installed
+
+    def rebuild(self, batch_size=1000):
+        changed = super().rebuild(batch_size)
+        if self.is_installed():
+            with connections[router.db_for_write(SearchIndex)].cursor() as cursor:
+                cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+        return changed
+
+    def match(self, entries, term):
+        if len(term) < self.min_term_length or not self.is_installed():
+            return super().match(entries, term)
+        phrase = '"{}"'.format(term.replace('"', '""'))
+        return entries.filter(pk__in=RawSQL(f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [phrase]))
+
+
+class PostgresSearchBackend(SearchBackend):
+    """
+    Backend for PostgreSQL using a GIN index on the ``tsvector`` of the
+    documents. Unlike the other backends, terms match the beginning of words
+    rather than any part of the text. The index is created by
+    ``filer_rebuild_search_index``.
+    """
+    @classmethod
+    def install(cls, schema_editor):
+        table = SearchIndex._meta.db_table
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {table}_document_tsv ON {table} "
+            f"USING gin (to_tsvector('simple'::regconfig, COALESCE(document, '')))"
+        )
+        return True
+
+    def rebuild(self, batch_size=1000):
+        with connections[router.db_for_write(SearchIndex)].schema_editor() as schema_editor:
+            self.install(schema_editor)
+        return super().rebuild(batch_size)
+
+    def match(self, entries, term):
+        from django.contrib.postgres.search import SearchQuery, SearchVector, SearchVectorExact
+
+        words = re.findall(r'\w+', term)
+        if not words:
+            return super().match(entries, term)
+        query = SearchQuery(' & '.join(f'{word}:*' for word in words), search_type='raw', config='simple')
+        return entries.filter(SearchVectorExact(SearchVector('document', config='simple'), query))
@@ -14,20 +14,31 @@ server = filer_settings.FILER_PRIVATEMEDIA_SERVER
 thumbnail_server = filer_settings.FILER_PRIVATEMEDIA_THUMBNAIL_SERVER
 
 
+def get_readable_file(request, path):
+    """
+    Returns a private file stored at ``path`` which the user may read.
+
+    Several files can share a stored file, e.g., deduplicated uploads or
+    copies made with ``FILER_COPY_MODE = 'reference'``. The stored file is
+    served if the user may read any of them.
+    """
+    files = File.objects.filter(file=path, is_public=False, trashed_at__isnull=True)
+    found = False
+    for file_obj in files:
+        found = True
+        if file_obj.has_read_permission(request):
+            return file_obj
+    if found and settings.DEBUG:
+        raise PermissionDenied
+    raise Http404('File not found')
+
+
 @never_cache
 def serve_protected_file(request, path):
     """
     Serve protected files to authenticated users with read permissions.
     """
-    try:
-        file_obj = File.objects.get(file=path, is_public=False)
-    except File.DoesNotExist:
-        raise Http404('File not found')
-    if not file_obj.has_read_permission(request):
-        if settings.DEBUG:
-            raise PermissionDenied
-        else:
-            raise Http404('File not found')
+    file_obj = get_readable_file(request, path)
     return server.serve(request, file_obj, save_as=False)
 
 
@@ -40,15 +51,7 @@ def serve_protected_thumbnail(request, path):
     source_path = thumbnail_to_original_filename(path)
     if not source_path:
         raise Http404('File not found')
-    try:
-        file_obj = File.objects.get(file=source_path, is_public=False)
-    except File.DoesNotExist:
-        raise Http404('File not found')
-    if not file_obj.has_read_permission(request):
-        if settings.DEBUG:
-            raise PermissionDenied
-        else:
-            raise Http404('File not found')
+    file_obj = get_readable_file(request, source_path)
     try:
         thumbnail = ThumbnailFile(name=path, storage=file_obj.file.thumbnail_storage)
         thumbnail.mime_type = file_obj.mime_type
@@ -34,6 +34,17 @@ if FILER_ENABLE_LOGGING:
 FILER_ENABLE_PERMISSIONS = getattr(settings, 'FILER_ENABLE_PERMISSIONS', False)
 FILER_ALLOW_REGULAR_USERS_TO_ADD_ROOT_FOLDERS = getattr(settings, 'FILER_ALLOW_REGULAR_USERS_TO_ADD_ROOT_FOLDERS', False)
 FILER_IS_PUBLIC_DEFAULT = getattr(settings, 'FILER_IS_PUBLIC_DEFAULT', True)
+# Store files with the same content once, named by their SHA-1 digest
+FILER_DEDUPLICATE_FILES = getattr(settings, 'FILER_DEDUPLICATE_FILES', False)
+# How copied files are stored: "copy", "link" (hard links on the local file
+# system) or "reference" (the copy shares the stored file until either changes)
+FILER_COPY_MODE = getattr(settings, 'FILER_COPY_MODE', 'copy')
+# Move deleted files and folders to the trash, see filer.trash
+FILER_ENABLE_TRASH = getattr(settings, 'FILER_ENABLE_TRASH', False)
+# Days after which filer_purge_trash deletes files and folders in the trash
+FILER_TRASH_RETENTION_DAYS = getattr(settings, 'FILER_TRASH_RETENTION_DAYS', 30)
+# Threads deleting stored files and thumbnails after bulk deletions, see filer.deletion
+FILER_DELETE_WORKERS = getattr(settings, 'FILER_DELETE_WORKERS', 4)
 
 FILER_PAGINATE_BY = getattr(settings, 'FILER_PAGINATE_BY', 100)
 
@@ -257,6 +268,21 @@ FILER_UPLOADER_MAX_FILES = getattr(
     settings, 'FILER_UPLOADER_MAX_FILES', 100)
 FILER_UPLOADER_MAX_FILE_SIZE = getattr(
     settings, 'FILER_UPLOADER_MAX_FILE_SIZE', None)
+# Size of the chunks of resumable uploads in MB, None uploads files in one request
+FILER_UPLOADER_CHUNK_SIZE = getattr(
+    settings, 'FILER_UPLOADER_CHUNK_SIZE', None)
+# Seconds after which a resumable upload not receiving any data is discarded
+FILER_UPLOADER_SESSION_EXPIRY = getattr(
+    settings, 'FILER_UPLOADER_SESSION_EXPIRY', 24 * 60 * 60)
+# Directory of the partially received files, by default in FILE_UPLOAD_TEMP_DIR
+FILER_UPLOADER_STAGING_DIR = getattr(
+    settings, 'FILER_UPLOADER_STAGING_DIR', None)
+# Extract uploaded .zip archives into the folder uploaded to
+FILER_UPLOADER_EXTRACT_ZIP = getattr(
+    settings, 'FILER_UPLOADER_EXTRACT_ZIP', False)
+# Limits of the number of files and of the extracted size (in MB) of .zip archives
+FILER_ZIP_MAX_MEMBERS = getattr(settings, 'FILER_ZIP_MAX_MEMBERS', 1000)
+FILER_ZIP_MAX_SIZE = getattr(settings, 'FILER_ZIP_MAX_SIZE', 1024)
 
 
 FILER_DUMP_PAYLOAD = getattr(settings, 'FILER_DUMP_PAYLOAD', False)  # Whether the filer shall dump the files payload
@@ -335,3 +361,18 @@ if "cms" in settings.INSTALLED_APPS:  # pragma: no cover
 
 # SVG are their own thumbnails if their size is below this limit
 FILER_MAX_SVG_THUMBNAIL_SIZE = getattr(settings, "FILER_MAX_SVG_THUMBNAIL_SIZE", 1024 * 1024)  # 1MB default
+
+# Search index used by the admin search, see filer.search
+FILER_SEARCH_BACKEND = getattr(settings, 'FILER_SEARCH_BACKEND', None)
+
+# Background generation of admin thumbnails, see filer.thumbnail_queue
+FILER_THUMBNAIL_QUEUE = getattr(settings, 'FILER_THUMBNAIL_QUEUE', None)
+FILER_THUMBNAIL_QUEUE_WORKERS = getattr(settings, 'FILER_THUMBNAIL_QUEUE_WORKERS', 2)
+
+# Large reductions of thumbnail sources shrink them by an integer factor with
+# Image.reduce() first, keeping them this many times larger than the thumbnail
+FILER_THUMBNAIL_REDUCING_GAP = getattr(settings, 'FILER_THUMBNAIL_REDUCING_GAP', 2.0)
+
+# Locks around the rendering of admin thumbnails, see filer.thumbnail_locks
+FILER_THUMBNAIL_LOCK = getattr(settings, 'FILER_THUMBNAIL_LOCK', 'auto')
+FILER_THUMBNAIL_LOCK_WAIT = getattr(settings, 'FILER_THUMBNAIL_LOCK_WAIT', 3)
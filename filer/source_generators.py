@@ -0,0 +1,66 @@
+"""
+Source generators for easy-thumbnails, see ``THUMBNAIL_SOURCE_GENERATORS``.
+"""
+import math
+from io import BytesIO
+
+from easy_thumbnails import utils
+from PIL import Image, ImageFile
+
+from . import settings as filer_settings
+from .thumbnail_processors import SOURCE_SIZE_INFO, get_required_source_size
+
+
+def draft_image(image, thumbnail_options_list):
+    """
+    Lets the JPEG decoder of the not yet loaded ``image`` scale it down by
+    1/2, 1/4 or 1/8 while decoding, as long as it stays
+    ``FILER_THUMBNAIL_REDUCING_GAP`` times larger than required by each of
+    the thumbnail options. Returns the full size of the source image after
+    applying the EXIF orientation.
+    """
+    source_size = image.size
+    try:
+        orientation = image.getexif().get(0x0112)
+    except Exception:
+        orientation = None
+    transposed = orientation in (5, 6, 7, 8)
+    if transposed:
+        source_size = source_size[::-1]
+    reducing_gap = filer_settings.FILER_THUMBNAIL_REDUCING_GAP
+    if reducing_gap and thumbnail_options_list and image.format == 'JPEG':
+        sizes = [get_required_source_size(options, source_size) for options in thumbnail_options_list]
+        if None not in sizes:
+            draft_size = (
+                math.ceil(max(size[0] for size in sizes) * reducing_gap),
+                math.ceil(max(size[1] for size in sizes) * reducing_gap),
+            )
+            image.draft(image.mode, draft_size[::-1] if transposed else draft_size)
+    return source_size
+
+
+def pil_image(source, exif_orientation=True, **options):
+    """
+    Like ``easy_thumbnails.source_generators.pil_image``, but JPEGs are only
+    decoded at the scale needed for the thumbnail, which is several times
+    faster and uses a fraction of the memory for large photos.
+
+    The full size of the source is recorded in ``image.info``, which
+    ``scale_and_crop_with_subject_location`` uses to locate the subject. Use
+    it only with processors which do not depend on the absolute size of the
+    source image, like the ones of the default ``THUMBNAIL_PROCESSORS``.
+    """
+    if not source:
+        return
+    image = Image.open(BytesIO(source.read()))
+    source_size = draft_image(image, [options] if options.get('size') else [])
+    # Fully load the image now to catch any problems with the image contents.
+    try:
+        ImageFile.LOAD_TRUNCATED_IMAGES = True
+        image.load()
+    finally:
+        ImageFile.LOAD_TRUNCATED_IMAGES = False
+    if exif_orientation:
+        image = utils.exif_orientation(image)
+    image.info[SOURCE_SIZE_INFO] = source_size
+    return image
@@ -0,0 +1,190 @@
+// #CHUNKED UPLOAD#
+// This script sends the files of a dropzone in chunks to the resumable upload
+// endpoint (see FILER_UPLOADER_CHUNK_SIZE), resuming interrupted uploads
+'use strict';
+
+/* globals XMLHttpRequest, FormData, AbortController */
+
+const maxRetries = 5;
+const retryDelay = 1000;
+
+// The resumable uploads of an upload URL, e.g. ``.../operations/upload/1/sessions/``
+// for ``.../operations/upload/1/``
+const getSessionsUrl = (uploadUrl) => `${uploadUrl.replace(/\/?$/, '/')}sessions/`;
+
+// Remembers unfinished uploads to resume them when the file is uploaded again
+const getStorageKey = (sessionsUrl, file) => `filer-upload:${sessionsUrl}:${file.name}:${file.size}:${file.lastModified}`;
+
+const getStoredSession = (key) => {
+    try {
+        return window.localStorage.getItem(key);
+    } catch (error) {
+        return null;
+    }
+};
+
+const storeSession = (key, sessionUrl) => {
+    try {
+        if (sessionUrl) {
+            window.localStorage.setItem(key, sessionUrl);
+        } else {
+            window.localStorage.removeItem(key);
+        }
+    } catch (error) {
+        // Storage disabled or full, uploads are not resumed after a reload
+    }
+};
+
+const wait = (milliseconds) => new Promise((resolve) => setTimeout(resolve, milliseconds));
+
+const send = (method, url, { body = null, headers = {}, onProgress = null, signal = null } = {}) => {
+    return new Promise((resolve, reject) => {
+        const xhr = new XMLHttpRequest();
+
+        xhr.open(method, url);
+        Object.entries(headers).forEach(([name, value]) => xhr.setRequestHeader(name, value));
+        if (onProgress) {
+            xhr.upload.addEventListener('progress', (progressEvent) => onProgress(progressEvent.loaded));
+        }
+        xhr.addEventListener('load', () => resolve(xhr));
+        xhr.addEventListener('error', () => reject(new Error('Network error')));
+        xhr.addEventListener('abort', () => reject(new Error('Upload canceled')));
+        if (signal) {
+            signal.addEventListener('abort', () => xhr.abort());
+        }
+        xhr.send(body);
+    });
+};
+
+const parseJson = (xhr) => {
+    try {
+        return JSON.parse(xhr.responseText);
+    } catch (error) {
+        return { error: xhr.statusText || `HTTP ${xhr.status}` };
+    }
+};
+
+const getOffset = (xhr) => parseInt(xhr.getResponseHeader('Upload-Offset'), 10);
+
+// Resolves to the offset of an unfinished upload, or null if it expired
+const getResumeOffset = async (sessionUrl, signal) => {
+    try {
+        const xhr = await send('HEAD', sessionUrl, { signal });
+        return xhr.status === 204 ? getOffset(xhr) : null;
+    } catch (error) {
+        if (signal.aborted) {
+            throw error;
+        }
+        return null;
+    }
+};
+
+/**
+ * Uploads ``file`` in chunks of ``chunkSize`` bytes and resolves to the
+ * response of the uploader, as for uploads in a single request.
+ */
+export const uploadChunked = async (file, sessionsUrl, chunkSize, { onProgress, signal }) => {
+    const key = getStorageKey(sessionsUrl, file);
+    let sessionUrl = getStoredSession(key);
+    let offset = sessionUrl ? await getResumeOffset(sessionUrl, signal) : null;
+    let retries = 0;
+
+    if (offset === null) {
+        const formData = new FormData();
+        formData.append('filename', file.name);
+        formData.append('size', file.size);
+        const xhr = await send('POST', sessionsUrl, { body: formData, signal });
+        const response = parseJson(xhr);
+        if (xhr.status === 200) {
+            // e.g. a permission error, reported like for uploads in a single request
+            return response;
+        }
+        if (xhr.status !== 201) {
+            throw new Error(response.error);
+        }
+        sessionUrl = response.url;
+        offset = response.offset;
+        storeSession(key, sessionUrl);
+    }
+
+    while (offset < file.size) {
+        const chunkOffset = offset;
+        let retry = false;
+        try {
+            const xhr = await send('PATCH', sessionUrl, {
+                body: file.slice(chunkOffset, chunkOffset + chunkSize),
+                headers: {
+                    'Upload-Offset': chunkOffset,
+                    'Content-Type': 'application/offset+octet-stream'
+                },
+                onProgress: (loaded) => onProgress(chunkOffset + loaded),
+                signal
+            });
+            if (xhr.status === 204 || xhr.status === 409) {
+                offset = getOffset(xhr);
+                // A conflict without progress, e.g. another tab still sending the chunk
+                retry = offset === chunkOffset;
+            } else if (xhr.status >= 500) {
+                retry = true;
+            } else {
+                storeSession(key, null);
+                throw new Error(parseJson(xhr).error);
+            }
+        } catch (error) {
+            if (signal.aborted || (!retry && error.message !== 'Network error')) {
+                throw error;
+            }
+            retry = true;
+        }
+        if (retry) {
+            retries++;
+            if (retries > maxRetries) {
+                throw new Error('The upload was interrupted, please try again to resume it.');
+            }
+            await wait(retryDelay * retries);
+            const resumeOffset = await getResumeOffset(sessionUrl, signal);
+            if (resumeOffset !== null) {
+                offset = resumeOffset;
+            }
+        } else {
+            retries = 0;
+        }
+    }
+
+    const xhr = await send('POST', sessionUrl, { signal });
+    storeSession(key, null);
+    return parseJson(xhr);
+};
+
+/**
+ * Makes ``dropzone`` upload its files in chunks to the resumable uploads of
+ * ``uploadUrl``, emitting the same events as for uploads in a single request.
+ */
+export const useChunkedUploads = (dropzone, uploadUrl, chunkSize) => {
+    const sessionsUrl = getSessionsUrl(uploadUrl);
+
+    dropzone.uploadFiles = (files) => {
+        files.forEach((file) => {
+            const controller = new AbortController();
+
+            // Dropzone aborts the request of canceled uploads
+            file.xhr = { abort: () => controller.abort() };
+            dropzone.emit('sending', file, null, null);
+            uploadChunked(file, sessionsUrl, chunkSize, {
+                signal: controller.signal,
+                onProgress: (bytesSent) => {
+                    file.upload.bytesSent = bytesSent;
+                    file.upload.progress = file.size ? 100 * bytesSent / file.size : 100;
+                    dropzone.emit('uploadprogress', file, file.upload.progress, bytesSent);
+                }
+            }).then(
+                (response) => dropzone._finished([file], response, null),
+                (error) => {
+                    if (!controller.signal.aborted) {
+                        dropzone._errorProcessing([file], error, null);
+                    }
+                }
+            );
+        });
+    };
+};
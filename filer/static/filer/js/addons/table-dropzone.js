@@ -3,6 +3,7 @@
 'use strict';
 
 import Dropzone from 'dropzone';
+import { useChunkedUploads } from './chunked-upload';
 
 
 /* globals Cl */
@@ -266,6 +267,10 @@ document.addEventListener('DOMContentLoaded', () => {
                     }
                 }
             });
+            const chunkSize = parseInt(dropzoneElement.dataset.chunkSize || 0, 10);  // in MB
+            if (chunkSize) {
+                useChunkedUploads(dropzoneInstance, dropzoneUrl, chunkSize * 1024 * 1024);
+            }
             dropzoneInstances.push(dropzoneInstance);
             if (cancelUpload) {
                 cancelUpload.addEventListener('click', (clickEvent) => {
@@ -3,6 +3,7 @@
 'use strict';
 
 import Dropzone from 'dropzone';
+import { useChunkedUploads } from './chunked-upload';
 
 /* globals Cl */
 
@@ -29,6 +30,7 @@ document.addEventListener('DOMContentLoaded', () => {
     const hiddenClass = 'hidden';
     const maxUploaderConnections = parseInt(uploadButton.dataset.maxUploaderConnections || 3, 10);
     const maxFilesize = parseInt(uploadButton.dataset.maxFilesize || 0, 10);
+    const chunkSize = parseInt(uploadButton.dataset.chunkSize || 0, 10);  // in MB
     let hasErrors = false;
 
     const updateUploadNumber = () => {
@@ -75,6 +77,9 @@ document.addEventListener('DOMContentLoaded', () => {
         addRemoveLinks: false,
         autoProcessQueue: true
     });
+    if (chunkSize) {
+        useChunkedUploads(dropzone, uploadUrl, chunkSize * 1024 * 1024);
+    }
 
     dropzone.on('addedfile', () => {
         Cl.mediator.remove('filer-upload-in-progress', removeButton);
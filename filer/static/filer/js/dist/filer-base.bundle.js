@@ -10,4 +10,4 @@
 * Project on GitHub: https://github.com/ajacksified/Mediator.js
 *
 * Last update: 22 Mar 2018
-*/!function(r){"use strict";n=function(){return r.Mediator=function(){function e(){var e=function(){return(65536*(1+Math.random())|0).toString(16).substring(1)};return e()+e()+"-"+e()+"-"+e()+"-"+e()+"-"+e()+e()+e()}function t(n,r,i){if(!(this instanceof t))return new t(n,r,i);this.id=e(),this.fn=n,this.options=r,this.context=i,this.channel=null}function n(e,t){if(!(this instanceof n))return new n(e);this.namespace=e||"",this._subscribers=[],this._channels={},this._parent=t,this.stopped=!1}function r(){if(!(this instanceof r))return new r;this._channels=new n("")}return t.prototype.update=function(e){e&&(this.fn=e.fn||this.fn,this.context=e.context||this.context,this.options=e.options||this.options,this.channel&&this.options&&void 0!==this.options.priority&&this.channel.setPriority(this.id,this.options.priority))},n.prototype.channelPrioritySort=function(e,t){return e.options.priority>t.options.priority?-1:e.options.priority<t.options.priority?1:0},n.prototype.addSubscriber=function(e,n,r){n||(n={priority:0}),n.priority=0|n.priority;var i=new t(e,n,r);return i.channel=this,this._subscribers.push(i),this._subscribers.sort(this.channelPrioritySort),i},n.prototype.stopPropagation=function(){this.stopped=!0},n.prototype.getSubscriber=function(e){for(var t=0,n=this._subscribers.length;t<n;t++)if(this._subscribers[t].id===e||this._subscribers[t].fn===e)return this._subscribers[t]},n.prototype.setPriority=function(e,t){for(var n=0,r=this._subscribers.length;n<r;n++)if(this._subscribers[n].id===e||this._subscribers[n].fn===e){this._subscribers[n].priority=t;break}this._subscribers.sort(this.channelPrioritySort)},n.prototype.addChannel=function(e){this._channels[e]=new n((this.namespace?this.namespace+":":"")+e,this)},n.prototype.hasChannel=function(e){return this._channels.hasOwnProperty(e)},n.prototype.returnChannel=function(e){return this._channels[e]},n.prototype.removeSubscriber=function(e,t){var n=this._subscribers.length-1;if(t=void 0===t||t,e)for(;n>=0;n--)this._subscribers[n].fn!==e&&this._subscribers[n].id!==e||(this._subscribers[n].channel=null,this._subscribers.splice(n,1));else this._subscribers=[];t&&this.autoCleanChannel();n=this._subscribers.length-1;if(e)for(;n>=0;n--)this._subscribers[n].fn!==e&&this._subscribers[n].id!==e||(this._subscribers[n].channel=null,this._subscribers.splice(n,1));else this._subscribers=[]},n.prototype.autoCleanChannel=function(){if(0===this._subscribers.length){for(var e in this._channels)if(this._channels.hasOwnProperty(e))return;if(null!=this._parent){var t=this.namespace.split(":"),n=t[t.length-1];this._parent.removeChannel(n)}}},n.prototype.removeChannel=function(e){this.hasChannel(e)&&(this._channels[e]=null,delete this._channels[e],this.autoCleanChannel())},n.prototype.publish=function(e){for(var t,n,r,i=0,o=this._subscribers.length,s=!1;i<o;i++)s=!1,t=this._subscribers[i],this.stopped||(n=this._subscribers.length,void 0!==t.options&&"function"==typeof t.options.predicate?t.options.predicate.apply(t.context,e)&&(s=!0):s=!0),s&&(t.options&&void 0!==t.options.calls&&(t.options.calls--,t.options.calls<1&&this.removeSubscriber(t.id)),t.fn.apply(t.context,e),o=r=this._subscribers.length,r===n-1&&i--);this._parent&&this._parent.publish(e),this.stopped=!1},r.prototype.getChannel=function(e,t){var n=this._channels,r=e.split(":"),i=0,o=r.length;if(""===e)return n;if(r.length>0)for(;i<o;i++){if(!n.hasChannel(r[i])){if(t)break;n.addChannel(r[i])}n=n.returnChannel(r[i])}return n},r.prototype.subscribe=function(e,t,n,r){return n=n||{},r=r||{},this.getChannel(e||"",!1).addSubscriber(t,n,r)},r.prototype.once=function(e,t,n,r){return(n=n||{}).calls=1,this.subscribe(e,t,n,r)},r.prototype.getSubscriber=function(e,t){var n=this.getChannel(t||"",!0);return n.namespace!==t?null:n.getSubscriber(e)},r.prototype.remove=function(e,t,n){var r=this.getChannel(e||"",!0);if(r.namespace!==e)return!1;r.removeSubscriber(t,n)},r.prototype.publish=function(e){var t=this.getChannel(e||"",!1);if(t.namespace!==e)return null;var n=Array.prototype.slice.call(arguments,1);n.push(t),t.publish(n)},r.prototype.on=r.prototype.subscribe,r.prototype.bind=r.prototype.subscribe,r.prototype.emit=r.prototype.publish,r.prototype.trigger=r.prototype.publish,r.prototype.off=r.prototype.remove,r.Channel=n,r.Subscriber=t,r.version="0.10.1",r}(),r.Mediator}.apply(t,[]),void 0===n||(e.exports=n)}(this)},628:e=>{var t;self,t=function(){return function(){var e={3099:function(e){e.exports=function(e){if("function"!=typeof e)throw TypeError(String(e)+" is not a function");return e}},6077:function(e,t,n){var r=n(111);e.exports=function(e){if(!r(e)&&null!==e)throw TypeError("Can't set "+String(e)+" as a prototype");return e}},1223:function(e,t,n){var r=n(5112),i=n(30),o=n(3070),s=r("unscopables"),a=Array.prototype;null==a[s]&&o.f(a,s,{configurable:!0,value:i(null)}),e.exports=function(e){a[s][e]=!0}},1530:function(e,t,n){"use strict";var r=n(8710).charAt;e.exports=function(e,t,n){return t+(n?r(e,t).length:1)}},5787:function(e){e.exports=function(e,t,n){if(!(e instanceof t))throw TypeError("Incorrect "+(n?n+" ":"")+"invocation");return e}},9670:function(e,t,n){var r=n(111);e.exports=function(e){if(!r(e))throw TypeError(String(e)+" is not an object");return e}},4019:function(e){e.exports="undefined"!=typeof ArrayBuffer&&"undefined"!=typeof DataView},260:function(e,t,n){"use strict";var r,i=n(4019),o=n(9781),s=n(7854),a=n(111),l=n(6656),c=n(648),u=n(8880),d=n(1320),f=n(3070).f,h=n(9518),p=n(7674),v=n(5112),m=n(9711),g=s.Int8Array,y=g&&g.prototype,b=s.Uint8ClampedArray,w=b&&b.prototype,x=g&&h(g),E=y&&h(y),S=Object.prototype,k=S.isPrototypeOf,L=v("toStringTag"),A=m("TYPED_ARRAY_TAG"),C=i&&!!p&&"Opera"!==c(s.opera),_=!1,T={Int8Array:1,Uint8Array:1,Uint8ClampedArray:1,Int16Array:2,Uint16Array:2,Int32Array:4,Uint32Array:4,Float32Array:4,Float64Array:8},F={BigInt64Array:8,BigUint64Array:8},I=function(e){if(!a(e))return!1;var t=c(e);return l(T,t)||l(F,t)};for(r in T)s[r]||(C=!1);if((!C||"function"!=typeof x||x===Function.prototype)&&(x=function(){throw TypeError("Incorrect invocation")},C))for(r in T)s[r]&&p(s[r],x);if((!C||!E||E===S)&&(E=x.prototype,C))for(r in T)s[r]&&p(s[r].prototype,E);if(C&&h(w)!==E&&p(w,E),o&&!l(E,L))for(r in _=!0,f(E,L,{get:function(){return a(this)?this[A]:void 0}}),T)s[r]&&u(s[r],A,r);e.exports={NATIVE_ARRAY_BUFFER_VIEWS:C,TYPED_ARRAY_TAG:_&&A,aTypedArray:function(e){if(I(e))return e;throw TypeError("Target is not a typed array")},aTypedArrayConstructor:function(e){if(p){if(k.call(x,e))return e}else for(var t in T)if(l(T,r)){var n=s[t];if(n&&(e===n||k.call(n,e)))return e}throw TypeError("Target is not a typed array constructor")},exportTypedArrayMethod:function(e,t,n){if(o){if(n)for(var r in T){var i=s[r];i&&l(i.prototype,e)&&delete i.prototype[e]}E[e]&&!n||d(E,e,n?t:C&&y[e]||t)}},exportTypedArrayStaticMethod:function(e,t,n){var r,i;if(o){if(p){if(n)for(r in T)(i=s[r])&&l(i,e)&&delete i[e];if(x[e]&&!n)return;try{return d(x,e,n?t:C&&g[e]||t)}catch(e){}}for(r in T)!(i=s[r])||i[e]&&!n||d(i,e,t)}},isView:function(e){if(!a(e))return!1;var t=c(e);return"DataView"===t||l(T,t)||l(F,t)},isTypedArray:I,TypedArray:x,TypedArrayPrototype:E}},3331:function(e,t,n){"use strict";var r=n(7854),i=n(9781),o=n(4019),s=n(8880),a=n(2248),l=n(7293),c=n(5787),u=n(9958),d=n(7466),f=n(7067),h=n(1179),p=n(9518),v=n(7674),m=n(8006).f,g=n(3070).f,y=n(1285),b=n(8003),w=n(9909),x=w.get,E=w.set,S="ArrayBuffer",k="DataView",L="prototype",A="Wrong index",C=r[S],_=C,T=r[k],F=T&&T[L],I=Object.prototype,M=r.RangeError,R=h.pack,U=h.unpack,z=function(e){return[255&e]},O=function(e){return[255&e,e>>8&255]},j=function(e){return[255&e,e>>8&255,e>>16&255,e>>24&255]},q=function(e){return e[3]<<24|e[2]<<16|e[1]<<8|e[0]},P=function(e){return R(e,23,4)},D=function(e){return R(e,52,8)},N=function(e,t){g(e[L],t,{get:function(){return x(this)[t]}})},B=function(e,t,n,r){var i=f(n),o=x(e);if(i+t>o.byteLength)throw M(A);var s=x(o.buffer).bytes,a=i+o.byteOffset,l=s.slice(a,a+t);return r?l:l.reverse()},$=function(e,t,n,r,i,o){var s=f(n),a=x(e);if(s+t>a.byteLength)throw M(A);for(var l=x(a.buffer).bytes,c=s+a.byteOffset,u=r(+i),d=0;d<t;d++)l[c+d]=u[o?d:t-d-1]};if(o){if(!l(function(){C(1)})||!l(function(){new C(-1)})||l(function(){return new C,new C(1.5),new C(NaN),C.name!=S})){for(var W,H=(_=function(e){return c(this,_),new C(f(e))})[L]=C[L],Y=m(C),G=0;Y.length>G;)(W=Y[G++])in _||s(_,W,C[W]);H.constructor=_}v&&p(F)!==I&&v(F,I);var Q=new T(new _(2)),X=F.setInt8;Q.setInt8(0,2147483648),Q.setInt8(1,2147483649),!Q.getInt8(0)&&Q.getInt8(1)||a(F,{setInt8:function(e,t){X.call(this,e,t<<24>>24)},setUint8:function(e,t){X.call(this,e,t<<24>>24)}},{unsafe:!0})}else _=function(e){c(this,_,S);var t=f(e);E(this,{bytes:y.call(new Array(t),0),byteLength:t}),i||(this.byteLength=t)},T=function(e,t,n){c(this,T,k),c(e,_,k);var r=x(e).byteLength,o=u(t);if(o<0||o>r)throw M("Wrong offset");if(o+(n=void 0===n?r-o:d(n))>r)throw M("Wrong length");E(this,{buffer:e,byteLength:n,byteOffset:o}),i||(this.buffer=e,this.byteLength=n,this.byteOffset=o)},i&&(N(_,"byteLength"),N(T,"buffer"),N(T,"byteLength"),N(T,"byteOffset")),a(T[L],{getInt8:function(e){return B(this,1,e)[0]<<24>>24},getUint8:function(e){return B(this,1,e)[0]},getInt16:function(e){var t=B(this,2,e,arguments.length>1?arguments[1]:void 0);return(t[1]<<8|t[0])<<16>>16},getUint16:function(e){var t=B(this,2,e,arguments.length>1?arguments[1]:void 0);return t[1]<<8|t[0]},getInt32:function(e){return q(B(this,4,e,arguments.length>1?arguments[1]:void 0))},getUint32:function(e){return q(B(this,4,e,arguments.length>1?arguments[1]:void 0))>>>0},getFloat32:function(e){return U(B(this,4,e,arguments.length>1?arguments[1]:void 0),23)},getFloat64:function(e){return U(B(this,8,e,arguments.length>1?arguments[1]:void 0),52)},setInt8:function(e,t){$(this,1,e,z,t)},setUint8:function(e,t){$(this,1,e,z,t)},setInt16:function(e,t){$(this,2,e,O,t,arguments.length>2?arguments[2]:void 0)},setUint16:function(e,t){$(this,2,e,O,t,arguments.length>2?arguments[2]:void 0)},setInt32:function(e,t){$(this,4,e,j,t,arguments.length>2?arguments[2]:void 0)},setUint32:function(e,t){$(this,4,e,j,t,arguments.length>2?arguments[2]:void 0)},setFloat32:function(e,t){$(this,4,e,P,t,arguments.length>2?arguments[2]:void 0)},setFloat64:function(e,t){$(this,8,e,D,t,arguments.length>2?arguments[2]:void 0)}});b(_,S),b(T,k),e.exports={ArrayBuffer:_,DataView:T}},1048:function(e,t,n){"use strict";var r=n(7908),i=n(1400),o=n(7466),s=Math.min;e.exports=[].copyWithin||function(e,t){var n=r(this),a=o(n.length),l=i(e,a),c=i(t,a),u=arguments.length>2?arguments[2]:void 0,d=s((void 0===u?a:i(u,a))-c,a-l),f=1;for(c<l&&l<c+d&&(f=-1,c+=d-1,l+=d-1);d-- >0;)c in n?n[l]=n[c]:delete n[l],l+=f,c+=f;return n}},1285:function(e,t,n){"use strict";var r=n(7908),i=n(1400),o=n(7466);e.exports=function(e){for(var t=r(this),n=o(t.length),s=arguments.length,a=i(s>1?arguments[1]:void 0,n),l=s>2?arguments[2]:void 0,c=void 0===l?n:i(l,n);c>a;)t[a++]=e;return t}},8533:function(e,t,n){"use strict";var r=n(2092).forEach,i=n(9341)("forEach");e.exports=i?[].forEach:function(e){return r(this,e,arguments.length>1?arguments[1]:void 0)}},8457:function(e,t,n){"use strict";var r=n(9974),i=n(7908),o=n(3411),s=n(7659),a=n(7466),l=n(6135),c=n(1246);e.exports=function(e){var t,n,u,d,f,h,p=i(e),v="function"==typeof this?this:Array,m=arguments.length,g=m>1?arguments[1]:void 0,y=void 0!==g,b=c(p),w=0;if(y&&(g=r(g,m>2?arguments[2]:void 0,2)),null==b||v==Array&&s(b))for(n=new v(t=a(p.length));t>w;w++)h=y?g(p[w],w):p[w],l(n,w,h);else for(f=(d=b.call(p)).next,n=new v;!(u=f.call(d)).done;w++)h=y?o(d,g,[u.value,w],!0):u.value,l(n,w,h);return n.length=w,n}},1318:function(e,t,n){var r=n(5656),i=n(7466),o=n(1400),s=function(e){return function(t,n,s){var a,l=r(t),c=i(l.length),u=o(s,c);if(e&&n!=n){for(;c>u;)if((a=l[u++])!=a)return!0}else for(;c>u;u++)if((e||u in l)&&l[u]===n)return e||u||0;return!e&&-1}};e.exports={includes:s(!0),indexOf:s(!1)}},2092:function(e,t,n){var r=n(9974),i=n(8361),o=n(7908),s=n(7466),a=n(5417),l=[].push,c=function(e){var t=1==e,n=2==e,c=3==e,u=4==e,d=6==e,f=7==e,h=5==e||d;return function(p,v,m,g){for(var y,b,w=o(p),x=i(w),E=r(v,m,3),S=s(x.length),k=0,L=g||a,A=t?L(p,S):n||f?L(p,0):void 0;S>k;k++)if((h||k in x)&&(b=E(y=x[k],k,w),e))if(t)A[k]=b;else if(b)switch(e){case 3:return!0;case 5:return y;case 6:return k;case 2:l.call(A,y)}else switch(e){case 4:return!1;case 7:l.call(A,y)}return d?-1:c||u?u:A}};e.exports={forEach:c(0),map:c(1),filter:c(2),some:c(3),every:c(4),find:c(5),findIndex:c(6),filterOut:c(7)}},6583:function(e,t,n){"use strict";var r=n(5656),i=n(9958),o=n(7466),s=n(9341),a=Math.min,l=[].lastIndexOf,c=!!l&&1/[1].lastIndexOf(1,-0)<0,u=s("lastIndexOf"),d=c||!u;e.exports=d?function(e){if(c)return l.apply(this,arguments)||0;var t=r(this),n=o(t.length),s=n-1;for(arguments.length>1&&(s=a(s,i(arguments[1]))),s<0&&(s=n+s);s>=0;s--)if(s in t&&t[s]===e)return s||0;return-1}:l},1194:function(e,t,n){var r=n(7293),i=n(5112),o=n(7392),s=i("species");e.exports=function(e){return o>=51||!r(function(){var t=[];return(t.constructor={})[s]=function(){return{foo:1}},1!==t[e](Boolean).foo})}},9341:function(e,t,n){"use strict";var r=n(7293);e.exports=function(e,t){var n=[][e];return!!n&&r(function(){n.call(null,t||function(){throw 1},1)})}},3671:function(e,t,n){var r=n(3099),i=n(7908),o=n(8361),s=n(7466),a=function(e){return function(t,n,a,l){r(n);var c=i(t),u=o(c),d=s(c.length),f=e?d-1:0,h=e?-1:1;if(a<2)for(;;){if(f in u){l=u[f],f+=h;break}if(f+=h,e?f<0:d<=f)throw TypeError("Reduce of empty array with no initial value")}for(;e?f>=0:d>f;f+=h)f in u&&(l=n(l,u[f],f,c));return l}};e.exports={left:a(!1),right:a(!0)}},5417:function(e,t,n){var r=n(111),i=n(3157),o=n(5112)("species");e.exports=function(e,t){var n;return i(e)&&("function"!=typeof(n=e.constructor)||n!==Array&&!i(n.prototype)?r(n)&&null===(n=n[o])&&(n=void 0):n=void 0),new(void 0===n?Array:n)(0===t?0:t)}},3411:function(e,t,n){var r=n(9670),i=n(9212);e.exports=function(e,t,n,o){try{return o?t(r(n)[0],n[1]):t(n)}catch(t){throw i(e),t}}},7072:function(e,t,n){var r=n(5112)("iterator"),i=!1;try{var o=0,s={next:function(){return{done:!!o++}},return:function(){i=!0}};s[r]=function(){return this},Array.from(s,function(){throw 2})}catch(e){}e.exports=function(e,t){if(!t&&!i)return!1;var n=!1;try{var o={};o[r]=function(){return{next:function(){return{done:n=!0}}}},e(o)}catch(e){}return n}},4326:function(e){var t={}.toString;e.exports=function(e){return t.call(e).slice(8,-1)}},648:function(e,t,n){var r=n(1694),i=n(4326),o=n(5112)("toStringTag"),s="Arguments"==i(function(){return arguments}());e.exports=r?i:function(e){var t,n,r;return void 0===e?"Undefined":null===e?"Null":"string"==typeof(n=function(e,t){try{return e[t]}catch(e){}}(t=Object(e),o))?n:s?i(t):"Object"==(r=i(t))&&"function"==typeof t.callee?"Arguments":r}},9920:function(e,t,n){var r=n(6656),i=n(3887),o=n(1236),s=n(3070);e.exports=function(e,t){for(var n=i(t),a=s.f,l=o.f,c=0;c<n.length;c++){var u=n[c];r(e,u)||a(e,u,l(t,u))}}},8544:function(e,t,n){var r=n(7293);e.exports=!r(function(){function e(){}return e.prototype.constructor=null,Object.getPrototypeOf(new e)!==e.prototype})},4994:function(e,t,n){"use strict";var r=n(3383).IteratorPrototype,i=n(30),o=n(9114),s=n(8003),a=n(7497),l=function(){return this};e.exports=function(e,t,n){var c=t+" Iterator";return e.prototype=i(r,{next:o(1,n)}),s(e,c,!1,!0),a[c]=l,e}},8880:function(e,t,n){var r=n(9781),i=n(3070),o=n(9114);e.exports=r?function(e,t,n){return i.f(e,t,o(1,n))}:function(e,t,n){return e[t]=n,e}},9114:function(e){e.exports=function(e,t){return{enumerable:!(1&e),configurable:!(2&e),writable:!(4&e),value:t}}},6135:function(e,t,n){"use strict";var r=n(7593),i=n(3070),o=n(9114);e.exports=function(e,t,n){var s=r(t);s in e?i.f(e,s,o(0,n)):e[s]=n}},654:function(e,t,n){"use strict";var r=n(2109),i=n(4994),o=n(9518),s=n(7674),a=n(8003),l=n(8880),c=n(1320),u=n(5112),d=n(1913),f=n(7497),h=n(3383),p=h.IteratorPrototype,v=h.BUGGY_SAFARI_ITERATORS,m=u("iterator"),g="keys",y="values",b="entries",w=function(){return this};e.exports=function(e,t,n,u,h,x,E){i(n,t,u);var S,k,L,A=function(e){if(e===h&&I)return I;if(!v&&e in T)return T[e];switch(e){case g:case y:case b:return function(){return new n(this,e)}}return function(){return new n(this)}},C=t+" Iterator",_=!1,T=e.prototype,F=T[m]||T["@@iterator"]||h&&T[h],I=!v&&F||A(h),M="Array"==t&&T.entries||F;if(M&&(S=o(M.call(new e)),p!==Object.prototype&&S.next&&(d||o(S)===p||(s?s(S,p):"function"!=typeof S[m]&&l(S,m,w)),a(S,C,!0,!0),d&&(f[C]=w))),h==y&&F&&F.name!==y&&(_=!0,I=function(){return F.call(this)}),d&&!E||T[m]===I||l(T,m,I),f[t]=I,h)if(k={values:A(y),keys:x?I:A(g),entries:A(b)},E)for(L in k)(v||_||!(L in T))&&c(T,L,k[L]);else r({target:t,proto:!0,forced:v||_},k);return k}},9781:function(e,t,n){var r=n(7293);e.exports=!r(function(){return 7!=Object.defineProperty({},1,{get:function(){return 7}})[1]})},317:function(e,t,n){var r=n(7854),i=n(111),o=r.document,s=i(o)&&i(o.createElement);e.exports=function(e){return s?o.createElement(e):{}}},8324:function(e){e.exports={CSSRuleList:0,CSSStyleDeclaration:0,CSSValueList:0,ClientRectList:0,DOMRectList:0,DOMStringList:0,DOMTokenList:1,DataTransferItemList:0,FileList:0,HTMLAllCollection:0,HTMLCollection:0,HTMLFormElement:0,HTMLSelectElement:0,MediaList:0,MimeTypeArray:0,NamedNodeMap:0,NodeList:1,PaintRequestList:0,Plugin:0,PluginArray:0,SVGLengthList:0,SVGNumberList:0,SVGPathSegList:0,SVGPointList:0,SVGStringList:0,SVGTransformList:0,SourceBufferList:0,StyleSheetList:0,TextTrackCueList:0,TextTrackList:0,TouchList:0}},8113:function(e,t,n){var r=n(5005);e.exports=r("navigator","userAgent")||""},7392:function(e,t,n){var r,i,o=n(7854),s=n(8113),a=o.process,l=a&&a.versions,c=l&&l.v8;c?i=(r=c.split("."))[0]+r[1]:s&&(!(r=s.match(/Edge\/(\d+)/))||r[1]>=74)&&(r=s.match(/Chrome\/(\d+)/))&&(i=r[1]),e.exports=i&&+i},748:function(e){e.exports=["constructor","hasOwnProperty","isPrototypeOf","propertyIsEnumerable","toLocaleString","toString","valueOf"]},2109:function(e,t,n){var r=n(7854),i=n(1236).f,o=n(8880),s=n(1320),a=n(3505),l=n(9920),c=n(4705);e.exports=function(e,t){var n,u,d,f,h,p=e.target,v=e.global,m=e.stat;if(n=v?r:m?r[p]||a(p,{}):(r[p]||{}).prototype)for(u in t){if(f=t[u],d=e.noTargetGet?(h=i(n,u))&&h.value:n[u],!c(v?u:p+(m?".":"#")+u,e.forced)&&void 0!==d){if(typeof f==typeof d)continue;l(f,d)}(e.sham||d&&d.sham)&&o(f,"sham",!0),s(n,u,f,e)}}},7293:function(e){e.exports=function(e){try{return!!e()}catch(e){return!0}}},7007:function(e,t,n){"use strict";n(4916);var r=n(1320),i=n(7293),o=n(5112),s=n(2261),a=n(8880),l=o("species"),c=!i(function(){var e=/./;return e.exec=function(){var e=[];return e.groups={a:"7"},e},"7"!=="".replace(e,"$<a>")}),u="$0"==="a".replace(/./,"$0"),d=o("replace"),f=!!/./[d]&&""===/./[d]("a","$0"),h=!i(function(){var e=/(?:)/,t=e.exec;e.exec=function(){return t.apply(this,arguments)};var n="ab".split(e);return 2!==n.length||"a"!==n[0]||"b"!==n[1]});e.exports=function(e,t,n,d){var p=o(e),v=!i(function(){var t={};return t[p]=function(){return 7},7!=""[e](t)}),m=v&&!i(function(){var t=!1,n=/a/;return"split"===e&&((n={}).constructor={},n.constructor[l]=function(){return n},n.flags="",n[p]=/./[p]),n.exec=function(){return t=!0,null},n[p](""),!t});if(!v||!m||"replace"===e&&(!c||!u||f)||"split"===e&&!h){var g=/./[p],y=n(p,""[e],function(e,t,n,r,i){return t.exec===s?v&&!i?{done:!0,value:g.call(t,n,r)}:{done:!0,value:e.call(n,t,r)}:{done:!1}},{REPLACE_KEEPS_$0:u,REGEXP_REPLACE_SUBSTITUTES_UNDEFINED_CAPTURE:f}),b=y[0],w=y[1];r(String.prototype,e,b),r(RegExp.prototype,p,2==t?function(e,t){return w.call(e,this,t)}:function(e){return w.call(e,this)})}d&&a(RegExp.prototype[p],"sham",!0)}},9974:function(e,t,n){var r=n(3099);e.exports=function(e,t,n){if(r(e),void 0===t)return e;switch(n){case 0:return function(){return e.call(t)};case 1:return function(n){return e.call(t,n)};case 2:return function(n,r){return e.call(t,n,r)};case 3:return function(n,r,i){return e.call(t,n,r,i)}}return function(){return e.apply(t,arguments)}}},5005:function(e,t,n){var r=n(857),i=n(7854),o=function(e){return"function"==typeof e?e:void 0};e.exports=function(e,t){return arguments.length<2?o(r[e])||o(i[e]):r[e]&&r[e][t]||i[e]&&i[e][t]}},1246:function(e,t,n){var r=n(648),i=n(7497),o=n(5112)("iterator");e.exports=function(e){if(null!=e)return e[o]||e["@@iterator"]||i[r(e)]}},8554:function(e,t,n){var r=n(9670),i=n(1246);e.exports=function(e){var t=i(e);if("function"!=typeof t)throw TypeError(String(e)+" is not iterable");return r(t.call(e))}},647:function(e,t,n){var r=n(7908),i=Math.floor,o="".replace,s=/\$([$&'`]|\d\d?|<[^>]*>)/g,a=/\$([$&'`]|\d\d?)/g;e.exports=function(e,t,n,l,c,u){var d=n+e.length,f=l.length,h=a;return void 0!==c&&(c=r(c),h=s),o.call(u,h,function(r,o){var s;switch(o.charAt(0)){case"$":return"$";case"&":return e;case"`":return t.slice(0,n);case"'":return t.slice(d);case"<":s=c[o.slice(1,-1)];break;default:var a=+o;if(0===a)return r;if(a>f){var u=i(a/10);return 0===u?r:u<=f?void 0===l[u-1]?o.charAt(1):l[u-1]+o.charAt(1):r}s=l[a-1]}return void 0===s?"":s})}},7854:function(e,t,n){var r=function(e){return e&&e.Math==Math&&e};e.exports=r("object"==typeof globalThis&&globalThis)||r("object"==typeof window&&window)||r("object"==typeof self&&self)||r("object"==typeof n.g&&n.g)||function(){return this}()||Function("return this")()},6656:function(e){var t={}.hasOwnProperty;e.exports=function(e,n){return t.call(e,n)}},3501:function(e){e.exports={}},490:function(e,t,n){var r=n(5005);e.exports=r("document","documentElement")},4664:function(e,t,n){var r=n(9781),i=n(7293),o=n(317);e.exports=!r&&!i(function(){return 7!=Object.defineProperty(o("div"),"a",{get:function(){return 7}}).a})},1179:function(e){var t=Math.abs,n=Math.pow,r=Math.floor,i=Math.log,o=Math.LN2;e.exports={pack:function(e,s,a){var l,c,u,d=new Array(a),f=8*a-s-1,h=(1<<f)-1,p=h>>1,v=23===s?n(2,-24)-n(2,-77):0,m=e<0||0===e&&1/e<0?1:0,g=0;for((e=t(e))!=e||e===1/0?(c=e!=e?1:0,l=h):(l=r(i(e)/o),e*(u=n(2,-l))<1&&(l--,u*=2),(e+=l+p>=1?v/u:v*n(2,1-p))*u>=2&&(l++,u/=2),l+p>=h?(c=0,l=h):l+p>=1?(c=(e*u-1)*n(2,s),l+=p):(c=e*n(2,p-1)*n(2,s),l=0));s>=8;d[g++]=255&c,c/=256,s-=8);for(l=l<<s|c,f+=s;f>0;d[g++]=255&l,l/=256,f-=8);return d[--g]|=128*m,d},unpack:function(e,t){var r,i=e.length,o=8*i-t-1,s=(1<<o)-1,a=s>>1,l=o-7,c=i-1,u=e[c--],d=127&u;for(u>>=7;l>0;d=256*d+e[c],c--,l-=8);for(r=d&(1<<-l)-1,d>>=-l,l+=t;l>0;r=256*r+e[c],c--,l-=8);if(0===d)d=1-a;else{if(d===s)return r?NaN:u?-1/0:1/0;r+=n(2,t),d-=a}return(u?-1:1)*r*n(2,d-t)}}},8361:function(e,t,n){var r=n(7293),i=n(4326),o="".split;e.exports=r(function(){return!Object("z").propertyIsEnumerable(0)})?function(e){return"String"==i(e)?o.call(e,""):Object(e)}:Object},9587:function(e,t,n){var r=n(111),i=n(7674);e.exports=function(e,t,n){var o,s;return i&&"function"==typeof(o=t.constructor)&&o!==n&&r(s=o.prototype)&&s!==n.prototype&&i(e,s),e}},2788:function(e,t,n){var r=n(5465),i=Function.toString;"function"!=typeof r.inspectSource&&(r.inspectSource=function(e){return i.call(e)}),e.exports=r.inspectSource},9909:function(e,t,n){var r,i,o,s=n(8536),a=n(7854),l=n(111),c=n(8880),u=n(6656),d=n(5465),f=n(6200),h=n(3501),p=a.WeakMap;if(s){var v=d.state||(d.state=new p),m=v.get,g=v.has,y=v.set;r=function(e,t){return t.facade=e,y.call(v,e,t),t},i=function(e){return m.call(v,e)||{}},o=function(e){return g.call(v,e)}}else{var b=f("state");h[b]=!0,r=function(e,t){return t.facade=e,c(e,b,t),t},i=function(e){return u(e,b)?e[b]:{}},o=function(e){return u(e,b)}}e.exports={set:r,get:i,has:o,enforce:function(e){return o(e)?i(e):r(e,{})},getterFor:function(e){return function(t){var n;if(!l(t)||(n=i(t)).type!==e)throw TypeError("Incompatible receiver, "+e+" required");return n}}}},7659:function(e,t,n){var r=n(5112),i=n(7497),o=r("iterator"),s=Array.prototype;e.exports=function(e){return void 0!==e&&(i.Array===e||s[o]===e)}},3157:function(e,t,n){var r=n(4326);e.exports=Array.isArray||function(e){return"Array"==r(e)}},4705:function(e,t,n){var r=n(7293),i=/#|\.prototype\./,o=function(e,t){var n=a[s(e)];return n==c||n!=l&&("function"==typeof t?r(t):!!t)},s=o.normalize=function(e){return String(e).replace(i,".").toLowerCase()},a=o.data={},l=o.NATIVE="N",c=o.POLYFILL="P";e.exports=o},111:function(e){e.exports=function(e){return"object"==typeof e?null!==e:"function"==typeof e}},1913:function(e){e.exports=!1},7850:function(e,t,n){var r=n(111),i=n(4326),o=n(5112)("match");e.exports=function(e){var t;return r(e)&&(void 0!==(t=e[o])?!!t:"RegExp"==i(e))}},9212:function(e,t,n){var r=n(9670);e.exports=function(e){var t=e.return;if(void 0!==t)return r(t.call(e)).value}},3383:function(e,t,n){"use strict";var r,i,o,s=n(7293),a=n(9518),l=n(8880),c=n(6656),u=n(5112),d=n(1913),f=u("iterator"),h=!1;[].keys&&("next"in(o=[].keys())?(i=a(a(o)))!==Object.prototype&&(r=i):h=!0);var p=null==r||s(function(){var e={};return r[f].call(e)!==e});p&&(r={}),d&&!p||c(r,f)||l(r,f,function(){return this}),e.exports={IteratorPrototype:r,BUGGY_SAFARI_ITERATORS:h}},7497:function(e){e.exports={}},133:function(e,t,n){var r=n(7293);e.exports=!!Object.getOwnPropertySymbols&&!r(function(){return!String(Symbol())})},590:function(e,t,n){var r=n(7293),i=n(5112),o=n(1913),s=i("iterator");e.exports=!r(function(){var e=new URL("b?a=1&b=2&c=3","http://a"),t=e.searchParams,n="";return e.pathname="c%20d",t.forEach(function(e,r){t.delete("b"),n+=r+e}),o&&!e.toJSON||!t.sort||"http://a/c%20d?a=1&c=3"!==e.href||"3"!==t.get("c")||"a=1"!==String(new URLSearchParams("?a=1"))||!t[s]||"a"!==new URL("https://a@b").username||"b"!==new URLSearchParams(new URLSearchParams("a=b")).get("a")||"xn--e1aybc"!==new URL("http://тест").host||"#%D0%B1"!==new URL("http://a#б").hash||"a1c3"!==n||"x"!==new URL("http://x",void 0).host})},8536:function(e,t,n){var r=n(7854),i=n(2788),o=r.WeakMap;e.exports="function"==typeof o&&/native code/.test(i(o))},1574:function(e,t,n){"use strict";var r=n(9781),i=n(7293),o=n(1956),s=n(5181),a=n(5296),l=n(7908),c=n(8361),u=Object.assign,d=Object.defineProperty;e.exports=!u||i(function(){if(r&&1!==u({b:1},u(d({},"a",{enumerable:!0,get:function(){d(this,"b",{value:3,enumerable:!1})}}),{b:2})).b)return!0;var e={},t={},n=Symbol(),i="abcdefghijklmnopqrst";return e[n]=7,i.split("").forEach(function(e){t[e]=e}),7!=u({},e)[n]||o(u({},t)).join("")!=i})?function(e,t){for(var n=l(e),i=arguments.length,u=1,d=s.f,f=a.f;i>u;)for(var h,p=c(arguments[u++]),v=d?o(p).concat(d(p)):o(p),m=v.length,g=0;m>g;)h=v[g++],r&&!f.call(p,h)||(n[h]=p[h]);return n}:u},30:function(e,t,n){var r,i=n(9670),o=n(6048),s=n(748),a=n(3501),l=n(490),c=n(317),u=n(6200),d="prototype",f="script",h=u("IE_PROTO"),p=function(){},v=function(e){return"<"+f+">"+e+"</"+f+">"},m=function(){try{r=document.domain&&new ActiveXObject("htmlfile")}catch(e){}var e,t,n;m=r?function(e){e.write(v("")),e.close();var t=e.parentWindow.Object;return e=null,t}(r):(t=c("iframe"),n="java"+f+":",t.style.display="none",l.appendChild(t),t.src=String(n),(e=t.contentWindow.document).open(),e.write(v("document.F=Object")),e.close(),e.F);for(var i=s.length;i--;)delete m[d][s[i]];return m()};a[h]=!0,e.exports=Object.create||function(e,t){var n;return null!==e?(p[d]=i(e),n=new p,p[d]=null,n[h]=e):n=m(),void 0===t?n:o(n,t)}},6048:function(e,t,n){var r=n(9781),i=n(3070),o=n(9670),s=n(1956);e.exports=r?Object.defineProperties:function(e,t){o(e);for(var n,r=s(t),a=r.length,l=0;a>l;)i.f(e,n=r[l++],t[n]);return e}},3070:function(e,t,n){var r=n(9781),i=n(4664),o=n(9670),s=n(7593),a=Object.defineProperty;t.f=r?a:function(e,t,n){if(o(e),t=s(t,!0),o(n),i)try{return a(e,t,n)}catch(e){}if("get"in n||"set"in n)throw TypeError("Accessors not supported");return"value"in n&&(e[t]=n.value),e}},1236:function(e,t,n){var r=n(9781),i=n(5296),o=n(9114),s=n(5656),a=n(7593),l=n(6656),c=n(4664),u=Object.getOwnPropertyDescriptor;t.f=r?u:function(e,t){if(e=s(e),t=a(t,!0),c)try{return u(e,t)}catch(e){}if(l(e,t))return o(!i.f.call(e,t),e[t])}},8006:function(e,t,n){var r=n(6324),i=n(748).concat("length","prototype");t.f=Object.getOwnPropertyNames||function(e){return r(e,i)}},5181:function(e,t){t.f=Object.getOwnPropertySymbols},9518:function(e,t,n){var r=n(6656),i=n(7908),o=n(6200),s=n(8544),a=o("IE_PROTO"),l=Object.prototype;e.exports=s?Object.getPrototypeOf:function(e){return e=i(e),r(e,a)?e[a]:"function"==typeof e.constructor&&e instanceof e.constructor?e.constructor.prototype:e instanceof Object?l:null}},6324:function(e,t,n){var r=n(6656),i=n(5656),o=n(1318).indexOf,s=n(3501);e.exports=function(e,t){var n,a=i(e),l=0,c=[];for(n in a)!r(s,n)&&r(a,n)&&c.push(n);for(;t.length>l;)r(a,n=t[l++])&&(~o(c,n)||c.push(n));return c}},1956:function(e,t,n){var r=n(6324),i=n(748);e.exports=Object.keys||function(e){return r(e,i)}},5296:function(e,t){"use strict";var n={}.propertyIsEnumerable,r=Object.getOwnPropertyDescriptor,i=r&&!n.call({1:2},1);t.f=i?function(e){var t=r(this,e);return!!t&&t.enumerable}:n},7674:function(e,t,n){var r=n(9670),i=n(6077);e.exports=Object.setPrototypeOf||("__proto__"in{}?function(){var e,t=!1,n={};try{(e=Object.getOwnPropertyDescriptor(Object.prototype,"__proto__").set).call(n,[]),t=n instanceof Array}catch(e){}return function(n,o){return r(n),i(o),t?e.call(n,o):n.__proto__=o,n}}():void 0)},288:function(e,t,n){"use strict";var r=n(1694),i=n(648);e.exports=r?{}.toString:function(){return"[object "+i(this)+"]"}},3887:function(e,t,n){var r=n(5005),i=n(8006),o=n(5181),s=n(9670);e.exports=r("Reflect","ownKeys")||function(e){var t=i.f(s(e)),n=o.f;return n?t.concat(n(e)):t}},857:function(e,t,n){var r=n(7854);e.exports=r},2248:function(e,t,n){var r=n(1320);e.exports=function(e,t,n){for(var i in t)r(e,i,t[i],n);return e}},1320:function(e,t,n){var r=n(7854),i=n(8880),o=n(6656),s=n(3505),a=n(2788),l=n(9909),c=l.get,u=l.enforce,d=String(String).split("String");(e.exports=function(e,t,n,a){var l,c=!!a&&!!a.unsafe,f=!!a&&!!a.enumerable,h=!!a&&!!a.noTargetGet;"function"==typeof n&&("string"!=typeof t||o(n,"name")||i(n,"name",t),(l=u(n)).source||(l.source=d.join("string"==typeof t?t:""))),e!==r?(c?!h&&e[t]&&(f=!0):delete e[t],f?e[t]=n:i(e,t,n)):f?e[t]=n:s(t,n)})(Function.prototype,"toString",function(){return"function"==typeof this&&c(this).source||a(this)})},7651:function(e,t,n){var r=n(4326),i=n(2261);e.exports=function(e,t){var n=e.exec;if("function"==typeof n){var o=n.call(e,t);if("object"!=typeof o)throw TypeError("RegExp exec method returned something other than an Object or null");return o}if("RegExp"!==r(e))throw TypeError("RegExp#exec called on incompatible receiver");return i.call(e,t)}},2261:function(e,t,n){"use strict";var r,i,o=n(7066),s=n(2999),a=RegExp.prototype.exec,l=String.prototype.replace,c=a,u=(r=/a/,i=/b*/g,a.call(r,"a"),a.call(i,"a"),0!==r.lastIndex||0!==i.lastIndex),d=s.UNSUPPORTED_Y||s.BROKEN_CARET,f=void 0!==/()??/.exec("")[1];(u||f||d)&&(c=function(e){var t,n,r,i,s=this,c=d&&s.sticky,h=o.call(s),p=s.source,v=0,m=e;return c&&(-1===(h=h.replace("y","")).indexOf("g")&&(h+="g"),m=String(e).slice(s.lastIndex),s.lastIndex>0&&(!s.multiline||s.multiline&&"\n"!==e[s.lastIndex-1])&&(p="(?: "+p+")",m=" "+m,v++),n=new RegExp("^(?:"+p+")",h)),f&&(n=new RegExp("^"+p+"$(?!\\s)",h)),u&&(t=s.lastIndex),r=a.call(c?n:s,m),c?r?(r.input=r.input.slice(v),r[0]=r[0].slice(v),r.index=s.lastIndex,s.lastIndex+=r[0].length):s.lastIndex=0:u&&r&&(s.lastIndex=s.global?r.index+r[0].length:t),f&&r&&r.length>1&&l.call(r[0],n,function(){for(i=1;i<arguments.length-2;i++)void 0===arguments[i]&&(r[i]=void 0)}),r}),e.exports=c},7066:function(e,t,n){"use strict";var r=n(9670);e.exports=function(){var e=r(this),t="";return e.global&&(t+="g"),e.ignoreCase&&(t+="i"),e.multiline&&(t+="m"),e.dotAll&&(t+="s"),e.unicode&&(t+="u"),e.sticky&&(t+="y"),t}},2999:function(e,t,n){"use strict";var r=n(7293);function i(e,t){return RegExp(e,t)}t.UNSUPPORTED_Y=r(function(){var e=i("a","y");return e.lastIndex=2,null!=e.exec("abcd")}),t.BROKEN_CARET=r(function(){var e=i("^r","gy");return e.lastIndex=2,null!=e.exec("str")})},4488:function(e){e.exports=function(e){if(null==e)throw TypeError("Can't call method on "+e);return e}},3505:function(e,t,n){var r=n(7854),i=n(8880);e.exports=function(e,t){try{i(r,e,t)}catch(n){r[e]=t}return t}},6340:function(e,t,n){"use strict";var r=n(5005),i=n(3070),o=n(5112),s=n(9781),a=o("species");e.exports=function(e){var t=r(e),n=i.f;s&&t&&!t[a]&&n(t,a,{configurable:!0,get:function(){return this}})}},8003:function(e,t,n){var r=n(3070).f,i=n(6656),o=n(5112)("toStringTag");e.exports=function(e,t,n){e&&!i(e=n?e:e.prototype,o)&&r(e,o,{configurable:!0,value:t})}},6200:function(e,t,n){var r=n(2309),i=n(9711),o=r("keys");e.exports=function(e){return o[e]||(o[e]=i(e))}},5465:function(e,t,n){var r=n(7854),i=n(3505),o="__core-js_shared__",s=r[o]||i(o,{});e.exports=s},2309:function(e,t,n){var r=n(1913),i=n(5465);(e.exports=function(e,t){return i[e]||(i[e]=void 0!==t?t:{})})("versions",[]).push({version:"3.9.0",mode:r?"pure":"global",copyright:"© 2021 Denis Pushkarev (zloirock.ru)"})},6707:function(e,t,n){var r=n(9670),i=n(3099),o=n(5112)("species");e.exports=function(e,t){var n,s=r(e).constructor;return void 0===s||null==(n=r(s)[o])?t:i(n)}},8710:function(e,t,n){var r=n(9958),i=n(4488),o=function(e){return function(t,n){var o,s,a=String(i(t)),l=r(n),c=a.length;return l<0||l>=c?e?"":void 0:(o=a.charCodeAt(l))<55296||o>56319||l+1===c||(s=a.charCodeAt(l+1))<56320||s>57343?e?a.charAt(l):o:e?a.slice(l,l+2):s-56320+(o-55296<<10)+65536}};e.exports={codeAt:o(!1),charAt:o(!0)}},3197:function(e){"use strict";var t=2147483647,n=/[^\0-\u007E]/,r=/[.\u3002\uFF0E\uFF61]/g,i="Overflow: input needs wider integers to process",o=Math.floor,s=String.fromCharCode,a=function(e){return e+22+75*(e<26)},l=function(e,t,n){var r=0;for(e=n?o(e/700):e>>1,e+=o(e/t);e>455;r+=36)e=o(e/35);return o(r+36*e/(e+38))},c=function(e){var n=[];e=function(e){for(var t=[],n=0,r=e.length;n<r;){var i=e.charCodeAt(n++);if(i>=55296&&i<=56319&&n<r){var o=e.charCodeAt(n++);56320==(64512&o)?t.push(((1023&i)<<10)+(1023&o)+65536):(t.push(i),n--)}else t.push(i)}return t}(e);var r,c,u=e.length,d=128,f=0,h=72;for(r=0;r<e.length;r++)(c=e[r])<128&&n.push(s(c));var p=n.length,v=p;for(p&&n.push("-");v<u;){var m=t;for(r=0;r<e.length;r++)(c=e[r])>=d&&c<m&&(m=c);var g=v+1;if(m-d>o((t-f)/g))throw RangeError(i);for(f+=(m-d)*g,d=m,r=0;r<e.length;r++){if((c=e[r])<d&&++f>t)throw RangeError(i);if(c==d){for(var y=f,b=36;;b+=36){var w=b<=h?1:b>=h+26?26:b-h;if(y<w)break;var x=y-w,E=36-w;n.push(s(a(w+x%E))),y=o(x/E)}n.push(s(a(y))),h=l(f,g,v==p),f=0,++v}}++f,++d}return n.join("")};e.exports=function(e){var t,i,o=[],s=e.toLowerCase().replace(r,".").split(".");for(t=0;t<s.length;t++)i=s[t],o.push(n.test(i)?"xn--"+c(i):i);return o.join(".")}},6091:function(e,t,n){var r=n(7293),i=n(1361);e.exports=function(e){return r(function(){return!!i[e]()||"​᠎"!="​᠎"[e]()||i[e].name!==e})}},3111:function(e,t,n){var r=n(4488),i="["+n(1361)+"]",o=RegExp("^"+i+i+"*"),s=RegExp(i+i+"*$"),a=function(e){return function(t){var n=String(r(t));return 1&e&&(n=n.replace(o,"")),2&e&&(n=n.replace(s,"")),n}};e.exports={start:a(1),end:a(2),trim:a(3)}},1400:function(e,t,n){var r=n(9958),i=Math.max,o=Math.min;e.exports=function(e,t){var n=r(e);return n<0?i(n+t,0):o(n,t)}},7067:function(e,t,n){var r=n(9958),i=n(7466);e.exports=function(e){if(void 0===e)return 0;var t=r(e),n=i(t);if(t!==n)throw RangeError("Wrong length or index");return n}},5656:function(e,t,n){var r=n(8361),i=n(4488);e.exports=function(e){return r(i(e))}},9958:function(e){var t=Math.ceil,n=Math.floor;e.exports=function(e){return isNaN(e=+e)?0:(e>0?n:t)(e)}},7466:function(e,t,n){var r=n(9958),i=Math.min;e.exports=function(e){return e>0?i(r(e),9007199254740991):0}},7908:function(e,t,n){var r=n(4488);e.exports=function(e){return Object(r(e))}},4590:function(e,t,n){var r=n(3002);e.exports=function(e,t){var n=r(e);if(n%t)throw RangeError("Wrong offset");return n}},3002:function(e,t,n){var r=n(9958);e.exports=function(e){var t=r(e);if(t<0)throw RangeError("The argument can't be less than 0");return t}},7593:function(e,t,n){var r=n(111);e.exports=function(e,t){if(!r(e))return e;var n,i;if(t&&"function"==typeof(n=e.toString)&&!r(i=n.call(e)))return i;if("function"==typeof(n=e.valueOf)&&!r(i=n.call(e)))return i;if(!t&&"function"==typeof(n=e.toString)&&!r(i=n.call(e)))return i;throw TypeError("Can't convert object to primitive value")}},1694:function(e,t,n){var r={};r[n(5112)("toStringTag")]="z",e.exports="[object z]"===String(r)},9843:function(e,t,n){"use strict";var r=n(2109),i=n(7854),o=n(9781),s=n(3832),a=n(260),l=n(3331),c=n(5787),u=n(9114),d=n(8880),f=n(7466),h=n(7067),p=n(4590),v=n(7593),m=n(6656),g=n(648),y=n(111),b=n(30),w=n(7674),x=n(8006).f,E=n(7321),S=n(2092).forEach,k=n(6340),L=n(3070),A=n(1236),C=n(9909),_=n(9587),T=C.get,F=C.set,I=L.f,M=A.f,R=Math.round,U=i.RangeError,z=l.ArrayBuffer,O=l.DataView,j=a.NATIVE_ARRAY_BUFFER_VIEWS,q=a.TYPED_ARRAY_TAG,P=a.TypedArray,D=a.TypedArrayPrototype,N=a.aTypedArrayConstructor,B=a.isTypedArray,$="BYTES_PER_ELEMENT",W="Wrong length",H=function(e,t){for(var n=0,r=t.length,i=new(N(e))(r);r>n;)i[n]=t[n++];return i},Y=function(e,t){I(e,t,{get:function(){return T(this)[t]}})},G=function(e){var t;return e instanceof z||"ArrayBuffer"==(t=g(e))||"SharedArrayBuffer"==t},Q=function(e,t){return B(e)&&"symbol"!=typeof t&&t in e&&String(+t)==String(t)},X=function(e,t){return Q(e,t=v(t,!0))?u(2,e[t]):M(e,t)},V=function(e,t,n){return!(Q(e,t=v(t,!0))&&y(n)&&m(n,"value"))||m(n,"get")||m(n,"set")||n.configurable||m(n,"writable")&&!n.writable||m(n,"enumerable")&&!n.enumerable?I(e,t,n):(e[t]=n.value,e)};o?(j||(A.f=X,L.f=V,Y(D,"buffer"),Y(D,"byteOffset"),Y(D,"byteLength"),Y(D,"length")),r({target:"Object",stat:!0,forced:!j},{getOwnPropertyDescriptor:X,defineProperty:V}),e.exports=function(e,t,n){var o=e.match(/\d+$/)[0]/8,a=e+(n?"Clamped":"")+"Array",l="get"+e,u="set"+e,v=i[a],m=v,g=m&&m.prototype,L={},A=function(e,t){I(e,t,{get:function(){return function(e,t){var n=T(e);return n.view[l](t*o+n.byteOffset,!0)}(this,t)},set:function(e){return function(e,t,r){var i=T(e);n&&(r=(r=R(r))<0?0:r>255?255:255&r),i.view[u](t*o+i.byteOffset,r,!0)}(this,t,e)},enumerable:!0})};j?s&&(m=t(function(e,t,n,r){return c(e,m,a),_(y(t)?G(t)?void 0!==r?new v(t,p(n,o),r):void 0!==n?new v(t,p(n,o)):new v(t):B(t)?H(m,t):E.call(m,t):new v(h(t)),e,m)}),w&&w(m,P),S(x(v),function(e){e in m||d(m,e,v[e])}),m.prototype=g):(m=t(function(e,t,n,r){c(e,m,a);var i,s,l,u=0,d=0;if(y(t)){if(!G(t))return B(t)?H(m,t):E.call(m,t);i=t,d=p(n,o);var v=t.byteLength;if(void 0===r){if(v%o)throw U(W);if((s=v-d)<0)throw U(W)}else if((s=f(r)*o)+d>v)throw U(W);l=s/o}else l=h(t),i=new z(s=l*o);for(F(e,{buffer:i,byteOffset:d,byteLength:s,length:l,view:new O(i)});u<l;)A(e,u++)}),w&&w(m,P),g=m.prototype=b(D)),g.constructor!==m&&d(g,"constructor",m),q&&d(g,q,a),L[a]=m,r({global:!0,forced:m!=v,sham:!j},L),$ in m||d(m,$,o),$ in g||d(g,$,o),k(a)}):e.exports=function(){}},3832:function(e,t,n){var r=n(7854),i=n(7293),o=n(7072),s=n(260).NATIVE_ARRAY_BUFFER_VIEWS,a=r.ArrayBuffer,l=r.Int8Array;e.exports=!s||!i(function(){l(1)})||!i(function(){new l(-1)})||!o(function(e){new l,new l(null),new l(1.5),new l(e)},!0)||i(function(){return 1!==new l(new a(2),1,void 0).length})},3074:function(e,t,n){var r=n(260).aTypedArrayConstructor,i=n(6707);e.exports=function(e,t){for(var n=i(e,e.constructor),o=0,s=t.length,a=new(r(n))(s);s>o;)a[o]=t[o++];return a}},7321:function(e,t,n){var r=n(7908),i=n(7466),o=n(1246),s=n(7659),a=n(9974),l=n(260).aTypedArrayConstructor;e.exports=function(e){var t,n,c,u,d,f,h=r(e),p=arguments.length,v=p>1?arguments[1]:void 0,m=void 0!==v,g=o(h);if(null!=g&&!s(g))for(f=(d=g.call(h)).next,h=[];!(u=f.call(d)).done;)h.push(u.value);for(m&&p>2&&(v=a(v,arguments[2],2)),n=i(h.length),c=new(l(this))(n),t=0;n>t;t++)c[t]=m?v(h[t],t):h[t];return c}},9711:function(e){var t=0,n=Math.random();e.exports=function(e){return"Symbol("+String(void 0===e?"":e)+")_"+(++t+n).toString(36)}},3307:function(e,t,n){var r=n(133);e.exports=r&&!Symbol.sham&&"symbol"==typeof Symbol.iterator},5112:function(e,t,n){var r=n(7854),i=n(2309),o=n(6656),s=n(9711),a=n(133),l=n(3307),c=i("wks"),u=r.Symbol,d=l?u:u&&u.withoutSetter||s;e.exports=function(e){return o(c,e)||(a&&o(u,e)?c[e]=u[e]:c[e]=d("Symbol."+e)),c[e]}},1361:function(e){e.exports="\t\n\v\f\r                　\u2028\u2029\ufeff"},8264:function(e,t,n){"use strict";var r=n(2109),i=n(7854),o=n(3331),s=n(6340),a="ArrayBuffer",l=o[a];r({global:!0,forced:i[a]!==l},{ArrayBuffer:l}),s(a)},2222:function(e,t,n){"use strict";var r=n(2109),i=n(7293),o=n(3157),s=n(111),a=n(7908),l=n(7466),c=n(6135),u=n(5417),d=n(1194),f=n(5112),h=n(7392),p=f("isConcatSpreadable"),v=9007199254740991,m="Maximum allowed index exceeded",g=h>=51||!i(function(){var e=[];return e[p]=!1,e.concat()[0]!==e}),y=d("concat"),b=function(e){if(!s(e))return!1;var t=e[p];return void 0!==t?!!t:o(e)};r({target:"Array",proto:!0,forced:!g||!y},{concat:function(e){var t,n,r,i,o,s=a(this),d=u(s,0),f=0;for(t=-1,r=arguments.length;t<r;t++)if(b(o=-1===t?s:arguments[t])){if(f+(i=l(o.length))>v)throw TypeError(m);for(n=0;n<i;n++,f++)n in o&&c(d,f,o[n])}else{if(f>=v)throw TypeError(m);c(d,f++,o)}return d.length=f,d}})},7327:function(e,t,n){"use strict";var r=n(2109),i=n(2092).filter;r({target:"Array",proto:!0,forced:!n(1194)("filter")},{filter:function(e){return i(this,e,arguments.length>1?arguments[1]:void 0)}})},2772:function(e,t,n){"use strict";var r=n(2109),i=n(1318).indexOf,o=n(9341),s=[].indexOf,a=!!s&&1/[1].indexOf(1,-0)<0,l=o("indexOf");r({target:"Array",proto:!0,forced:a||!l},{indexOf:function(e){return a?s.apply(this,arguments)||0:i(this,e,arguments.length>1?arguments[1]:void 0)}})},6992:function(e,t,n){"use strict";var r=n(5656),i=n(1223),o=n(7497),s=n(9909),a=n(654),l="Array Iterator",c=s.set,u=s.getterFor(l);e.exports=a(Array,"Array",function(e,t){c(this,{type:l,target:r(e),index:0,kind:t})},function(){var e=u(this),t=e.target,n=e.kind,r=e.index++;return!t||r>=t.length?(e.target=void 0,{value:void 0,done:!0}):"keys"==n?{value:r,done:!1}:"values"==n?{value:t[r],done:!1}:{value:[r,t[r]],done:!1}},"values"),o.Arguments=o.Array,i("keys"),i("values"),i("entries")},1249:function(e,t,n){"use strict";var r=n(2109),i=n(2092).map;r({target:"Array",proto:!0,forced:!n(1194)("map")},{map:function(e){return i(this,e,arguments.length>1?arguments[1]:void 0)}})},7042:function(e,t,n){"use strict";var r=n(2109),i=n(111),o=n(3157),s=n(1400),a=n(7466),l=n(5656),c=n(6135),u=n(5112),d=n(1194)("slice"),f=u("species"),h=[].slice,p=Math.max;r({target:"Array",proto:!0,forced:!d},{slice:function(e,t){var n,r,u,d=l(this),v=a(d.length),m=s(e,v),g=s(void 0===t?v:t,v);if(o(d)&&("function"!=typeof(n=d.constructor)||n!==Array&&!o(n.prototype)?i(n)&&null===(n=n[f])&&(n=void 0):n=void 0,n===Array||void 0===n))return h.call(d,m,g);for(r=new(void 0===n?Array:n)(p(g-m,0)),u=0;m<g;m++,u++)m in d&&c(r,u,d[m]);return r.length=u,r}})},561:function(e,t,n){"use strict";var r=n(2109),i=n(1400),o=n(9958),s=n(7466),a=n(7908),l=n(5417),c=n(6135),u=n(1194)("splice"),d=Math.max,f=Math.min;r({target:"Array",proto:!0,forced:!u},{splice:function(e,t){var n,r,u,h,p,v,m=a(this),g=s(m.length),y=i(e,g),b=arguments.length;if(0===b?n=r=0:1===b?(n=0,r=g-y):(n=b-2,r=f(d(o(t),0),g-y)),g+n-r>9007199254740991)throw TypeError("Maximum allowed length exceeded");for(u=l(m,r),h=0;h<r;h++)(p=y+h)in m&&c(u,h,m[p]);if(u.length=r,n<r){for(h=y;h<g-r;h++)v=h+n,(p=h+r)in m?m[v]=m[p]:delete m[v];for(h=g;h>g-r+n;h--)delete m[h-1]}else if(n>r)for(h=g-r;h>y;h--)v=h+n-1,(p=h+r-1)in m?m[v]=m[p]:delete m[v];for(h=0;h<n;h++)m[h+y]=arguments[h+2];return m.length=g-r+n,u}})},8309:function(e,t,n){var r=n(9781),i=n(3070).f,o=Function.prototype,s=o.toString,a=/^\s*function ([^ (]*)/,l="name";r&&!(l in o)&&i(o,l,{configurable:!0,get:function(){try{return s.call(this).match(a)[1]}catch(e){return""}}})},489:function(e,t,n){var r=n(2109),i=n(7293),o=n(7908),s=n(9518),a=n(8544);r({target:"Object",stat:!0,forced:i(function(){s(1)}),sham:!a},{getPrototypeOf:function(e){return s(o(e))}})},1539:function(e,t,n){var r=n(1694),i=n(1320),o=n(288);r||i(Object.prototype,"toString",o,{unsafe:!0})},4916:function(e,t,n){"use strict";var r=n(2109),i=n(2261);r({target:"RegExp",proto:!0,forced:/./.exec!==i},{exec:i})},9714:function(e,t,n){"use strict";var r=n(1320),i=n(9670),o=n(7293),s=n(7066),a="toString",l=RegExp.prototype,c=l[a],u=o(function(){return"/a/b"!=c.call({source:"a",flags:"b"})}),d=c.name!=a;(u||d)&&r(RegExp.prototype,a,function(){var e=i(this),t=String(e.source),n=e.flags;return"/"+t+"/"+String(void 0===n&&e instanceof RegExp&&!("flags"in l)?s.call(e):n)},{unsafe:!0})},8783:function(e,t,n){"use strict";var r=n(8710).charAt,i=n(9909),o=n(654),s="String Iterator",a=i.set,l=i.getterFor(s);o(String,"String",function(e){a(this,{type:s,string:String(e),index:0})},function(){var e,t=l(this),n=t.string,i=t.index;return i>=n.length?{value:void 0,done:!0}:(e=r(n,i),t.index+=e.length,{value:e,done:!1})})},4723:function(e,t,n){"use strict";var r=n(7007),i=n(9670),o=n(7466),s=n(4488),a=n(1530),l=n(7651);r("match",1,function(e,t,n){return[function(t){var n=s(this),r=null==t?void 0:t[e];return void 0!==r?r.call(t,n):new RegExp(t)[e](String(n))},function(e){var r=n(t,e,this);if(r.done)return r.value;var s=i(e),c=String(this);if(!s.global)return l(s,c);var u=s.unicode;s.lastIndex=0;for(var d,f=[],h=0;null!==(d=l(s,c));){var p=String(d[0]);f[h]=p,""===p&&(s.lastIndex=a(c,o(s.lastIndex),u)),h++}return 0===h?null:f}]})},5306:function(e,t,n){"use strict";var r=n(7007),i=n(9670),o=n(7466),s=n(9958),a=n(4488),l=n(1530),c=n(647),u=n(7651),d=Math.max,f=Math.min,h=function(e){return void 0===e?e:String(e)};r("replace",2,function(e,t,n,r){var p=r.REGEXP_REPLACE_SUBSTITUTES_UNDEFINED_CAPTURE,v=r.REPLACE_KEEPS_$0,m=p?"$":"$0";return[function(n,r){var i=a(this),o=null==n?void 0:n[e];return void 0!==o?o.call(n,i,r):t.call(String(i),n,r)},function(e,r){if(!p&&v||"string"==typeof r&&-1===r.indexOf(m)){var a=n(t,e,this,r);if(a.done)return a.value}var g=i(e),y=String(this),b="function"==typeof r;b||(r=String(r));var w=g.global;if(w){var x=g.unicode;g.lastIndex=0}for(var E=[];;){var S=u(g,y);if(null===S)break;if(E.push(S),!w)break;""===String(S[0])&&(g.lastIndex=l(y,o(g.lastIndex),x))}for(var k="",L=0,A=0;A<E.length;A++){S=E[A];for(var C=String(S[0]),_=d(f(s(S.index),y.length),0),T=[],F=1;F<S.length;F++)T.push(h(S[F]));var I=S.groups;if(b){var M=[C].concat(T,_,y);void 0!==I&&M.push(I);var R=String(r.apply(void 0,M))}else R=c(C,y,_,T,I,r);_>=L&&(k+=y.slice(L,_)+R,L=_+C.length)}return k+y.slice(L)}]})},3123:function(e,t,n){"use strict";var r=n(7007),i=n(7850),o=n(9670),s=n(4488),a=n(6707),l=n(1530),c=n(7466),u=n(7651),d=n(2261),f=n(7293),h=[].push,p=Math.min,v=4294967295,m=!f(function(){return!RegExp(v,"y")});r("split",2,function(e,t,n){var r;return r="c"=="abbc".split(/(b)*/)[1]||4!="test".split(/(?:)/,-1).length||2!="ab".split(/(?:ab)*/).length||4!=".".split(/(.?)(.?)/).length||".".split(/()()/).length>1||"".split(/.?/).length?function(e,n){var r=String(s(this)),o=void 0===n?v:n>>>0;if(0===o)return[];if(void 0===e)return[r];if(!i(e))return t.call(r,e,o);for(var a,l,c,u=[],f=(e.ignoreCase?"i":"")+(e.multiline?"m":"")+(e.unicode?"u":"")+(e.sticky?"y":""),p=0,m=new RegExp(e.source,f+"g");(a=d.call(m,r))&&!((l=m.lastIndex)>p&&(u.push(r.slice(p,a.index)),a.length>1&&a.index<r.length&&h.apply(u,a.slice(1)),c=a[0].length,p=l,u.length>=o));)m.lastIndex===a.index&&m.lastIndex++;return p===r.length?!c&&m.test("")||u.push(""):u.push(r.slice(p)),u.length>o?u.slice(0,o):u}:"0".split(void 0,0).length?function(e,n){return void 0===e&&0===n?[]:t.call(this,e,n)}:t,[function(t,n){var i=s(this),o=null==t?void 0:t[e];return void 0!==o?o.call(t,i,n):r.call(String(i),t,n)},function(e,i){var s=n(r,e,this,i,r!==t);if(s.done)return s.value;var d=o(e),f=String(this),h=a(d,RegExp),g=d.unicode,y=(d.ignoreCase?"i":"")+(d.multiline?"m":"")+(d.unicode?"u":"")+(m?"y":"g"),b=new h(m?d:"^(?:"+d.source+")",y),w=void 0===i?v:i>>>0;if(0===w)return[];if(0===f.length)return null===u(b,f)?[f]:[];for(var x=0,E=0,S=[];E<f.length;){b.lastIndex=m?E:0;var k,L=u(b,m?f:f.slice(E));if(null===L||(k=p(c(b.lastIndex+(m?0:E)),f.length))===x)E=l(f,E,g);else{if(S.push(f.slice(x,E)),S.length===w)return S;for(var A=1;A<=L.length-1;A++)if(S.push(L[A]),S.length===w)return S;E=x=k}}return S.push(f.slice(x)),S}]},!m)},3210:function(e,t,n){"use strict";var r=n(2109),i=n(3111).trim;r({target:"String",proto:!0,forced:n(6091)("trim")},{trim:function(){return i(this)}})},2990:function(e,t,n){"use strict";var r=n(260),i=n(1048),o=r.aTypedArray;(0,r.exportTypedArrayMethod)("copyWithin",function(e,t){return i.call(o(this),e,t,arguments.length>2?arguments[2]:void 0)})},8927:function(e,t,n){"use strict";var r=n(260),i=n(2092).every,o=r.aTypedArray;(0,r.exportTypedArrayMethod)("every",function(e){return i(o(this),e,arguments.length>1?arguments[1]:void 0)})},3105:function(e,t,n){"use strict";var r=n(260),i=n(1285),o=r.aTypedArray;(0,r.exportTypedArrayMethod)("fill",function(e){return i.apply(o(this),arguments)})},5035:function(e,t,n){"use strict";var r=n(260),i=n(2092).filter,o=n(3074),s=r.aTypedArray;(0,r.exportTypedArrayMethod)("filter",function(e){var t=i(s(this),e,arguments.length>1?arguments[1]:void 0);return o(this,t)})},7174:function(e,t,n){"use strict";var r=n(260),i=n(2092).findIndex,o=r.aTypedArray;(0,r.exportTypedArrayMethod)("findIndex",function(e){return i(o(this),e,arguments.length>1?arguments[1]:void 0)})},4345:function(e,t,n){"use strict";var r=n(260),i=n(2092).find,o=r.aTypedArray;(0,r.exportTypedArrayMethod)("find",function(e){return i(o(this),e,arguments.length>1?arguments[1]:void 0)})},2846:function(e,t,n){"use strict";var r=n(260),i=n(2092).forEach,o=r.aTypedArray;(0,r.exportTypedArrayMethod)("forEach",function(e){i(o(this),e,arguments.length>1?arguments[1]:void 0)})},4731:function(e,t,n){"use strict";var r=n(260),i=n(1318).includes,o=r.aTypedArray;(0,r.exportTypedArrayMethod)("includes",function(e){return i(o(this),e,arguments.length>1?arguments[1]:void 0)})},7209:function(e,t,n){"use strict";var r=n(260),i=n(1318).indexOf,o=r.aTypedArray;(0,r.exportTypedArrayMethod)("indexOf",function(e){return i(o(this),e,arguments.length>1?arguments[1]:void 0)})},6319:function(e,t,n){"use strict";var r=n(7854),i=n(260),o=n(6992),s=n(5112)("iterator"),a=r.Uint8Array,l=o.values,c=o.keys,u=o.entries,d=i.aTypedArray,f=i.exportTypedArrayMethod,h=a&&a.prototype[s],p=!!h&&("values"==h.name||null==h.name),v=function(){return l.call(d(this))};f("entries",function(){return u.call(d(this))}),f("keys",function(){return c.call(d(this))}),f("values",v,!p),f(s,v,!p)},8867:function(e,t,n){"use strict";var r=n(260),i=r.aTypedArray,o=r.exportTypedArrayMethod,s=[].join;o("join",function(e){return s.apply(i(this),arguments)})},7789:function(e,t,n){"use strict";var r=n(260),i=n(6583),o=r.aTypedArray;(0,r.exportTypedArrayMethod)("lastIndexOf",function(e){return i.apply(o(this),arguments)})},3739:function(e,t,n){"use strict";var r=n(260),i=n(2092).map,o=n(6707),s=r.aTypedArray,a=r.aTypedArrayConstructor;(0,r.exportTypedArrayMethod)("map",function(e){return i(s(this),e,arguments.length>1?arguments[1]:void 0,function(e,t){return new(a(o(e,e.constructor)))(t)})})},4483:function(e,t,n){"use strict";var r=n(260),i=n(3671).right,o=r.aTypedArray;(0,r.exportTypedArrayMethod)("reduceRight",function(e){return i(o(this),e,arguments.length,arguments.length>1?arguments[1]:void 0)})},9368:function(e,t,n){"use strict";var r=n(260),i=n(3671).left,o=r.aTypedArray;(0,r.exportTypedArrayMethod)("reduce",function(e){return i(o(this),e,arguments.length,arguments.length>1?arguments[1]:void 0)})},2056:function(e,t,n){"use strict";var r=n(260),i=r.aTypedArray,o=r.exportTypedArrayMethod,s=Math.floor;o("reverse",function(){for(var e,t=this,n=i(t).length,r=s(n/2),o=0;o<r;)e=t[o],t[o++]=t[--n],t[n]=e;return t})},3462:function(e,t,n){"use strict";var r=n(260),i=n(7466),o=n(4590),s=n(7908),a=n(7293),l=r.aTypedArray;(0,r.exportTypedArrayMethod)("set",function(e){l(this);var t=o(arguments.length>1?arguments[1]:void 0,1),n=this.length,r=s(e),a=i(r.length),c=0;if(a+t>n)throw RangeError("Wrong length");for(;c<a;)this[t+c]=r[c++]},a(function(){new Int8Array(1).set({})}))},678:function(e,t,n){"use strict";var r=n(260),i=n(6707),o=n(7293),s=r.aTypedArray,a=r.aTypedArrayConstructor,l=r.exportTypedArrayMethod,c=[].slice;l("slice",function(e,t){for(var n=c.call(s(this),e,t),r=i(this,this.constructor),o=0,l=n.length,u=new(a(r))(l);l>o;)u[o]=n[o++];return u},o(function(){new Int8Array(1).slice()}))},7462:function(e,t,n){"use strict";var r=n(260),i=n(2092).some,o=r.aTypedArray;(0,r.exportTypedArrayMethod)("some",function(e){return i(o(this),e,arguments.length>1?arguments[1]:void 0)})},3824:function(e,t,n){"use strict";var r=n(260),i=r.aTypedArray,o=r.exportTypedArrayMethod,s=[].sort;o("sort",function(e){return s.call(i(this),e)})},5021:function(e,t,n){"use strict";var r=n(260),i=n(7466),o=n(1400),s=n(6707),a=r.aTypedArray;(0,r.exportTypedArrayMethod)("subarray",function(e,t){var n=a(this),r=n.length,l=o(e,r);return new(s(n,n.constructor))(n.buffer,n.byteOffset+l*n.BYTES_PER_ELEMENT,i((void 0===t?r:o(t,r))-l))})},2974:function(e,t,n){"use strict";var r=n(7854),i=n(260),o=n(7293),s=r.Int8Array,a=i.aTypedArray,l=i.exportTypedArrayMethod,c=[].toLocaleString,u=[].slice,d=!!s&&o(function(){c.call(new s(1))});l("toLocaleString",function(){return c.apply(d?u.call(a(this)):a(this),arguments)},o(function(){return[1,2].toLocaleString()!=new s([1,2]).toLocaleString()})||!o(function(){s.prototype.toLocaleString.call([1,2])}))},5016:function(e,t,n){"use strict";var r=n(260).exportTypedArrayMethod,i=n(7293),o=n(7854).Uint8Array,s=o&&o.prototype||{},a=[].toString,l=[].join;i(function(){a.call({})})&&(a=function(){return l.call(this)});var c=s.toString!=a;r("toString",a,c)},2472:function(e,t,n){n(9843)("Uint8",function(e){return function(t,n,r){return e(this,t,n,r)}})},4747:function(e,t,n){var r=n(7854),i=n(8324),o=n(8533),s=n(8880);for(var a in i){var l=r[a],c=l&&l.prototype;if(c&&c.forEach!==o)try{s(c,"forEach",o)}catch(e){c.forEach=o}}},3948:function(e,t,n){var r=n(7854),i=n(8324),o=n(6992),s=n(8880),a=n(5112),l=a("iterator"),c=a("toStringTag"),u=o.values;for(var d in i){var f=r[d],h=f&&f.prototype;if(h){if(h[l]!==u)try{s(h,l,u)}catch(e){h[l]=u}if(h[c]||s(h,c,d),i[d])for(var p in o)if(h[p]!==o[p])try{s(h,p,o[p])}catch(e){h[p]=o[p]}}}},1637:function(e,t,n){"use strict";n(6992);var r=n(2109),i=n(5005),o=n(590),s=n(1320),a=n(2248),l=n(8003),c=n(4994),u=n(9909),d=n(5787),f=n(6656),h=n(9974),p=n(648),v=n(9670),m=n(111),g=n(30),y=n(9114),b=n(8554),w=n(1246),x=n(5112),E=i("fetch"),S=i("Headers"),k=x("iterator"),L="URLSearchParams",A=L+"Iterator",C=u.set,_=u.getterFor(L),T=u.getterFor(A),F=/\+/g,I=Array(4),M=function(e){return I[e-1]||(I[e-1]=RegExp("((?:%[\\da-f]{2}){"+e+"})","gi"))},R=function(e){try{return decodeURIComponent(e)}catch(t){return e}},U=function(e){var t=e.replace(F," "),n=4;try{return decodeURIComponent(t)}catch(e){for(;n;)t=t.replace(M(n--),R);return t}},z=/[!'()~]|%20/g,O={"!":"%21","'":"%27","(":"%28",")":"%29","~":"%7E","%20":"+"},j=function(e){return O[e]},q=function(e){return encodeURIComponent(e).replace(z,j)},P=function(e,t){if(t)for(var n,r,i=t.split("&"),o=0;o<i.length;)(n=i[o++]).length&&(r=n.split("="),e.push({key:U(r.shift()),value:U(r.join("="))}))},D=function(e){this.entries.length=0,P(this.entries,e)},N=function(e,t){if(e<t)throw TypeError("Not enough arguments")},B=c(function(e,t){C(this,{type:A,iterator:b(_(e).entries),kind:t})},"Iterator",function(){var e=T(this),t=e.kind,n=e.iterator.next(),r=n.value;return n.done||(n.value="keys"===t?r.key:"values"===t?r.value:[r.key,r.value]),n}),$=function(){d(this,$,L);var e,t,n,r,i,o,s,a,l,c=arguments.length>0?arguments[0]:void 0,u=[];if(C(this,{type:L,entries:u,updateURL:function(){},updateSearchParams:D}),void 0!==c)if(m(c))if("function"==typeof(e=w(c)))for(n=(t=e.call(c)).next;!(r=n.call(t)).done;){if((s=(o=(i=b(v(r.value))).next).call(i)).done||(a=o.call(i)).done||!o.call(i).done)throw TypeError("Expected sequence with length 2");u.push({key:s.value+"",value:a.value+""})}else for(l in c)f(c,l)&&u.push({key:l,value:c[l]+""});else P(u,"string"==typeof c?"?"===c.charAt(0)?c.slice(1):c:c+"")},W=$.prototype;a(W,{append:function(e,t){N(arguments.length,2);var n=_(this);n.entries.push({key:e+"",value:t+""}),n.updateURL()},delete:function(e){N(arguments.length,1);for(var t=_(this),n=t.entries,r=e+"",i=0;i<n.length;)n[i].key===r?n.splice(i,1):i++;t.updateURL()},get:function(e){N(arguments.length,1);for(var t=_(this).entries,n=e+"",r=0;r<t.length;r++)if(t[r].key===n)return t[r].value;return null},getAll:function(e){N(arguments.length,1);for(var t=_(this).entries,n=e+"",r=[],i=0;i<t.length;i++)t[i].key===n&&r.push(t[i].value);return r},has:function(e){N(arguments.length,1);for(var t=_(this).entries,n=e+"",r=0;r<t.length;)if(t[r++].key===n)return!0;return!1},set:function(e,t){N(arguments.length,1);for(var n,r=_(this),i=r.entries,o=!1,s=e+"",a=t+"",l=0;l<i.length;l++)(n=i[l]).key===s&&(o?i.splice(l--,1):(o=!0,n.value=a));o||i.push({key:s,value:a}),r.updateURL()},sort:function(){var e,t,n,r=_(this),i=r.entries,o=i.slice();for(i.length=0,n=0;n<o.length;n++){for(e=o[n],t=0;t<n;t++)if(i[t].key>e.key){i.splice(t,0,e);break}t===n&&i.push(e)}r.updateURL()},forEach:function(e){for(var t,n=_(this).entries,r=h(e,arguments.length>1?arguments[1]:void 0,3),i=0;i<n.length;)r((t=n[i++]).value,t.key,this)},keys:function(){return new B(this,"keys")},values:function(){return new B(this,"values")},entries:function(){return new B(this,"entries")}},{enumerable:!0}),s(W,k,W.entries),s(W,"toString",function(){for(var e,t=_(this).entries,n=[],r=0;r<t.length;)e=t[r++],n.push(q(e.key)+"="+q(e.value));return n.join("&")},{enumerable:!0}),l($,L),r({global:!0,forced:!o},{URLSearchParams:$}),o||"function"!=typeof E||"function"!=typeof S||r({global:!0,enumerable:!0,forced:!0},{fetch:function(e){var t,n,r,i=[e];return arguments.length>1&&(m(t=arguments[1])&&(n=t.body,p(n)===L&&((r=t.headers?new S(t.headers):new S).has("content-type")||r.set("content-type","application/x-www-form-urlencoded;charset=UTF-8"),t=g(t,{body:y(0,String(n)),headers:y(0,r)}))),i.push(t)),E.apply(this,i)}}),e.exports={URLSearchParams:$,getState:_}},285:function(e,t,n){"use strict";n(8783);var r,i=n(2109),o=n(9781),s=n(590),a=n(7854),l=n(6048),c=n(1320),u=n(5787),d=n(6656),f=n(1574),h=n(8457),p=n(8710).codeAt,v=n(3197),m=n(8003),g=n(1637),y=n(9909),b=a.URL,w=g.URLSearchParams,x=g.getState,E=y.set,S=y.getterFor("URL"),k=Math.floor,L=Math.pow,A="Invalid scheme",C="Invalid host",_="Invalid port",T=/[A-Za-z]/,F=/[\d+-.A-Za-z]/,I=/\d/,M=/^(0x|0X)/,R=/^[0-7]+$/,U=/^\d+$/,z=/^[\dA-Fa-f]+$/,O=/[\u0000\t\u000A\u000D #%/:?@[\\]]/,j=/[\u0000\t\u000A\u000D #/:?@[\\]]/,q=/^[\u0000-\u001F ]+|[\u0000-\u001F ]+$/g,P=/[\t\u000A\u000D]/g,D=function(e,t){var n,r,i;if("["==t.charAt(0)){if("]"!=t.charAt(t.length-1))return C;if(!(n=B(t.slice(1,-1))))return C;e.host=n}else if(V(e)){if(t=v(t),O.test(t))return C;if(null===(n=N(t)))return C;e.host=n}else{if(j.test(t))return C;for(n="",r=h(t),i=0;i<r.length;i++)n+=Q(r[i],W);e.host=n}},N=function(e){var t,n,r,i,o,s,a,l=e.split(".");if(l.length&&""==l[l.length-1]&&l.pop(),(t=l.length)>4)return e;for(n=[],r=0;r<t;r++){if(""==(i=l[r]))return e;if(o=10,i.length>1&&"0"==i.charAt(0)&&(o=M.test(i)?16:8,i=i.slice(8==o?1:2)),""===i)s=0;else{if(!(10==o?U:8==o?R:z).test(i))return e;s=parseInt(i,o)}n.push(s)}for(r=0;r<t;r++)if(s=n[r],r==t-1){if(s>=L(256,5-t))return null}else if(s>255)return null;for(a=n.pop(),r=0;r<n.length;r++)a+=n[r]*L(256,3-r);return a},B=function(e){var t,n,r,i,o,s,a,l=[0,0,0,0,0,0,0,0],c=0,u=null,d=0,f=function(){return e.charAt(d)};if(":"==f()){if(":"!=e.charAt(1))return;d+=2,u=++c}for(;f();){if(8==c)return;if(":"!=f()){for(t=n=0;n<4&&z.test(f());)t=16*t+parseInt(f(),16),d++,n++;if("."==f()){if(0==n)return;if(d-=n,c>6)return;for(r=0;f();){if(i=null,r>0){if(!("."==f()&&r<4))return;d++}if(!I.test(f()))return;for(;I.test(f());){if(o=parseInt(f(),10),null===i)i=o;else{if(0==i)return;i=10*i+o}if(i>255)return;d++}l[c]=256*l[c]+i,2!=++r&&4!=r||c++}if(4!=r)return;break}if(":"==f()){if(d++,!f())return}else if(f())return;l[c++]=t}else{if(null!==u)return;d++,u=++c}}if(null!==u)for(s=c-u,c=7;0!=c&&s>0;)a=l[c],l[c--]=l[u+s-1],l[u+--s]=a;else if(8!=c)return;return l},$=function(e){var t,n,r,i;if("number"==typeof e){for(t=[],n=0;n<4;n++)t.unshift(e%256),e=k(e/256);return t.join(".")}if("object"==typeof e){for(t="",r=function(e){for(var t=null,n=1,r=null,i=0,o=0;o<8;o++)0!==e[o]?(i>n&&(t=r,n=i),r=null,i=0):(null===r&&(r=o),++i);return i>n&&(t=r,n=i),t}(e),n=0;n<8;n++)i&&0===e[n]||(i&&(i=!1),r===n?(t+=n?":":"::",i=!0):(t+=e[n].toString(16),n<7&&(t+=":")));return"["+t+"]"}return e},W={},H=f({},W,{" ":1,'"':1,"<":1,">":1,"`":1}),Y=f({},H,{"#":1,"?":1,"{":1,"}":1}),G=f({},Y,{"/":1,":":1,";":1,"=":1,"@":1,"[":1,"\\":1,"]":1,"^":1,"|":1}),Q=function(e,t){var n=p(e,0);return n>32&&n<127&&!d(t,e)?e:encodeURIComponent(e)},X={ftp:21,file:null,http:80,https:443,ws:80,wss:443},V=function(e){return d(X,e.scheme)},K=function(e){return""!=e.username||""!=e.password},Z=function(e){return!e.host||e.cannotBeABaseURL||"file"==e.scheme},J=function(e,t){var n;return 2==e.length&&T.test(e.charAt(0))&&(":"==(n=e.charAt(1))||!t&&"|"==n)},ee=function(e){var t;return e.length>1&&J(e.slice(0,2))&&(2==e.length||"/"===(t=e.charAt(2))||"\\"===t||"?"===t||"#"===t)},te=function(e){var t=e.path,n=t.length;!n||"file"==e.scheme&&1==n&&J(t[0],!0)||t.pop()},ne=function(e){return"."===e||"%2e"===e.toLowerCase()},re=function(e){return".."===(e=e.toLowerCase())||"%2e."===e||".%2e"===e||"%2e%2e"===e},ie={},oe={},se={},ae={},le={},ce={},ue={},de={},fe={},he={},pe={},ve={},me={},ge={},ye={},be={},we={},xe={},Ee={},Se={},ke={},Le=function(e,t,n,i){var o,s,a,l,c=n||ie,u=0,f="",p=!1,v=!1,m=!1;for(n||(e.scheme="",e.username="",e.password="",e.host=null,e.port=null,e.path=[],e.query=null,e.fragment=null,e.cannotBeABaseURL=!1,t=t.replace(q,"")),t=t.replace(P,""),o=h(t);u<=o.length;){switch(s=o[u],c){case ie:if(!s||!T.test(s)){if(n)return A;c=se;continue}f+=s.toLowerCase(),c=oe;break;case oe:if(s&&(F.test(s)||"+"==s||"-"==s||"."==s))f+=s.toLowerCase();else{if(":"!=s){if(n)return A;f="",c=se,u=0;continue}if(n&&(V(e)!=d(X,f)||"file"==f&&(K(e)||null!==e.port)||"file"==e.scheme&&!e.host))return;if(e.scheme=f,n)return void(V(e)&&X[e.scheme]==e.port&&(e.port=null));f="","file"==e.scheme?c=ge:V(e)&&i&&i.scheme==e.scheme?c=ae:V(e)?c=de:"/"==o[u+1]?(c=le,u++):(e.cannotBeABaseURL=!0,e.path.push(""),c=Ee)}break;case se:if(!i||i.cannotBeABaseURL&&"#"!=s)return A;if(i.cannotBeABaseURL&&"#"==s){e.scheme=i.scheme,e.path=i.path.slice(),e.query=i.query,e.fragment="",e.cannotBeABaseURL=!0,c=ke;break}c="file"==i.scheme?ge:ce;continue;case ae:if("/"!=s||"/"!=o[u+1]){c=ce;continue}c=fe,u++;break;case le:if("/"==s){c=he;break}c=xe;continue;case ce:if(e.scheme=i.scheme,s==r)e.username=i.username,e.password=i.password,e.host=i.host,e.port=i.port,e.path=i.path.slice(),e.query=i.query;else if("/"==s||"\\"==s&&V(e))c=ue;else if("?"==s)e.username=i.username,e.password=i.password,e.host=i.host,e.port=i.port,e.path=i.path.slice(),e.query="",c=Se;else{if("#"!=s){e.username=i.username,e.password=i.password,e.host=i.host,e.port=i.port,e.path=i.path.slice(),e.path.pop(),c=xe;continue}e.username=i.username,e.password=i.password,e.host=i.host,e.port=i.port,e.path=i.path.slice(),e.query=i.query,e.fragment="",c=ke}break;case ue:if(!V(e)||"/"!=s&&"\\"!=s){if("/"!=s){e.username=i.username,e.password=i.password,e.host=i.host,e.port=i.port,c=xe;continue}c=he}else c=fe;break;case de:if(c=fe,"/"!=s||"/"!=f.charAt(u+1))continue;u++;break;case fe:if("/"!=s&&"\\"!=s){c=he;continue}break;case he:if("@"==s){p&&(f="%40"+f),p=!0,a=h(f);for(var g=0;g<a.length;g++){var y=a[g];if(":"!=y||m){var b=Q(y,G);m?e.password+=b:e.username+=b}else m=!0}f=""}else if(s==r||"/"==s||"?"==s||"#"==s||"\\"==s&&V(e)){if(p&&""==f)return"Invalid authority";u-=h(f).length+1,f="",c=pe}else f+=s;break;case pe:case ve:if(n&&"file"==e.scheme){c=be;continue}if(":"!=s||v){if(s==r||"/"==s||"?"==s||"#"==s||"\\"==s&&V(e)){if(V(e)&&""==f)return C;if(n&&""==f&&(K(e)||null!==e.port))return;if(l=D(e,f))return l;if(f="",c=we,n)return;continue}"["==s?v=!0:"]"==s&&(v=!1),f+=s}else{if(""==f)return C;if(l=D(e,f))return l;if(f="",c=me,n==ve)return}break;case me:if(!I.test(s)){if(s==r||"/"==s||"?"==s||"#"==s||"\\"==s&&V(e)||n){if(""!=f){var w=parseInt(f,10);if(w>65535)return _;e.port=V(e)&&w===X[e.scheme]?null:w,f=""}if(n)return;c=we;continue}return _}f+=s;break;case ge:if(e.scheme="file","/"==s||"\\"==s)c=ye;else{if(!i||"file"!=i.scheme){c=xe;continue}if(s==r)e.host=i.host,e.path=i.path.slice(),e.query=i.query;else if("?"==s)e.host=i.host,e.path=i.path.slice(),e.query="",c=Se;else{if("#"!=s){ee(o.slice(u).join(""))||(e.host=i.host,e.path=i.path.slice(),te(e)),c=xe;continue}e.host=i.host,e.path=i.path.slice(),e.query=i.query,e.fragment="",c=ke}}break;case ye:if("/"==s||"\\"==s){c=be;break}i&&"file"==i.scheme&&!ee(o.slice(u).join(""))&&(J(i.path[0],!0)?e.path.push(i.path[0]):e.host=i.host),c=xe;continue;case be:if(s==r||"/"==s||"\\"==s||"?"==s||"#"==s){if(!n&&J(f))c=xe;else if(""==f){if(e.host="",n)return;c=we}else{if(l=D(e,f))return l;if("localhost"==e.host&&(e.host=""),n)return;f="",c=we}continue}f+=s;break;case we:if(V(e)){if(c=xe,"/"!=s&&"\\"!=s)continue}else if(n||"?"!=s)if(n||"#"!=s){if(s!=r&&(c=xe,"/"!=s))continue}else e.fragment="",c=ke;else e.query="",c=Se;break;case xe:if(s==r||"/"==s||"\\"==s&&V(e)||!n&&("?"==s||"#"==s)){if(re(f)?(te(e),"/"==s||"\\"==s&&V(e)||e.path.push("")):ne(f)?"/"==s||"\\"==s&&V(e)||e.path.push(""):("file"==e.scheme&&!e.path.length&&J(f)&&(e.host&&(e.host=""),f=f.charAt(0)+":"),e.path.push(f)),f="","file"==e.scheme&&(s==r||"?"==s||"#"==s))for(;e.path.length>1&&""===e.path[0];)e.path.shift();"?"==s?(e.query="",c=Se):"#"==s&&(e.fragment="",c=ke)}else f+=Q(s,Y);break;case Ee:"?"==s?(e.query="",c=Se):"#"==s?(e.fragment="",c=ke):s!=r&&(e.path[0]+=Q(s,W));break;case Se:n||"#"!=s?s!=r&&("'"==s&&V(e)?e.query+="%27":e.query+="#"==s?"%23":Q(s,W)):(e.fragment="",c=ke);break;case ke:s!=r&&(e.fragment+=Q(s,H))}u++}},Ae=function(e){var t,n,r=u(this,Ae,"URL"),i=arguments.length>1?arguments[1]:void 0,s=String(e),a=E(r,{type:"URL"});if(void 0!==i)if(i instanceof Ae)t=S(i);else if(n=Le(t={},String(i)))throw TypeError(n);if(n=Le(a,s,null,t))throw TypeError(n);var l=a.searchParams=new w,c=x(l);c.updateSearchParams(a.query),c.updateURL=function(){a.query=String(l)||null},o||(r.href=_e.call(r),r.origin=Te.call(r),r.protocol=Fe.call(r),r.username=Ie.call(r),r.password=Me.call(r),r.host=Re.call(r),r.hostname=Ue.call(r),r.port=ze.call(r),r.pathname=Oe.call(r),r.search=je.call(r),r.searchParams=qe.call(r),r.hash=Pe.call(r))},Ce=Ae.prototype,_e=function(){var e=S(this),t=e.scheme,n=e.username,r=e.password,i=e.host,o=e.port,s=e.path,a=e.query,l=e.fragment,c=t+":";return null!==i?(c+="//",K(e)&&(c+=n+(r?":"+r:"")+"@"),c+=$(i),null!==o&&(c+=":"+o)):"file"==t&&(c+="//"),c+=e.cannotBeABaseURL?s[0]:s.length?"/"+s.join("/"):"",null!==a&&(c+="?"+a),null!==l&&(c+="#"+l),c},Te=function(){var e=S(this),t=e.scheme,n=e.port;if("blob"==t)try{return new URL(t.path[0]).origin}catch(e){return"null"}return"file"!=t&&V(e)?t+"://"+$(e.host)+(null!==n?":"+n:""):"null"},Fe=function(){return S(this).scheme+":"},Ie=function(){return S(this).username},Me=function(){return S(this).password},Re=function(){var e=S(this),t=e.host,n=e.port;return null===t?"":null===n?$(t):$(t)+":"+n},Ue=function(){var e=S(this).host;return null===e?"":$(e)},ze=function(){var e=S(this).port;return null===e?"":String(e)},Oe=function(){var e=S(this),t=e.path;return e.cannotBeABaseURL?t[0]:t.length?"/"+t.join("/"):""},je=function(){var e=S(this).query;return e?"?"+e:""},qe=function(){return S(this).searchParams},Pe=function(){var e=S(this).fragment;return e?"#"+e:""},De=function(e,t){return{get:e,set:t,configurable:!0,enumerable:!0}};if(o&&l(Ce,{href:De(_e,function(e){var t=S(this),n=String(e),r=Le(t,n);if(r)throw TypeError(r);x(t.searchParams).updateSearchParams(t.query)}),origin:De(Te),protocol:De(Fe,function(e){var t=S(this);Le(t,String(e)+":",ie)}),username:De(Ie,function(e){var t=S(this),n=h(String(e));if(!Z(t)){t.username="";for(var r=0;r<n.length;r++)t.username+=Q(n[r],G)}}),password:De(Me,function(e){var t=S(this),n=h(String(e));if(!Z(t)){t.password="";for(var r=0;r<n.length;r++)t.password+=Q(n[r],G)}}),host:De(Re,function(e){var t=S(this);t.cannotBeABaseURL||Le(t,String(e),pe)}),hostname:De(Ue,function(e){var t=S(this);t.cannotBeABaseURL||Le(t,String(e),ve)}),port:De(ze,function(e){var t=S(this);Z(t)||(""==(e=String(e))?t.port=null:Le(t,e,me))}),pathname:De(Oe,function(e){var t=S(this);t.cannotBeABaseURL||(t.path=[],Le(t,e+"",we))}),search:De(je,function(e){var t=S(this);""==(e=String(e))?t.query=null:("?"==e.charAt(0)&&(e=e.slice(1)),t.query="",Le(t,e,Se)),x(t.searchParams).updateSearchParams(t.query)}),searchParams:De(qe),hash:De(Pe,function(e){var t=S(this);""!=(e=String(e))?("#"==e.charAt(0)&&(e=e.slice(1)),t.fragment="",Le(t,e,ke)):t.fragment=null})}),c(Ce,"toJSON",function(){return _e.call(this)},{enumerable:!0}),c(Ce,"toString",function(){return _e.call(this)},{enumerable:!0}),b){var Ne=b.createObjectURL,Be=b.revokeObjectURL;Ne&&c(Ae,"createObjectURL",function(e){return Ne.apply(b,arguments)}),Be&&c(Ae,"revokeObjectURL",function(e){return Be.apply(b,arguments)})}m(Ae,"URL"),i({global:!0,forced:!s,sham:!o},{URL:Ae})}},t={};function n(r){if(t[r])return t[r].exports;var i=t[r]={exports:{}};return e[r](i,i.exports,n),i.exports}n.d=function(e,t){for(var r in t)n.o(t,r)&&!n.o(e,r)&&Object.defineProperty(e,r,{enumerable:!0,get:t[r]})},n.g=function(){if("object"==typeof globalThis)return globalThis;try{return this||new Function("return this")()}catch(e){if("object"==typeof window)return window}}(),n.o=function(e,t){return Object.prototype.hasOwnProperty.call(e,t)},n.r=function(e){"undefined"!=typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(e,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(e,"__esModule",{value:!0})};var r={};return function(){"use strict";function e(e,n){var r;if("undefined"==typeof Symbol||null==e[Symbol.iterator]){if(Array.isArray(e)||(r=function(e,n){if(e){if("string"==typeof e)return t(e,n);var r=Object.prototype.toString.call(e).slice(8,-1);return"Object"===r&&e.constructor&&(r=e.constructor.name),"Map"===r||"Set"===r?Array.from(e):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?t(e,n):void 0}}(e))||n&&e&&"number"==typeof e.length){r&&(e=r);var i=0,o=function(){};return{s:o,n:function(){return i>=e.length?{done:!0}:{done:!1,value:e[i++]}},e:function(e){throw e},f:o}}throw new TypeError("Invalid attempt to iterate non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}var s,a=!0,l=!1;return{s:function(){r=e[Symbol.iterator]()},n:function(){var e=r.next();return a=e.done,e},e:function(e){l=!0,s=e},f:function(){try{a||null==r.return||r.return()}finally{if(l)throw s}}}}function t(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function i(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}n.r(r),n.d(r,{Dropzone:function(){return w},default:function(){return L}}),n(2222),n(7327),n(2772),n(6992),n(1249),n(7042),n(561),n(8264),n(8309),n(489),n(1539),n(4916),n(9714),n(8783),n(4723),n(5306),n(3123),n(3210),n(2472),n(2990),n(8927),n(3105),n(5035),n(4345),n(7174),n(2846),n(4731),n(7209),n(6319),n(8867),n(7789),n(3739),n(9368),n(4483),n(2056),n(3462),n(678),n(7462),n(3824),n(5021),n(2974),n(5016),n(4747),n(3948),n(285);var o=function(){function t(){!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,t)}var n,r,o;return n=t,r=[{key:"on",value:function(e,t){return this._callbacks=this._callbacks||{},this._callbacks[e]||(this._callbacks[e]=[]),this._callbacks[e].push(t),this}},{key:"emit",value:function(t){this._callbacks=this._callbacks||{};for(var n=this._callbacks[t],r=arguments.length,i=new Array(r>1?r-1:0),o=1;o<r;o++)i[o-1]=arguments[o];if(n){var s,a=e(n,!0);try{for(a.s();!(s=a.n()).done;)s.value.apply(this,i)}catch(e){a.e(e)}finally{a.f()}}return this.element&&this.element.dispatchEvent(this.makeEvent("dropzone:"+t,{args:i})),this}},{key:"makeEvent",value:function(e,t){var n={bubbles:!0,cancelable:!0,detail:t};if("function"==typeof window.CustomEvent)return new CustomEvent(e,n);var r=document.createEvent("CustomEvent");return r.initCustomEvent(e,n.bubbles,n.cancelable,n.detail),r}},{key:"off",value:function(e,t){if(!this._callbacks||0===arguments.length)return this._callbacks={},this;var n=this._callbacks[e];if(!n)return this;if(1===arguments.length)return delete this._callbacks[e],this;for(var r=0;r<n.length;r++)if(n[r]===t){n.splice(r,1);break}return this}}],r&&i(n.prototype,r),o&&i(n,o),t}();function s(e,t){var n;if("undefined"==typeof Symbol||null==e[Symbol.iterator]){if(Array.isArray(e)||(n=function(e,t){if(e){if("string"==typeof e)return a(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?a(e,t):void 0}}(e))||t&&e&&"number"==typeof e.length){n&&(e=n);var r=0,i=function(){};return{s:i,n:function(){return r>=e.length?{done:!0}:{done:!1,value:e[r++]}},e:function(e){throw e},f:i}}throw new TypeError("Invalid attempt to iterate non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}var o,s=!0,l=!1;return{s:function(){n=e[Symbol.iterator]()},n:function(){var e=n.next();return s=e.done,e},e:function(e){l=!0,o=e},f:function(){try{s||null==n.return||n.return()}finally{if(l)throw o}}}}function a(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}var l={url:null,method:"post",withCredentials:!1,timeout:null,parallelUploads:2,uploadMultiple:!1,chunking:!1,forceChunking:!1,chunkSize:2e6,parallelChunkUploads:!1,retryChunks:!1,retryChunksLimit:3,maxFilesize:256,paramName:"file",createImageThumbnails:!0,maxThumbnailFilesize:10,thumbnailWidth:120,thumbnailHeight:120,thumbnailMethod:"crop",resizeWidth:null,resizeHeight:null,resizeMimeType:null,resizeQuality:.8,resizeMethod:"contain",filesizeBase:1e3,maxFiles:null,headers:null,clickable:!0,ignoreHiddenFiles:!0,acceptedFiles:null,acceptedMimeTypes:null,autoProcessQueue:!0,autoQueue:!0,addRemoveLinks:!1,previewsContainer:null,disablePreviews:!1,hiddenInputContainer:"body",capture:null,renameFilename:null,renameFile:null,forceFallback:!1,dictDefaultMessage:"Drop files here to upload",dictFallbackMessage:"Your browser does not support drag'n'drop file uploads.",dictFallbackText:"Please use the fallback form below to upload your files like in the olden days.",dictFileTooBig:"File is too big ({{filesize}}MiB). Max filesize: {{maxFilesize}}MiB.",dictInvalidFileType:"You can't upload files of this type.",dictResponseError:"Server responded with {{statusCode}} code.",dictCancelUpload:"Cancel upload",dictUploadCanceled:"Upload canceled.",dictCancelUploadConfirmation:"Are you sure you want to cancel this upload?",dictRemoveFile:"Remove file",dictRemoveFileConfirmation:null,dictMaxFilesExceeded:"You can not upload any more files.",dictFileSizeUnits:{tb:"TB",gb:"GB",mb:"MB",kb:"KB",b:"b"},init:function(){},params:function(e,t,n){if(n)return{dzuuid:n.file.upload.uuid,dzchunkindex:n.index,dztotalfilesize:n.file.size,dzchunksize:this.options.chunkSize,dztotalchunkcount:n.file.upload.totalChunkCount,dzchunkbyteoffset:n.index*this.options.chunkSize}},accept:function(e,t){return t()},chunksUploaded:function(e,t){t()},fallback:function(){var e;this.element.className="".concat(this.element.className," dz-browser-not-supported");var t,n=s(this.element.getElementsByTagName("div"),!0);try{for(n.s();!(t=n.n()).done;){var r=t.value;if(/(^| )dz-message($| )/.test(r.className)){e=r,r.className="dz-message";break}}}catch(e){n.e(e)}finally{n.f()}e||(e=w.createElement('<div class="dz-message"><span></span></div>'),this.element.appendChild(e));var i=e.getElementsByTagName("span")[0];return i&&(null!=i.textContent?i.textContent=this.options.dictFallbackMessage:null!=i.innerText&&(i.innerText=this.options.dictFallbackMessage)),this.element.appendChild(this.getFallbackForm())},resize:function(e,t,n,r){var i={srcX:0,srcY:0,srcWidth:e.width,srcHeight:e.height},o=e.width/e.height;null==t&&null==n?(t=i.srcWidth,n=i.srcHeight):null==t?t=n*o:null==n&&(n=t/o);var s=(t=Math.min(t,i.srcWidth))/(n=Math.min(n,i.srcHeight));if(i.srcWidth>t||i.srcHeight>n)if("crop"===r)o>s?(i.srcHeight=e.height,i.srcWidth=i.srcHeight*s):(i.srcWidth=e.width,i.srcHeight=i.srcWidth/s);else{if("contain"!==r)throw new Error("Unknown resizeMethod '".concat(r,"'"));o>s?n=t/o:t=n*o}return i.srcX=(e.width-i.srcWidth)/2,i.srcY=(e.height-i.srcHeight)/2,i.trgWidth=t,i.trgHeight=n,i},transformFile:function(e,t){return(this.options.resizeWidth||this.options.resizeHeight)&&e.type.match(/image.*/)?this.resizeImage(e,this.options.resizeWidth,this.options.resizeHeight,this.options.resizeMethod,t):t(e)},previewTemplate:'<div class="dz-preview dz-file-preview"> <div class="dz-image"><img data-dz-thumbnail/></div> <div class="dz-details"> <div class="dz-size"><span data-dz-size></span></div> <div class="dz-filename"><span data-dz-name></span></div> </div> <div class="dz-progress"> <span class="dz-upload" data-dz-uploadprogress></span> </div> <div class="dz-error-message"><span data-dz-errormessage></span></div> <div class="dz-success-mark"> <svg width="54px" height="54px" viewBox="0 0 54 54" version="1.1" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink"> <title>Check</title> <g stroke="none" stroke-width="1" fill="none" fill-rule="evenodd"> <path d="M23.5,31.8431458 L17.5852419,25.9283877 C16.0248253,24.3679711 13.4910294,24.366835 11.9289322,25.9289322 C10.3700136,27.4878508 10.3665912,30.0234455 11.9283877,31.5852419 L20.4147581,40.0716123 C20.5133999,40.1702541 20.6159315,40.2626649 20.7218615,40.3488435 C22.2835669,41.8725651 24.794234,41.8626202 26.3461564,40.3106978 L43.3106978,23.3461564 C44.8771021,21.7797521 44.8758057,19.2483887 43.3137085,17.6862915 C41.7547899,16.1273729 39.2176035,16.1255422 37.6538436,17.6893022 L23.5,31.8431458 Z M27,53 C41.3594035,53 53,41.3594035 53,27 C53,12.6405965 41.3594035,1 27,1 C12.6405965,1 1,12.6405965 1,27 C1,41.3594035 12.6405965,53 27,53 Z" stroke-opacity="0.198794158" stroke="#747474" fill-opacity="0.816519475" fill="#FFFFFF"></path> </g> </svg> </div> <div class="dz-error-mark"> <svg width="54px" height="54px" viewBox="0 0 54 54" version="1.1" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink"> <title>Error</title> <g stroke="none" stroke-width="1" fill="none" fill-rule="evenodd"> <g stroke="#747474" stroke-opacity="0.198794158" fill="#FFFFFF" fill-opacity="0.816519475"> <path d="M32.6568542,29 L38.3106978,23.3461564 C39.8771021,21.7797521 39.8758057,19.2483887 38.3137085,17.6862915 C36.7547899,16.1273729 34.2176035,16.1255422 32.6538436,17.6893022 L27,23.3431458 L21.3461564,17.6893022 C19.7823965,16.1255422 17.2452101,16.1273729 15.6862915,17.6862915 C14.1241943,19.2483887 14.1228979,21.7797521 15.6893022,23.3461564 L21.3431458,29 L15.6893022,34.6538436 C14.1228979,36.2202479 14.1241943,38.7516113 15.6862915,40.3137085 C17.2452101,41.8726271 19.7823965,41.8744578 21.3461564,40.3106978 L27,34.6568542 L32.6538436,40.3106978 C34.2176035,41.8744578 36.7547899,41.8726271 38.3137085,40.3137085 C39.8758057,38.7516113 39.8771021,36.2202479 38.3106978,34.6538436 L32.6568542,29 Z M27,53 C41.3594035,53 53,41.3594035 53,27 C53,12.6405965 41.3594035,1 27,1 C12.6405965,1 1,12.6405965 1,27 C1,41.3594035 12.6405965,53 27,53 Z"></path> </g> </g> </svg> </div> </div> ',drop:function(e){return this.element.classList.remove("dz-drag-hover")},dragstart:function(e){},dragend:function(e){return this.element.classList.remove("dz-drag-hover")},dragenter:function(e){return this.element.classList.add("dz-drag-hover")},dragover:function(e){return this.element.classList.add("dz-drag-hover")},dragleave:function(e){return this.element.classList.remove("dz-drag-hover")},paste:function(e){},reset:function(){return this.element.classList.remove("dz-started")},addedfile:function(e){var t=this;if(this.element===this.previewsContainer&&this.element.classList.add("dz-started"),this.previewsContainer&&!this.options.disablePreviews){e.previewElement=w.createElement(this.options.previewTemplate.trim()),e.previewTemplate=e.previewElement,this.previewsContainer.appendChild(e.previewElement);var n,r=s(e.previewElement.querySelectorAll("[data-dz-name]"),!0);try{for(r.s();!(n=r.n()).done;){var i=n.value;i.textContent=e.name}}catch(e){r.e(e)}finally{r.f()}var o,a=s(e.previewElement.querySelectorAll("[data-dz-size]"),!0);try{for(a.s();!(o=a.n()).done;)(i=o.value).innerHTML=this.filesize(e.size)}catch(e){a.e(e)}finally{a.f()}this.options.addRemoveLinks&&(e._removeLink=w.createElement('<a class="dz-remove" href="javascript:undefined;" data-dz-remove>'.concat(this.options.dictRemoveFile,"</a>")),e.previewElement.appendChild(e._removeLink));var l,c=function(n){return n.preventDefault(),n.stopPropagation(),e.status===w.UPLOADING?w.confirm(t.options.dictCancelUploadConfirmation,function(){return t.removeFile(e)}):t.options.dictRemoveFileConfirmation?w.confirm(t.options.dictRemoveFileConfirmation,function(){return t.removeFile(e)}):t.removeFile(e)},u=s(e.previewElement.querySelectorAll("[data-dz-remove]"),!0);try{for(u.s();!(l=u.n()).done;)l.value.addEventListener("click",c)}catch(e){u.e(e)}finally{u.f()}}},removedfile:function(e){return null!=e.previewElement&&null!=e.previewElement.parentNode&&e.previewElement.parentNode.removeChild(e.previewElement),this._updateMaxFilesReachedClass()},thumbnail:function(e,t){if(e.previewElement){e.previewElement.classList.remove("dz-file-preview");var n,r=s(e.previewElement.querySelectorAll("[data-dz-thumbnail]"),!0);try{for(r.s();!(n=r.n()).done;){var i=n.value;i.alt=e.name,i.src=t}}catch(e){r.e(e)}finally{r.f()}return setTimeout(function(){return e.previewElement.classList.add("dz-image-preview")},1)}},error:function(e,t){if(e.previewElement){e.previewElement.classList.add("dz-error"),"string"!=typeof t&&t.error&&(t=t.error);var n,r=s(e.previewElement.querySelectorAll("[data-dz-errormessage]"),!0);try{for(r.s();!(n=r.n()).done;)n.value.textContent=t}catch(e){r.e(e)}finally{r.f()}}},errormultiple:function(){},processing:function(e){if(e.previewElement&&(e.previewElement.classList.add("dz-processing"),e._removeLink))return e._removeLink.innerHTML=this.options.dictCancelUpload},processingmultiple:function(){},uploadprogress:function(e,t,n){if(e.previewElement){var r,i=s(e.previewElement.querySelectorAll("[data-dz-uploadprogress]"),!0);try{for(i.s();!(r=i.n()).done;){var o=r.value;"PROGRESS"===o.nodeName?o.value=t:o.style.width="".concat(t,"%")}}catch(e){i.e(e)}finally{i.f()}}},totaluploadprogress:function(){},sending:function(){},sendingmultiple:function(){},success:function(e){if(e.previewElement)return e.previewElement.classList.add("dz-success")},successmultiple:function(){},canceled:function(e){return this.emit("error",e,this.options.dictUploadCanceled)},canceledmultiple:function(){},complete:function(e){if(e._removeLink&&(e._removeLink.innerHTML=this.options.dictRemoveFile),e.previewElement)return e.previewElement.classList.add("dz-complete")},completemultiple:function(){},maxfilesexceeded:function(){},maxfilesreached:function(){},queuecomplete:function(){},addedfiles:function(){}};function c(e){return c="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},c(e)}function u(e,t){var n;if("undefined"==typeof Symbol||null==e[Symbol.iterator]){if(Array.isArray(e)||(n=function(e,t){if(e){if("string"==typeof e)return d(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?d(e,t):void 0}}(e))||t&&e&&"number"==typeof e.length){n&&(e=n);var r=0,i=function(){};return{s:i,n:function(){return r>=e.length?{done:!0}:{done:!1,value:e[r++]}},e:function(e){throw e},f:i}}throw new TypeError("Invalid attempt to iterate non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}var o,s=!0,a=!1;return{s:function(){n=e[Symbol.iterator]()},n:function(){var e=n.next();return s=e.done,e},e:function(e){a=!0,o=e},f:function(){try{s||null==n.return||n.return()}finally{if(a)throw o}}}}function d(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function f(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function h(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function p(e,t,n){return t&&h(e.prototype,t),n&&h(e,n),e}function v(e,t){return v=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e},v(e,t)}function m(e){var t=function(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Date.prototype.toString.call(Reflect.construct(Date,[],function(){})),!0}catch(e){return!1}}();return function(){var n,r=b(e);if(t){var i=b(this).constructor;n=Reflect.construct(r,arguments,i)}else n=r.apply(this,arguments);return g(this,n)}}function g(e,t){return!t||"object"!==c(t)&&"function"!=typeof t?y(e):t}function y(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function b(e){return b=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)},b(e)}var w=function(e){!function(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),t&&v(e,t)}(n,e);var t=m(n);function n(e,r){var i,o,s;if(f(this,n),(i=t.call(this)).element=e,i.version=n.version,i.clickableElements=[],i.listeners=[],i.files=[],"string"==typeof i.element&&(i.element=document.querySelector(i.element)),!i.element||null==i.element.nodeType)throw new Error("Invalid dropzone element.");if(i.element.dropzone)throw new Error("Dropzone already attached.");n.instances.push(y(i)),i.element.dropzone=y(i);var a=null!=(s=n.optionsForElement(i.element))?s:{};if(i.options=n.extend({},l,a,null!=r?r:{}),i.options.previewTemplate=i.options.previewTemplate.replace(/\n*/g,""),i.options.forceFallback||!n.isBrowserSupported())return g(i,i.options.fallback.call(y(i)));if(null==i.options.url&&(i.options.url=i.element.getAttribute("action")),!i.options.url)throw new Error("No URL provided.");if(i.options.acceptedFiles&&i.options.acceptedMimeTypes)throw new Error("You can't provide both 'acceptedFiles' and 'acceptedMimeTypes'. 'acceptedMimeTypes' is deprecated.");if(i.options.uploadMultiple&&i.options.chunking)throw new Error("You cannot set both: uploadMultiple and chunking.");return i.options.acceptedMimeTypes&&(i.options.acceptedFiles=i.options.acceptedMimeTypes,delete i.options.acceptedMimeTypes),null!=i.options.renameFilename&&(i.options.renameFile=function(e){return i.options.renameFilename.call(y(i),e.name,e)}),"string"==typeof i.options.method&&(i.options.method=i.options.method.toUpperCase()),(o=i.getExistingFallback())&&o.parentNode&&o.parentNode.removeChild(o),!1!==i.options.previewsContainer&&(i.options.previewsContainer?i.previewsContainer=n.getElement(i.options.previewsContainer,"previewsContainer"):i.previewsContainer=i.element),i.options.clickable&&(!0===i.options.clickable?i.clickableElements=[i.element]:i.clickableElements=n.getElements(i.options.clickable,"clickable")),i.init(),i}return p(n,[{key:"getAcceptedFiles",value:function(){return this.files.filter(function(e){return e.accepted}).map(function(e){return e})}},{key:"getRejectedFiles",value:function(){return this.files.filter(function(e){return!e.accepted}).map(function(e){return e})}},{key:"getFilesWithStatus",value:function(e){return this.files.filter(function(t){return t.status===e}).map(function(e){return e})}},{key:"getQueuedFiles",value:function(){return this.getFilesWithStatus(n.QUEUED)}},{key:"getUploadingFiles",value:function(){return this.getFilesWithStatus(n.UPLOADING)}},{key:"getAddedFiles",value:function(){return this.getFilesWithStatus(n.ADDED)}},{key:"getActiveFiles",value:function(){return this.files.filter(function(e){return e.status===n.UPLOADING||e.status===n.QUEUED}).map(function(e){return e})}},{key:"init",value:function(){var e=this;"form"===this.element.tagName&&this.element.setAttribute("enctype","multipart/form-data"),this.element.classList.contains("dropzone")&&!this.element.querySelector(".dz-message")&&this.element.appendChild(n.createElement('<div class="dz-default dz-message"><button class="dz-button" type="button">'.concat(this.options.dictDefaultMessage,"</button></div>"))),this.clickableElements.length&&function t(){e.hiddenFileInput&&e.hiddenFileInput.parentNode.removeChild(e.hiddenFileInput),e.hiddenFileInput=document.createElement("input"),e.hiddenFileInput.setAttribute("type","file"),(null===e.options.maxFiles||e.options.maxFiles>1)&&e.hiddenFileInput.setAttribute("multiple","multiple"),e.hiddenFileInput.className="dz-hidden-input",null!==e.options.acceptedFiles&&e.hiddenFileInput.setAttribute("accept",e.options.acceptedFiles),null!==e.options.capture&&e.hiddenFileInput.setAttribute("capture",e.options.capture),e.hiddenFileInput.setAttribute("tabindex","-1"),e.hiddenFileInput.style.visibility="hidden",e.hiddenFileInput.style.position="absolute",e.hiddenFileInput.style.top="0",e.hiddenFileInput.style.left="0",e.hiddenFileInput.style.height="0",e.hiddenFileInput.style.width="0",n.getElement(e.options.hiddenInputContainer,"hiddenInputContainer").appendChild(e.hiddenFileInput),e.hiddenFileInput.addEventListener("change",function(){var n=e.hiddenFileInput.files;if(n.length){var r,i=u(n,!0);try{for(i.s();!(r=i.n()).done;){var o=r.value;e.addFile(o)}}catch(e){i.e(e)}finally{i.f()}}e.emit("addedfiles",n),t()})}(),this.URL=null!==window.URL?window.URL:window.webkitURL;var t,r=u(this.events,!0);try{for(r.s();!(t=r.n()).done;){var i=t.value;this.on(i,this.options[i])}}catch(e){r.e(e)}finally{r.f()}this.on("uploadprogress",function(){return e.updateTotalUploadProgress()}),this.on("removedfile",function(){return e.updateTotalUploadProgress()}),this.on("canceled",function(t){return e.emit("complete",t)}),this.on("complete",function(t){if(0===e.getAddedFiles().length&&0===e.getUploadingFiles().length&&0===e.getQueuedFiles().length)return setTimeout(function(){return e.emit("queuecomplete")},0)});var o=function(e){if(function(e){if(e.dataTransfer.types)for(var t=0;t<e.dataTransfer.types.length;t++)if("Files"===e.dataTransfer.types[t])return!0;return!1}(e))return e.stopPropagation(),e.preventDefault?e.preventDefault():e.returnValue=!1};return this.listeners=[{element:this.element,events:{dragstart:function(t){return e.emit("dragstart",t)},dragenter:function(t){return o(t),e.emit("dragenter",t)},dragover:function(t){var n;try{n=t.dataTransfer.effectAllowed}catch(e){}return t.dataTransfer.dropEffect="move"===n||"linkMove"===n?"move":"copy",o(t),e.emit("dragover",t)},dragleave:function(t){return e.emit("dragleave",t)},drop:function(t){return o(t),e.drop(t)},dragend:function(t){return e.emit("dragend",t)}}}],this.clickableElements.forEach(function(t){return e.listeners.push({element:t,events:{click:function(r){return(t!==e.element||r.target===e.element||n.elementInside(r.target,e.element.querySelector(".dz-message")))&&e.hiddenFileInput.click(),!0}}})}),this.enable(),this.options.init.call(this)}},{key:"destroy",value:function(){return this.disable(),this.removeAllFiles(!0),(null!=this.hiddenFileInput?this.hiddenFileInput.parentNode:void 0)&&(this.hiddenFileInput.parentNode.removeChild(this.hiddenFileInput),this.hiddenFileInput=null),delete this.element.dropzone,n.instances.splice(n.instances.indexOf(this),1)}},{key:"updateTotalUploadProgress",value:function(){var e,t=0,n=0;if(this.getActiveFiles().length){var r,i=u(this.getActiveFiles(),!0);try{for(i.s();!(r=i.n()).done;){var o=r.value;t+=o.upload.bytesSent,n+=o.upload.total}}catch(e){i.e(e)}finally{i.f()}e=100*t/n}else e=100;return this.emit("totaluploadprogress",e,n,t)}},{key:"_getParamName",value:function(e){return"function"==typeof this.options.paramName?this.options.paramName(e):"".concat(this.options.paramName).concat(this.options.uploadMultiple?"[".concat(e,"]"):"")}},{key:"_renameFile",value:function(e){return"function"!=typeof this.options.renameFile?e.name:this.options.renameFile(e)}},{key:"getFallbackForm",value:function(){var e,t;if(e=this.getExistingFallback())return e;var r='<div class="dz-fallback">';this.options.dictFallbackText&&(r+="<p>".concat(this.options.dictFallbackText,"</p>")),r+='<input type="file" name="'.concat(this._getParamName(0),'" ').concat(this.options.uploadMultiple?'multiple="multiple"':void 0,' /><input type="submit" value="Upload!"></div>');var i=n.createElement(r);return"FORM"!==this.element.tagName?(t=n.createElement('<form action="'.concat(this.options.url,'" enctype="multipart/form-data" method="').concat(this.options.method,'"></form>'))).appendChild(i):(this.element.setAttribute("enctype","multipart/form-data"),this.element.setAttribute("method",this.options.method)),null!=t?t:i}},{key:"getExistingFallback",value:function(){for(var e=function(e){var t,n=u(e,!0);try{for(n.s();!(t=n.n()).done;){var r=t.value;if(/(^| )fallback($| )/.test(r.className))return r}}catch(e){n.e(e)}finally{n.f()}},t=0,n=["div","form"];t<n.length;t++){var r,i=n[t];if(r=e(this.element.getElementsByTagName(i)))return r}}},{key:"setupEventListeners",value:function(){return this.listeners.map(function(e){return function(){var t=[];for(var n in e.events){var r=e.events[n];t.push(e.element.addEventListener(n,r,!1))}return t}()})}},{key:"removeEventListeners",value:function(){return this.listeners.map(function(e){return function(){var t=[];for(var n in e.events){var r=e.events[n];t.push(e.element.removeEventListener(n,r,!1))}return t}()})}},{key:"disable",value:function(){var e=this;return this.clickableElements.forEach(function(e){return e.classList.remove("dz-clickable")}),this.removeEventListeners(),this.disabled=!0,this.files.map(function(t){return e.cancelUpload(t)})}},{key:"enable",value:function(){return delete this.disabled,this.clickableElements.forEach(function(e){return e.classList.add("dz-clickable")}),this.setupEventListeners()}},{key:"filesize",value:function(e){var t=0,n="b";if(e>0){for(var r=["tb","gb","mb","kb","b"],i=0;i<r.length;i++){var o=r[i];if(e>=Math.pow(this.options.filesizeBase,4-i)/10){t=e/Math.pow(this.options.filesizeBase,4-i),n=o;break}}t=Math.round(10*t)/10}return"<strong>".concat(t,"</strong> ").concat(this.options.dictFileSizeUnits[n])}},{key:"_updateMaxFilesReachedClass",value:function(){return null!=this.options.maxFiles&&this.getAcceptedFiles().length>=this.options.maxFiles?(this.getAcceptedFiles().length===this.options.maxFiles&&this.emit("maxfilesreached",this.files),this.element.classList.add("dz-max-files-reached")):this.element.classList.remove("dz-max-files-reached")}},{key:"drop",value:function(e){if(e.dataTransfer){this.emit("drop",e);for(var t=[],n=0;n<e.dataTransfer.files.length;n++)t[n]=e.dataTransfer.files[n];if(t.length){var r=e.dataTransfer.items;r&&r.length&&null!=r[0].webkitGetAsEntry?this._addFilesFromItems(r):this.handleFiles(t)}this.emit("addedfiles",t)}}},{key:"paste",value:function(e){if(null!=(t=null!=e?e.clipboardData:void 0,n=function(e){return e.items},null!=t?n(t):void 0)){var t,n;this.emit("paste",e);var r=e.clipboardData.items;return r.length?this._addFilesFromItems(r):void 0}}},{key:"handleFiles",value:function(e){var t,n=u(e,!0);try{for(n.s();!(t=n.n()).done;){var r=t.value;this.addFile(r)}}catch(e){n.e(e)}finally{n.f()}}},{key:"_addFilesFromItems",value:function(e){var t=this;return function(){var n,r=[],i=u(e,!0);try{for(i.s();!(n=i.n()).done;){var o,s=n.value;null!=s.webkitGetAsEntry&&(o=s.webkitGetAsEntry())?o.isFile?r.push(t.addFile(s.getAsFile())):o.isDirectory?r.push(t._addFilesFromDirectory(o,o.name)):r.push(void 0):null==s.getAsFile||null!=s.kind&&"file"!==s.kind?r.push(void 0):r.push(t.addFile(s.getAsFile()))}}catch(e){i.e(e)}finally{i.f()}return r}()}},{key:"_addFilesFromDirectory",value:function(e,t){var n=this,r=e.createReader(),i=function(e){return t=console,n="log",r=function(t){return t.log(e)},null!=t&&"function"==typeof t[n]?r(t,n):void 0;var t,n,r};return function e(){return r.readEntries(function(r){if(r.length>0){var i,o=u(r,!0);try{for(o.s();!(i=o.n()).done;){var s=i.value;s.isFile?s.file(function(e){if(!n.options.ignoreHiddenFiles||"."!==e.name.substring(0,1))return e.fullPath="".concat(t,"/").concat(e.name),n.addFile(e)}):s.isDirectory&&n._addFilesFromDirectory(s,"".concat(t,"/").concat(s.name))}}catch(e){o.e(e)}finally{o.f()}e()}return null},i)}()}},{key:"accept",value:function(e,t){this.options.maxFilesize&&e.size>1024*this.options.maxFilesize*1024?t(this.options.dictFileTooBig.replace("{{filesize}}",Math.round(e.size/1024/10.24)/100).replace("{{maxFilesize}}",this.options.maxFilesize)):n.isValidFile(e,this.options.acceptedFiles)?null!=this.options.maxFiles&&this.getAcceptedFiles().length>=this.options.maxFiles?(t(this.options.dictMaxFilesExceeded.replace("{{maxFiles}}",this.options.maxFiles)),this.emit("maxfilesexceeded",e)):this.options.accept.call(this,e,t):t(this.options.dictInvalidFileType)}},{key:"addFile",value:function(e){var t=this;e.upload={uuid:n.uuidv4(),progress:0,total:e.size,bytesSent:0,filename:this._renameFile(e)},this.files.push(e),e.status=n.ADDED,this.emit("addedfile",e),this._enqueueThumbnail(e),this.accept(e,function(n){n?(e.accepted=!1,t._errorProcessing([e],n)):(e.accepted=!0,t.options.autoQueue&&t.enqueueFile(e)),t._updateMaxFilesReachedClass()})}},{key:"enqueueFiles",value:function(e){var t,n=u(e,!0);try{for(n.s();!(t=n.n()).done;){var r=t.value;this.enqueueFile(r)}}catch(e){n.e(e)}finally{n.f()}return null}},{key:"enqueueFile",value:function(e){var t=this;if(e.status!==n.ADDED||!0!==e.accepted)throw new Error("This file can't be queued because it has already been processed or was rejected.");if(e.status=n.QUEUED,this.options.autoProcessQueue)return setTimeout(function(){return t.processQueue()},0)}},{key:"_enqueueThumbnail",value:function(e){var t=this;if(this.options.createImageThumbnails&&e.type.match(/image.*/)&&e.size<=1024*this.options.maxThumbnailFilesize*1024)return this._thumbnailQueue.push(e),setTimeout(function(){return t._processThumbnailQueue()},0)}},{key:"_processThumbnailQueue",value:function(){var e=this;if(!this._processingThumbnail&&0!==this._thumbnailQueue.length){this._processingThumbnail=!0;var t=this._thumbnailQueue.shift();return this.createThumbnail(t,this.options.thumbnailWidth,this.options.thumbnailHeight,this.options.thumbnailMethod,!0,function(n){return e.emit("thumbnail",t,n),e._processingThumbnail=!1,e._processThumbnailQueue()})}}},{key:"removeFile",value:function(e){if(e.status===n.UPLOADING&&this.cancelUpload(e),this.files=x(this.files,e),this.emit("removedfile",e),0===this.files.length)return this.emit("reset")}},{key:"removeAllFiles",value:function(e){null==e&&(e=!1);var t,r=u(this.files.slice(),!0);try{for(r.s();!(t=r.n()).done;){var i=t.value;(i.status!==n.UPLOADING||e)&&this.removeFile(i)}}catch(e){r.e(e)}finally{r.f()}return null}},{key:"resizeImage",value:function(e,t,r,i,o){var s=this;return this.createThumbnail(e,t,r,i,!0,function(t,r){if(null==r)return o(e);var i=s.options.resizeMimeType;null==i&&(i=e.type);var a=r.toDataURL(i,s.options.resizeQuality);return"image/jpeg"!==i&&"image/jpg"!==i||(a=k.restore(e.dataURL,a)),o(n.dataURItoBlob(a))})}},{key:"createThumbnail",value:function(e,t,n,r,i,o){var s=this,a=new FileReader;a.onload=function(){e.dataURL=a.result,"image/svg+xml"!==e.type?s.createThumbnailFromUrl(e,t,n,r,i,o):null!=o&&o(a.result)},a.readAsDataURL(e)}},{key:"displayExistingFile",value:function(e,t,n,r){var i=this,o=!(arguments.length>4&&void 0!==arguments[4])||arguments[4];this.emit("addedfile",e),this.emit("complete",e),o?(e.dataURL=t,this.createThumbnailFromUrl(e,this.options.thumbnailWidth,this.options.thumbnailHeight,this.options.thumbnailMethod,this.options.fixOrientation,function(t){i.emit("thumbnail",e,t),n&&n()},r)):(this.emit("thumbnail",e,t),n&&n())}},{key:"createThumbnailFromUrl",value:function(e,t,n,r,i,o,s){var a=this,l=document.createElement("img");return s&&(l.crossOrigin=s),i="from-image"!=getComputedStyle(document.body).imageOrientation&&i,l.onload=function(){var s=function(e){return e(1)};return"undefined"!=typeof EXIF&&null!==EXIF&&i&&(s=function(e){return EXIF.getData(l,function(){return e(EXIF.getTag(this,"Orientation"))})}),s(function(i){e.width=l.width,e.height=l.height;var s=a.options.resize.call(a,e,t,n,r),c=document.createElement("canvas"),u=c.getContext("2d");switch(c.width=s.trgWidth,c.height=s.trgHeight,i>4&&(c.width=s.trgHeight,c.height=s.trgWidth),i){case 2:u.translate(c.width,0),u.scale(-1,1);break;case 3:u.translate(c.width,c.height),u.rotate(Math.PI);break;case 4:u.translate(0,c.height),u.scale(1,-1);break;case 5:u.rotate(.5*Math.PI),u.scale(1,-1);break;case 6:u.rotate(.5*Math.PI),u.translate(0,-c.width);break;case 7:u.rotate(.5*Math.PI),u.translate(c.height,-c.width),u.scale(-1,1);break;case 8:u.rotate(-.5*Math.PI),u.translate(-c.height,0)}S(u,l,null!=s.srcX?s.srcX:0,null!=s.srcY?s.srcY:0,s.srcWidth,s.srcHeight,null!=s.trgX?s.trgX:0,null!=s.trgY?s.trgY:0,s.trgWidth,s.trgHeight);var d=c.toDataURL("image/png");if(null!=o)return o(d,c)})},null!=o&&(l.onerror=o),l.src=e.dataURL}},{key:"processQueue",value:function(){var e=this.options.parallelUploads,t=this.getUploadingFiles().length,n=t;if(!(t>=e)){var r=this.getQueuedFiles();if(r.length>0){if(this.options.uploadMultiple)return this.processFiles(r.slice(0,e-t));for(;n<e;){if(!r.length)return;this.processFile(r.shift()),n++}}}}},{key:"processFile",value:function(e){return this.processFiles([e])}},{key:"processFiles",value:function(e){var t,r=u(e,!0);try{for(r.s();!(t=r.n()).done;){var i=t.value;i.processing=!0,i.status=n.UPLOADING,this.emit("processing",i)}}catch(e){r.e(e)}finally{r.f()}return this.options.uploadMultiple&&this.emit("processingmultiple",e),this.uploadFiles(e)}},{key:"_getFilesWithXhr",value:function(e){return this.files.filter(function(t){return t.xhr===e}).map(function(e){return e})}},{key:"cancelUpload",value:function(e){if(e.status===n.UPLOADING){var t,r=this._getFilesWithXhr(e.xhr),i=u(r,!0);try{for(i.s();!(t=i.n()).done;)t.value.status=n.CANCELED}catch(e){i.e(e)}finally{i.f()}void 0!==e.xhr&&e.xhr.abort();var o,s=u(r,!0);try{for(s.s();!(o=s.n()).done;){var a=o.value;this.emit("canceled",a)}}catch(e){s.e(e)}finally{s.f()}this.options.uploadMultiple&&this.emit("canceledmultiple",r)}else e.status!==n.ADDED&&e.status!==n.QUEUED||(e.status=n.CANCELED,this.emit("canceled",e),this.options.uploadMultiple&&this.emit("canceledmultiple",[e]));if(this.options.autoProcessQueue)return this.processQueue()}},{key:"resolveOption",value:function(e){if("function"==typeof e){for(var t=arguments.length,n=new Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];return e.apply(this,n)}return e}},{key:"uploadFile",value:function(e){return this.uploadFiles([e])}},{key:"uploadFiles",value:function(e){var t=this;this._transformFiles(e,function(r){if(t.options.chunking){var i=r[0];e[0].upload.chunked=t.options.chunking&&(t.options.forceChunking||i.size>t.options.chunkSize),e[0].upload.totalChunkCount=Math.ceil(i.size/t.options.chunkSize)}if(e[0].upload.chunked){var o=e[0],s=r[0];o.upload.chunks=[];var a=function(){for(var r=0;void 0!==o.upload.chunks[r];)r++;if(!(r>=o.upload.totalChunkCount)){var i=r*t.options.chunkSize,a=Math.min(i+t.options.chunkSize,s.size),l={name:t._getParamName(0),data:s.webkitSlice?s.webkitSlice(i,a):s.slice(i,a),filename:o.upload.filename,chunkIndex:r};o.upload.chunks[r]={file:o,index:r,dataBlock:l,status:n.UPLOADING,progress:0,retries:0},t._uploadData(e,[l])}};if(o.upload.finishedChunkUpload=function(r,i){var s=!0;r.status=n.SUCCESS,r.dataBlock=null,r.xhr=null;for(var l=0;l<o.upload.totalChunkCount;l++){if(void 0===o.upload.chunks[l])return a();o.upload.chunks[l].status!==n.SUCCESS&&(s=!1)}s&&t.options.chunksUploaded(o,function(){t._finished(e,i,null)})},t.options.parallelChunkUploads)for(var l=0;l<o.upload.totalChunkCount;l++)a();else a()}else{for(var c=[],u=0;u<e.length;u++)c[u]={name:t._getParamName(u),data:r[u],filename:e[u].upload.filename};t._uploadData(e,c)}})}},{key:"_getChunk",value:function(e,t){for(var n=0;n<e.upload.totalChunkCount;n++)if(void 0!==e.upload.chunks[n]&&e.upload.chunks[n].xhr===t)return e.upload.chunks[n]}},{key:"_uploadData",value:function(e,t){var r,i=this,o=new XMLHttpRequest,s=u(e,!0);try{for(s.s();!(r=s.n()).done;)r.value.xhr=o}catch(e){s.e(e)}finally{s.f()}e[0].upload.chunked&&(e[0].upload.chunks[t[0].chunkIndex].xhr=o);var a=this.resolveOption(this.options.method,e),l=this.resolveOption(this.options.url,e);o.open(a,l,!0),this.resolveOption(this.options.timeout,e)&&(o.timeout=this.resolveOption(this.options.timeout,e)),o.withCredentials=!!this.options.withCredentials,o.onload=function(t){i._finishedUploading(e,o,t)},o.ontimeout=function(){i._handleUploadError(e,o,"Request timedout after ".concat(i.options.timeout/1e3," seconds"))},o.onerror=function(){i._handleUploadError(e,o)},(null!=o.upload?o.upload:o).onprogress=function(t){return i._updateFilesUploadProgress(e,o,t)};var c={Accept:"application/json","Cache-Control":"no-cache","X-Requested-With":"XMLHttpRequest"};for(var d in this.options.headers&&n.extend(c,this.options.headers),c){var f=c[d];f&&o.setRequestHeader(d,f)}var h=new FormData;if(this.options.params){var p=this.options.params;for(var v in"function"==typeof p&&(p=p.call(this,e,o,e[0].upload.chunked?this._getChunk(e[0],o):null)),p){var m=p[v];if(Array.isArray(m))for(var g=0;g<m.length;g++)h.append(v,m[g]);else h.append(v,m)}}var y,b=u(e,!0);try{for(b.s();!(y=b.n()).done;){var w=y.value;this.emit("sending",w,o,h)}}catch(e){b.e(e)}finally{b.f()}this.options.uploadMultiple&&this.emit("sendingmultiple",e,o,h),this._addFormElementData(h);for(var x=0;x<t.length;x++){var E=t[x];h.append(E.name,E.data,E.filename)}this.submitRequest(o,h,e)}},{key:"_transformFiles",value:function(e,t){for(var n=this,r=[],i=0,o=function(o){n.options.transformFile.call(n,e[o],function(n){r[o]=n,++i===e.length&&t(r)})},s=0;s<e.length;s++)o(s)}},{key:"_addFormElementData",value:function(e){if("FORM"===this.element.tagName){var t,n=u(this.element.querySelectorAll("input, textarea, select, button"),!0);try{for(n.s();!(t=n.n()).done;){var r=t.value,i=r.getAttribute("name"),o=r.getAttribute("type");if(o&&(o=o.toLowerCase()),null!=i)if("SELECT"===r.tagName&&r.hasAttribute("multiple")){var s,a=u(r.options,!0);try{for(a.s();!(s=a.n()).done;){var l=s.value;l.selected&&e.append(i,l.value)}}catch(e){a.e(e)}finally{a.f()}}else(!o||"checkbox"!==o&&"radio"!==o||r.checked)&&e.append(i,r.value)}}catch(e){n.e(e)}finally{n.f()}}}},{key:"_updateFilesUploadProgress",value:function(e,t,n){if(e[0].upload.chunked){var r=e[0],i=this._getChunk(r,t);n?(i.progress=100*n.loaded/n.total,i.total=n.total,i.bytesSent=n.loaded):(i.progress=100,i.bytesSent=i.total),r.upload.progress=0,r.upload.total=0,r.upload.bytesSent=0;for(var o=0;o<r.upload.totalChunkCount;o++)r.upload.chunks[o]&&void 0!==r.upload.chunks[o].progress&&(r.upload.progress+=r.upload.chunks[o].progress,r.upload.total+=r.upload.chunks[o].total,r.upload.bytesSent+=r.upload.chunks[o].bytesSent);r.upload.progress=r.upload.progress/r.upload.totalChunkCount,this.emit("uploadprogress",r,r.upload.progress,r.upload.bytesSent)}else{var s,a=u(e,!0);try{for(a.s();!(s=a.n()).done;){var l=s.value;l.upload.total&&l.upload.bytesSent&&l.upload.bytesSent==l.upload.total||(n?(l.upload.progress=100*n.loaded/n.total,l.upload.total=n.total,l.upload.bytesSent=n.loaded):(l.upload.progress=100,l.upload.bytesSent=l.upload.total),this.emit("uploadprogress",l,l.upload.progress,l.upload.bytesSent))}}catch(e){a.e(e)}finally{a.f()}}}},{key:"_finishedUploading",value:function(e,t,r){var i;if(e[0].status!==n.CANCELED&&4===t.readyState){if("arraybuffer"!==t.responseType&&"blob"!==t.responseType&&(i=t.responseText,t.getResponseHeader("content-type")&&~t.getResponseHeader("content-type").indexOf("application/json")))try{i=JSON.parse(i)}catch(e){r=e,i="Invalid JSON response from server."}this._updateFilesUploadProgress(e,t),200<=t.status&&t.status<300?e[0].upload.chunked?e[0].upload.finishedChunkUpload(this._getChunk(e[0],t),i):this._finished(e,i,r):this._handleUploadError(e,t,i)}}},{key:"_handleUploadError",value:function(e,t,r){if(e[0].status!==n.CANCELED){if(e[0].upload.chunked&&this.options.retryChunks){var i=this._getChunk(e[0],t);if(i.retries++<this.options.retryChunksLimit)return void this._uploadData(e,[i.dataBlock]);console.warn("Retried this chunk too often. Giving up.")}this._errorProcessing(e,r||this.options.dictResponseError.replace("{{statusCode}}",t.status),t)}}},{key:"submitRequest",value:function(e,t,n){1==e.readyState?e.send(t):console.warn("Cannot send this request because the XMLHttpRequest.readyState is not OPENED.")}},{key:"_finished",value:function(e,t,r){var i,o=u(e,!0);try{for(o.s();!(i=o.n()).done;){var s=i.value;s.status=n.SUCCESS,this.emit("success",s,t,r),this.emit("complete",s)}}catch(e){o.e(e)}finally{o.f()}if(this.options.uploadMultiple&&(this.emit("successmultiple",e,t,r),this.emit("completemultiple",e)),this.options.autoProcessQueue)return this.processQueue()}},{key:"_errorProcessing",value:function(e,t,r){var i,o=u(e,!0);try{for(o.s();!(i=o.n()).done;){var s=i.value;s.status=n.ERROR,this.emit("error",s,t,r),this.emit("complete",s)}}catch(e){o.e(e)}finally{o.f()}if(this.options.uploadMultiple&&(this.emit("errormultiple",e,t,r),this.emit("completemultiple",e)),this.options.autoProcessQueue)return this.processQueue()}}],[{key:"initClass",value:function(){this.prototype.Emitter=o,this.prototype.events=["drop","dragstart","dragend","dragenter","dragover","dragleave","addedfile","addedfiles","removedfile","thumbnail","error","errormultiple","processing","processingmultiple","uploadprogress","totaluploadprogress","sending","sendingmultiple","success","successmultiple","canceled","canceledmultiple","complete","completemultiple","reset","maxfilesexceeded","maxfilesreached","queuecomplete"],this.prototype._thumbnailQueue=[],this.prototype._processingThumbnail=!1}},{key:"extend",value:function(e){for(var t=arguments.length,n=new Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];for(var i=0,o=n;i<o.length;i++){var s=o[i];for(var a in s){var l=s[a];e[a]=l}}return e}},{key:"uuidv4",value:function(){return"xxxxxxxx-xxxx-4xxx-yxxx-xxxxxxxxxxxx".replace(/[xy]/g,function(e){var t=16*Math.random()|0;return("x"===e?t:3&t|8).toString(16)})}}]),n}(o);w.initClass(),w.version="5.9.3",w.options={},w.optionsForElement=function(e){return e.getAttribute("id")?w.options[E(e.getAttribute("id"))]:void 0},w.instances=[],w.forElement=function(e){if("string"==typeof e&&(e=document.querySelector(e)),null==(null!=e?e.dropzone:void 0))throw new Error("No Dropzone found for given element. This is probably because you're trying to access it before Dropzone had the time to initialize. Use the `init` option to setup any additional observers on your Dropzone.");return e.dropzone},w.autoDiscover=!0,w.discover=function(){var e;if(document.querySelectorAll)e=document.querySelectorAll(".dropzone");else{e=[];var t=function(t){return function(){var n,r=[],i=u(t,!0);try{for(i.s();!(n=i.n()).done;){var o=n.value;/(^| )dropzone($| )/.test(o.className)?r.push(e.push(o)):r.push(void 0)}}catch(e){i.e(e)}finally{i.f()}return r}()};t(document.getElementsByTagName("div")),t(document.getElementsByTagName("form"))}return function(){var t,n=[],r=u(e,!0);try{for(r.s();!(t=r.n()).done;){var i=t.value;!1!==w.optionsForElement(i)?n.push(new w(i)):n.push(void 0)}}catch(e){r.e(e)}finally{r.f()}return n}()},w.blockedBrowsers=[/opera.*(Macintosh|Windows Phone).*version\/12/i],w.isBrowserSupported=function(){var e=!0;if(window.File&&window.FileReader&&window.FileList&&window.Blob&&window.FormData&&document.querySelector)if("classList"in document.createElement("a")){void 0!==w.blacklistedBrowsers&&(w.blockedBrowsers=w.blacklistedBrowsers);var t,n=u(w.blockedBrowsers,!0);try{for(n.s();!(t=n.n()).done;)t.value.test(navigator.userAgent)&&(e=!1)}catch(e){n.e(e)}finally{n.f()}}else e=!1;else e=!1;return e},w.dataURItoBlob=function(e){for(var t=atob(e.split(",")[1]),n=e.split(",")[0].split(":")[1].split(";")[0],r=new ArrayBuffer(t.length),i=new Uint8Array(r),o=0,s=t.length,a=0<=s;a?o<=s:o>=s;a?o++:o--)i[o]=t.charCodeAt(o);return new Blob([r],{type:n})};var x=function(e,t){return e.filter(function(e){return e!==t}).map(function(e){return e})},E=function(e){return e.replace(/[\-_](\w)/g,function(e){return e.charAt(1).toUpperCase()})};w.createElement=function(e){var t=document.createElement("div");return t.innerHTML=e,t.childNodes[0]},w.elementInside=function(e,t){if(e===t)return!0;for(;e=e.parentNode;)if(e===t)return!0;return!1},w.getElement=function(e,t){var n;if("string"==typeof e?n=document.querySelector(e):null!=e.nodeType&&(n=e),null==n)throw new Error("Invalid `".concat(t,"` option provided. Please provide a CSS selector or a plain HTML element."));return n},w.getElements=function(e,t){var n,r;if(e instanceof Array){r=[];try{var i,o=u(e,!0);try{for(o.s();!(i=o.n()).done;)n=i.value,r.push(this.getElement(n,t))}catch(e){o.e(e)}finally{o.f()}}catch(e){r=null}}else if("string"==typeof e){r=[];var s,a=u(document.querySelectorAll(e),!0);try{for(a.s();!(s=a.n()).done;)n=s.value,r.push(n)}catch(e){a.e(e)}finally{a.f()}}else null!=e.nodeType&&(r=[e]);if(null==r||!r.length)throw new Error("Invalid `".concat(t,"` option provided. Please provide a CSS selector, a plain HTML element or a list of those."));return r},w.confirm=function(e,t,n){return window.confirm(e)?t():null!=n?n():void 0},w.isValidFile=function(e,t){if(!t)return!0;t=t.split(",");var n,r=e.type,i=r.replace(/\/.*$/,""),o=u(t,!0);try{for(o.s();!(n=o.n()).done;){var s=n.value;if("."===(s=s.trim()).charAt(0)){if(-1!==e.name.toLowerCase().indexOf(s.toLowerCase(),e.name.length-s.length))return!0}else if(/\/\*$/.test(s)){if(i===s.replace(/\/.*$/,""))return!0}else if(r===s)return!0}}catch(e){o.e(e)}finally{o.f()}return!1},"undefined"!=typeof jQuery&&null!==jQuery&&(jQuery.fn.dropzone=function(e){return this.each(function(){return new w(this,e)})}),w.ADDED="added",w.QUEUED="queued",w.ACCEPTED=w.QUEUED,w.UPLOADING="uploading",w.PROCESSING=w.UPLOADING,w.CANCELED="canceled",w.ERROR="error",w.SUCCESS="success";var S=function(e,t,n,r,i,o,s,a,l,c){var u=function(e){e.naturalWidth;var t=e.naturalHeight,n=document.createElement("canvas");n.width=1,n.height=t;var r=n.getContext("2d");r.drawImage(e,0,0);for(var i=r.getImageData(1,0,1,t).data,o=0,s=t,a=t;a>o;)0===i[4*(a-1)+3]?s=a:o=a,a=s+o>>1;var l=a/t;return 0===l?1:l}(t);return e.drawImage(t,n,r,i,o,s,a,l,c/u)},k=function(){function e(){f(this,e)}return p(e,null,[{key:"initClass",value:function(){this.KEY_STR="ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/="}},{key:"encode64",value:function(e){for(var t="",n=void 0,r=void 0,i="",o=void 0,s=void 0,a=void 0,l="",c=0;o=(n=e[c++])>>2,s=(3&n)<<4|(r=e[c++])>>4,a=(15&r)<<2|(i=e[c++])>>6,l=63&i,isNaN(r)?a=l=64:isNaN(i)&&(l=64),t=t+this.KEY_STR.charAt(o)+this.KEY_STR.charAt(s)+this.KEY_STR.charAt(a)+this.KEY_STR.charAt(l),n=r=i="",o=s=a=l="",c<e.length;);return t}},{key:"restore",value:function(e,t){if(!e.match("data:image/jpeg;base64,"))return t;var n=this.decode64(e.replace("data:image/jpeg;base64,","")),r=this.slice2Segments(n),i=this.exifManipulation(t,r);return"data:image/jpeg;base64,".concat(this.encode64(i))}},{key:"exifManipulation",value:function(e,t){var n=this.getExifArray(t),r=this.insertExif(e,n);return new Uint8Array(r)}},{key:"getExifArray",value:function(e){for(var t=void 0,n=0;n<e.length;){if(255===(t=e[n])[0]&225===t[1])return t;n++}return[]}},{key:"insertExif",value:function(e,t){var n=e.replace("data:image/jpeg;base64,",""),r=this.decode64(n),i=r.indexOf(255,3),o=r.slice(0,i),s=r.slice(i),a=o;return a=(a=a.concat(t)).concat(s)}},{key:"slice2Segments",value:function(e){for(var t=0,n=[];!(255===e[t]&218===e[t+1]);){if(255===e[t]&216===e[t+1])t+=2;else{var r=t+(256*e[t+2]+e[t+3])+2,i=e.slice(t,r);n.push(i),t=r}if(t>e.length)break}return n}},{key:"decode64",value:function(e){var t=void 0,n=void 0,r="",i=void 0,o=void 0,s="",a=0,l=[];for(/[^A-Za-z0-9\+\/\=]/g.exec(e)&&console.warn("There were invalid base64 characters in the input text.\nValid base64 characters are A-Z, a-z, 0-9, '+', '/',and '='\nExpect errors in decoding."),e=e.replace(/[^A-Za-z0-9\+\/\=]/g,"");t=this.KEY_STR.indexOf(e.charAt(a++))<<2|(i=this.KEY_STR.indexOf(e.charAt(a++)))>>4,n=(15&i)<<4|(o=this.KEY_STR.indexOf(e.charAt(a++)))>>2,r=(3&o)<<6|(s=this.KEY_STR.indexOf(e.charAt(a++))),l.push(t),64!==o&&l.push(n),64!==s&&l.push(r),t=n=r="",i=o=s="",a<e.length;);return l}}]),e}();k.initClass(),w._autoDiscoverFunction=function(){if(w.autoDiscover)return w.discover()},function(e,t){var n=!1,r=!0,i=e.document,o=i.documentElement,s=i.addEventListener?"addEventListener":"attachEvent",a=i.addEventListener?"removeEventListener":"detachEvent",l=i.addEventListener?"":"on",c=function r(o){if("readystatechange"!==o.type||"complete"===i.readyState)return("load"===o.type?e:i)[a](l+o.type,r,!1),!n&&(n=!0)?t.call(e,o.type||o):void 0};if("complete"!==i.readyState){if(i.createEventObject&&o.doScroll){try{r=!e.frameElement}catch(e){}r&&function e(){try{o.doScroll("left")}catch(t){return void setTimeout(e,50)}return c("poll")}()}i[s](l+"DOMContentLoaded",c,!1),i[s](l+"readystatechange",c,!1),e[s](l+"load",c,!1)}}(window,w._autoDiscoverFunction),window.Dropzone=w;var L=w}(),r}()},e.exports=t()}},t={};function n(r){var i=t[r];if(void 0!==i)return i.exports;var o=t[r]={id:r,loaded:!1,exports:{}};return e[r].call(o.exports,o,o.exports,n),o.loaded=!0,o.exports}n.n=e=>{var t=e&&e.__esModule?()=>e.default:()=>e;return n.d(t,{a:t}),t},n.d=(e,t)=>{for(var r in t)n.o(t,r)&&!n.o(e,r)&&Object.defineProperty(e,r,{enumerable:!0,get:t[r]})},n.hmd=e=>((e=Object.create(e)).children||(e.children=[]),Object.defineProperty(e,"exports",{enumerable:!0,set:()=>{throw new Error("ES Modules may not assign module.exports or exports.*, Use ESM export syntax, instead: "+e.id)}}),e),n.o=(e,t)=>Object.prototype.hasOwnProperty.call(e,t),(()=>{"use strict";(()=>{const e="filer-dropdown-backdrop",t='[data-toggle="filer-dropdown"]';class n{constructor(e){this.element=e,e.addEventListener("click",()=>this.toggle())}toggle(){const t=this.element,n=r(t),o=n.classList.contains("open"),s={relatedTarget:t};if(t.disabled||t.classList.contains("disabled"))return!1;if(i(),!o){if("ontouchstart"in document.documentElement&&!n.closest(".navbar-nav")){const n=document.createElement("div");n.className=e,t.parentNode.insertBefore(n,t.nextSibling),n.addEventListener("click",i)}const r=new CustomEvent("show.bs.filer-dropdown",{bubbles:!0,cancelable:!0,detail:s});if(n.dispatchEvent(r),r.defaultPrevented)return!1;t.focus(),t.setAttribute("aria-expanded","true"),n.classList.add("open");const o=new CustomEvent("shown.bs.filer-dropdown",{bubbles:!0,detail:s});n.dispatchEvent(o)}return!1}keydown(e){const n=this.element,i=r(n),o=i.classList.contains("open"),s=Array.from(i.querySelectorAll(".filer-dropdown-menu li:not(.disabled):visible a")).filter(e=>null!==e.offsetParent),a=s.indexOf(e.target);if(!/(38|40|27|32)/.test(e.which)||/input|textarea/i.test(e.target.tagName))return;if(e.preventDefault(),e.stopPropagation(),n.disabled||n.classList.contains("disabled"))return;if(!o&&27!==e.which||o&&27===e.which)return 27===e.which&&i.querySelector(t)?.focus(),n.click();if(!s.length)return;let l=a;38===e.which&&a>0&&l--,40===e.which&&a<s.length-1&&l++,-1===l&&(l=0),s[l]?.focus()}}function r(e){let t=e.getAttribute("data-target"),n=t?document.querySelector(t):null;return t||(t=e.getAttribute("href"),t=t&&/#[A-Za-z]/.test(t)&&t.replace(/.*(?=#[^\s]*$)/,""),n=t?document.querySelector(t):null),n&&n.parentNode?n:e.parentNode}function i(n){n&&3===n.which||(document.querySelectorAll(`.${e}`).forEach(e=>e.remove()),document.querySelectorAll(t).forEach(e=>{const t=r(e),i={relatedTarget:e};if(!t.classList.contains("open"))return;if(n&&"click"===n.type&&/input|textarea/i.test(n.target.tagName)&&t.contains(n.target))return;const o=new CustomEvent("hide.bs.filer-dropdown",{bubbles:!0,cancelable:!0,detail:i});if(t.dispatchEvent(o),o.defaultPrevented)return;e.setAttribute("aria-expanded","false"),t.classList.remove("open");const s=new CustomEvent("hidden.bs.filer-dropdown",{bubbles:!0,detail:i});t.dispatchEvent(s)}))}function o(e){return this.forEach(t=>{let r=t._filerDropdownInstance;r||(r=new n(t),t._filerDropdownInstance=r),"string"==typeof e&&r[e].call(t)}),this}NodeList.prototype.dropdown||(NodeList.prototype.dropdown=function(e){return o.call(this,e)}),HTMLCollection.prototype.dropdown||(HTMLCollection.prototype.dropdown=function(e){return o.call(this,e)}),document.addEventListener("click",i),document.addEventListener("click",e=>{e.target.closest(".filer-dropdown form")&&e.stopPropagation()}),document.addEventListener("click",e=>{const r=e.target.closest(t);if(r){const t=r._filerDropdownInstance||new n(r);r._filerDropdownInstance||(r._filerDropdownInstance=t),t.toggle(e)}}),document.addEventListener("keydown",e=>{const r=e.target.closest(t);if(r){const t=r._filerDropdownInstance||new n(r);r._filerDropdownInstance||(r._filerDropdownInstance=t),t.keydown(e)}}),document.addEventListener("keydown",e=>{const r=e.target.closest(".filer-dropdown-menu");if(r){const i=r.parentNode.querySelector(t);if(i){const t=i._filerDropdownInstance||new n(i);i._filerDropdownInstance||(i._filerDropdownInstance=t),t.keydown(e)}}}),window.FilerDropdown=n})()})(),(()=>{"use strict";const e=e=>{const t=(e=(e=e.replace(/__dot__/g,".")).replace(/__dash__/g,"-")).lastIndexOf("__");return-1===t?e:e.substring(0,t)};window.dismissPopupAndReload=e=>{document.location.reload(),e.close()},window.dismissRelatedImageLookupPopup=(t,n,r,i,o)=>{const s=e(t.name),a=document.getElementById(s);if(!a)return;const l=a.closest(".filerFile");if(!l)return;const c=l.querySelector(".edit"),u=l.querySelector(".thumbnail_img"),d=l.querySelector(".description_text"),f=l.querySelector(".filerClearer"),h=l.parentElement.querySelector(".dz-message"),p=l.querySelector("input"),v=p.value;p.value=n;const m=p.closest(".js-filer-dropzone");m&&m.classList.add("js-object-attached"),r&&u&&(u.src=r,u.classList.remove("hidden"),u.removeAttribute("srcset")),d&&(d.textContent=i),f&&f.classList.remove("hidden"),a.classList.add("related-lookup-change"),c&&c.classList.add("related-lookup-change"),o&&c&&c.setAttribute("href",`${o}?_edit_from_widget=1`),h&&h.classList.add("hidden"),v!==n&&p.dispatchEvent(new Event("change",{bubbles:!0})),t.close()},window.dismissRelatedFolderLookupPopup=(t,n,r)=>{const i=e(t.name),o=document.getElementById(i);if(!o)return;const s=o.closest(".filerFile");if(!s)return;const a=s.querySelector(".thumbnail_img"),l=document.getElementById(`id_${i}_clear`),c=document.getElementById(`id_${i}`),u=s.querySelector(".description_text"),d=document.getElementById(i);c&&(c.value=n),a&&a.classList.remove("hidden"),u&&(u.textContent=r),l&&l.classList.remove("hidden"),d&&d.classList.add("hidden"),t.close()},document.addEventListener("DOMContentLoaded",()=>{document.querySelectorAll(".js-dismiss-popup").forEach(e=>{e.addEventListener("click",function(e){e.preventDefault();const t=this.dataset.fileId,n=this.dataset.iconUrl,r=this.dataset.label;if(this.classList.contains("js-dismiss-image")){const e=this.dataset.changeUrl||"";window.opener.dismissRelatedImageLookupPopup(window,t,n,r,e)}else this.classList.contains("js-dismiss-folder")&&window.opener.dismissRelatedFolderLookupPopup(window,t,r)})});const e=document.getElementById("popup-dismiss-data");if(e&&window.opener){const t=e.dataset.pk,n=e.dataset.label;window.opener.dismissRelatedPopup(window,t,n)}})})(),(()=>{"use strict";var e=n(628),t=n.n(e);document.addEventListener("DOMContentLoaded",()=>{let e=0,n=0;const r=[],i=document.querySelector(".js-filer-dropzone-base"),o=".js-filer-dropzone";let s;const a=document.querySelector(".js-filer-dropzone-info-message"),l=document.querySelector(".js-filer-dropzone-folder-name"),c=document.querySelector(".js-filer-dropzone-upload-info-container"),u=document.querySelector(".js-filer-dropzone-upload-info"),d=document.querySelector(".js-filer-dropzone-upload-welcome"),f=document.querySelector(".js-filer-dropzone-upload-number"),h=document.querySelector(".js-filer-upload-count"),p=document.querySelector(".js-filer-upload-text"),v=".js-filer-dropzone-progress",m=document.querySelector(".js-filer-dropzone-upload-success"),g=document.querySelector(".js-filer-dropzone-upload-canceled"),y=document.querySelector(".js-filer-dropzone-cancel"),b="dz-drag-hover",w=document.querySelector(".drag-hover-border"),x="hidden";let E,S,k,L=!1;const A=()=>{f&&(f.textContent=`${n-e}/${n}`),p&&p.classList.remove("hidden"),h&&h.classList.remove("hidden")},C=()=>{r.forEach(e=>{e.destroy()})},_=(e,t)=>document.getElementById(`file-${encodeURIComponent(e.name)}${e.size}${e.lastModified}${t}`);if(i){S=i.dataset.url,k=i.dataset.folderName;const e=document.body;e.dataset.url=S,e.dataset.folderName=k,e.dataset.maxFiles=i.dataset.maxFiles,e.dataset.maxFilesize=i.dataset.maxFiles,e.classList.add("js-filer-dropzone")}Cl.mediator.subscribe("filer-upload-in-progress",C),s=document.querySelectorAll(o),s.length&&t()&&(t().autoDiscover=!1,s.forEach(i=>{const h=i.dataset.url,p=new(t())(i,{url:h,paramName:"file",maxFiles:parseInt(i.dataset.maxFiles)||100,maxFilesize:parseInt(i.dataset.maxFilesize),previewTemplate:"<div></div>",clickable:!1,addRemoveLinks:!1,parallelUploads:i.dataset["max-uploader-connections"]||3,accept:(t,r)=>{let i;if(Cl.mediator.remove("filer-upload-in-progress",C),Cl.mediator.publish("filer-upload-in-progress"),clearTimeout(E),clearTimeout(E),d&&d.classList.add(x),y&&y.classList.remove(x),_(t,h))r("duplicate");else{i=u.cloneNode(!0);const o=i.querySelector(".js-filer-dropzone-file-name");o&&(o.textContent=t.name);const s=i.querySelector(v);s&&(s.style.width="0"),i.setAttribute("id",`file-${encodeURIComponent(t.name)}${t.size}${t.lastModified}${h}`),c&&c.appendChild(i),e++,n++,A(),r()}s.forEach(e=>e.classList.remove("reset-hover")),a&&a.classList.remove(x),s.forEach(e=>e.classList.remove(b))},dragover:e=>{const t=e.target.closest(o),n=t?.dataset.folderName,r=i.classList.contains("js-filer-dropzone-folder"),c=i.getBoundingClientRect(),u=w?window.getComputedStyle(w):null,d=u?u.borderTopWidth:"0px",f=u?u.borderLeftWidth:"0px",h={top:`${c.top}px`,bottom:`${c.bottom}px`,left:`${c.left}px`,right:`${c.right}px`,width:c.width-2*parseInt(f,10)+"px",height:c.height-2*parseInt(d,10)+"px",display:"block"};r&&w&&Object.assign(w.style,h),s.forEach(e=>e.classList.add("reset-hover")),m&&m.classList.add(x),a&&a.classList.remove(x),i.classList.add(b),i.classList.remove("reset-hover"),l&&n&&(l.textContent=n)},dragend:()=>{clearTimeout(E),E=setTimeout(()=>{a&&a.classList.add(x)},1e3),a&&a.classList.remove(x),s.forEach(e=>e.classList.remove(b)),w&&Object.assign(w.style,{top:"0",bottom:"0",width:"0",height:"0"})},dragleave:()=>{clearTimeout(E),E=setTimeout(()=>{a&&a.classList.add(x)},1e3),a&&a.classList.remove(x),s.forEach(e=>e.classList.remove(b)),w&&Object.assign(w.style,{top:"0",bottom:"0",width:"0",height:"0"})},sending:e=>{const t=_(e,h);t&&t.classList.remove(x)},uploadprogress:(e,t)=>{const n=_(e,h);if(n){const e=n.querySelector(v);e&&(e.style.width=`${t}%`)}},success:t=>{e--,A();const n=_(t,h);n&&n.remove()},queuecomplete:()=>{0===e&&(A(),y&&y.classList.add(x),u&&u.classList.add(x),L?(f&&f.classList.add(x),setTimeout(()=>{window.location.reload()},1e3)):(m&&m.classList.remove(x),window.location.reload()))},error:(e,t)=>{A(),"duplicate"!==t&&(L=!0,window.filerShowError&&window.filerShowError(`${e.name}: ${t.message}`))}});r.push(p),y&&y.addEventListener("click",e=>{e.preventDefault(),y.classList.add(x),g&&g.classList.remove(x),p.removeAllFiles(!0)})}))})})(),(()=>{"use strict";var e=n(628),t=n.n(e);document.addEventListener("DOMContentLoaded",()=>{let e=0,n=1;const r=document.querySelector(".js-upload-button");if(!r)return;const i=document.querySelector(".js-upload-button-disabled"),o=r.dataset.url,s=document.querySelector(".js-filer-dropzone-upload-welcome"),a=document.querySelector(".js-filer-dropzone-upload-info-container"),l=document.querySelector(".js-filer-dropzone-upload-info"),c=document.querySelector(".js-filer-dropzone-upload-number"),u=".js-filer-dropzone-progress",d=document.querySelector(".js-filer-dropzone-upload-success"),f=document.querySelector(".js-filer-dropzone-upload-canceled"),h=document.querySelector(".js-filer-dropzone-cancel"),p=document.querySelector(".js-filer-dropzone-info-message"),v="hidden",m=parseInt(r.dataset.maxUploaderConnections||3,10),g=parseInt(r.dataset.maxFilesize||0,10);let y=!1;const b=()=>{c&&(c.textContent=`${n-e}/${n}`)},w=()=>{r&&r.remove()},x=()=>{const e=window.location.toString();window.location.replace(((e,t,n)=>{const r=new RegExp(`([?&])${t}=.*?(&|$)`,"i"),i=-1!==e.indexOf("?")?"&":"?",o=window.location.hash;return(e=e.replace(/#.*$/,"")).match(r)?e.replace(r,`$1${t}=${n}$2`)+o:e+i+t+"="+n+o})(e,"order_by","-modified_at"))};Cl.mediator.subscribe("filer-upload-in-progress",w),t().autoDiscover=!1;const E=new(t())(r,{url:o,paramName:"file",maxFilesize:g,parallelUploads:m,clickable:r,previewTemplate:"<div></div>",addRemoveLinks:!1,autoProcessQueue:!0});E.on("addedfile",()=>{Cl.mediator.remove("filer-upload-in-progress",w),Cl.mediator.publish("filer-upload-in-progress"),e++,n=E.files.length,p&&p.classList.remove(v),s&&s.classList.add(v),d&&d.classList.add(v),a&&a.classList.remove(v),h&&h.classList.remove(v),f&&f.classList.add(v),b()}),E.on("uploadprogress",(e,t)=>{const n=Math.round(t),r=`file-${encodeURIComponent(e.name)}${e.size}${e.lastModified}`,i=document.getElementById(r);let o;if(i){const e=i.querySelector(u);e&&(e.style.width=`${n}%`)}else if(l){o=l.cloneNode(!0);const t=o.querySelector(".js-filer-dropzone-file-name");t&&(t.textContent=e.name);const i=o.querySelector(u);i&&(i.style.width=`${n}%`),o.classList.remove(v),o.setAttribute("id",r),a&&a.appendChild(o)}}),E.on("success",(t,r)=>{const i=`file-${encodeURIComponent(t.name)}${t.size}${t.lastModified}`,o=document.getElementById(i);o&&o.remove(),r.error&&(y=!0,window.filerShowError(`${t.name}: ${r.error}`)),e--,b(),0===e&&(n=1,s&&s.classList.add(v),c&&c.classList.add(v),f&&f.classList.add(v),h&&h.classList.add(v),d&&d.classList.remove(v),y?setTimeout(x,1e3):x())}),E.on("error",(t,r)=>{const i=`file-${encodeURIComponent(t.name)}${t.size}${t.lastModified}`,o=document.getElementById(i);o&&o.remove(),y=!0,window.filerShowError(`${t.name}: ${r}`),e--,b(),0===e&&(n=1,s&&s.classList.add(v),c&&c.classList.add(v),f&&f.classList.add(v),h&&h.classList.add(v),d&&d.classList.remove(v),setTimeout(x,1e3))}),h&&h.addEventListener("click",e=>{e.preventDefault(),h.classList.add(v),c&&c.classList.add(v),a&&a.classList.add(v),f&&f.classList.remove(v),setTimeout(()=>{window.location.reload()},1e3)}),i&&Cl.filerTooltip&&Cl.filerTooltip(),document.dispatchEvent(new Event("filer-upload-scripts-executed"))})})(),(()=>{"use strict";window.Cl=window.Cl||{},Cl.filerTooltip=()=>{const e=".js-filer-tooltip";document.querySelectorAll(e).forEach(t=>{t.addEventListener("mouseover",function(){const t=this.getAttribute("title");if(!t)return;this.dataset.filerTooltip=t,this.removeAttribute("title");const n=document.createElement("p");n.className="filer-tooltip",n.textContent=t;const r=document.querySelector(e);r&&r.appendChild(n)}),t.addEventListener("mouseout",function(){const e=this.dataset.filerTooltip;e&&this.setAttribute("title",e);document.querySelectorAll(".filer-tooltip").forEach(e=>{e.remove()})})})}})(),(()=>{"use strict";var e=n(295),t=n.n(e),r=n(242);window.Cl=window.Cl||{};class i{constructor(e={}){this.options={linksSelector:".js-toggler-link",dataHeaderSelector:"toggler-header-selector",dataContentSelector:"toggler-content-selector",collapsedClass:"js-collapsed",expandedClass:"js-expanded",hiddenClass:"hidden",...e},this.togglerInstances=[];document.querySelectorAll(this.options.linksSelector).forEach(e=>{const t=new o(e,this.options);this.togglerInstances.push(t)})}destroy(){this.links=null,this.togglerInstances.forEach(e=>e.destroy()),this.togglerInstances=[]}}class o{constructor(e,t={}){this.options={...t},this.link=e,this.headerSelector=this.link.dataset[this.options.dataHeaderSelector],this.contentSelector=this.link.dataset[this.options.dataContentSelector],this.header=document.querySelector(this.headerSelector),this.header=this.header||this.link,this.content=document.querySelector(this.contentSelector),this.content&&this._initLink()}_updateClasses(){this.content.classList.contains(this.options.hiddenClass)?(this.header.classList.remove(this.options.expandedClass),this.header.classList.add(this.options.collapsedClass)):(this.header.classList.add(this.options.expandedClass),this.header.classList.remove(this.options.collapsedClass))}_onTogglerClick(e){this.content.classList.toggle(this.options.hiddenClass),this._updateClasses(),e.preventDefault()}_initLink(){this._updateClasses(),this.link.addEventListener("click",e=>this._onTogglerClick(e))}destroy(){this.options=null,this.link=null}}Cl.Toggler=i,Cl.TogglerConstructor=o;const s=i;window.Cl=window.Cl||{},Cl.mediator=new(t()),Cl.FocalPoint=r.A,Cl.Toggler=s,document.addEventListener("DOMContentLoaded",()=>{let e;window.filerShowError=t=>{const n=document.querySelector(".messagelist"),r=document.querySelector("#header"),i="js-filer-error",o=`<ul class="messagelist"><li class="error ${i}">{msg}</li></ul>`.replace("{msg}",t);n?n.outerHTML=o:r&&r.insertAdjacentHTML("afterend",o),e&&clearTimeout(e),e=setTimeout(()=>{const e=document.querySelector(`.${i}`);e&&e.remove()},5e3)};const t=document.querySelector(".js-filter-files");t&&(t.addEventListener("focus",e=>{const t=e.target.closest(".navigator-top-nav");t&&t.classList.add("search-is-focused")}),t.addEventListener("blur",e=>{const t=e.target.closest(".navigator-top-nav");if(t){const n=t.querySelector(".dropdown-container a");n&&e.relatedTarget===n||t.classList.remove("search-is-focused")}})),(()=>{const e=document.querySelector(".js-filter-files"),t=".navigator-top-nav",n=document.querySelector(t),r=n?.querySelector(".filter-search-wrapper .filer-dropdown-container");e&&(e.addEventListener("keydown",function(){const e=this.closest(t);e&&e.classList.add("search-is-focused")}),r&&(r.addEventListener("show.bs.filer-dropdown",()=>{n&&n.classList.add("search-is-focused")}),r.addEventListener("hide.bs.filer-dropdown",()=>{n&&n.classList.remove("search-is-focused")})))})(),(()=>{const e=document.querySelectorAll(".navigator-table tr, .navigator-list .list-item"),t=document.querySelector(".actions-wrapper"),n=document.querySelectorAll(".action-select, #action-toggle, #files-action-toggle, #folders-action-toggle, .actions .clear a");setTimeout(()=>{n.forEach(e=>{if(e.checked){const t=e.closest(".list-item");t&&t.classList.add("selected")}});Array.from(e).some(e=>e.classList.contains("selected"))&&t&&t.classList.add("action-selected")},100),n.forEach(n=>{n.addEventListener("change",function(){const n=this.closest(".list-item");n&&(this.checked?n.classList.add("selected"):n.classList.remove("selected")),setTimeout(()=>{const n=Array.from(e).some(e=>e.classList.contains("selected"));t&&(n?t.classList.add("action-selected"):t.classList.remove("action-selected"))},0)})})})(),(()=>{const e=document.querySelector(".js-actions-menu");if(!e)return;const t=e.querySelector(".filer-dropdown-menu"),n=document.querySelector('.actions select[name="action"]'),r=n?.querySelectorAll("option")||[],i=document.querySelector('.actions button[type="submit"]'),o=document.querySelector(".js-action-delete"),s=document.querySelector(".js-action-copy"),a=document.querySelector(".js-action-move"),l="delete_files_or_folders",c="copy_files_and_folders",u="move_files_and_folders",d=document.querySelectorAll(".navigator-table tr, .navigator-list .list-item"),f=(e,t)=>{t&&r.forEach(r=>{r.value===e&&(t.style.display="",t.addEventListener("click",t=>{t.preventDefault();if(Array.from(d).some(e=>e.classList.contains("selected"))&&n&&i){n.value=e;const t=n.querySelector(`option[value="${e}"]`);t&&(t.selected=!0),i.click()}}))})};f(l,o),f(c,s),f(u,a),r.forEach((e,n)=>{if(0!==n){const n=document.createElement("li"),r=document.createElement("a");r.href="#",r.textContent=e.textContent,e.value!==l&&e.value!==c&&e.value!==u||r.classList.add("hidden"),n.appendChild(r),t&&t.appendChild(n)}}),t&&t.addEventListener("click",e=>{if("A"===e.target.tagName){const r=e.target.closest("li"),o=Array.from(t.querySelectorAll("li")).indexOf(r)+1;if(e.preventDefault(),n&&i){const e=n.querySelectorAll("option");e[o]&&(e[o].selected=!0),i.click()}}}),e.addEventListener("click",e=>{Array.from(d).some(e=>e.classList.contains("selected"))||(e.preventDefault(),e.stopPropagation())})})(),(()=>{const e=document.querySelector(".navigator-top-nav");if(!e)return;const t=document.querySelector(".breadcrumbs-container");if(!t)return;const n=t.querySelector(".navigator-breadcrumbs"),r=t.querySelector(".filer-dropdown-container"),i=document.querySelector(".filter-files-container"),o=document.querySelector(".actions-wrapper"),s=document.querySelector(".navigator-button-wrapper"),a=n?.offsetWidth||0,l=r?.offsetWidth||0,c=i?.offsetWidth||0,u=o?.offsetWidth||0,d=s?.offsetWidth||0,f=window.getComputedStyle(e),h=parseInt(f.paddingLeft,10)+parseInt(f.paddingRight,10);let p=e.offsetWidth;const v=80+a+l+c+u+d+h,m="breadcrumb-min-width",g=()=>{p<v?e.classList.add(m):e.classList.remove(m)};g(),window.addEventListener("resize",()=>{p=e.offsetWidth,g()})})(),(()=>{const e=document.querySelectorAll(".navigator-list .list-item input.action-select"),t=".navigator-list .navigator-folders-body .list-item input.action-select",n=".navigator-list .navigator-files-body .list-item input.action-select",r=document.querySelector("#files-action-toggle"),i=document.querySelector("#folders-action-toggle");i&&i.addEventListener("click",function(){const e=document.querySelectorAll(t);this.checked?e.forEach(e=>{e.checked||e.click()}):e.forEach(e=>{e.checked&&e.click()})}),r&&r.addEventListener("click",function(){const e=document.querySelectorAll(n);this.checked?e.forEach(e=>{e.checked||e.click()}):e.forEach(e=>{e.checked&&e.click()})}),e.forEach(e=>{e.addEventListener("click",function(){const e=document.querySelectorAll(n),o=document.querySelectorAll(t);if(this.checked){const t=Array.from(e).every(e=>e.checked),n=Array.from(o).every(e=>e.checked);t&&r&&(r.checked=!0),n&&i&&(i.checked=!0)}else{const t=Array.from(e).some(e=>!e.checked),n=Array.from(o).some(e=>!e.checked);t&&r&&(r.checked=!1),n&&i&&(i.checked=!1)}})});const o=document.querySelector(".navigator .actions .clear a");o&&o.addEventListener("click",()=>{i&&(i.checked=!1),r&&(r.checked=!1)})})();document.querySelectorAll(".js-copy-url").forEach(e=>{e.addEventListener("click",function(e){const t=new URL(this.dataset.url,document.location.href),n=this.dataset.msg||"URL copied to clipboard",r=document.createElement("template");e.preventDefault();document.querySelectorAll(".info.filer-tooltip").forEach(e=>{e.remove()}),navigator.clipboard.writeText(t.href),r.innerHTML=`<div class="info filer-tooltip">${n}</div>`,this.classList.add("filer-tooltip-wrapper"),this.appendChild(r.content.firstChild);const i=this;setTimeout(()=>{const e=i.querySelector(".info");e&&e.remove()},1200)})});(new r.A).initialize(),new s})})()})();
\ No newline at end of file
+*/!function(r){"use strict";n=function(){return r.Mediator=function(){function e(){var e=function(){return(65536*(1+Math.random())|0).toString(16).substring(1)};return e()+e()+"-"+e()+"-"+e()+"-"+e()+"-"+e()+e()+e()}function t(n,r,i){if(!(this instanceof t))return new t(n,r,i);this.id=e(),this.fn=n,this.options=r,this.context=i,this.channel=null}function n(e,t){if(!(this instanceof n))return new n(e);this.namespace=e||"",this._subscribers=[],this._channels={},this._parent=t,this.stopped=!1}function r(){if(!(this instanceof r))return new r;this._channels=new n("")}return t.prototype.update=function(e){e&&(this.fn=e.fn||this.fn,this.context=e.context||this.context,this.options=e.options||this.options,this.channel&&this.options&&void 0!==this.options.priority&&this.channel.setPriority(this.id,this.options.priority))},n.prototype.channelPrioritySort=function(e,t){return e.options.priority>t.options.priority?-1:e.options.priority<t.options.priority?1:0},n.prototype.addSubscriber=function(e,n,r){n||(n={priority:0}),n.priority=0|n.priority;var i=new t(e,n,r);return i.channel=this,this._subscribers.push(i),this._subscribers.sort(this.channelPrioritySort),i},n.prototype.stopPropagation=function(){this.stopped=!0},n.prototype.getSubscriber=function(e){for(var t=0,n=this._subscribers.length;t<n;t++)if(this._subscribers[t].id===e||this._subscribers[t].fn===e)return this._subscribers[t]},n.prototype.setPriority=function(e,t){for(var n=0,r=this._subscribers.length;n<r;n++)if(this._subscribers[n].id===e||this._subscribers[n].fn===e){this._subscribers[n].priority=t;break}this._subscribers.sort(this.channelPrioritySort)},n.prototype.addChannel=function(e){this._channels[e]=new n((this.namespace?this.namespace+":":"")+e,this)},n.prototype.hasChannel=function(e){return this._channels.hasOwnProperty(e)},n.prototype.returnChannel=function(e){return this._channels[e]},n.prototype.removeSubscriber=function(e,t){var n=this._subscribers.length-1;if(t=void 0===t||t,e)for(;n>=0;n--)this._subscribers[n].fn!==e&&this._subscribers[n].id!==e||(this._subscribers[n].channel=null,this._subscribers.splice(n,1));else this._subscribers=[];t&&this.autoCleanChannel();n=this._subscribers.length-1;if(e)for(;n>=0;n--)this._subscribers[n].fn!==e&&this._subscribers[n].id!==e||(this._subscribers[n].channel=null,this._subscribers.splice(n,1));else this._subscribers=[]},n.prototype.autoCleanChannel=function(){if(0===this._subscribers.length){for(var e in this._channels)if(this._channels.hasOwnProperty(e))return;if(null!=this._parent){var t=this.namespace.split(":"),n=t[t.length-1];this._parent.removeChannel(n)}}},n.prototype.removeChannel=function(e){this.hasChannel(e)&&(this._channels[e]=null,delete this._channels[e],this.autoCleanChannel())},n.prototype.publish=function(e){for(var t,n,r,i=0,o=this._subscribers.length,s=!1;i<o;i++)s=!1,t=this._subscribers[i],this.stopped||(n=this._subscribers.length,void 0!==t.options&&"function"==typeof t.options.predicate?t.options.predicate.apply(t.context,e)&&(s=!0):s=!0),s&&(t.options&&void 0!==t.options.calls&&(t.options.calls--,t.options.calls<1&&this.removeSubscriber(t.id)),t.fn.apply(t.context,e),o=r=this._subscribers.length,r===n-1&&i--);this._parent&&this._parent.publish(e),this.stopped=!1},r.prototype.getChannel=function(e,t){var n=this._channels,r=e.split(":"),i=0,o=r.length;if(""===e)return n;if(r.length>0)for(;i<o;i++){if(!n.hasChannel(r[i])){if(t)break;n.addChannel(r[i])}n=n.returnChannel(r[i])}return n},r.prototype.subscribe=function(e,t,n,r){return n=n||{},r=r||{},this.getChannel(e||"",!1).addSubscriber(t,n,r)},r.prototype.once=function(e,t,n,r){return(n=n||{}).calls=1,this.subscribe(e,t,n,r)},r.prototype.getSubscriber=function(e,t){var n=this.getChannel(t||"",!0);return n.namespace!==t?null:n.getSubscriber(e)},r.prototype.remove=function(e,t,n){var r=this.getChannel(e||"",!0);if(r.namespace!==e)return!1;r.removeSubscriber(t,n)},r.prototype.publish=function(e){var t=this.getChannel(e||"",!1);if(t.namespace!==e)return null;var n=Array.prototype.slice.call(arguments,1);n.push(t),t.publish(n)},r.prototype.on=r.prototype.subscribe,r.prototype.bind=r.prototype.subscribe,r.prototype.emit=r.prototype.publish,r.prototype.trigger=r.prototype.publish,r.prototype.off=r.prototype.remove,r.Channel=n,r.Subscriber=t,r.version="0.10.1",r}(),r.Mediator}.apply(t,[]),void 0===n||(e.exports=n)}(this)},628:e=>{var t;self,t=function(){return function(){var e={3099:function(e){e.exports=function(e){if("function"!=typeof e)throw TypeError(String(e)+" is not a function");return e}},6077:function(e,t,n){var r=n(111);e.exports=function(e){if(!r(e)&&null!==e)throw TypeError("Can't set "+String(e)+" as a prototype");return e}},1223:function(e,t,n){var r=n(5112),i=n(30),o=n(3070),s=r("unscopables"),a=Array.prototype;null==a[s]&&o.f(a,s,{configurable:!0,value:i(null)}),e.exports=function(e){a[s][e]=!0}},1530:function(e,t,n){"use strict";var r=n(8710).charAt;e.exports=function(e,t,n){return t+(n?r(e,t).length:1)}},5787:function(e){e.exports=function(e,t,n){if(!(e instanceof t))throw TypeError("Incorrect "+(n?n+" ":"")+"invocation");return e}},9670:function(e,t,n){var r=n(111);e.exports=function(e){if(!r(e))throw TypeError(String(e)+" is not an object");return e}},4019:function(e){e.exports="undefined"!=typeof ArrayBuffer&&"undefined"!=typeof DataView},260:function(e,t,n){"use strict";var r,i=n(4019),o=n(9781),s=n(7854),a=n(111),l=n(6656),c=n(648),u=n(8880),d=n(1320),f=n(3070).f,h=n(9518),p=n(7674),v=n(5112),m=n(9711),g=s.Int8Array,y=g&&g.prototype,b=s.Uint8ClampedArray,w=b&&b.prototype,x=g&&h(g),E=y&&h(y),S=Object.prototype,k=S.isPrototypeOf,L=v("toStringTag"),A=m("TYPED_ARRAY_TAG"),C=i&&!!p&&"Opera"!==c(s.opera),_=!1,T={Int8Array:1,Uint8Array:1,Uint8ClampedArray:1,Int16Array:2,Uint16Array:2,Int32Array:4,Uint32Array:4,Float32Array:4,Float64Array:8},F={BigInt64Array:8,BigUint64Array:8},I=function(e){if(!a(e))return!1;var t=c(e);return l(T,t)||l(F,t)};for(r in T)s[r]||(C=!1);if((!C||"function"!=typeof x||x===Function.prototype)&&(x=function(){throw TypeError("Incorrect invocation")},C))for(r in T)s[r]&&p(s[r],x);if((!C||!E||E===S)&&(E=x.prototype,C))for(r in T)s[r]&&p(s[r].prototype,E);if(C&&h(w)!==E&&p(w,E),o&&!l(E,L))for(r in _=!0,f(E,L,{get:function(){return a(this)?this[A]:void 0}}),T)s[r]&&u(s[r],A,r);e.exports={NATIVE_ARRAY_BUFFER_VIEWS:C,TYPED_ARRAY_TAG:_&&A,aTypedArray:function(e){if(I(e))return e;throw TypeError("Target is not a typed array")},aTypedArrayConstructor:function(e){if(p){if(k.call(x,e))return e}else for(var t in T)if(l(T,r)){var n=s[t];if(n&&(e===n||k.call(n,e)))return e}throw TypeError("Target is not a typed array constructor")},exportTypedArrayMethod:function(e,t,n){if(o){if(n)for(var r in T){var i=s[r];i&&l(i.prototype,e)&&delete i.prototype[e]}E[e]&&!n||d(E,e,n?t:C&&y[e]||t)}},exportTypedArrayStaticMethod:function(e,t,n){var r,i;if(o){if(p){if(n)for(r in T)(i=s[r])&&l(i,e)&&delete i[e];if(x[e]&&!n)return;try{return d(x,e,n?t:C&&g[e]||t)}catch(e){}}for(r in T)!(i=s[r])||i[e]&&!n||d(i,e,t)}},isView:function(e){if(!a(e))return!1;var t=c(e);return"DataView"===t||l(T,t)||l(F,t)},isTypedArray:I,TypedArray:x,TypedArrayPrototype:E}},3331:function(e,t,n){"use strict";var r=n(7854),i=n(9781),o=n(4019),s=n(8880),a=n(2248),l=n(7293),c=n(5787),u=n(9958),d=n(7466),f=n(7067),h=n(1179),p=n(9518),v=n(7674),m=n(8006).f,g=n(3070).f,y=n(1285),b=n(8003),w=n(9909),x=w.get,E=w.set,S="ArrayBuffer",k="DataView",L="prototype",A="Wrong index",C=r[S],_=C,T=r[k],F=T&&T[L],I=Object.prototype,M=r.RangeError,R=h.pack,U=h.unpack,z=function(e){return[255&e]},O=function(e){return[255&e,e>>8&255]},j=function(e){return[255&e,e>>8&255,e>>16&255,e>>24&255]},q=function(e){return e[3]<<24|e[2]<<16|e[1]<<8|e[0]},P=function(e){return R(e,23,4)},D=function(e){return R(e,52,8)},N=function(e,t){g(e[L],t,{get:function(){return x(this)[t]}})},B=function(e,t,n,r){var i=f(n),o=x(e);if(i+t>o.byteLength)throw M(A);var s=x(o.buffer).bytes,a=i+o.byteOffset,l=s.slice(a,a+t);return r?l:l.reverse()},$=function(e,t,n,r,i,o){var s=f(n),a=x(e);if(s+t>a.byteLength)throw M(A);for(var l=x(a.buffer).bytes,c=s+a.byteOffset,u=r(+i),d=0;d<t;d++)l[c+d]=u[o?d:t-d-1]};if(o){if(!l(function(){C(1)})||!l(function(){new C(-1)})||l(function(){return new C,new C(1.5),new C(NaN),C.name!=S})){for(var W,H=(_=function(e){return c(this,_),new C(f(e))})[L]=C[L],Y=m(C),G=0;Y.length>G;)(W=Y[G++])in _||s(_,W,C[W]);H.constructor=_}v&&p(F)!==I&&v(F,I);var Q=new T(new _(2)),X=F.setInt8;Q.setInt8(0,2147483648),Q.setInt8(1,2147483649),!Q.getInt8(0)&&Q.getInt8(1)||a(F,{setInt8:function(e,t){X.call(this,e,t<<24>>24)},setUint8:function(e,t){X.call(this,e,t<<24>>24)}},{unsafe:!0})}else _=function(e){c(this,_,S);var t=f(e);E(this,{bytes:y.call(new Array(t),0),byteLength:t}),i||(this.byteLength=t)},T=function(e,t,n){c(this,T,k),c(e,_,k);var r=x(e).byteLength,o=u(t);if(o<0||o>r)throw M("Wrong offset");if(o+(n=void 0===n?r-o:d(n))>r)throw M("Wrong length");E(this,{buffer:e,byteLength:n,byteOffset:o}),i||(this.buffer=e,this.byteLength=n,this.byteOffset=o)},i&&(N(_,"byteLength"),N(T,"buffer"),N(T,"byteLength"),N(T,"byteOffset")),a(T[L],{getInt8:function(e){return B(this,1,e)[0]<<24>>24},getUint8:function(e){return B(this,1,e)[0]},getInt16:function(e){var t=B(this,2,e,arguments.length>1?arguments[1]:void 0);return(t[1]<<8|t[0])<<16>>16},getUint16:function(e){var t=B(this,2,e,arguments.length>1?arguments[1]:void 0);return t[1]<<8|t[0]},getInt32:function(e){return q(B(this,4,e,arguments.length>1?arguments[1]:void 0))},getUint32:function(e){return q(B(this,4,e,arguments.length>1?arguments[1]:void 0))>>>0},getFloat32:function(e){return U(B(this,4,e,arguments.length>1?arguments[1]:void 0),23)},getFloat64:function(e){return U(B(this,8,e,arguments.length>1?arguments[1]:void 0),52)},setInt8:function(e,t){$(this,1,e,z,t)},setUint8:function(e,t){$(this,1,e,z,t)},setInt16:function(e,t){$(this,2,e,O,t,arguments.length>2?arguments[2]:void 0)},setUint16:function(e,t){$(this,2,e,O,t,arguments.length>2?arguments[2]:void 0)},setInt32:function(e,t){$(this,4,e,j,t,arguments.length>2?arguments[2]:void 0)},setUint32:function(e,t){$(this,4,e,j,t,arguments.length>2?arguments[2]:void 0)},setFloat32:function(e,t){$(this,4,e,P,t,arguments.length>2?arguments[2]:void 0)},setFloat64:function(e,t){$(this,8,e,D,t,arguments.length>2?arguments[2]:void 0)}});b(_,S),b(T,k),e.exports={ArrayBuffer:_,DataView:T}},1048:function(e,t,n){"use strict";var r=n(7908),i=n(1400),o=n(7466),s=Math.min;e.exports=[].copyWithin||function(e,t){var n=r(this),a=o(n.length),l=i(e,a),c=i(t,a),u=arguments.length>2?arguments[2]:void 0,d=s((void 0===u?a:i(u,a))-c,a-l),f=1;for(c<l&&l<c+d&&(f=-1,c+=d-1,l+=d-1);d-- >0;)c in n?n[l]=n[c]:delete n[l],l+=f,c+=f;return n}},1285:function(e,t,n){"use strict";var r=n(7908),i=n(1400),o=n(7466);e.exports=function(e){for(var t=r(this),n=o(t.length),s=arguments.length,a=i(s>1?arguments[1]:void 0,n),l=s>2?arguments[2]:void 0,c=void 0===l?n:i(l,n);c>a;)t[a++]=e;return t}},8533:function(e,t,n){"use strict";var r=n(2092).forEach,i=n(9341)("forEach");e.exports=i?[].forEach:function(e){return r(this,e,arguments.length>1?arguments[1]:void 0)}},8457:function(e,t,n){"use strict";var r=n(9974),i=n(7908),o=n(3411),s=n(7659),a=n(7466),l=n(6135),c=n(1246);e.exports=function(e){var t,n,u,d,f,h,p=i(e),v="function"==typeof this?this:Array,m=arguments.length,g=m>1?arguments[1]:void 0,y=void 0!==g,b=c(p),w=0;if(y&&(g=r(g,m>2?arguments[2]:void 0,2)),null==b||v==Array&&s(b))for(n=new v(t=a(p.length));t>w;w++)h=y?g(p[w],w):p[w],l(n,w,h);else for(f=(d=b.call(p)).next,n=new v;!(u=f.call(d)).done;w++)h=y?o(d,g,[u.value,w],!0):u.value,l(n,w,h);return n.length=w,n}},1318:function(e,t,n){var r=n(5656),i=n(7466),o=n(1400),s=function(e){return function(t,n,s){var a,l=r(t),c=i(l.length),u=o(s,c);if(e&&n!=n){for(;c>u;)if((a=l[u++])!=a)return!0}else for(;c>u;u++)if((e||u in l)&&l[u]===n)return e||u||0;return!e&&-1}};e.exports={includes:s(!0),indexOf:s(!1)}},2092:function(e,t,n){var r=n(9974),i=n(8361),o=n(7908),s=n(7466),a=n(5417),l=[].push,c=function(e){var t=1==e,n=2==e,c=3==e,u=4==e,d=6==e,f=7==e,h=5==e||d;return function(p,v,m,g){for(var y,b,w=o(p),x=i(w),E=r(v,m,3),S=s(x.length),k=0,L=g||a,A=t?L(p,S):n||f?L(p,0):void 0;S>k;k++)if((h||k in x)&&(b=E(y=x[k],k,w),e))if(t)A[k]=b;else if(b)switch(e){case 3:return!0;case 5:return y;case 6:return k;case 2:l.call(A,y)}else switch(e){case 4:return!1;case 7:l.call(A,y)}return d?-1:c||u?u:A}};e.exports={forEach:c(0),map:c(1),filter:c(2),some:c(3),every:c(4),find:c(5),findIndex:c(6),filterOut:c(7)}},6583:function(e,t,n){"use strict";var r=n(5656),i=n(9958),o=n(7466),s=n(9341),a=Math.min,l=[].lastIndexOf,c=!!l&&1/[1].lastIndexOf(1,-0)<0,u=s("lastIndexOf"),d=c||!u;e.exports=d?function(e){if(c)return l.apply(this,arguments)||0;var t=r(this),n=o(t.length),s=n-1;for(arguments.length>1&&(s=a(s,i(arguments[1]))),s<0&&(s=n+s);s>=0;s--)if(s in t&&t[s]===e)return s||0;return-1}:l},1194:function(e,t,n){var r=n(7293),i=n(5112),o=n(7392),s=i("species");e.exports=function(e){return o>=51||!r(function(){var t=[];return(t.constructor={})[s]=function(){return{foo:1}},1!==t[e](Boolean).foo})}},9341:function(e,t,n){"use strict";var r=n(7293);e.exports=function(e,t){var n=[][e];return!!n&&r(function(){n.call(null,t||function(){throw 1},1)})}},3671:function(e,t,n){var r=n(3099),i=n(7908),o=n(8361),s=n(7466),a=function(e){return function(t,n,a,l){r(n);var c=i(t),u=o(c),d=s(c.length),f=e?d-1:0,h=e?-1:1;if(a<2)for(;;){if(f in u){l=u[f],f+=h;break}if(f+=h,e?f<0:d<=f)throw TypeError("Reduce of empty array with no initial value")}for(;e?f>=0:d>f;f+=h)f in u&&(l=n(l,u[f],f,c));return l}};e.exports={left:a(!1),right:a(!0)}},5417:function(e,t,n){var r=n(111),i=n(3157),o=n(5112)("species");e.exports=function(e,t){var n;return i(e)&&("function"!=typeof(n=e.constructor)||n!==Array&&!i(n.prototype)?r(n)&&null===(n=n[o])&&(n=void 0):n=void 0),new(void 0===n?Array:n)(0===t?0:t)}},3411:function(e,t,n){var r=n(9670),i=n(9212);e.exports=function(e,t,n,o){try{return o?t(r(n)[0],n[1]):t(n)}catch(t){throw i(e),t}}},7072:function(e,t,n){var r=n(5112)("iterator"),i=!1;try{var o=0,s={next:function(){return{done:!!o++}},return:function(){i=!0}};s[r]=function(){return this},Array.from(s,function(){throw 2})}catch(e){}e.exports=function(e,t){if(!t&&!i)return!1;var n=!1;try{var o={};o[r]=function(){return{next:function(){return{done:n=!0}}}},e(o)}catch(e){}return n}},4326:function(e){var t={}.toString;e.exports=function(e){return t.call(e).slice(8,-1)}},648:function(e,t,n){var r=n(1694),i=n(4326),o=n(5112)("toStringTag"),s="Arguments"==i(function(){return arguments}());e.exports=r?i:function(e){var t,n,r;return void 0===e?"Undefined":null===e?"Null":"string"==typeof(n=function(e,t){try{return e[t]}catch(e){}}(t=Object(e),o))?n:s?i(t):"Object"==(r=i(t))&&"function"==typeof t.callee?"Arguments":r}},9920:function(e,t,n){var r=n(6656),i=n(3887),o=n(1236),s=n(3070);e.exports=function(e,t){for(var n=i(t),a=s.f,l=o.f,c=0;c<n.length;c++){var u=n[c];r(e,u)||a(e,u,l(t,u))}}},8544:function(e,t,n){var r=n(7293);e.exports=!r(function(){function e(){}return e.prototype.constructor=null,Object.getPrototypeOf(new e)!==e.prototype})},4994:function(e,t,n){"use strict";var r=n(3383).IteratorPrototype,i=n(30),o=n(9114),s=n(8003),a=n(7497),l=function(){return this};e.exports=function(e,t,n){var c=t+" Iterator";return e.prototype=i(r,{next:o(1,n)}),s(e,c,!1,!0),a[c]=l,e}},8880:function(e,t,n){var r=n(9781),i=n(3070),o=n(9114);e.exports=r?function(e,t,n){return i.f(e,t,o(1,n))}:function(e,t,n){return e[t]=n,e}},9114:function(e){e.exports=function(e,t){return{enumerable:!(1&e),configurable:!(2&e),writable:!(4&e),value:t}}},6135:function(e,t,n){"use strict";var r=n(7593),i=n(3070),o=n(9114);e.exports=function(e,t,n){var s=r(t);s in e?i.f(e,s,o(0,n)):e[s]=n}},654:function(e,t,n){"use strict";var r=n(2109),i=n(4994),o=n(9518),s=n(7674),a=n(8003),l=n(8880),c=n(1320),u=n(5112),d=n(1913),f=n(7497),h=n(3383),p=h.IteratorPrototype,v=h.BUGGY_SAFARI_ITERATORS,m=u("iterator"),g="keys",y="values",b="entries",w=function(){return this};e.exports=function(e,t,n,u,h,x,E){i(n,t,u);var S,k,L,A=function(e){if(e===h&&I)return I;if(!v&&e in T)return T[e];switch(e){case g:case y:case b:return function(){return new n(this,e)}}return function(){return new n(this)}},C=t+" Iterator",_=!1,T=e.prototype,F=T[m]||T["@@iterator"]||h&&T[h],I=!v&&F||A(h),M="Array"==t&&T.entries||F;if(M&&(S=o(M.call(new e)),p!==Object.prototype&&S.next&&(d||o(S)===p||(s?s(S,p):"function"!=typeof S[m]&&l(S,m,w)),a(S,C,!0,!0),d&&(f[C]=w))),h==y&&F&&F.name!==y&&(_=!0,I=function(){return F.call(this)}),d&&!E||T[m]===I||l(T,m,I),f[t]=I,h)if(k={values:A(y),keys:x?I:A(g),entries:A(b)},E)for(L in k)(v||_||!(L in T))&&c(T,L,k[L]);else r({target:t,proto:!0,forced:v||_},k);return k}},9781:function(e,t,n){var r=n(7293);e.exports=!r(function(){return 7!=Object.defineProperty({},1,{get:function(){return 7}})[1]})},317:function(e,t,n){var r=n(7854),i=n(111),o=r.document,s=i(o)&&i(o.createElement);e.exports=function(e){return s?o.createElement(e):{}}},8324:function(e){e.exports={CSSRuleList:0,CSSStyleDeclaration:0,CSSValueList:0,ClientRectList:0,DOMRectList:0,DOMStringList:0,DOMTokenList:1,DataTransferItemList:0,FileList:0,HTMLAllCollection:0,HTMLCollection:0,HTMLFormElement:0,HTMLSelectElement:0,MediaList:0,MimeTypeArray:0,NamedNodeMap:0,NodeList:1,PaintRequestList:0,Plugin:0,PluginArray:0,SVGLengthList:0,SVGNumberList:0,SVGPathSegList:0,SVGPointList:0,SVGStringList:0,SVGTransformList:0,SourceBufferList:0,StyleSheetList:0,TextTrackCueList:0,TextTrackList:0,TouchList:0}},8113:function(e,t,n){var r=n(5005);e.exports=r("navigator","userAgent")||""},7392:function(e,t,n){var r,i,o=n(7854),s=n(8113),a=o.process,l=a&&a.versions,c=l&&l.v8;c?i=(r=c.split("."))[0]+r[1]:s&&(!(r=s.match(/Edge\/(\d+)/))||r[1]>=74)&&(r=s.match(/Chrome\/(\d+)/))&&(i=r[1]),e.exports=i&&+i},748:function(e){e.exports=["constructor","hasOwnProperty","isPrototypeOf","propertyIsEnumerable","toLocaleString","toString","valueOf"]},2109:function(e,t,n){var r=n(7854),i=n(1236).f,o=n(8880),s=n(1320),a=n(3505),l=n(9920),c=n(4705);e.exports=function(e,t){var n,u,d,f,h,p=e.target,v=e.global,m=e.stat;if(n=v?r:m?r[p]||a(p,{}):(r[p]||{}).prototype)for(u in t){if(f=t[u],d=e.noTargetGet?(h=i(n,u))&&h.value:n[u],!c(v?u:p+(m?".":"#")+u,e.forced)&&void 0!==d){if(typeof f==typeof d)continue;l(f,d)}(e.sham||d&&d.sham)&&o(f,"sham",!0),s(n,u,f,e)}}},7293:function(e){e.exports=function(e){try{return!!e()}catch(e){return!0}}},7007:function(e,t,n){"use strict";n(4916);var r=n(1320),i=n(7293),o=n(5112),s=n(2261),a=n(8880),l=o("species"),c=!i(function(){var e=/./;return e.exec=function(){var e=[];return e.groups={a:"7"},e},"7"!=="".replace(e,"$<a>")}),u="$0"==="a".replace(/./,"$0"),d=o("replace"),f=!!/./[d]&&""===/./[d]("a","$0"),h=!i(function(){var e=/(?:)/,t=e.exec;e.exec=function(){return t.apply(this,arguments)};var n="ab".split(e);return 2!==n.length||"a"!==n[0]||"b"!==n[1]});e.exports=function(e,t,n,d){var p=o(e),v=!i(function(){var t={};return t[p]=function(){return 7},7!=""[e](t)}),m=v&&!i(function(){var t=!1,n=/a/;return"split"===e&&((n={}).constructor={},n.constructor[l]=function(){return n},n.flags="",n[p]=/./[p]),n.exec=function(){return t=!0,null},n[p](""),!t});if(!v||!m||"replace"===e&&(!c||!u||f)||"split"===e&&!h){var g=/./[p],y=n(p,""[e],function(e,t,n,r,i){return t.exec===s?v&&!i?{done:!0,value:g.call(t,n,r)}:{done:!0,value:e.call(n,t,r)}:{done:!1}},{REPLACE_KEEPS_$0:u,REGEXP_REPLACE_SUBSTITUTES_UNDEFINED_CAPTURE:f}),b=y[0],w=y[1];r(String.prototype,e,b),r(RegExp.prototype,p,2==t?function(e,t){return w.call(e,this,t)}:function(e){return w.call(e,this)})}d&&a(RegExp.prototype[p],"sham",!0)}},9974:function(e,t,n){var r=n(3099);e.exports=function(e,t,n){if(r(e),void 0===t)return e;switch(n){case 0:return function(){return e.call(t)};case 1:return function(n){return e.call(t,n)};case 2:return function(n,r){return e.call(t,n,r)};case 3:return function(n,r,i){return e.call(t,n,r,i)}}return function(){return e.apply(t,arguments)}}},5005:function(e,t,n){var r=n(857),i=n(7854),o=function(e){return"function"==typeof e?e:void 0};e.exports=function(e,t){return arguments.length<2?o(r[e])||o(i[e]):r[e]&&r[e][t]||i[e]&&i[e][t]}},1246:function(e,t,n){var r=n(648),i=n(7497),o=n(5112)("iterator");e.exports=function(e){if(null!=e)return e[o]||e["@@iterator"]||i[r(e)]}},8554:function(e,t,n){var r=n(9670),i=n(1246);e.exports=function(e){var t=i(e);if("function"!=typeof t)throw TypeError(String(e)+" is not iterable");return r(t.call(e))}},647:function(e,t,n){var r=n(7908),i=Math.floor,o="".replace,s=/\$([$&'`]|\d\d?|<[^>]*>)/g,a=/\$([$&'`]|\d\d?)/g;e.exports=function(e,t,n,l,c,u){var d=n+e.length,f=l.length,h=a;return void 0!==c&&(c=r(c),h=s),o.call(u,h,function(r,o){var s;switch(o.charAt(0)){case"$":return"$";case"&":return e;case"`":return t.slice(0,n);case"'":return t.slice(d);case"<":s=c[o.slice(1,-1)];break;default:var a=+o;if(0===a)return r;if(a>f){var u=i(a/10);return 0===u?r:u<=f?void 0===l[u-1]?o.charAt(1):l[u-1]+o.charAt(1):r}s=l[a-1]}return void 0===s?"":s})}},7854:function(e,t,n){var r=function(e){return e&&e.Math==Math&&e};e.exports=r("object"==typeof globalThis&&globalThis)||r("object"==typeof window&&window)||r("object"==typeof self&&self)||r("object"==typeof n.g&&n.g)||function(){return this}()||Function("return this")()},6656:function(e){var t={}.hasOwnProperty;e.exports=function(e,n){return t.call(e,n)}},3501:function(e){e.exports={}},490:function(e,t,n){var r=n(5005);e.exports=r("document","documentElement")},4664:function(e,t,n){var r=n(9781),i=n(7293),o=n(317);e.exports=!r&&!i(function(){return 7!=Object.defineProperty(o("div"),"a",{get:function(){return 7}}).a})},1179:function(e){var t=Math.abs,n=Math.pow,r=Math.floor,i=Math.log,o=Math.LN2;e.exports={pack:function(e,s,a){var l,c,u,d=new Array(a),f=8*a-s-1,h=(1<<f)-1,p=h>>1,v=23===s?n(2,-24)-n(2,-77):0,m=e<0||0===e&&1/e<0?1:0,g=0;for((e=t(e))!=e||e===1/0?(c=e!=e?1:0,l=h):(l=r(i(e)/o),e*(u=n(2,-l))<1&&(l--,u*=2),(e+=l+p>=1?v/u:v*n(2,1-p))*u>=2&&(l++,u/=2),l+p>=h?(c=0,l=h):l+p>=1?(c=(e*u-1)*n(2,s),l+=p):(c=e*n(2,p-1)*n(2,s),l=0));s>=8;d[g++]=255&c,c/=256,s-=8);for(l=l<<s|c,f+=s;f>0;d[g++]=255&l,l/=256,f-=8);return d[--g]|=128*m,d},unpack:function(e,t){var r,i=e.length,o=8*i-t-1,s=(1<<o)-1,a=s>>1,l=o-7,c=i-1,u=e[c--],d=127&u;for(u>>=7;l>0;d=256*d+e[c],c--,l-=8);for(r=d&(1<<-l)-1,d>>=-l,l+=t;l>0;r=256*r+e[c],c--,l-=8);if(0===d)d=1-a;else{if(d===s)return r?NaN:u?-1/0:1/0;r+=n(2,t),d-=a}return(u?-1:1)*r*n(2,d-t)}}},8361:function(e,t,n){var r=n(7293),i=n(4326),o="".split;e.exports=r(function(){return!Object("z").propertyIsEnumerable(0)})?function(e){return"String"==i(e)?o.call(e,""):Object(e)}:Object},9587:function(e,t,n){var r=n(111),i=n(7674);e.exports=function(e,t,n){var o,s;return i&&"function"==typeof(o=t.constructor)&&o!==n&&r(s=o.prototype)&&s!==n.prototype&&i(e,s),e}},2788:function(e,t,n){var r=n(5465),i=Function.toString;"function"!=typeof r.inspectSource&&(r.inspectSource=function(e){return i.call(e)}),e.exports=r.inspectSource},9909:function(e,t,n){var r,i,o,s=n(8536),a=n(7854),l=n(111),c=n(8880),u=n(6656),d=n(5465),f=n(6200),h=n(3501),p=a.WeakMap;if(s){var v=d.state||(d.state=new p),m=v.get,g=v.has,y=v.set;r=function(e,t){return t.facade=e,y.call(v,e,t),t},i=function(e){return m.call(v,e)||{}},o=function(e){return g.call(v,e)}}else{var b=f("state");h[b]=!0,r=function(e,t){return t.facade=e,c(e,b,t),t},i=function(e){return u(e,b)?e[b]:{}},o=function(e){return u(e,b)}}e.exports={set:r,get:i,has:o,enforce:function(e){return o(e)?i(e):r(e,{})},getterFor:function(e){return function(t){var n;if(!l(t)||(n=i(t)).type!==e)throw TypeError("Incompatible receiver, "+e+" required");return n}}}},7659:function(e,t,n){var r=n(5112),i=n(7497),o=r("iterator"),s=Array.prototype;e.exports=function(e){return void 0!==e&&(i.Array===e||s[o]===e)}},3157:function(e,t,n){var r=n(4326);e.exports=Array.isArray||function(e){return"Array"==r(e)}},4705:function(e,t,n){var r=n(7293),i=/#|\.prototype\./,o=function(e,t){var n=a[s(e)];return n==c||n!=l&&("function"==typeof t?r(t):!!t)},s=o.normalize=function(e){return String(e).replace(i,".").toLowerCase()},a=o.data={},l=o.NATIVE="N",c=o.POLYFILL="P";e.exports=o},111:function(e){e.exports=function(e){return"object"==typeof e?null!==e:"function"==typeof e}},1913:function(e){e.exports=!1},7850:function(e,t,n){var r=n(111),i=n(4326),o=n(5112)("match");e.exports=function(e){var t;return r(e)&&(void 0!==(t=e[o])?!!t:"RegExp"==i(e))}},9212:function(e,t,n){var r=n(9670);e.exports=function(e){var t=e.return;if(void 0!==t)return r(t.call(e)).value}},3383:function(e,t,n){"use strict";var r,i,o,s=n(7293),a=n(9518),l=n(8880),c=n(6656),u=n(5112),d=n(1913),f=u("iterator"),h=!1;[].keys&&("next"in(o=[].keys())?(i=a(a(o)))!==Object.prototype&&(r=i):h=!0);var p=null==r||s(function(){var e={};return r[f].call(e)!==e});p&&(r={}),d&&!p||c(r,f)||l(r,f,function(){return this}),e.exports={IteratorPrototype:r,BUGGY_SAFARI_ITERATORS:h}},7497:function(e){e.exports={}},133:function(e,t,n){var r=n(7293);e.exports=!!Object.getOwnPropertySymbols&&!r(function(){return!String(Symbol())})},590:function(e,t,n){var r=n(7293),i=n(5112),o=n(1913),s=i("iterator");e.exports=!r(function(){var e=new URL("b?a=1&b=2&c=3","http://a"),t=e.searchParams,n="";return e.pathname="c%20d",t.forEach(function(e,r){t.delete("b"),n+=r+e}),o&&!e.toJSON||!t.sort||"http://a/c%20d?a=1&c=3"!==e.href||"3"!==t.get("c")||"a=1"!==String(new URLSearchParams("?a=1"))||!t[s]||"a"!==new URL("https://a@b").username||"b"!==new URLSearchParams(new URLSearchParams("a=b")).get("a")||"xn--e1aybc"!==new URL("http://тест").host||"#%D0%B1"!==new URL("http://a#б").hash||"a1c3"!==n||"x"!==new URL("http://x",void 0).host})},8536:function(e,t,n){var r=n(7854),i=n(2788),o=r.WeakMap;e.exports="function"==typeof o&&/native code/.test(i(o))},1574:function(e,t,n){"use strict";var r=n(9781),i=n(7293),o=n(1956),s=n(5181),a=n(5296),l=n(7908),c=n(8361),u=Object.assign,d=Object.defineProperty;e.exports=!u||i(function(){if(r&&1!==u({b:1},u(d({},"a",{enumerable:!0,get:function(){d(this,"b",{value:3,enumerable:!1})}}),{b:2})).b)return!0;var e={},t={},n=Symbol(),i="abcdefghijklmnopqrst";return e[n]=7,i.split("").forEach(function(e){t[e]=e}),7!=u({},e)[n]||o(u({},t)).join("")!=i})?function(e,t){for(var n=l(e),i=arguments.length,u=1,d=s.f,f=a.f;i>u;)for(var h,p=c(arguments[u++]),v=d?o(p).concat(d(p)):o(p),m=v.length,g=0;m>g;)h=v[g++],r&&!f.call(p,h)||(n[h]=p[h]);return n}:u},30:function(e,t,n){var r,i=n(9670),o=n(6048),s=n(748),a=n(3501),l=n(490),c=n(317),u=n(6200),d="prototype",f="script",h=u("IE_PROTO"),p=function(){},v=function(e){return"<"+f+">"+e+"</"+f+">"},m=function(){try{r=document.domain&&new ActiveXObject("htmlfile")}catch(e){}var e,t,n;m=r?function(e){e.write(v("")),e.close();var t=e.parentWindow.Object;return e=null,t}(r):(t=c("iframe"),n="java"+f+":",t.style.display="none",l.appendChild(t),t.src=String(n),(e=t.contentWindow.document).open(),e.write(v("document.F=Object")),e.close(),e.F);for(var i=s.length;i--;)delete m[d][s[i]];return m()};a[h]=!0,e.exports=Object.create||function(e,t){var n;return null!==e?(p[d]=i(e),n=new p,p[d]=null,n[h]=e):n=m(),void 0===t?n:o(n,t)}},6048:function(e,t,n){var r=n(9781),i=n(3070),o=n(9670),s=n(1956);e.exports=r?Object.defineProperties:function(e,t){o(e);for(var n,r=s(t),a=r.length,l=0;a>l;)i.f(e,n=r[l++],t[n]);return e}},3070:function(e,t,n){var r=n(9781),i=n(4664),o=n(9670),s=n(7593),a=Object.defineProperty;t.f=r?a:function(e,t,n){if(o(e),t=s(t,!0),o(n),i)try{return a(e,t,n)}catch(e){}if("get"in n||"set"in n)throw TypeError("Accessors not supported");return"value"in n&&(e[t]=n.value),e}},1236:function(e,t,n){var r=n(9781),i=n(5296),o=n(9114),s=n(5656),a=n(7593),l=n(6656),c=n(4664),u=Object.getOwnPropertyDescriptor;t.f=r?u:function(e,t){if(e=s(e),t=a(t,!0),c)try{return u(e,t)}catch(e){}if(l(e,t))return o(!i.f.call(e,t),e[t])}},8006:function(e,t,n){var r=n(6324),i=n(748).concat("length","prototype");t.f=Object.getOwnPropertyNames||function(e){return r(e,i)}},5181:function(e,t){t.f=Object.getOwnPropertySymbols},9518:function(e,t,n){var r=n(6656),i=n(7908),o=n(6200),s=n(8544),a=o("IE_PROTO"),l=Object.prototype;e.exports=s?Object.getPrototypeOf:function(e){return e=i(e),r(e,a)?e[a]:"function"==typeof e.constructor&&e instanceof e.constructor?e.constructor.prototype:e instanceof Object?l:null}},6324:function(e,t,n){var r=n(6656),i=n(5656),o=n(1318).indexOf,s=n(3501);e.exports=function(e,t){var n,a=i(e),l=0,c=[];for(n in a)!r(s,n)&&r(a,n)&&c.push(n);for(;t.length>l;)r(a,n=t[l++])&&(~o(c,n)||c.push(n));return c}},1956:function(e,t,n){var r=n(6324),i=n(748);e.exports=Object.keys||function(e){return r(e,i)}},5296:function(e,t){"use strict";var n={}.propertyIsEnumerable,r=Object.getOwnPropertyDescriptor,i=r&&!n.call({1:2},1);t.f=i?function(e){var t=r(this,e);return!!t&&t.enumerable}:n},7674:function(e,t,n){var r=n(9670),i=n(6077);e.exports=Object.setPrototypeOf||("__proto__"in{}?function(){var e,t=!1,n={};try{(e=Object.getOwnPropertyDescriptor(Object.prototype,"__proto__").set).call(n,[]),t=n instanceof Array}catch(e){}return function(n,o){return r(n),i(o),t?e.call(n,o):n.__proto__=o,n}}():void 0)},288:function(e,t,n){"use strict";var r=n(1694),i=n(648);e.exports=r?{}.toString:function(){return"[object "+i(this)+"]"}},3887:function(e,t,n){var r=n(5005),i=n(8006),o=n(5181),s=n(9670);e.exports=r("Reflect","ownKeys")||function(e){var t=i.f(s(e)),n=o.f;return n?t.concat(n(e)):t}},857:function(e,t,n){var r=n(7854);e.exports=r},2248:function(e,t,n){var r=n(1320);e.exports=function(e,t,n){for(var i in t)r(e,i,t[i],n);return e}},1320:function(e,t,n){var r=n(7854),i=n(8880),o=n(6656),s=n(3505),a=n(2788),l=n(9909),c=l.get,u=l.enforce,d=String(String).split("String");(e.exports=function(e,t,n,a){var l,c=!!a&&!!a.unsafe,f=!!a&&!!a.enumerable,h=!!a&&!!a.noTargetGet;"function"==typeof n&&("string"!=typeof t||o(n,"name")||i(n,"name",t),(l=u(n)).source||(l.source=d.join("string"==typeof t?t:""))),e!==r?(c?!h&&e[t]&&(f=!0):delete e[t],f?e[t]=n:i(e,t,n)):f?e[t]=n:s(t,n)})(Function.prototype,"toString",function(){return"function"==typeof this&&c(this).source||a(this)})},7651:function(e,t,n){var r=n(4326),i=n(2261);e.exports=function(e,t){var n=e.exec;if("function"==typeof n){var o=n.call(e,t);if("object"!=typeof o)throw TypeError("RegExp exec method returned something other than an Object or null");return o}if("RegExp"!==r(e))throw TypeError("RegExp#exec called on incompatible receiver");return i.call(e,t)}},2261:function(e,t,n){"use strict";var r,i,o=n(7066),s=n(2999),a=RegExp.prototype.exec,l=String.prototype.replace,c=a,u=(r=/a/,i=/b*/g,a.call(r,"a"),a.call(i,"a"),0!==r.lastIndex||0!==i.lastIndex),d=s.UNSUPPORTED_Y||s.BROKEN_CARET,f=void 0!==/()??/.exec("")[1];(u||f||d)&&(c=function(e){var t,n,r,i,s=this,c=d&&s.sticky,h=o.call(s),p=s.source,v=0,m=e;return c&&(-1===(h=h.replace("y","")).indexOf("g")&&(h+="g"),m=String(e).slice(s.lastIndex),s.lastIndex>0&&(!s.multiline||s.multiline&&"\n"!==e[s.lastIndex-1])&&(p="(?: "+p+")",m=" "+m,v++),n=new RegExp("^(?:"+p+")",h)),f&&(n=new RegExp("^"+p+"$(?!\\s)",h)),u&&(t=s.lastIndex),r=a.call(c?n:s,m),c?r?(r.input=r.input.slice(v),r[0]=r[0].slice(v),r.index=s.lastIndex,s.lastIndex+=r[0].length):s.lastIndex=0:u&&r&&(s.lastIndex=s.global?r.index+r[0].length:t),f&&r&&r.length>1&&l.call(r[0],n,function(){for(i=1;i<arguments.length-2;i++)void 0===arguments[i]&&(r[i]=void 0)}),r}),e.exports=c},7066:function(e,t,n){"use strict";var r=n(9670);e.exports=function(){var e=r(this),t="";return e.global&&(t+="g"),e.ignoreCase&&(t+="i"),e.multiline&&(t+="m"),e.dotAll&&(t+="s"),e.unicode&&(t+="u"),e.sticky&&(t+="y"),t}},2999:function(e,t,n){"use strict";var r=n(7293);function i(e,t){return RegExp(e,t)}t.UNSUPPORTED_Y=r(function(){var e=i("a","y");return e.lastIndex=2,null!=e.exec("abcd")}),t.BROKEN_CARET=r(function(){var e=i("^r","gy");return e.lastIndex=2,null!=e.exec("str")})},4488:function(e){e.exports=function(e){if(null==e)throw TypeError("Can't call method on "+e);return e}},3505:function(e,t,n){var r=n(7854),i=n(8880);e.exports=function(e,t){try{i(r,e,t)}catch(n){r[e]=t}return t}},6340:function(e,t,n){"use strict";var r=n(5005),i=n(3070),o=n(5112),s=n(9781),a=o("species");e.exports=function(e){var t=r(e),n=i.f;s&&t&&!t[a]&&n(t,a,{configurable:!0,get:function(){return this}})}},8003:function(e,t,n){var r=n(3070).f,i=n(6656),o=n(5112)("toStringTag");e.exports=function(e,t,n){e&&!i(e=n?e:e.prototype,o)&&r(e,o,{configurable:!0,value:t})}},6200:function(e,t,n){var r=n(2309),i=n(9711),o=r("keys");e.exports=function(e){return o[e]||(o[e]=i(e))}},5465:function(e,t,n){var r=n(7854),i=n(3505),o="__core-js_shared__",s=r[o]||i(o,{});e.exports=s},2309:function(e,t,n){var r=n(1913),i=n(5465);(e.exports=function(e,t){return i[e]||(i[e]=void 0!==t?t:{})})("versions",[]).push({version:"3.9.0",mode:r?"pure":"global",copyright:"© 2021 Denis Pushkarev (zloirock.ru)"})},6707:function(e,t,n){var r=n(9670),i=n(3099),o=n(5112)("species");e.exports=function(e,t){var n,s=r(e).constructor;return void 0===s||null==(n=r(s)[o])?t:i(n)}},8710:function(e,t,n){var r=n(9958),i=n(4488),o=function(e){return function(t,n){var o,s,a=String(i(t)),l=r(n),c=a.length;return l<0||l>=c?e?"":void 0:(o=a.charCodeAt(l))<55296||o>56319||l+1===c||(s=a.charCodeAt(l+1))<56320||s>57343?e?a.charAt(l):o:e?a.slice(l,l+2):s-56320+(o-55296<<10)+65536}};e.exports={codeAt:o(!1),charAt:o(!0)}},3197:function(e){"use strict";var t=2147483647,n=/[^\0-\u007E]/,r=/[.\u3002\uFF0E\uFF61]/g,i="Overflow: input needs wider integers to process",o=Math.floor,s=String.fromCharCode,a=function(e){return e+22+75*(e<26)},l=function(e,t,n){var r=0;for(e=n?o(e/700):e>>1,e+=o(e/t);e>455;r+=36)e=o(e/35);return o(r+36*e/(e+38))},c=function(e){var n=[];e=function(e){for(var t=[],n=0,r=e.length;n<r;){var i=e.charCodeAt(n++);if(i>=55296&&i<=56319&&n<r){var o=e.charCodeAt(n++);56320==(64512&o)?t.push(((1023&i)<<10)+(1023&o)+65536):(t.push(i),n--)}else t.push(i)}return t}(e);var r,c,u=e.length,d=128,f=0,h=72;for(r=0;r<e.length;r++)(c=e[r])<128&&n.push(s(c));var p=n.length,v=p;for(p&&n.push("-");v<u;){var m=t;for(r=0;r<e.length;r++)(c=e[r])>=d&&c<m&&(m=c);var g=v+1;if(m-d>o((t-f)/g))throw RangeError(i);for(f+=(m-d)*g,d=m,r=0;r<e.length;r++){if((c=e[r])<d&&++f>t)throw RangeError(i);if(c==d){for(var y=f,b=36;;b+=36){var w=b<=h?1:b>=h+26?26:b-h;if(y<w)break;var x=y-w,E=36-w;n.push(s(a(w+x%E))),y=o(x/E)}n.push(s(a(y))),h=l(f,g,v==p),f=0,++v}}++f,++d}return n.join("")};e.exports=function(e){var t,i,o=[],s=e.toLowerCase().replace(r,".").split(".");for(t=0;t<s.length;t++)i=s[t],o.push(n.test(i)?"xn--"+c(i):i);return o.join(".")}},6091:function(e,t,n){var r=n(7293),i=n(1361);e.exports=function(e){return r(function(){return!!i[e]()||"​᠎"!="​᠎"[e]()||i[e].name!==e})}},3111:function(e,t,n){var r=n(4488),i="["+n(1361)+"]",o=RegExp("^"+i+i+"*"),s=RegExp(i+i+"*$"),a=function(e){return function(t){var n=String(r(t));return 1&e&&(n=n.replace(o,"")),2&e&&(n=n.replace(s,"")),n}};e.exports={start:a(1),end:a(2),trim:a(3)}},1400:function(e,t,n){var r=n(9958),i=Math.max,o=Math.min;e.exports=function(e,t){var n=r(e);return n<0?i(n+t,0):o(n,t)}},7067:function(e,t,n){var r=n(9958),i=n(7466);e.exports=function(e){if(void 0===e)return 0;var t=r(e),n=i(t);if(t!==n)throw RangeError("Wrong length or index");return n}},5656:function(e,t,n){var r=n(8361),i=n(4488);e.exports=function(e){return r(i(e))}},9958:function(e){var t=Math.ceil,n=Math.floor;e.exports=function(e){return isNaN(e=+e)?0:(e>0?n:t)(e)}},7466:function(e,t,n){var r=n(9958),i=Math.min;e.exports=function(e){return e>0?i(r(e),9007199254740991):0}},7908:function(e,t,n){var r=n(4488);e.exports=function(e){return Object(r(e))}},4590:function(e,t,n){var r=n(3002);e.exports=function(e,t){var n=r(e);if(n%t)throw RangeError("Wrong offset");return n}},3002:function(e,t,n){var r=n(9958);e.exports=function(e){var t=r(e);if(t<0)throw RangeError("The argument can't be less than 0");return t}},7593:function(e,t,n){var r=n(111);e.exports=function(e,t){if(!r(e))return e;var n,i;if(t&&"function"==typeof(n=e.toString)&&!r(i=n.call(e)))return i;if("function"==typeof(n=e.valueOf)&&!r(i=n.call(e)))return i;if(!t&&"function"==typeof(n=e.toString)&&!r(i=n.call(e)))return i;throw TypeError("Can't convert object to primitive value")}},1694:function(e,t,n){var r={};r[n(5112)("toStringTag")]="z",e.exports="[object z]"===String(r)},9843:function(e,t,n){"use strict";var r=n(2109),i=n(7854),o=n(9781),s=n(3832),a=n(260),l=n(3331),c=n(5787),u=n(9114),d=n(8880),f=n(7466),h=n(7067),p=n(4590),v=n(7593),m=n(6656),g=n(648),y=n(111),b=n(30),w=n(7674),x=n(8006).f,E=n(7321),S=n(2092).forEach,k=n(6340),L=n(3070),A=n(1236),C=n(9909),_=n(9587),T=C.get,F=C.set,I=L.f,M=A.f,R=Math.round,U=i.RangeError,z=l.ArrayBuffer,O=l.DataView,j=a.NATIVE_ARRAY_BUFFER_VIEWS,q=a.TYPED_ARRAY_TAG,P=a.TypedArray,D=a.TypedArrayPrototype,N=a.aTypedArrayConstructor,B=a.isTypedArray,$="BYTES_PER_ELEMENT",W="Wrong length",H=function(e,t){for(var n=0,r=t.length,i=new(N(e))(r);r>n;)i[n]=t[n++];return i},Y=function(e,t){I(e,t,{get:function(){return T(this)[t]}})},G=function(e){var t;return e instanceof z||"ArrayBuffer"==(t=g(e))||"SharedArrayBuffer"==t},Q=function(e,t){return B(e)&&"symbol"!=typeof t&&t in e&&String(+t)==String(t)},X=function(e,t){return Q(e,t=v(t,!0))?u(2,e[t]):M(e,t)},V=function(e,t,n){return!(Q(e,t=v(t,!0))&&y(n)&&m(n,"value"))||m(n,"get")||m(n,"set")||n.configurable||m(n,"writable")&&!n.writable||m(n,"enumerable")&&!n.enumerable?I(e,t,n):(e[t]=n.value,e)};o?(j||(A.f=X,L.f=V,Y(D,"buffer"),Y(D,"byteOffset"),Y(D,"byteLength"),Y(D,"length")),r({target:"Object",stat:!0,forced:!j},{getOwnPropertyDescriptor:X,defineProperty:V}),e.exports=function(e,t,n){var o=e.match(/\d+$/)[0]/8,a=e+(n?"Clamped":"")+"Array",l="get"+e,u="set"+e,v=i[a],m=v,g=m&&m.prototype,L={},A=function(e,t){I(e,t,{get:function(){return function(e,t){var n=T(e);return n.view[l](t*o+n.byteOffset,!0)}(this,t)},set:function(e){return function(e,t,r){var i=T(e);n&&(r=(r=R(r))<0?0:r>255?255:255&r),i.view[u](t*o+i.byteOffset,r,!0)}(this,t,e)},enumerable:!0})};j?s&&(m=t(function(e,t,n,r){return c(e,m,a),_(y(t)?G(t)?void 0!==r?new v(t,p(n,o),r):void 0!==n?new v(t,p(n,o)):new v(t):B(t)?H(m,t):E.call(m,t):new v(h(t)),e,m)}),w&&w(m,P),S(x(v),function(e){e in m||d(m,e,v[e])}),m.prototype=g):(m=t(function(e,t,n,r){c(e,m,a);var i,s,l,u=0,d=0;if(y(t)){if(!G(t))return B(t)?H(m,t):E.call(m,t);i=t,d=p(n,o);var v=t.byteLength;if(void 0===r){if(v%o)throw U(W);if((s=v-d)<0)throw U(W)}else if((s=f(r)*o)+d>v)throw U(W);l=s/o}else l=h(t),i=new z(s=l*o);for(F(e,{buffer:i,byteOffset:d,byteLength:s,length:l,view:new O(i)});u<l;)A(e,u++)}),w&&w(m,P),g=m.prototype=b(D)),g.constructor!==m&&d(g,"constructor",m),q&&d(g,q,a),L[a]=m,r({global:!0,forced:m!=v,sham:!j},L),$ in m||d(m,$,o),$ in g||d(g,$,o),k(a)}):e.exports=function(){}},3832:function(e,t,n){var r=n(7854),i=n(7293),o=n(7072),s=n(260).NATIVE_ARRAY_BUFFER_VIEWS,a=r.ArrayBuffer,l=r.Int8Array;e.exports=!s||!i(function(){l(1)})||!i(function(){new l(-1)})||!o(function(e){new l,new l(null),new l(1.5),new l(e)},!0)||i(function(){return 1!==new l(new a(2),1,void 0).length})},3074:function(e,t,n){var r=n(260).aTypedArrayConstructor,i=n(6707);e.exports=function(e,t){for(var n=i(e,e.constructor),o=0,s=t.length,a=new(r(n))(s);s>o;)a[o]=t[o++];return a}},7321:function(e,t,n){var r=n(7908),i=n(7466),o=n(1246),s=n(7659),a=n(9974),l=n(260).aTypedArrayConstructor;e.exports=function(e){var t,n,c,u,d,f,h=r(e),p=arguments.length,v=p>1?arguments[1]:void 0,m=void 0!==v,g=o(h);if(null!=g&&!s(g))for(f=(d=g.call(h)).next,h=[];!(u=f.call(d)).done;)h.push(u.value);for(m&&p>2&&(v=a(v,arguments[2],2)),n=i(h.length),c=new(l(this))(n),t=0;n>t;t++)c[t]=m?v(h[t],t):h[t];return c}},9711:function(e){var t=0,n=Math.random();e.exports=function(e){return"Symbol("+String(void 0===e?"":e)+")_"+(++t+n).toString(36)}},3307:function(e,t,n){var r=n(133);e.exports=r&&!Symbol.sham&&"symbol"==typeof Symbol.iterator},5112:function(e,t,n){var r=n(7854),i=n(2309),o=n(6656),s=n(9711),a=n(133),l=n(3307),c=i("wks"),u=r.Symbol,d=l?u:u&&u.withoutSetter||s;e.exports=function(e){return o(c,e)||(a&&o(u,e)?c[e]=u[e]:c[e]=d("Symbol."+e)),c[e]}},1361:function(e){e.exports="\t\n\v\f\r                　\u2028\u2029\ufeff"},8264:function(e,t,n){"use strict";var r=n(2109),i=n(7854),o=n(3331),s=n(6340),a="ArrayBuffer",l=o[a];r({global:!0,forced:i[a]!==l},{ArrayBuffer:l}),s(a)},2222:function(e,t,n){"use strict";var r=n(2109),i=n(7293),o=n(3157),s=n(111),a=n(7908),l=n(7466),c=n(6135),u=n(5417),d=n(1194),f=n(5112),h=n(7392),p=f("isConcatSpreadable"),v=9007199254740991,m="Maximum allowed index exceeded",g=h>=51||!i(function(){var e=[];return e[p]=!1,e.concat()[0]!==e}),y=d("concat"),b=function(e){if(!s(e))return!1;var t=e[p];return void 0!==t?!!t:o(e)};r({target:"Array",proto:!0,forced:!g||!y},{concat:function(e){var t,n,r,i,o,s=a(this),d=u(s,0),f=0;for(t=-1,r=arguments.length;t<r;t++)if(b(o=-1===t?s:arguments[t])){if(f+(i=l(o.length))>v)throw TypeError(m);for(n=0;n<i;n++,f++)n in o&&c(d,f,o[n])}else{if(f>=v)throw TypeError(m);c(d,f++,o)}return d.length=f,d}})},7327:function(e,t,n){"use strict";var r=n(2109),i=n(2092).filter;r({target:"Array",proto:!0,forced:!n(1194)("filter")},{filter:function(e){return i(this,e,arguments.length>1?arguments[1]:void 0)}})},2772:function(e,t,n){"use strict";var r=n(2109),i=n(1318).indexOf,o=n(9341),s=[].indexOf,a=!!s&&1/[1].indexOf(1,-0)<0,l=o("indexOf");r({target:"Array",proto:!0,forced:a||!l},{indexOf:function(e){return a?s.apply(this,arguments)||0:i(this,e,arguments.length>1?arguments[1]:void 0)}})},6992:function(e,t,n){"use strict";var r=n(5656),i=n(1223),o=n(7497),s=n(9909),a=n(654),l="Array Iterator",c=s.set,u=s.getterFor(l);e.exports=a(Array,"Array",function(e,t){c(this,{type:l,target:r(e),index:0,kind:t})},function(){var e=u(this),t=e.target,n=e.kind,r=e.index++;return!t||r>=t.length?(e.target=void 0,{value:void 0,done:!0}):"keys"==n?{value:r,done:!1}:"values"==n?{value:t[r],done:!1}:{value:[r,t[r]],done:!1}},"values"),o.Arguments=o.Array,i("keys"),i("values"),i("entries")},1249:function(e,t,n){"use strict";var r=n(2109),i=n(2092).map;r({target:"Array",proto:!0,forced:!n(1194)("map")},{map:function(e){return i(this,e,arguments.length>1?arguments[1]:void 0)}})},7042:function(e,t,n){"use strict";var r=n(2109),i=n(111),o=n(3157),s=n(1400),a=n(7466),l=n(5656),c=n(6135),u=n(5112),d=n(1194)("slice"),f=u("species"),h=[].slice,p=Math.max;r({target:"Array",proto:!0,forced:!d},{slice:function(e,t){var n,r,u,d=l(this),v=a(d.length),m=s(e,v),g=s(void 0===t?v:t,v);if(o(d)&&("function"!=typeof(n=d.constructor)||n!==Array&&!o(n.prototype)?i(n)&&null===(n=n[f])&&(n=void 0):n=void 0,n===Array||void 0===n))return h.call(d,m,g);for(r=new(void 0===n?Array:n)(p(g-m,0)),u=0;m<g;m++,u++)m in d&&c(r,u,d[m]);return r.length=u,r}})},561:function(e,t,n){"use strict";var r=n(2109),i=n(1400),o=n(9958),s=n(7466),a=n(7908),l=n(5417),c=n(6135),u=n(1194)("splice"),d=Math.max,f=Math.min;r({target:"Array",proto:!0,forced:!u},{splice:function(e,t){var n,r,u,h,p,v,m=a(this),g=s(m.length),y=i(e,g),b=arguments.length;if(0===b?n=r=0:1===b?(n=0,r=g-y):(n=b-2,r=f(d(o(t),0),g-y)),g+n-r>9007199254740991)throw TypeError("Maximum allowed length exceeded");for(u=l(m,r),h=0;h<r;h++)(p=y+h)in m&&c(u,h,m[p]);if(u.length=r,n<r){for(h=y;h<g-r;h++)v=h+n,(p=h+r)in m?m[v]=m[p]:delete m[v];for(h=g;h>g-r+n;h--)delete m[h-1]}else if(n>r)for(h=g-r;h>y;h--)v=h+n-1,(p=h+r-1)in m?m[v]=m[p]:delete m[v];for(h=0;h<n;h++)m[h+y]=arguments[h+2];return m.length=g-r+n,u}})},8309:function(e,t,n){var r=n(9781),i=n(3070).f,o=Function.prototype,s=o.toString,a=/^\s*function ([^ (]*)/,l="name";r&&!(l in o)&&i(o,l,{configurable:!0,get:function(){try{return s.call(this).match(a)[1]}catch(e){return""}}})},489:function(e,t,n){var r=n(2109),i=n(7293),o=n(7908),s=n(9518),a=n(8544);r({target:"Object",stat:!0,forced:i(function(){s(1)}),sham:!a},{getPrototypeOf:function(e){return s(o(e))}})},1539:function(e,t,n){var r=n(1694),i=n(1320),o=n(288);r||i(Object.prototype,"toString",o,{unsafe:!0})},4916:function(e,t,n){"use strict";var r=n(2109),i=n(2261);r({target:"RegExp",proto:!0,forced:/./.exec!==i},{exec:i})},9714:function(e,t,n){"use strict";var r=n(1320),i=n(9670),o=n(7293),s=n(7066),a="toString",l=RegExp.prototype,c=l[a],u=o(function(){return"/a/b"!=c.call({source:"a",flags:"b"})}),d=c.name!=a;(u||d)&&r(RegExp.prototype,a,function(){var e=i(this),t=String(e.source),n=e.flags;return"/"+t+"/"+String(void 0===n&&e instanceof RegExp&&!("flags"in l)?s.call(e):n)},{unsafe:!0})},8783:function(e,t,n){"use strict";var r=n(8710).charAt,i=n(9909),o=n(654),s="String Iterator",a=i.set,l=i.getterFor(s);o(String,"String",function(e){a(this,{type:s,string:String(e),index:0})},function(){var e,t=l(this),n=t.string,i=t.index;return i>=n.length?{value:void 0,done:!0}:(e=r(n,i),t.index+=e.length,{value:e,done:!1})})},4723:function(e,t,n){"use strict";var r=n(7007),i=n(9670),o=n(7466),s=n(4488),a=n(1530),l=n(7651);r("match",1,function(e,t,n){return[function(t){var n=s(this),r=null==t?void 0:t[e];return void 0!==r?r.call(t,n):new RegExp(t)[e](String(n))},function(e){var r=n(t,e,this);if(r.done)return r.value;var s=i(e),c=String(this);if(!s.global)return l(s,c);var u=s.unicode;s.lastIndex=0;for(var d,f=[],h=0;null!==(d=l(s,c));){var p=String(d[0]);f[h]=p,""===p&&(s.lastIndex=a(c,o(s.lastIndex),u)),h++}return 0===h?null:f}]})},5306:function(e,t,n){"use strict";var r=n(7007),i=n(9670),o=n(7466),s=n(9958),a=n(4488),l=n(1530),c=n(647),u=n(7651),d=Math.max,f=Math.min,h=function(e){return void 0===e?e:String(e)};r("replace",2,function(e,t,n,r){var p=r.REGEXP_REPLACE_SUBSTITUTES_UNDEFINED_CAPTURE,v=r.REPLACE_KEEPS_$0,m=p?"$":"$0";return[function(n,r){var i=a(this),o=null==n?void 0:n[e];return void 0!==o?o.call(n,i,r):t.call(String(i),n,r)},function(e,r){if(!p&&v||"string"==typeof r&&-1===r.indexOf(m)){var a=n(t,e,this,r);if(a.done)return a.value}var g=i(e),y=String(this),b="function"==typeof r;b||(r=String(r));var w=g.global;if(w){var x=g.unicode;g.lastIndex=0}for(var E=[];;){var S=u(g,y);if(null===S)break;if(E.push(S),!w)break;""===String(S[0])&&(g.lastIndex=l(y,o(g.lastIndex),x))}for(var k="",L=0,A=0;A<E.length;A++){S=E[A];for(var C=String(S[0]),_=d(f(s(S.index),y.length),0),T=[],F=1;F<S.length;F++)T.push(h(S[F]));var I=S.groups;if(b){var M=[C].concat(T,_,y);void 0!==I&&M.push(I);var R=String(r.apply(void 0,M))}else R=c(C,y,_,T,I,r);_>=L&&(k+=y.slice(L,_)+R,L=_+C.length)}return k+y.slice(L)}]})},3123:function(e,t,n){"use strict";var r=n(7007),i=n(7850),o=n(9670),s=n(4488),a=n(6707),l=n(1530),c=n(7466),u=n(7651),d=n(2261),f=n(7293),h=[].push,p=Math.min,v=4294967295,m=!f(function(){return!RegExp(v,"y")});r("split",2,function(e,t,n){var r;return r="c"=="abbc".split(/(b)*/)[1]||4!="test".split(/(?:)/,-1).length||2!="ab".split(/(?:ab)*/).length||4!=".".split(/(.?)(.?)/).length||".".split(/()()/).length>1||"".split(/.?/).length?function(e,n){var r=String(s(this)),o=void 0===n?v:n>>>0;if(0===o)return[];if(void 0===e)return[r];if(!i(e))return t.call(r,e,o);for(var a,l,c,u=[],f=(e.ignoreCase?"i":"")+(e.multiline?"m":"")+(e.unicode?"u":"")+(e.sticky?"y":""),p=0,m=new RegExp(e.source,f+"g");(a=d.call(m,r))&&!((l=m.lastIndex)>p&&(u.push(r.slice(p,a.index)),a.length>1&&a.index<r.length&&h.apply(u,a.slice(1)),c=a[0].length,p=l,u.length>=o));)m.lastIndex===a.index&&m.lastIndex++;return p===r.length?!c&&m.test("")||u.push(""):u.push(r.slice(p)),u.length>o?u.slice(0,o):u}:"0".split(void 0,0).length?function(e,n){return void 0===e&&0===n?[]:t.call(this,e,n)}:t,[function(t,n){var i=s(this),o=null==t?void 0:t[e];return void 0!==o?o.call(t,i,n):r.call(String(i),t,n)},function(e,i){var s=n(r,e,this,i,r!==t);if(s.done)return s.value;var d=o(e),f=String(this),h=a(d,RegExp),g=d.unicode,y=(d.ignoreCase?"i":"")+(d.multiline?"m":"")+(d.unicode?"u":"")+(m?"y":"g"),b=new h(m?d:"^(?:"+d.source+")",y),w=void 0===i?v:i>>>0;if(0===w)return[];if(0===f.length)return null===u(b,f)?[f]:[];for(var x=0,E=0,S=[];E<f.length;){b.lastIndex=m?E:0;var k,L=u(b,m?f:f.slice(E));if(null===L||(k=p(c(b.lastIndex+(m?0:E)),f.length))===x)E=l(f,E,g);else{if(S.push(f.slice(x,E)),S.length===w)return S;for(var A=1;A<=L.length-1;A++)if(S.push(L[A]),S.length===w)return S;E=x=k}}return S.push(f.slice(x)),S}]},!m)},3210:function(e,t,n){"use strict";var r=n(2109),i=n(3111).trim;r({target:"String",proto:!0,forced:n(6091)("trim")},{trim:function(){return i(this)}})},2990:function(e,t,n){"use strict";var r=n(260),i=n(1048),o=r.aTypedArray;(0,r.exportTypedArrayMethod)("copyWithin",function(e,t){return i.call(o(this),e,t,arguments.length>2?arguments[2]:void 0)})},8927:function(e,t,n){"use strict";var r=n(260),i=n(2092).every,o=r.aTypedArray;(0,r.exportTypedArrayMethod)("every",function(e){return i(o(this),e,arguments.length>1?arguments[1]:void 0)})},3105:function(e,t,n){"use strict";var r=n(260),i=n(1285),o=r.aTypedArray;(0,r.exportTypedArrayMethod)("fill",function(e){return i.apply(o(this),arguments)})},5035:function(e,t,n){"use strict";var r=n(260),i=n(2092).filter,o=n(3074),s=r.aTypedArray;(0,r.exportTypedArrayMethod)("filter",function(e){var t=i(s(this),e,arguments.length>1?arguments[1]:void 0);return o(this,t)})},7174:function(e,t,n){"use strict";var r=n(260),i=n(2092).findIndex,o=r.aTypedArray;(0,r.exportTypedArrayMethod)("findIndex",function(e){return i(o(this),e,arguments.length>1?arguments[1]:void 0)})},4345:function(e,t,n){"use strict";var r=n(260),i=n(2092).find,o=r.aTypedArray;(0,r.exportTypedArrayMethod)("find",function(e){return i(o(this),e,arguments.length>1?arguments[1]:void 0)})},2846:function(e,t,n){"use strict";var r=n(260),i=n(2092).forEach,o=r.aTypedArray;(0,r.exportTypedArrayMethod)("forEach",function(e){i(o(this),e,arguments.length>1?arguments[1]:void 0)})},4731:function(e,t,n){"use strict";var r=n(260),i=n(1318).includes,o=r.aTypedArray;(0,r.exportTypedArrayMethod)("includes",function(e){return i(o(this),e,arguments.length>1?arguments[1]:void 0)})},7209:function(e,t,n){"use strict";var r=n(260),i=n(1318).indexOf,o=r.aTypedArray;(0,r.exportTypedArrayMethod)("indexOf",function(e){return i(o(this),e,arguments.length>1?arguments[1]:void 0)})},6319:function(e,t,n){"use strict";var r=n(7854),i=n(260),o=n(6992),s=n(5112)("iterator"),a=r.Uint8Array,l=o.values,c=o.keys,u=o.entries,d=i.aTypedArray,f=i.exportTypedArrayMethod,h=a&&a.prototype[s],p=!!h&&("values"==h.name||null==h.name),v=function(){return l.call(d(this))};f("entries",function(){return u.call(d(this))}),f("keys",function(){return c.call(d(this))}),f("values",v,!p),f(s,v,!p)},8867:function(e,t,n){"use strict";var r=n(260),i=r.aTypedArray,o=r.exportTypedArrayMethod,s=[].join;o("join",function(e){return s.apply(i(this),arguments)})},7789:function(e,t,n){"use strict";var r=n(260),i=n(6583),o=r.aTypedArray;(0,r.exportTypedArrayMethod)("lastIndexOf",function(e){return i.apply(o(this),arguments)})},3739:function(e,t,n){"use strict";var r=n(260),i=n(2092).map,o=n(6707),s=r.aTypedArray,a=r.aTypedArrayConstructor;(0,r.exportTypedArrayMethod)("map",function(e){return i(s(this),e,arguments.length>1?arguments[1]:void 0,function(e,t){return new(a(o(e,e.constructor)))(t)})})},4483:function(e,t,n){"use strict";var r=n(260),i=n(3671).right,o=r.aTypedArray;(0,r.exportTypedArrayMethod)("reduceRight",function(e){return i(o(this),e,arguments.length,arguments.length>1?arguments[1]:void 0)})},9368:function(e,t,n){"use strict";var r=n(260),i=n(3671).left,o=r.aTypedArray;(0,r.exportTypedArrayMethod)("reduce",function(e){return i(o(this),e,arguments.length,arguments.length>1?arguments[1]:void 0)})},2056:function(e,t,n){"use strict";var r=n(260),i=r.aTypedArray,o=r.exportTypedArrayMethod,s=Math.floor;o("reverse",function(){for(var e,t=this,n=i(t).length,r=s(n/2),o=0;o<r;)e=t[o],t[o++]=t[--n],t[n]=e;return t})},3462:function(e,t,n){"use strict";var r=n(260),i=n(7466),o=n(4590),s=n(7908),a=n(7293),l=r.aTypedArray;(0,r.exportTypedArrayMethod)("set",function(e){l(this);var t=o(arguments.length>1?arguments[1]:void 0,1),n=this.length,r=s(e),a=i(r.length),c=0;if(a+t>n)throw RangeError("Wrong length");for(;c<a;)this[t+c]=r[c++]},a(function(){new Int8Array(1).set({})}))},678:function(e,t,n){"use strict";var r=n(260),i=n(6707),o=n(7293),s=r.aTypedArray,a=r.aTypedArrayConstructor,l=r.exportTypedArrayMethod,c=[].slice;l("slice",function(e,t){for(var n=c.call(s(this),e,t),r=i(this,this.constructor),o=0,l=n.length,u=new(a(r))(l);l>o;)u[o]=n[o++];return u},o(function(){new Int8Array(1).slice()}))},7462:function(e,t,n){"use strict";var r=n(260),i=n(2092).some,o=r.aTypedArray;(0,r.exportTypedArrayMethod)("some",function(e){return i(o(this),e,arguments.length>1?arguments[1]:void 0)})},3824:function(e,t,n){"use strict";var r=n(260),i=r.aTypedArray,o=r.exportTypedArrayMethod,s=[].sort;o("sort",function(e){return s.call(i(this),e)})},5021:function(e,t,n){"use strict";var r=n(260),i=n(7466),o=n(1400),s=n(6707),a=r.aTypedArray;(0,r.exportTypedArrayMethod)("subarray",function(e,t){var n=a(this),r=n.length,l=o(e,r);return new(s(n,n.constructor))(n.buffer,n.byteOffset+l*n.BYTES_PER_ELEMENT,i((void 0===t?r:o(t,r))-l))})},2974:function(e,t,n){"use strict";var r=n(7854),i=n(260),o=n(7293),s=r.Int8Array,a=i.aTypedArray,l=i.exportTypedArrayMethod,c=[].toLocaleString,u=[].slice,d=!!s&&o(function(){c.call(new s(1))});l("toLocaleString",function(){return c.apply(d?u.call(a(this)):a(this),arguments)},o(function(){return[1,2].toLocaleString()!=new s([1,2]).toLocaleString()})||!o(function(){s.prototype.toLocaleString.call([1,2])}))},5016:function(e,t,n){"use strict";var r=n(260).exportTypedArrayMethod,i=n(7293),o=n(7854).Uint8Array,s=o&&o.prototype||{},a=[].toString,l=[].join;i(function(){a.call({})})&&(a=function(){return l.call(this)});var c=s.toString!=a;r("toString",a,c)},2472:function(e,t,n){n(9843)("Uint8",function(e){return function(t,n,r){return e(this,t,n,r)}})},4747:function(e,t,n){var r=n(7854),i=n(8324),o=n(8533),s=n(8880);for(var a in i){var l=r[a],c=l&&l.prototype;if(c&&c.forEach!==o)try{s(c,"forEach",o)}catch(e){c.forEach=o}}},3948:function(e,t,n){var r=n(7854),i=n(8324),o=n(6992),s=n(8880),a=n(5112),l=a("iterator"),c=a("toStringTag"),u=o.values;for(var d in i){var f=r[d],h=f&&f.prototype;if(h){if(h[l]!==u)try{s(h,l,u)}catch(e){h[l]=u}if(h[c]||s(h,c,d),i[d])for(var p in o)if(h[p]!==o[p])try{s(h,p,o[p])}catch(e){h[p]=o[p]}}}},1637:function(e,t,n){"use strict";n(6992);var r=n(2109),i=n(5005),o=n(590),s=n(1320),a=n(2248),l=n(8003),c=n(4994),u=n(9909),d=n(5787),f=n(6656),h=n(9974),p=n(648),v=n(9670),m=n(111),g=n(30),y=n(9114),b=n(8554),w=n(1246),x=n(5112),E=i("fetch"),S=i("Headers"),k=x("iterator"),L="URLSearchParams",A=L+"Iterator",C=u.set,_=u.getterFor(L),T=u.getterFor(A),F=/\+/g,I=Array(4),M=function(e){return I[e-1]||(I[e-1]=RegExp("((?:%[\\da-f]{2}){"+e+"})","gi"))},R=function(e){try{return decodeURIComponent(e)}catch(t){return e}},U=function(e){var t=e.replace(F," "),n=4;try{return decodeURIComponent(t)}catch(e){for(;n;)t=t.replace(M(n--),R);return t}},z=/[!'()~]|%20/g,O={"!":"%21","'":"%27","(":"%28",")":"%29","~":"%7E","%20":"+"},j=function(e){return O[e]},q=function(e){return encodeURIComponent(e).replace(z,j)},P=function(e,t){if(t)for(var n,r,i=t.split("&"),o=0;o<i.length;)(n=i[o++]).length&&(r=n.split("="),e.push({key:U(r.shift()),value:U(r.join("="))}))},D=function(e){this.entries.length=0,P(this.entries,e)},N=function(e,t){if(e<t)throw TypeError("Not enough arguments")},B=c(function(e,t){C(this,{type:A,iterator:b(_(e).entries),kind:t})},"Iterator",function(){var e=T(this),t=e.kind,n=e.iterator.next(),r=n.value;return n.done||(n.value="keys"===t?r.key:"values"===t?r.value:[r.key,r.value]),n}),$=function(){d(this,$,L);var e,t,n,r,i,o,s,a,l,c=arguments.length>0?arguments[0]:void 0,u=[];if(C(this,{type:L,entries:u,updateURL:function(){},updateSearchParams:D}),void 0!==c)if(m(c))if("function"==typeof(e=w(c)))for(n=(t=e.call(c)).next;!(r=n.call(t)).done;){if((s=(o=(i=b(v(r.value))).next).call(i)).done||(a=o.call(i)).done||!o.call(i).done)throw TypeError("Expected sequence with length 2");u.push({key:s.value+"",value:a.value+""})}else for(l in c)f(c,l)&&u.push({key:l,value:c[l]+""});else P(u,"string"==typeof c?"?"===c.charAt(0)?c.slice(1):c:c+"")},W=$.prototype;a(W,{append:function(e,t){N(arguments.length,2);var n=_(this);n.entries.push({key:e+"",value:t+""}),n.updateURL()},delete:function(e){N(arguments.length,1);for(var t=_(this),n=t.entries,r=e+"",i=0;i<n.length;)n[i].key===r?n.splice(i,1):i++;t.updateURL()},get:function(e){N(arguments.length,1);for(var t=_(this).entries,n=e+"",r=0;r<t.length;r++)if(t[r].key===n)return t[r].value;return null},getAll:function(e){N(arguments.length,1);for(var t=_(this).entries,n=e+"",r=[],i=0;i<t.length;i++)t[i].key===n&&r.push(t[i].value);return r},has:function(e){N(arguments.length,1);for(var t=_(this).entries,n=e+"",r=0;r<t.length;)if(t[r++].key===n)return!0;return!1},set:function(e,t){N(arguments.length,1);for(var n,r=_(this),i=r.entries,o=!1,s=e+"",a=t+"",l=0;l<i.length;l++)(n=i[l]).key===s&&(o?i.splice(l--,1):(o=!0,n.value=a));o||i.push({key:s,value:a}),r.updateURL()},sort:function(){var e,t,n,r=_(this),i=r.entries,o=i.slice();for(i.length=0,n=0;n<o.length;n++){for(e=o[n],t=0;t<n;t++)if(i[t].key>e.key){i.splice(t,0,e);break}t===n&&i.push(e)}r.updateURL()},forEach:function(e){for(var t,n=_(this).entries,r=h(e,arguments.length>1?arguments[1]:void 0,3),i=0;i<n.length;)r((t=n[i++]).value,t.key,this)},keys:function(){return new B(this,"keys")},values:function(){return new B(this,"values")},entries:function(){return new B(this,"entries")}},{enumerable:!0}),s(W,k,W.entries),s(W,"toString",function(){for(var e,t=_(this).entries,n=[],r=0;r<t.length;)e=t[r++],n.push(q(e.key)+"="+q(e.value));return n.join("&")},{enumerable:!0}),l($,L),r({global:!0,forced:!o},{URLSearchParams:$}),o||"function"!=typeof E||"function"!=typeof S||r({global:!0,enumerable:!0,forced:!0},{fetch:function(e){var t,n,r,i=[e];return arguments.length>1&&(m(t=arguments[1])&&(n=t.body,p(n)===L&&((r=t.headers?new S(t.headers):new S).has("content-type")||r.set("content-type","application/x-www-form-urlencoded;charset=UTF-8"),t=g(t,{body:y(0,String(n)),headers:y(0,r)}))),i.push(t)),E.apply(this,i)}}),e.exports={URLSearchParams:$,getState:_}},285:function(e,t,n){"use strict";n(8783);var r,i=n(2109),o=n(9781),s=n(590),a=n(7854),l=n(6048),c=n(1320),u=n(5787),d=n(6656),f=n(1574),h=n(8457),p=n(8710).codeAt,v=n(3197),m=n(8003),g=n(1637),y=n(9909),b=a.URL,w=g.URLSearchParams,x=g.getState,E=y.set,S=y.getterFor("URL"),k=Math.floor,L=Math.pow,A="Invalid scheme",C="Invalid host",_="Invalid port",T=/[A-Za-z]/,F=/[\d+-.A-Za-z]/,I=/\d/,M=/^(0x|0X)/,R=/^[0-7]+$/,U=/^\d+$/,z=/^[\dA-Fa-f]+$/,O=/[\u0000\t\u000A\u000D #%/:?@[\\]]/,j=/[\u0000\t\u000A\u000D #/:?@[\\]]/,q=/^[\u0000-\u001F ]+|[\u0000-\u001F ]+$/g,P=/[\t\u000A\u000D]/g,D=function(e,t){var n,r,i;if("["==t.charAt(0)){if("]"!=t.charAt(t.length-1))return C;if(!(n=B(t.slice(1,-1))))return C;e.host=n}else if(V(e)){if(t=v(t),O.test(t))return C;if(null===(n=N(t)))return C;e.host=n}else{if(j.test(t))return C;for(n="",r=h(t),i=0;i<r.length;i++)n+=Q(r[i],W);e.host=n}},N=function(e){var t,n,r,i,o,s,a,l=e.split(".");if(l.length&&""==l[l.length-1]&&l.pop(),(t=l.length)>4)return e;for(n=[],r=0;r<t;r++){if(""==(i=l[r]))return e;if(o=10,i.length>1&&"0"==i.charAt(0)&&(o=M.test(i)?16:8,i=i.slice(8==o?1:2)),""===i)s=0;else{if(!(10==o?U:8==o?R:z).test(i))return e;s=parseInt(i,o)}n.push(s)}for(r=0;r<t;r++)if(s=n[r],r==t-1){if(s>=L(256,5-t))return null}else if(s>255)return null;for(a=n.pop(),r=0;r<n.length;r++)a+=n[r]*L(256,3-r);return a},B=function(e){var t,n,r,i,o,s,a,l=[0,0,0,0,0,0,0,0],c=0,u=null,d=0,f=function(){return e.charAt(d)};if(":"==f()){if(":"!=e.charAt(1))return;d+=2,u=++c}for(;f();){if(8==c)return;if(":"!=f()){for(t=n=0;n<4&&z.test(f());)t=16*t+parseInt(f(),16),d++,n++;if("."==f()){if(0==n)return;if(d-=n,c>6)return;for(r=0;f();){if(i=null,r>0){if(!("."==f()&&r<4))return;d++}if(!I.test(f()))return;for(;I.test(f());){if(o=parseInt(f(),10),null===i)i=o;else{if(0==i)return;i=10*i+o}if(i>255)return;d++}l[c]=256*l[c]+i,2!=++r&&4!=r||c++}if(4!=r)return;break}if(":"==f()){if(d++,!f())return}else if(f())return;l[c++]=t}else{if(null!==u)return;d++,u=++c}}if(null!==u)for(s=c-u,c=7;0!=c&&s>0;)a=l[c],l[c--]=l[u+s-1],l[u+--s]=a;else if(8!=c)return;return l},$=function(e){var t,n,r,i;if("number"==typeof e){for(t=[],n=0;n<4;n++)t.unshift(e%256),e=k(e/256);return t.join(".")}if("object"==typeof e){for(t="",r=function(e){for(var t=null,n=1,r=null,i=0,o=0;o<8;o++)0!==e[o]?(i>n&&(t=r,n=i),r=null,i=0):(null===r&&(r=o),++i);return i>n&&(t=r,n=i),t}(e),n=0;n<8;n++)i&&0===e[n]||(i&&(i=!1),r===n?(t+=n?":":"::",i=!0):(t+=e[n].toString(16),n<7&&(t+=":")));return"["+t+"]"}return e},W={},H=f({},W,{" ":1,'"':1,"<":1,">":1,"`":1}),Y=f({},H,{"#":1,"?":1,"{":1,"}":1}),G=f({},Y,{"/":1,":":1,";":1,"=":1,"@":1,"[":1,"\\":1,"]":1,"^":1,"|":1}),Q=function(e,t){var n=p(e,0);return n>32&&n<127&&!d(t,e)?e:encodeURIComponent(e)},X={ftp:21,file:null,http:80,https:443,ws:80,wss:443},V=function(e){return d(X,e.scheme)},K=function(e){return""!=e.username||""!=e.password},Z=function(e){return!e.host||e.cannotBeABaseURL||"file"==e.scheme},J=function(e,t){var n;return 2==e.length&&T.test(e.charAt(0))&&(":"==(n=e.charAt(1))||!t&&"|"==n)},ee=function(e){var t;return e.length>1&&J(e.slice(0,2))&&(2==e.length||"/"===(t=e.charAt(2))||"\\"===t||"?"===t||"#"===t)},te=function(e){var t=e.path,n=t.length;!n||"file"==e.scheme&&1==n&&J(t[0],!0)||t.pop()},ne=function(e){return"."===e||"%2e"===e.toLowerCase()},re=function(e){return".."===(e=e.toLowerCase())||"%2e."===e||".%2e"===e||"%2e%2e"===e},ie={},oe={},se={},ae={},le={},ce={},ue={},de={},fe={},he={},pe={},ve={},me={},ge={},ye={},be={},we={},xe={},Ee={},Se={},ke={},Le=function(e,t,n,i){var o,s,a,l,c=n||ie,u=0,f="",p=!1,v=!1,m=!1;for(n||(e.scheme="",e.username="",e.password="",e.host=null,e.port=null,e.path=[],e.query=null,e.fragment=null,e.cannotBeABaseURL=!1,t=t.replace(q,"")),t=t.replace(P,""),o=h(t);u<=o.length;){switch(s=o[u],c){case ie:if(!s||!T.test(s)){if(n)return A;c=se;continue}f+=s.toLowerCase(),c=oe;break;case oe:if(s&&(F.test(s)||"+"==s||"-"==s||"."==s))f+=s.toLowerCase();else{if(":"!=s){if(n)return A;f="",c=se,u=0;continue}if(n&&(V(e)!=d(X,f)||"file"==f&&(K(e)||null!==e.port)||"file"==e.scheme&&!e.host))return;if(e.scheme=f,n)return void(V(e)&&X[e.scheme]==e.port&&(e.port=null));f="","file"==e.scheme?c=ge:V(e)&&i&&i.scheme==e.scheme?c=ae:V(e)?c=de:"/"==o[u+1]?(c=le,u++):(e.cannotBeABaseURL=!0,e.path.push(""),c=Ee)}break;case se:if(!i||i.cannotBeABaseURL&&"#"!=s)return A;if(i.cannotBeABaseURL&&"#"==s){e.scheme=i.scheme,e.path=i.path.slice(),e.query=i.query,e.fragment="",e.cannotBeABaseURL=!0,c=ke;break}c="file"==i.scheme?ge:ce;continue;case ae:if("/"!=s||"/"!=o[u+1]){c=ce;continue}c=fe,u++;break;case le:if("/"==s){c=he;break}c=xe;continue;case ce:if(e.scheme=i.scheme,s==r)e.username=i.username,e.password=i.password,e.host=i.host,e.port=i.port,e.path=i.path.slice(),e.query=i.query;else if("/"==s||"\\"==s&&V(e))c=ue;else if("?"==s)e.username=i.username,e.password=i.password,e.host=i.host,e.port=i.port,e.path=i.path.slice(),e.query="",c=Se;else{if("#"!=s){e.username=i.username,e.password=i.password,e.host=i.host,e.port=i.port,e.path=i.path.slice(),e.path.pop(),c=xe;continue}e.username=i.username,e.password=i.password,e.host=i.host,e.port=i.port,e.path=i.path.slice(),e.query=i.query,e.fragment="",c=ke}break;case ue:if(!V(e)||"/"!=s&&"\\"!=s){if("/"!=s){e.username=i.username,e.password=i.password,e.host=i.host,e.port=i.port,c=xe;continue}c=he}else c=fe;break;case de:if(c=fe,"/"!=s||"/"!=f.charAt(u+1))continue;u++;break;case fe:if("/"!=s&&"\\"!=s){c=he;continue}break;case he:if("@"==s){p&&(f="%40"+f),p=!0,a=h(f);for(var g=0;g<a.length;g++){var y=a[g];if(":"!=y||m){var b=Q(y,G);m?e.password+=b:e.username+=b}else m=!0}f=""}else if(s==r||"/"==s||"?"==s||"#"==s||"\\"==s&&V(e)){if(p&&""==f)return"Invalid authority";u-=h(f).length+1,f="",c=pe}else f+=s;break;case pe:case ve:if(n&&"file"==e.scheme){c=be;continue}if(":"!=s||v){if(s==r||"/"==s||"?"==s||"#"==s||"\\"==s&&V(e)){if(V(e)&&""==f)return C;if(n&&""==f&&(K(e)||null!==e.port))return;if(l=D(e,f))return l;if(f="",c=we,n)return;continue}"["==s?v=!0:"]"==s&&(v=!1),f+=s}else{if(""==f)return C;if(l=D(e,f))return l;if(f="",c=me,n==ve)return}break;case me:if(!I.test(s)){if(s==r||"/"==s||"?"==s||"#"==s||"\\"==s&&V(e)||n){if(""!=f){var w=parseInt(f,10);if(w>65535)return _;e.port=V(e)&&w===X[e.scheme]?null:w,f=""}if(n)return;c=we;continue}return _}f+=s;break;case ge:if(e.scheme="file","/"==s||"\\"==s)c=ye;else{if(!i||"file"!=i.scheme){c=xe;continue}if(s==r)e.host=i.host,e.path=i.path.slice(),e.query=i.query;else if("?"==s)e.host=i.host,e.path=i.path.slice(),e.query="",c=Se;else{if("#"!=s){ee(o.slice(u).join(""))||(e.host=i.host,e.path=i.path.slice(),te(e)),c=xe;continue}e.host=i.host,e.path=i.path.slice(),e.query=i.query,e.fragment="",c=ke}}break;case ye:if("/"==s||"\\"==s){c=be;break}i&&"file"==i.scheme&&!ee(o.slice(u).join(""))&&(J(i.path[0],!0)?e.path.push(i.path[0]):e.host=i.host),c=xe;continue;case be:if(s==r||"/"==s||"\\"==s||"?"==s||"#"==s){if(!n&&J(f))c=xe;else if(""==f){if(e.host="",n)return;c=we}else{if(l=D(e,f))return l;if("localhost"==e.host&&(e.host=""),n)return;f="",c=we}continue}f+=s;break;case we:if(V(e)){if(c=xe,"/"!=s&&"\\"!=s)continue}else if(n||"?"!=s)if(n||"#"!=s){if(s!=r&&(c=xe,"/"!=s))continue}else e.fragment="",c=ke;else e.query="",c=Se;break;case xe:if(s==r||"/"==s||"\\"==s&&V(e)||!n&&("?"==s||"#"==s)){if(re(f)?(te(e),"/"==s||"\\"==s&&V(e)||e.path.push("")):ne(f)?"/"==s||"\\"==s&&V(e)||e.path.push(""):("file"==e.scheme&&!e.path.length&&J(f)&&(e.host&&(e.host=""),f=f.charAt(0)+":"),e.path.push(f)),f="","file"==e.scheme&&(s==r||"?"==s||"#"==s))for(;e.path.length>1&&""===e.path[0];)e.path.shift();"?"==s?(e.query="",c=Se):"#"==s&&(e.fragment="",c=ke)}else f+=Q(s,Y);break;case Ee:"?"==s?(e.query="",c=Se):"#"==s?(e.fragment="",c=ke):s!=r&&(e.path[0]+=Q(s,W));break;case Se:n||"#"!=s?s!=r&&("'"==s&&V(e)?e.query+="%27":e.query+="#"==s?"%23":Q(s,W)):(e.fragment="",c=ke);break;case ke:s!=r&&(e.fragment+=Q(s,H))}u++}},Ae=function(e){var t,n,r=u(this,Ae,"URL"),i=arguments.length>1?arguments[1]:void 0,s=String(e),a=E(r,{type:"URL"});if(void 0!==i)if(i instanceof Ae)t=S(i);else if(n=Le(t={},String(i)))throw TypeError(n);if(n=Le(a,s,null,t))throw TypeError(n);var l=a.searchParams=new w,c=x(l);c.updateSearchParams(a.query),c.updateURL=function(){a.query=String(l)||null},o||(r.href=_e.call(r),r.origin=Te.call(r),r.protocol=Fe.call(r),r.username=Ie.call(r),r.password=Me.call(r),r.host=Re.call(r),r.hostname=Ue.call(r),r.port=ze.call(r),r.pathname=Oe.call(r),r.search=je.call(r),r.searchParams=qe.call(r),r.hash=Pe.call(r))},Ce=Ae.prototype,_e=function(){var e=S(this),t=e.scheme,n=e.username,r=e.password,i=e.host,o=e.port,s=e.path,a=e.query,l=e.fragment,c=t+":";return null!==i?(c+="//",K(e)&&(c+=n+(r?":"+r:"")+"@"),c+=$(i),null!==o&&(c+=":"+o)):"file"==t&&(c+="//"),c+=e.cannotBeABaseURL?s[0]:s.length?"/"+s.join("/"):"",null!==a&&(c+="?"+a),null!==l&&(c+="#"+l),c},Te=function(){var e=S(this),t=e.scheme,n=e.port;if("blob"==t)try{return new URL(t.path[0]).origin}catch(e){return"null"}return"file"!=t&&V(e)?t+"://"+$(e.host)+(null!==n?":"+n:""):"null"},Fe=function(){return S(this).scheme+":"},Ie=function(){return S(this).username},Me=function(){return S(this).password},Re=function(){var e=S(this),t=e.host,n=e.port;return null===t?"":null===n?$(t):$(t)+":"+n},Ue=function(){var e=S(this).host;return null===e?"":$(e)},ze=function(){var e=S(this).port;return null===e?"":String(e)},Oe=function(){var e=S(this),t=e.path;return e.cannotBeABaseURL?t[0]:t.length?"/"+t.join("/"):""},je=function(){var e=S(this).query;return e?"?"+e:""},qe=function(){return S(this).searchParams},Pe=function(){var e=S(this).fragment;return e?"#"+e:""},De=function(e,t){return{get:e,set:t,configurable:!0,enumerable:!0}};if(o&&l(Ce,{href:De(_e,function(e){var t=S(this),n=String(e),r=Le(t,n);if(r)throw TypeError(r);x(t.searchParams).updateSearchParams(t.query)}),origin:De(Te),protocol:De(Fe,function(e){var t=S(this);Le(t,String(e)+":",ie)}),username:De(Ie,function(e){var t=S(this),n=h(String(e));if(!Z(t)){t.username="";for(var r=0;r<n.length;r++)t.username+=Q(n[r],G)}}),password:De(Me,function(e){var t=S(this),n=h(String(e));if(!Z(t)){t.password="";for(var r=0;r<n.length;r++)t.password+=Q(n[r],G)}}),host:De(Re,function(e){var t=S(this);t.cannotBeABaseURL||Le(t,String(e),pe)}),hostname:De(Ue,function(e){var t=S(this);t.cannotBeABaseURL||Le(t,String(e),ve)}),port:De(ze,function(e){var t=S(this);Z(t)||(""==(e=String(e))?t.port=null:Le(t,e,me))}),pathname:De(Oe,function(e){var t=S(this);t.cannotBeABaseURL||(t.path=[],Le(t,e+"",we))}),search:De(je,function(e){var t=S(this);""==(e=String(e))?t.query=null:("?"==e.charAt(0)&&(e=e.slice(1)),t.query="",Le(t,e,Se)),x(t.searchParams).updateSearchParams(t.query)}),searchParams:De(qe),hash:De(Pe,function(e){var t=S(this);""!=(e=String(e))?("#"==e.charAt(0)&&(e=e.slice(1)),t.fragment="",Le(t,e,ke)):t.fragment=null})}),c(Ce,"toJSON",function(){return _e.call(this)},{enumerable:!0}),c(Ce,"toString",function(){return _e.call(this)},{enumerable:!0}),b){var Ne=b.createObjectURL,Be=b.revokeObjectURL;Ne&&c(Ae,"createObjectURL",function(e){return Ne.apply(b,arguments)}),Be&&c(Ae,"revokeObjectURL",function(e){return Be.apply(b,arguments)})}m(Ae,"URL"),i({global:!0,forced:!s,sham:!o},{URL:Ae})}},t={};function n(r){if(t[r])return t[r].exports;var i=t[r]={exports:{}};return e[r](i,i.exports,n),i.exports}n.d=function(e,t){for(var r in t)n.o(t,r)&&!n.o(e,r)&&Object.defineProperty(e,r,{enumerable:!0,get:t[r]})},n.g=function(){if("object"==typeof globalThis)return globalThis;try{return this||new Function("return this")()}catch(e){if("object"==typeof window)return window}}(),n.o=function(e,t){return Object.prototype.hasOwnProperty.call(e,t)},n.r=function(e){"undefined"!=typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(e,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(e,"__esModule",{value:!0})};var r={};return function(){"use strict";function e(e,n){var r;if("undefined"==typeof Symbol||null==e[Symbol.iterator]){if(Array.isArray(e)||(r=function(e,n){if(e){if("string"==typeof e)return t(e,n);var r=Object.prototype.toString.call(e).slice(8,-1);return"Object"===r&&e.constructor&&(r=e.constructor.name),"Map"===r||"Set"===r?Array.from(e):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?t(e,n):void 0}}(e))||n&&e&&"number"==typeof e.length){r&&(e=r);var i=0,o=function(){};return{s:o,n:function(){return i>=e.length?{done:!0}:{done:!1,value:e[i++]}},e:function(e){throw e},f:o}}throw new TypeError("Invalid attempt to iterate non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}var s,a=!0,l=!1;return{s:function(){r=e[Symbol.iterator]()},n:function(){var e=r.next();return a=e.done,e},e:function(e){l=!0,s=e},f:function(){try{a||null==r.return||r.return()}finally{if(l)throw s}}}}function t(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function i(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}n.r(r),n.d(r,{Dropzone:function(){return w},default:function(){return L}}),n(2222),n(7327),n(2772),n(6992),n(1249),n(7042),n(561),n(8264),n(8309),n(489),n(1539),n(4916),n(9714),n(8783),n(4723),n(5306),n(3123),n(3210),n(2472),n(2990),n(8927),n(3105),n(5035),n(4345),n(7174),n(2846),n(4731),n(7209),n(6319),n(8867),n(7789),n(3739),n(9368),n(4483),n(2056),n(3462),n(678),n(7462),n(3824),n(5021),n(2974),n(5016),n(4747),n(3948),n(285);var o=function(){function t(){!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,t)}var n,r,o;return n=t,r=[{key:"on",value:function(e,t){return this._callbacks=this._callbacks||{},this._callbacks[e]||(this._callbacks[e]=[]),this._callbacks[e].push(t),this}},{key:"emit",value:function(t){this._callbacks=this._callbacks||{};for(var n=this._callbacks[t],r=arguments.length,i=new Array(r>1?r-1:0),o=1;o<r;o++)i[o-1]=arguments[o];if(n){var s,a=e(n,!0);try{for(a.s();!(s=a.n()).done;)s.value.apply(this,i)}catch(e){a.e(e)}finally{a.f()}}return this.element&&this.element.dispatchEvent(this.makeEvent("dropzone:"+t,{args:i})),this}},{key:"makeEvent",value:function(e,t){var n={bubbles:!0,cancelable:!0,detail:t};if("function"==typeof window.CustomEvent)return new CustomEvent(e,n);var r=document.createEvent("CustomEvent");return r.initCustomEvent(e,n.bubbles,n.cancelable,n.detail),r}},{key:"off",value:function(e,t){if(!this._callbacks||0===arguments.length)return this._callbacks={},this;var n=this._callbacks[e];if(!n)return this;if(1===arguments.length)return delete this._callbacks[e],this;for(var r=0;r<n.length;r++)if(n[r]===t){n.splice(r,1);break}return this}}],r&&i(n.prototype,r),o&&i(n,o),t}();function s(e,t){var n;if("undefined"==typeof Symbol||null==e[Symbol.iterator]){if(Array.isArray(e)||(n=function(e,t){if(e){if("string"==typeof e)return a(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?a(e,t):void 0}}(e))||t&&e&&"number"==typeof e.length){n&&(e=n);var r=0,i=function(){};return{s:i,n:function(){return r>=e.length?{done:!0}:{done:!1,value:e[r++]}},e:function(e){throw e},f:i}}throw new TypeError("Invalid attempt to iterate non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}var o,s=!0,l=!1;return{s:function(){n=e[Symbol.iterator]()},n:function(){var e=n.next();return s=e.done,e},e:function(e){l=!0,o=e},f:function(){try{s||null==n.return||n.return()}finally{if(l)throw o}}}}function a(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}var l={url:null,method:"post",withCredentials:!1,timeout:null,parallelUploads:2,uploadMultiple:!1,chunking:!1,forceChunking:!1,chunkSize:2e6,parallelChunkUploads:!1,retryChunks:!1,retryChunksLimit:3,maxFilesize:256,paramName:"file",createImageThumbnails:!0,maxThumbnailFilesize:10,thumbnailWidth:120,thumbnailHeight:120,thumbnailMethod:"crop",resizeWidth:null,resizeHeight:null,resizeMimeType:null,resizeQuality:.8,resizeMethod:"contain",filesizeBase:1e3,maxFiles:null,headers:null,clickable:!0,ignoreHiddenFiles:!0,acceptedFiles:null,acceptedMimeTypes:null,autoProcessQueue:!0,autoQueue:!0,addRemoveLinks:!1,previewsContainer:null,disablePreviews:!1,hiddenInputContainer:"body",capture:null,renameFilename:null,renameFile:null,forceFallback:!1,dictDefaultMessage:"Drop files here to upload",dictFallbackMessage:"Your browser does not support drag'n'drop file uploads.",dictFallbackText:"Please use the fallback form below to upload your files like in the olden days.",dictFileTooBig:"File is too big ({{filesize}}MiB). Max filesize: {{maxFilesize}}MiB.",dictInvalidFileType:"You can't upload files of this type.",dictResponseError:"Server responded with {{statusCode}} code.",dictCancelUpload:"Cancel upload",dictUploadCanceled:"Upload canceled.",dictCancelUploadConfirmation:"Are you sure you want to cancel this upload?",dictRemoveFile:"Remove file",dictRemoveFileConfirmation:null,dictMaxFilesExceeded:"You can not upload any more files.",dictFileSizeUnits:{tb:"TB",gb:"GB",mb:"MB",kb:"KB",b:"b"},init:function(){},params:function(e,t,n){if(n)return{dzuuid:n.file.upload.uuid,dzchunkindex:n.index,dztotalfilesize:n.file.size,dzchunksize:this.options.chunkSize,dztotalchunkcount:n.file.upload.totalChunkCount,dzchunkbyteoffset:n.index*this.options.chunkSize}},accept:function(e,t){return t()},chunksUploaded:function(e,t){t()},fallback:function(){var e;this.element.className="".concat(this.element.className," dz-browser-not-supported");var t,n=s(this.element.getElementsByTagName("div"),!0);try{for(n.s();!(t=n.n()).done;){var r=t.value;if(/(^| )dz-message($| )/.test(r.className)){e=r,r.className="dz-message";break}}}catch(e){n.e(e)}finally{n.f()}e||(e=w.createElement('<div class="dz-message"><span></span></div>'),this.element.appendChild(e));var i=e.getElementsByTagName("span")[0];return i&&(null!=i.textContent?i.textContent=this.options.dictFallbackMessage:null!=i.innerText&&(i.innerText=this.options.dictFallbackMessage)),this.element.appendChild(this.getFallbackForm())},resize:function(e,t,n,r){var i={srcX:0,srcY:0,srcWidth:e.width,srcHeight:e.height},o=e.width/e.height;null==t&&null==n?(t=i.srcWidth,n=i.srcHeight):null==t?t=n*o:null==n&&(n=t/o);var s=(t=Math.min(t,i.srcWidth))/(n=Math.min(n,i.srcHeight));if(i.srcWidth>t||i.srcHeight>n)if("crop"===r)o>s?(i.srcHeight=e.height,i.srcWidth=i.srcHeight*s):(i.srcWidth=e.width,i.srcHeight=i.srcWidth/s);else{if("contain"!==r)throw new Error("Unknown resizeMethod '".concat(r,"'"));o>s?n=t/o:t=n*o}return i.srcX=(e.width-i.srcWidth)/2,i.srcY=(e.height-i.srcHeight)/2,i.trgWidth=t,i.trgHeight=n,i},transformFile:function(e,t){return(this.options.resizeWidth||this.options.resizeHeight)&&e.type.match(/image.*/)?this.resizeImage(e,this.options.resizeWidth,this.options.resizeHeight,this.options.resizeMethod,t):t(e)},previewTemplate:'<div class="dz-preview dz-file-preview"> <div class="dz-image"><img data-dz-thumbnail/></div> <div class="dz-details"> <div class="dz-size"><span data-dz-size></span></div> <div class="dz-filename"><span data-dz-name></span></div> </div> <div class="dz-progress"> <span class="dz-upload" data-dz-uploadprogress></span> </div> <div class="dz-error-message"><span data-dz-errormessage></span></div> <div class="dz-success-mark"> <svg width="54px" height="54px" viewBox="0 0 54 54" version="1.1" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink"> <title>Check</title> <g stroke="none" stroke-width="1" fill="none" fill-rule="evenodd"> <path d="M23.5,31.8431458 L17.5852419,25.9283877 C16.0248253,24.3679711 13.4910294,24.366835 11.9289322,25.9289322 C10.3700136,27.4878508 10.3665912,30.0234455 11.9283877,31.5852419 L20.4147581,40.0716123 C20.5133999,40.1702541 20.6159315,40.2626649 20.7218615,40.3488435 C22.2835669,41.8725651 24.794234,41.8626202 26.3461564,40.3106978 L43.3106978,23.3461564 C44.8771021,21.7797521 44.8758057,19.2483887 43.3137085,17.6862915 C41.7547899,16.1273729 39.2176035,16.1255422 37.6538436,17.6893022 L23.5,31.8431458 Z M27,53 C41.3594035,53 53,41.3594035 53,27 C53,12.6405965 41.3594035,1 27,1 C12.6405965,1 1,12.6405965 1,27 C1,41.3594035 12.6405965,53 27,53 Z" stroke-opacity="0.198794158" stroke="#747474" fill-opacity="0.816519475" fill="#FFFFFF"></path> </g> </svg> </div> <div class="dz-error-mark"> <svg width="54px" height="54px" viewBox="0 0 54 54" version="1.1" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink"> <title>Error</title> <g stroke="none" stroke-width="1" fill="none" fill-rule="evenodd"> <g stroke="#747474" stroke-opacity="0.198794158" fill="#FFFFFF" fill-opacity="0.816519475"> <path d="M32.6568542,29 L38.3106978,23.3461564 C39.8771021,21.7797521 39.8758057,19.2483887 38.3137085,17.6862915 C36.7547899,16.1273729 34.2176035,16.1255422 32.6538436,17.6893022 L27,23.3431458 L21.3461564,17.6893022 C19.7823965,16.1255422 17.2452101,16.1273729 15.6862915,17.6862915 C14.1241943,19.2483887 14.1228979,21.7797521 15.6893022,23.3461564 L21.3431458,29 L15.6893022,34.6538436 C14.1228979,36.2202479 14.1241943,38.7516113 15.6862915,40.3137085 C17.2452101,41.8726271 19.7823965,41.8744578 21.3461564,40.3106978 L27,34.6568542 L32.6538436,40.3106978 C34.2176035,41.8744578 36.7547899,41.8726271 38.3137085,40.3137085 C39.8758057,38.7516113 39.8771021,36.2202479 38.3106978,34.6538436 L32.6568542,29 Z M27,53 C41.3594035,53 53,41.3594035 53,27 C53,12.6405965 41.3594035,1 27,1 C12.6405965,1 1,12.6405965 1,27 C1,41.3594035 12.6405965,53 27,53 Z"></path> </g> </g> </svg> </div> </div> ',drop:function(e){return this.element.classList.remove("dz-drag-hover")},dragstart:function(e){},dragend:function(e){return this.element.classList.remove("dz-drag-hover")},dragenter:function(e){return this.element.classList.add("dz-drag-hover")},dragover:function(e){return this.element.classList.add("dz-drag-hover")},dragleave:function(e){return this.element.classList.remove("dz-drag-hover")},paste:function(e){},reset:function(){return this.element.classList.remove("dz-started")},addedfile:function(e){var t=this;if(this.element===this.previewsContainer&&this.element.classList.add("dz-started"),this.previewsContainer&&!this.options.disablePreviews){e.previewElement=w.createElement(this.options.previewTemplate.trim()),e.previewTemplate=e.previewElement,this.previewsContainer.appendChild(e.previewElement);var n,r=s(e.previewElement.querySelectorAll("[data-dz-name]"),!0);try{for(r.s();!(n=r.n()).done;){var i=n.value;i.textContent=e.name}}catch(e){r.e(e)}finally{r.f()}var o,a=s(e.previewElement.querySelectorAll("[data-dz-size]"),!0);try{for(a.s();!(o=a.n()).done;)(i=o.value).innerHTML=this.filesize(e.size)}catch(e){a.e(e)}finally{a.f()}this.options.addRemoveLinks&&(e._removeLink=w.createElement('<a class="dz-remove" href="javascript:undefined;" data-dz-remove>'.concat(this.options.dictRemoveFile,"</a>")),e.previewElement.appendChild(e._removeLink));var l,c=function(n){return n.preventDefault(),n.stopPropagation(),e.status===w.UPLOADING?w.confirm(t.options.dictCancelUploadConfirmation,function(){return t.removeFile(e)}):t.options.dictRemoveFileConfirmation?w.confirm(t.options.dictRemoveFileConfirmation,function(){return t.removeFile(e)}):t.removeFile(e)},u=s(e.previewElement.querySelectorAll("[data-dz-remove]"),!0);try{for(u.s();!(l=u.n()).done;)l.value.addEventListener("click",c)}catch(e){u.e(e)}finally{u.f()}}},removedfile:function(e){return null!=e.previewElement&&null!=e.previewElement.parentNode&&e.previewElement.parentNode.removeChild(e.previewElement),this._updateMaxFilesReachedClass()},thumbnail:function(e,t){if(e.previewElement){e.previewElement.classList.remove("dz-file-preview");var n,r=s(e.previewElement.querySelectorAll("[data-dz-thumbnail]"),!0);try{for(r.s();!(n=r.n()).done;){var i=n.value;i.alt=e.name,i.src=t}}catch(e){r.e(e)}finally{r.f()}return setTimeout(function(){return e.previewElement.classList.add("dz-image-preview")},1)}},error:function(e,t){if(e.previewElement){e.previewElement.classList.add("dz-error"),"string"!=typeof t&&t.error&&(t=t.error);var n,r=s(e.previewElement.querySelectorAll("[data-dz-errormessage]"),!0);try{for(r.s();!(n=r.n()).done;)n.value.textContent=t}catch(e){r.e(e)}finally{r.f()}}},errormultiple:function(){},processing:function(e){if(e.previewElement&&(e.previewElement.classList.add("dz-processing"),e._removeLink))return e._removeLink.innerHTML=this.options.dictCancelUpload},processingmultiple:function(){},uploadprogress:function(e,t,n){if(e.previewElement){var r,i=s(e.previewElement.querySelectorAll("[data-dz-uploadprogress]"),!0);try{for(i.s();!(r=i.n()).done;){var o=r.value;"PROGRESS"===o.nodeName?o.value=t:o.style.width="".concat(t,"%")}}catch(e){i.e(e)}finally{i.f()}}},totaluploadprogress:function(){},sending:function(){},sendingmultiple:function(){},success:function(e){if(e.previewElement)return e.previewElement.classList.add("dz-success")},successmultiple:function(){},canceled:function(e){return this.emit("error",e,this.options.dictUploadCanceled)},canceledmultiple:function(){},complete:function(e){if(e._removeLink&&(e._removeLink.innerHTML=this.options.dictRemoveFile),e.previewElement)return e.previewElement.classList.add("dz-complete")},completemultiple:function(){},maxfilesexceeded:function(){},maxfilesreached:function(){},queuecomplete:function(){},addedfiles:function(){}};function c(e){return c="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},c(e)}function u(e,t){var n;if("undefined"==typeof Symbol||null==e[Symbol.iterator]){if(Array.isArray(e)||(n=function(e,t){if(e){if("string"==typeof e)return d(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?d(e,t):void 0}}(e))||t&&e&&"number"==typeof e.length){n&&(e=n);var r=0,i=function(){};return{s:i,n:function(){return r>=e.length?{done:!0}:{done:!1,value:e[r++]}},e:function(e){throw e},f:i}}throw new TypeError("Invalid attempt to iterate non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}var o,s=!0,a=!1;return{s:function(){n=e[Symbol.iterator]()},n:function(){var e=n.next();return s=e.done,e},e:function(e){a=!0,o=e},f:function(){try{s||null==n.return||n.return()}finally{if(a)throw o}}}}function d(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function f(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function h(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function p(e,t,n){return t&&h(e.prototype,t),n&&h(e,n),e}function v(e,t){return v=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e},v(e,t)}function m(e){var t=function(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Date.prototype.toString.call(Reflect.construct(Date,[],function(){})),!0}catch(e){return!1}}();return function(){var n,r=b(e);if(t){var i=b(this).constructor;n=Reflect.construct(r,arguments,i)}else n=r.apply(this,arguments);return g(this,n)}}function g(e,t){return!t||"object"!==c(t)&&"function"!=typeof t?y(e):t}function y(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function b(e){return b=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)},b(e)}var w=function(e){!function(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),t&&v(e,t)}(n,e);var t=m(n);function n(e,r){var i,o,s;if(f(this,n),(i=t.call(this)).element=e,i.version=n.version,i.clickableElements=[],i.listeners=[],i.files=[],"string"==typeof i.element&&(i.element=document.querySelector(i.element)),!i.element||null==i.element.nodeType)throw new Error("Invalid dropzone element.");if(i.element.dropzone)throw new Error("Dropzone already attached.");n.instances.push(y(i)),i.element.dropzone=y(i);var a=null!=(s=n.optionsForElement(i.element))?s:{};if(i.options=n.extend({},l,a,null!=r?r:{}),i.options.previewTemplate=i.options.previewTemplate.replace(/\n*/g,""),i.options.forceFallback||!n.isBrowserSupported())return g(i,i.options.fallback.call(y(i)));if(null==i.options.url&&(i.options.url=i.element.getAttribute("action")),!i.options.url)throw new Error("No URL provided.");if(i.options.acceptedFiles&&i.options.acceptedMimeTypes)throw new Error("You can't provide both 'acceptedFiles' and 'acceptedMimeTypes'. 'acceptedMimeTypes' is deprecated.");if(i.options.uploadMultiple&&i.options.chunking)throw new Error("You cannot set both: uploadMultiple and chunking.");return i.options.acceptedMimeTypes&&(i.options.acceptedFiles=i.options.acceptedMimeTypes,delete i.options.acceptedMimeTypes),null!=i.options.renameFilename&&(i.options.renameFile=function(e){return i.options.renameFilename.call(y(i),e.name,e)}),"string"==typeof i.options.method&&(i.options.method=i.options.method.toUpperCase()),(o=i.getExistingFallback())&&o.parentNode&&o.parentNode.removeChild(o),!1!==i.options.previewsContainer&&(i.options.previewsContainer?i.previewsContainer=n.getElement(i.options.previewsContainer,"previewsContainer"):i.previewsContainer=i.element),i.options.clickable&&(!0===i.options.clickable?i.clickableElements=[i.element]:i.clickableElements=n.getElements(i.options.clickable,"clickable")),i.init(),i}return p(n,[{key:"getAcceptedFiles",value:function(){return this.files.filter(function(e){return e.accepted}).map(function(e){return e})}},{key:"getRejectedFiles",value:function(){return this.files.filter(function(e){return!e.accepted}).map(function(e){return e})}},{key:"getFilesWithStatus",value:function(e){return this.files.filter(function(t){return t.status===e}).map(function(e){return e})}},{key:"getQueuedFiles",value:function(){return this.getFilesWithStatus(n.QUEUED)}},{key:"getUploadingFiles",value:function(){return this.getFilesWithStatus(n.UPLOADING)}},{key:"getAddedFiles",value:function(){return this.getFilesWithStatus(n.ADDED)}},{key:"getActiveFiles",value:function(){return this.files.filter(function(e){return e.status===n.UPLOADING||e.status===n.QUEUED}).map(function(e){return e})}},{key:"init",value:function(){var e=this;"form"===this.element.tagName&&this.element.setAttribute("enctype","multipart/form-data"),this.element.classList.contains("dropzone")&&!this.element.querySelector(".dz-message")&&this.element.appendChild(n.createElement('<div class="dz-default dz-message"><button class="dz-button" type="button">'.concat(this.options.dictDefaultMessage,"</button></div>"))),this.clickableElements.length&&function t(){e.hiddenFileInput&&e.hiddenFileInput.parentNode.removeChild(e.hiddenFileInput),e.hiddenFileInput=document.createElement("input"),e.hiddenFileInput.setAttribute("type","file"),(null===e.options.maxFiles||e.options.maxFiles>1)&&e.hiddenFileInput.setAttribute("multiple","multiple"),e.hiddenFileInput.className="dz-hidden-input",null!==e.options.acceptedFiles&&e.hiddenFileInput.setAttribute("accept",e.options.acceptedFiles),null!==e.options.capture&&e.hiddenFileInput.setAttribute("capture",e.options.capture),e.hiddenFileInput.setAttribute("tabindex","-1"),e.hiddenFileInput.style.visibility="hidden",e.hiddenFileInput.style.position="absolute",e.hiddenFileInput.style.top="0",e.hiddenFileInput.style.left="0",e.hiddenFileInput.style.height="0",e.hiddenFileInput.style.width="0",n.getElement(e.options.hiddenInputContainer,"hiddenInputContainer").appendChild(e.hiddenFileInput),e.hiddenFileInput.addEventListener("change",function(){var n=e.hiddenFileInput.files;if(n.length){var r,i=u(n,!0);try{for(i.s();!(r=i.n()).done;){var o=r.value;e.addFile(o)}}catch(e){i.e(e)}finally{i.f()}}e.emit("addedfiles",n),t()})}(),this.URL=null!==window.URL?window.URL:window.webkitURL;var t,r=u(this.events,!0);try{for(r.s();!(t=r.n()).done;){var i=t.value;this.on(i,this.options[i])}}catch(e){r.e(e)}finally{r.f()}this.on("uploadprogress",function(){return e.updateTotalUploadProgress()}),this.on("removedfile",function(){return e.updateTotalUploadProgress()}),this.on("canceled",function(t){return e.emit("complete",t)}),this.on("complete",function(t){if(0===e.getAddedFiles().length&&0===e.getUploadingFiles().length&&0===e.getQueuedFiles().length)return setTimeout(function(){return e.emit("queuecomplete")},0)});var o=function(e){if(function(e){if(e.dataTransfer.types)for(var t=0;t<e.dataTransfer.types.length;t++)if("Files"===e.dataTransfer.types[t])return!0;return!1}(e))return e.stopPropagation(),e.preventDefault?e.preventDefault():e.returnValue=!1};return this.listeners=[{element:this.element,events:{dragstart:function(t){return e.emit("dragstart",t)},dragenter:function(t){return o(t),e.emit("dragenter",t)},dragover:function(t){var n;try{n=t.dataTransfer.effectAllowed}catch(e){}return t.dataTransfer.dropEffect="move"===n||"linkMove"===n?"move":"copy",o(t),e.emit("dragover",t)},dragleave:function(t){return e.emit("dragleave",t)},drop:function(t){return o(t),e.drop(t)},dragend:function(t){return e.emit("dragend",t)}}}],this.clickableElements.forEach(function(t){return e.listeners.push({element:t,events:{click:function(r){return(t!==e.element||r.target===e.element||n.elementInside(r.target,e.element.querySelector(".dz-message")))&&e.hiddenFileInput.click(),!0}}})}),this.enable(),this.options.init.call(this)}},{key:"destroy",value:function(){return this.disable(),this.removeAllFiles(!0),(null!=this.hiddenFileInput?this.hiddenFileInput.parentNode:void 0)&&(this.hiddenFileInput.parentNode.removeChild(this.hiddenFileInput),this.hiddenFileInput=null),delete this.element.dropzone,n.instances.splice(n.instances.indexOf(this),1)}},{key:"updateTotalUploadProgress",value:function(){var e,t=0,n=0;if(this.getActiveFiles().length){var r,i=u(this.getActiveFiles(),!0);try{for(i.s();!(r=i.n()).done;){var o=r.value;t+=o.upload.bytesSent,n+=o.upload.total}}catch(e){i.e(e)}finally{i.f()}e=100*t/n}else e=100;return this.emit("totaluploadprogress",e,n,t)}},{key:"_getParamName",value:function(e){return"function"==typeof this.options.paramName?this.options.paramName(e):"".concat(this.options.paramName).concat(this.options.uploadMultiple?"[".concat(e,"]"):"")}},{key:"_renameFile",value:function(e){return"function"!=typeof this.options.renameFile?e.name:this.options.renameFile(e)}},{key:"getFallbackForm",value:function(){var e,t;if(e=this.getExistingFallback())return e;var r='<div class="dz-fallback">';this.options.dictFallbackText&&(r+="<p>".concat(this.options.dictFallbackText,"</p>")),r+='<input type="file" name="'.concat(this._getParamName(0),'" ').concat(this.options.uploadMultiple?'multiple="multiple"':void 0,' /><input type="submit" value="Upload!"></div>');var i=n.createElement(r);return"FORM"!==this.element.tagName?(t=n.createElement('<form action="'.concat(this.options.url,'" enctype="multipart/form-data" method="').concat(this.options.method,'"></form>'))).appendChild(i):(this.element.setAttribute("enctype","multipart/form-data"),this.element.setAttribute("method",this.options.method)),null!=t?t:i}},{key:"getExistingFallback",value:function(){for(var e=function(e){var t,n=u(e,!0);try{for(n.s();!(t=n.n()).done;){var r=t.value;if(/(^| )fallback($| )/.test(r.className))return r}}catch(e){n.e(e)}finally{n.f()}},t=0,n=["div","form"];t<n.length;t++){var r,i=n[t];if(r=e(this.element.getElementsByTagName(i)))return r}}},{key:"setupEventListeners",value:function(){return this.listeners.map(function(e){return function(){var t=[];for(var n in e.events){var r=e.events[n];t.push(e.element.addEventListener(n,r,!1))}return t}()})}},{key:"removeEventListeners",value:function(){return this.listeners.map(function(e){return function(){var t=[];for(var n in e.events){var r=e.events[n];t.push(e.element.removeEventListener(n,r,!1))}return t}()})}},{key:"disable",value:function(){var e=this;return this.clickableElements.forEach(function(e){return e.classList.remove("dz-clickable")}),this.removeEventListeners(),this.disabled=!0,this.files.map(function(t){return e.cancelUpload(t)})}},{key:"enable",value:function(){return delete this.disabled,this.clickableElements.forEach(function(e){return e.classList.add("dz-clickable")}),this.setupEventListeners()}},{key:"filesize",value:function(e){var t=0,n="b";if(e>0){for(var r=["tb","gb","mb","kb","b"],i=0;i<r.length;i++){var o=r[i];if(e>=Math.pow(this.options.filesizeBase,4-i)/10){t=e/Math.pow(this.options.filesizeBase,4-i),n=o;break}}t=Math.round(10*t)/10}return"<strong>".concat(t,"</strong> ").concat(this.options.dictFileSizeUnits[n])}},{key:"_updateMaxFilesReachedClass",value:function(){return null!=this.options.maxFiles&&this.getAcceptedFiles().length>=this.options.maxFiles?(this.getAcceptedFiles().length===this.options.maxFiles&&this.emit("maxfilesreached",this.files),this.element.classList.add("dz-max-files-reached")):this.element.classList.remove("dz-max-files-reached")}},{key:"drop",value:function(e){if(e.dataTransfer){this.emit("drop",e);for(var t=[],n=0;n<e.dataTransfer.files.length;n++)t[n]=e.dataTransfer.files[n];if(t.length){var r=e.dataTransfer.items;r&&r.length&&null!=r[0].webkitGetAsEntry?this._addFilesFromItems(r):this.handleFiles(t)}this.emit("addedfiles",t)}}},{key:"paste",value:function(e){if(null!=(t=null!=e?e.clipboardData:void 0,n=function(e){return e.items},null!=t?n(t):void 0)){var t,n;this.emit("paste",e);var r=e.clipboardData.items;return r.length?this._addFilesFromItems(r):void 0}}},{key:"handleFiles",value:function(e){var t,n=u(e,!0);try{for(n.s();!(t=n.n()).done;){var r=t.value;this.addFile(r)}}catch(e){n.e(e)}finally{n.f()}}},{key:"_addFilesFromItems",value:function(e){var t=this;return function(){var n,r=[],i=u(e,!0);try{for(i.s();!(n=i.n()).done;){var o,s=n.value;null!=s.webkitGetAsEntry&&(o=s.webkitGetAsEntry())?o.isFile?r.push(t.addFile(s.getAsFile())):o.isDirectory?r.push(t._addFilesFromDirectory(o,o.name)):r.push(void 0):null==s.getAsFile||null!=s.kind&&"file"!==s.kind?r.push(void 0):r.push(t.addFile(s.getAsFile()))}}catch(e){i.e(e)}finally{i.f()}return r}()}},{key:"_addFilesFromDirectory",value:function(e,t){var n=this,r=e.createReader(),i=function(e){return t=console,n="log",r=function(t){return t.log(e)},null!=t&&"function"==typeof t[n]?r(t,n):void 0;var t,n,r};return function e(){return r.readEntries(function(r){if(r.length>0){var i,o=u(r,!0);try{for(o.s();!(i=o.n()).done;){var s=i.value;s.isFile?s.file(function(e){if(!n.options.ignoreHiddenFiles||"."!==e.name.substring(0,1))return e.fullPath="".concat(t,"/").concat(e.name),n.addFile(e)}):s.isDirectory&&n._addFilesFromDirectory(s,"".concat(t,"/").concat(s.name))}}catch(e){o.e(e)}finally{o.f()}e()}return null},i)}()}},{key:"accept",value:function(e,t){this.options.maxFilesize&&e.size>1024*this.options.maxFilesize*1024?t(this.options.dictFileTooBig.replace("{{filesize}}",Math.round(e.size/1024/10.24)/100).replace("{{maxFilesize}}",this.options.maxFilesize)):n.isValidFile(e,this.options.acceptedFiles)?null!=this.options.maxFiles&&this.getAcceptedFiles().length>=this.options.maxFiles?(t(this.options.dictMaxFilesExceeded.replace("{{maxFiles}}",this.options.maxFiles)),this.emit("maxfilesexceeded",e)):this.options.accept.call(this,e,t):t(this.options.dictInvalidFileType)}},{key:"addFile",value:function(e){var t=this;e.upload={uuid:n.uuidv4(),progress:0,total:e.size,bytesSent:0,filename:this._renameFile(e)},this.files.push(e),e.status=n.ADDED,this.emit("addedfile",e),this._enqueueThumbnail(e),this.accept(e,function(n){n?(e.accepted=!1,t._errorProcessing([e],n)):(e.accepted=!0,t.options.autoQueue&&t.enqueueFile(e)),t._updateMaxFilesReachedClass()})}},{key:"enqueueFiles",value:function(e){var t,n=u(e,!0);try{for(n.s();!(t=n.n()).done;){var r=t.value;this.enqueueFile(r)}}catch(e){n.e(e)}finally{n.f()}return null}},{key:"enqueueFile",value:function(e){var t=this;if(e.status!==n.ADDED||!0!==e.accepted)throw new Error("This file can't be queued because it has already been processed or was rejected.");if(e.status=n.QUEUED,this.options.autoProcessQueue)return setTimeout(function(){return t.processQueue()},0)}},{key:"_enqueueThumbnail",value:function(e){var t=this;if(this.options.createImageThumbnails&&e.type.match(/image.*/)&&e.size<=1024*this.options.maxThumbnailFilesize*1024)return this._thumbnailQueue.push(e),setTimeout(function(){return t._processThumbnailQueue()},0)}},{key:"_processThumbnailQueue",value:function(){var e=this;if(!this._processingThumbnail&&0!==this._thumbnailQueue.length){this._processingThumbnail=!0;var t=this._thumbnailQueue.shift();return this.createThumbnail(t,this.options.thumbnailWidth,this.options.thumbnailHeight,this.options.thumbnailMethod,!0,function(n){return e.emit("thumbnail",t,n),e._processingThumbnail=!1,e._processThumbnailQueue()})}}},{key:"removeFile",value:function(e){if(e.status===n.UPLOADING&&this.cancelUpload(e),this.files=x(this.files,e),this.emit("removedfile",e),0===this.files.length)return this.emit("reset")}},{key:"removeAllFiles",value:function(e){null==e&&(e=!1);var t,r=u(this.files.slice(),!0);try{for(r.s();!(t=r.n()).done;){var i=t.value;(i.status!==n.UPLOADING||e)&&this.removeFile(i)}}catch(e){r.e(e)}finally{r.f()}return null}},{key:"resizeImage",value:function(e,t,r,i,o){var s=this;return this.createThumbnail(e,t,r,i,!0,function(t,r){if(null==r)return o(e);var i=s.options.resizeMimeType;null==i&&(i=e.type);var a=r.toDataURL(i,s.options.resizeQuality);return"image/jpeg"!==i&&"image/jpg"!==i||(a=k.restore(e.dataURL,a)),o(n.dataURItoBlob(a))})}},{key:"createThumbnail",value:function(e,t,n,r,i,o){var s=this,a=new FileReader;a.onload=function(){e.dataURL=a.result,"image/svg+xml"!==e.type?s.createThumbnailFromUrl(e,t,n,r,i,o):null!=o&&o(a.result)},a.readAsDataURL(e)}},{key:"displayExistingFile",value:function(e,t,n,r){var i=this,o=!(arguments.length>4&&void 0!==arguments[4])||arguments[4];this.emit("addedfile",e),this.emit("complete",e),o?(e.dataURL=t,this.createThumbnailFromUrl(e,this.options.thumbnailWidth,this.options.thumbnailHeight,this.options.thumbnailMethod,this.options.fixOrientation,function(t){i.emit("thumbnail",e,t),n&&n()},r)):(this.emit("thumbnail",e,t),n&&n())}},{key:"createThumbnailFromUrl",value:function(e,t,n,r,i,o,s){var a=this,l=document.createElement("img");return s&&(l.crossOrigin=s),i="from-image"!=getComputedStyle(document.body).imageOrientation&&i,l.onload=function(){var s=function(e){return e(1)};return"undefined"!=typeof EXIF&&null!==EXIF&&i&&(s=function(e){return EXIF.getData(l,function(){return e(EXIF.getTag(this,"Orientation"))})}),s(function(i){e.width=l.width,e.height=l.height;var s=a.options.resize.call(a,e,t,n,r),c=document.createElement("canvas"),u=c.getContext("2d");switch(c.width=s.trgWidth,c.height=s.trgHeight,i>4&&(c.width=s.trgHeight,c.height=s.trgWidth),i){case 2:u.translate(c.width,0),u.scale(-1,1);break;case 3:u.translate(c.width,c.height),u.rotate(Math.PI);break;case 4:u.translate(0,c.height),u.scale(1,-1);break;case 5:u.rotate(.5*Math.PI),u.scale(1,-1);break;case 6:u.rotate(.5*Math.PI),u.translate(0,-c.width);break;case 7:u.rotate(.5*Math.PI),u.translate(c.height,-c.width),u.scale(-1,1);break;case 8:u.rotate(-.5*Math.PI),u.translate(-c.height,0)}S(u,l,null!=s.srcX?s.srcX:0,null!=s.srcY?s.srcY:0,s.srcWidth,s.srcHeight,null!=s.trgX?s.trgX:0,null!=s.trgY?s.trgY:0,s.trgWidth,s.trgHeight);var d=c.toDataURL("image/png");if(null!=o)return o(d,c)})},null!=o&&(l.onerror=o),l.src=e.dataURL}},{key:"processQueue",value:function(){var e=this.options.parallelUploads,t=this.getUploadingFiles().length,n=t;if(!(t>=e)){var r=this.getQueuedFiles();if(r.length>0){if(this.options.uploadMultiple)return this.processFiles(r.slice(0,e-t));for(;n<e;){if(!r.length)return;this.processFile(r.shift()),n++}}}}},{key:"processFile",value:function(e){return this.processFiles([e])}},{key:"processFiles",value:function(e){var t,r=u(e,!0);try{for(r.s();!(t=r.n()).done;){var i=t.value;i.processing=!0,i.status=n.UPLOADING,this.emit("processing",i)}}catch(e){r.e(e)}finally{r.f()}return this.options.uploadMultiple&&this.emit("processingmultiple",e),this.uploadFiles(e)}},{key:"_getFilesWithXhr",value:function(e){return this.files.filter(function(t){return t.xhr===e}).map(function(e){return e})}},{key:"cancelUpload",value:function(e){if(e.status===n.UPLOADING){var t,r=this._getFilesWithXhr(e.xhr),i=u(r,!0);try{for(i.s();!(t=i.n()).done;)t.value.status=n.CANCELED}catch(e){i.e(e)}finally{i.f()}void 0!==e.xhr&&e.xhr.abort();var o,s=u(r,!0);try{for(s.s();!(o=s.n()).done;){var a=o.value;this.emit("canceled",a)}}catch(e){s.e(e)}finally{s.f()}this.options.uploadMultiple&&this.emit("canceledmultiple",r)}else e.status!==n.ADDED&&e.status!==n.QUEUED||(e.status=n.CANCELED,this.emit("canceled",e),this.options.uploadMultiple&&this.emit("canceledmultiple",[e]));if(this.options.autoProcessQueue)return this.processQueue()}},{key:"resolveOption",value:function(e){if("function"==typeof e){for(var t=arguments.length,n=new Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];return e.apply(this,n)}return e}},{key:"uploadFile",value:function(e){return this.uploadFiles([e])}},{key:"uploadFiles",value:function(e){var t=this;this._transformFiles(e,function(r){if(t.options.chunking){var i=r[0];e[0].upload.chunked=t.options.chunking&&(t.options.forceChunking||i.size>t.options.chunkSize),e[0].upload.totalChunkCount=Math.ceil(i.size/t.options.chunkSize)}if(e[0].upload.chunked){var o=e[0],s=r[0];o.upload.chunks=[];var a=function(){for(var r=0;void 0!==o.upload.chunks[r];)r++;if(!(r>=o.upload.totalChunkCount)){var i=r*t.options.chunkSize,a=Math.min(i+t.options.chunkSize,s.size),l={name:t._getParamName(0),data:s.webkitSlice?s.webkitSlice(i,a):s.slice(i,a),filename:o.upload.filename,chunkIndex:r};o.upload.chunks[r]={file:o,index:r,dataBlock:l,status:n.UPLOADING,progress:0,retries:0},t._uploadData(e,[l])}};if(o.upload.finishedChunkUpload=function(r,i){var s=!0;r.status=n.SUCCESS,r.dataBlock=null,r.xhr=null;for(var l=0;l<o.upload.totalChunkCount;l++){if(void 0===o.upload.chunks[l])return a();o.upload.chunks[l].status!==n.SUCCESS&&(s=!1)}s&&t.options.chunksUploaded(o,function(){t._finished(e,i,null)})},t.options.parallelChunkUploads)for(var l=0;l<o.upload.totalChunkCount;l++)a();else a()}else{for(var c=[],u=0;u<e.length;u++)c[u]={name:t._getParamName(u),data:r[u],filename:e[u].upload.filename};t._uploadData(e,c)}})}},{key:"_getChunk",value:function(e,t){for(var n=0;n<e.upload.totalChunkCount;n++)if(void 0!==e.upload.chunks[n]&&e.upload.chunks[n].xhr===t)return e.upload.chunks[n]}},{key:"_uploadData",value:function(e,t){var r,i=this,o=new XMLHttpRequest,s=u(e,!0);try{for(s.s();!(r=s.n()).done;)r.value.xhr=o}catch(e){s.e(e)}finally{s.f()}e[0].upload.chunked&&(e[0].upload.chunks[t[0].chunkIndex].xhr=o);var a=this.resolveOption(this.options.method,e),l=this.resolveOption(this.options.url,e);o.open(a,l,!0),this.resolveOption(this.options.timeout,e)&&(o.timeout=this.resolveOption(this.options.timeout,e)),o.withCredentials=!!this.options.withCredentials,o.onload=function(t){i._finishedUploading(e,o,t)},o.ontimeout=function(){i._handleUploadError(e,o,"Request timedout after ".concat(i.options.timeout/1e3," seconds"))},o.onerror=function(){i._handleUploadError(e,o)},(null!=o.upload?o.upload:o).onprogress=function(t){return i._updateFilesUploadProgress(e,o,t)};var c={Accept:"application/json","Cache-Control":"no-cache","X-Requested-With":"XMLHttpRequest"};for(var d in this.options.headers&&n.extend(c,this.options.headers),c){var f=c[d];f&&o.setRequestHeader(d,f)}var h=new FormData;if(this.options.params){var p=this.options.params;for(var v in"function"==typeof p&&(p=p.call(this,e,o,e[0].upload.chunked?this._getChunk(e[0],o):null)),p){var m=p[v];if(Array.isArray(m))for(var g=0;g<m.length;g++)h.append(v,m[g]);else h.append(v,m)}}var y,b=u(e,!0);try{for(b.s();!(y=b.n()).done;){var w=y.value;this.emit("sending",w,o,h)}}catch(e){b.e(e)}finally{b.f()}this.options.uploadMultiple&&this.emit("sendingmultiple",e,o,h),this._addFormElementData(h);for(var x=0;x<t.length;x++){var E=t[x];h.append(E.name,E.data,E.filename)}this.submitRequest(o,h,e)}},{key:"_transformFiles",value:function(e,t){for(var n=this,r=[],i=0,o=function(o){n.options.transformFile.call(n,e[o],function(n){r[o]=n,++i===e.length&&t(r)})},s=0;s<e.length;s++)o(s)}},{key:"_addFormElementData",value:function(e){if("FORM"===this.element.tagName){var t,n=u(this.element.querySelectorAll("input, textarea, select, button"),!0);try{for(n.s();!(t=n.n()).done;){var r=t.value,i=r.getAttribute("name"),o=r.getAttribute("type");if(o&&(o=o.toLowerCase()),null!=i)if("SELECT"===r.tagName&&r.hasAttribute("multiple")){var s,a=u(r.options,!0);try{for(a.s();!(s=a.n()).done;){var l=s.value;l.selected&&e.append(i,l.value)}}catch(e){a.e(e)}finally{a.f()}}else(!o||"checkbox"!==o&&"radio"!==o||r.checked)&&e.append(i,r.value)}}catch(e){n.e(e)}finally{n.f()}}}},{key:"_updateFilesUploadProgress",value:function(e,t,n){if(e[0].upload.chunked){var r=e[0],i=this._getChunk(r,t);n?(i.progress=100*n.loaded/n.total,i.total=n.total,i.bytesSent=n.loaded):(i.progress=100,i.bytesSent=i.total),r.upload.progress=0,r.upload.total=0,r.upload.bytesSent=0;for(var o=0;o<r.upload.totalChunkCount;o++)r.upload.chunks[o]&&void 0!==r.upload.chunks[o].progress&&(r.upload.progress+=r.upload.chunks[o].progress,r.upload.total+=r.upload.chunks[o].total,r.upload.bytesSent+=r.upload.chunks[o].bytesSent);r.upload.progress=r.upload.progress/r.upload.totalChunkCount,this.emit("uploadprogress",r,r.upload.progress,r.upload.bytesSent)}else{var s,a=u(e,!0);try{for(a.s();!(s=a.n()).done;){var l=s.value;l.upload.total&&l.upload.bytesSent&&l.upload.bytesSent==l.upload.total||(n?(l.upload.progress=100*n.loaded/n.total,l.upload.total=n.total,l.upload.bytesSent=n.loaded):(l.upload.progress=100,l.upload.bytesSent=l.upload.total),this.emit("uploadprogress",l,l.upload.progress,l.upload.bytesSent))}}catch(e){a.e(e)}finally{a.f()}}}},{key:"_finishedUploading",value:function(e,t,r){var i;if(e[0].status!==n.CANCELED&&4===t.readyState){if("arraybuffer"!==t.responseType&&"blob"!==t.responseType&&(i=t.responseText,t.getResponseHeader("content-type")&&~t.getResponseHeader("content-type").indexOf("application/json")))try{i=JSON.parse(i)}catch(e){r=e,i="Invalid JSON response from server."}this._updateFilesUploadProgress(e,t),200<=t.status&&t.status<300?e[0].upload.chunked?e[0].upload.finishedChunkUpload(this._getChunk(e[0],t),i):this._finished(e,i,r):this._handleUploadError(e,t,i)}}},{key:"_handleUploadError",value:function(e,t,r){if(e[0].status!==n.CANCELED){if(e[0].upload.chunked&&this.options.retryChunks){var i=this._getChunk(e[0],t);if(i.retries++<this.options.retryChunksLimit)return void this._uploadData(e,[i.dataBlock]);console.warn("Retried this chunk too often. Giving up.")}this._errorProcessing(e,r||this.options.dictResponseError.replace("{{statusCode}}",t.status),t)}}},{key:"submitRequest",value:function(e,t,n){1==e.readyState?e.send(t):console.warn("Cannot send this request because the XMLHttpRequest.readyState is not OPENED.")}},{key:"_finished",value:function(e,t,r){var i,o=u(e,!0);try{for(o.s();!(i=o.n()).done;){var s=i.value;s.status=n.SUCCESS,this.emit("success",s,t,r),this.emit("complete",s)}}catch(e){o.e(e)}finally{o.f()}if(this.options.uploadMultiple&&(this.emit("successmultiple",e,t,r),this.emit("completemultiple",e)),this.options.autoProcessQueue)return this.processQueue()}},{key:"_errorProcessing",value:function(e,t,r){var i,o=u(e,!0);try{for(o.s();!(i=o.n()).done;){var s=i.value;s.status=n.ERROR,this.emit("error",s,t,r),this.emit("complete",s)}}catch(e){o.e(e)}finally{o.f()}if(this.options.uploadMultiple&&(this.emit("errormultiple",e,t,r),this.emit("completemultiple",e)),this.options.autoProcessQueue)return this.processQueue()}}],[{key:"initClass",value:function(){this.prototype.Emitter=o,this.prototype.events=["drop","dragstart","dragend","dragenter","dragover","dragleave","addedfile","addedfiles","removedfile","thumbnail","error","errormultiple","processing","processingmultiple","uploadprogress","totaluploadprogress","sending","sendingmultiple","success","successmultiple","canceled","canceledmultiple","complete","completemultiple","reset","maxfilesexceeded","maxfilesreached","queuecomplete"],this.prototype._thumbnailQueue=[],this.prototype._processingThumbnail=!1}},{key:"extend",value:function(e){for(var t=arguments.length,n=new Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];for(var i=0,o=n;i<o.length;i++){var s=o[i];for(var a in s){var l=s[a];e[a]=l}}return e}},{key:"uuidv4",value:function(){return"xxxxxxxx-xxxx-4xxx-yxxx-xxxxxxxxxxxx".replace(/[xy]/g,function(e){var t=16*Math.random()|0;return("x"===e?t:3&t|8).toString(16)})}}]),n}(o);w.initClass(),w.version="5.9.3",w.options={},w.optionsForElement=function(e){return e.getAttribute("id")?w.options[E(e.getAttribute("id"))]:void 0},w.instances=[],w.forElement=function(e){if("string"==typeof e&&(e=document.querySelector(e)),null==(null!=e?e.dropzone:void 0))throw new Error("No Dropzone found for given element. This is probably because you're trying to access it before Dropzone had the time to initialize. Use the `init` option to setup any additional observers on your Dropzone.");return e.dropzone},w.autoDiscover=!0,w.discover=function(){var e;if(document.querySelectorAll)e=document.querySelectorAll(".dropzone");else{e=[];var t=function(t){return function(){var n,r=[],i=u(t,!0);try{for(i.s();!(n=i.n()).done;){var o=n.value;/(^| )dropzone($| )/.test(o.className)?r.push(e.push(o)):r.push(void 0)}}catch(e){i.e(e)}finally{i.f()}return r}()};t(document.getElementsByTagName("div")),t(document.getElementsByTagName("form"))}return function(){var t,n=[],r=u(e,!0);try{for(r.s();!(t=r.n()).done;){var i=t.value;!1!==w.optionsForElement(i)?n.push(new w(i)):n.push(void 0)}}catch(e){r.e(e)}finally{r.f()}return n}()},w.blockedBrowsers=[/opera.*(Macintosh|Windows Phone).*version\/12/i],w.isBrowserSupported=function(){var e=!0;if(window.File&&window.FileReader&&window.FileList&&window.Blob&&window.FormData&&document.querySelector)if("classList"in document.createElement("a")){void 0!==w.blacklistedBrowsers&&(w.blockedBrowsers=w.blacklistedBrowsers);var t,n=u(w.blockedBrowsers,!0);try{for(n.s();!(t=n.n()).done;)t.value.test(navigator.userAgent)&&(e=!1)}catch(e){n.e(e)}finally{n.f()}}else e=!1;else e=!1;return e},w.dataURItoBlob=function(e){for(var t=atob(e.split(",")[1]),n=e.split(",")[0].split(":")[1].split(";")[0],r=new ArrayBuffer(t.length),i=new Uint8Array(r),o=0,s=t.length,a=0<=s;a?o<=s:o>=s;a?o++:o--)i[o]=t.charCodeAt(o);return new Blob([r],{type:n})};var x=function(e,t){return e.filter(function(e){return e!==t}).map(function(e){return e})},E=function(e){return e.replace(/[\-_](\w)/g,function(e){return e.charAt(1).toUpperCase()})};w.createElement=function(e){var t=document.createElement("div");return t.innerHTML=e,t.childNodes[0]},w.elementInside=function(e,t){if(e===t)return!0;for(;e=e.parentNode;)if(e===t)return!0;return!1},w.getElement=function(e,t){var n;if("string"==typeof e?n=document.querySelector(e):null!=e.nodeType&&(n=e),null==n)throw new Error("Invalid `".concat(t,"` option provided. Please provide a CSS selector or a plain HTML element."));return n},w.getElements=function(e,t){var n,r;if(e instanceof Array){r=[];try{var i,o=u(e,!0);try{for(o.s();!(i=o.n()).done;)n=i.value,r.push(this.getElement(n,t))}catch(e){o.e(e)}finally{o.f()}}catch(e){r=null}}else if("string"==typeof e){r=[];var s,a=u(document.querySelectorAll(e),!0);try{for(a.s();!(s=a.n()).done;)n=s.value,r.push(n)}catch(e){a.e(e)}finally{a.f()}}else null!=e.nodeType&&(r=[e]);if(null==r||!r.length)throw new Error("Invalid `".concat(t,"` option provided. Please provide a CSS selector, a plain HTML element or a list of those."));return r},w.confirm=function(e,t,n){return window.confirm(e)?t():null!=n?n():void 0},w.isValidFile=function(e,t){if(!t)return!0;t=t.split(",");var n,r=e.type,i=r.replace(/\/.*$/,""),o=u(t,!0);try{for(o.s();!(n=o.n()).done;){var s=n.value;if("."===(s=s.trim()).charAt(0)){if(-1!==e.name.toLowerCase().indexOf(s.toLowerCase(),e.name.length-s.length))return!0}else if(/\/\*$/.test(s)){if(i===s.replace(/\/.*$/,""))return!0}else if(r===s)return!0}}catch(e){o.e(e)}finally{o.f()}return!1},"undefined"!=typeof jQuery&&null!==jQuery&&(jQuery.fn.dropzone=function(e){return this.each(function(){return new w(this,e)})}),w.ADDED="added",w.QUEUED="queued",w.ACCEPTED=w.QUEUED,w.UPLOADING="uploading",w.PROCESSING=w.UPLOADING,w.CANCELED="canceled",w.ERROR="error",w.SUCCESS="success";var S=function(e,t,n,r,i,o,s,a,l,c){var u=function(e){e.naturalWidth;var t=e.naturalHeight,n=document.createElement("canvas");n.width=1,n.height=t;var r=n.getContext("2d");r.drawImage(e,0,0);for(var i=r.getImageData(1,0,1,t).data,o=0,s=t,a=t;a>o;)0===i[4*(a-1)+3]?s=a:o=a,a=s+o>>1;var l=a/t;return 0===l?1:l}(t);return e.drawImage(t,n,r,i,o,s,a,l,c/u)},k=function(){function e(){f(this,e)}return p(e,null,[{key:"initClass",value:function(){this.KEY_STR="ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/="}},{key:"encode64",value:function(e){for(var t="",n=void 0,r=void 0,i="",o=void 0,s=void 0,a=void 0,l="",c=0;o=(n=e[c++])>>2,s=(3&n)<<4|(r=e[c++])>>4,a=(15&r)<<2|(i=e[c++])>>6,l=63&i,isNaN(r)?a=l=64:isNaN(i)&&(l=64),t=t+this.KEY_STR.charAt(o)+this.KEY_STR.charAt(s)+this.KEY_STR.charAt(a)+this.KEY_STR.charAt(l),n=r=i="",o=s=a=l="",c<e.length;);return t}},{key:"restore",value:function(e,t){if(!e.match("data:image/jpeg;base64,"))return t;var n=this.decode64(e.replace("data:image/jpeg;base64,","")),r=this.slice2Segments(n),i=this.exifManipulation(t,r);return"data:image/jpeg;base64,".concat(this.encode64(i))}},{key:"exifManipulation",value:function(e,t){var n=this.getExifArray(t),r=this.insertExif(e,n);return new Uint8Array(r)}},{key:"getExifArray",value:function(e){for(var t=void 0,n=0;n<e.length;){if(255===(t=e[n])[0]&225===t[1])return t;n++}return[]}},{key:"insertExif",value:function(e,t){var n=e.replace("data:image/jpeg;base64,",""),r=this.decode64(n),i=r.indexOf(255,3),o=r.slice(0,i),s=r.slice(i),a=o;return a=(a=a.concat(t)).concat(s)}},{key:"slice2Segments",value:function(e){for(var t=0,n=[];!(255===e[t]&218===e[t+1]);){if(255===e[t]&216===e[t+1])t+=2;else{var r=t+(256*e[t+2]+e[t+3])+2,i=e.slice(t,r);n.push(i),t=r}if(t>e.length)break}return n}},{key:"decode64",value:function(e){var t=void 0,n=void 0,r="",i=void 0,o=void 0,s="",a=0,l=[];for(/[^A-Za-z0-9\+\/\=]/g.exec(e)&&console.warn("There were invalid base64 characters in the input text.\nValid base64 characters are A-Z, a-z, 0-9, '+', '/',and '='\nExpect errors in decoding."),e=e.replace(/[^A-Za-z0-9\+\/\=]/g,"");t=this.KEY_STR.indexOf(e.charAt(a++))<<2|(i=this.KEY_STR.indexOf(e.charAt(a++)))>>4,n=(15&i)<<4|(o=this.KEY_STR.indexOf(e.charAt(a++)))>>2,r=(3&o)<<6|(s=this.KEY_STR.indexOf(e.charAt(a++))),l.push(t),64!==o&&l.push(n),64!==s&&l.push(r),t=n=r="",i=o=s="",a<e.length;);return l}}]),e}();k.initClass(),w._autoDiscoverFunction=function(){if(w.autoDiscover)return w.discover()},function(e,t){var n=!1,r=!0,i=e.document,o=i.documentElement,s=i.addEventListener?"addEventListener":"attachEvent",a=i.addEventListener?"removeEventListener":"detachEvent",l=i.addEventListener?"":"on",c=function r(o){if("readystatechange"!==o.type||"complete"===i.readyState)return("load"===o.type?e:i)[a](l+o.type,r,!1),!n&&(n=!0)?t.call(e,o.type||o):void 0};if("complete"!==i.readyState){if(i.createEventObject&&o.doScroll){try{r=!e.frameElement}catch(e){}r&&function e(){try{o.doScroll("left")}catch(t){return void setTimeout(e,50)}return c("poll")}()}i[s](l+"DOMContentLoaded",c,!1),i[s](l+"readystatechange",c,!1),e[s](l+"load",c,!1)}}(window,w._autoDiscoverFunction),window.Dropzone=w;var L=w}(),r}()},e.exports=t()},417:(e,t,n)=>{"use strict";n.d(t,{A:()=>p});const r=(e,t)=>`filer-upload:${e}:${t.name}:${t.size}:${t.lastModified}`,i=e=>{try{return window.localStorage.getItem(e)}catch(e){return null}},o=(e,t)=>{try{t?window.localStorage.setItem(e,t):window.localStorage.removeItem(e)}catch(e){}},s=e=>new Promise(t=>setTimeout(t,e)),a=(e,t,{body:n=null,headers:r={},onProgress:i=null,signal:o=null}={})=>new Promise((s,a)=>{const l=new XMLHttpRequest;l.open(e,t),Object.entries(r).forEach(([e,t])=>l.setRequestHeader(e,t)),i&&l.upload.addEventListener("progress",e=>i(e.loaded)),l.addEventListener("load",()=>s(l)),l.addEventListener("error",()=>a(new Error("Network error"))),l.addEventListener("abort",()=>a(new Error("Upload canceled"))),o&&o.addEventListener("abort",()=>l.abort()),l.send(n)}),l=e=>{try{return JSON.parse(e.responseText)}catch(t){return{error:e.statusText||`HTTP ${e.status}`}}},c=e=>parseInt(e.getResponseHeader("Upload-Offset"),10),u=async(e,t)=>{try{const n=await a("HEAD",e,{signal:t});return 204===n.status?c(n):null}catch(e){if(t.aborted)throw e;return null}},d=async(e,t,n,{onProgress:h,signal:f})=>{const v=r(t,e);let m=i(v),g=m?await u(m,f):null,y=0;if(null===g){const b=new FormData;b.append("filename",e.name),b.append("size",e.size);const w=await a("POST",t,{body:b,signal:f}),x=l(w);if(200===w.status)return x;if(201!==w.status)throw new Error(x.error);m=x.url,g=x.offset,o(v,m)}for(;g<e.size;){const b=g;let w=!1;try{const x=await a("PATCH",m,{body:e.slice(b,b+n),headers:{"Upload-Offset":b,"Content-Type":"application/offset+octet-stream"},onProgress:e=>h(b+e),signal:f});if(204===x.status||409===x.status)g=c(x),w=g===b;else{if(!(x.status>=500))throw o(v,null),new Error(l(x).error);w=!0}}catch(e){if(f.aborted||!w&&"Network error"!==e.message)throw e;w=!0}if(w){if(y++,y>5)throw new Error("The upload was interrupted, please try again to resume it.");await s(1e3*y);const E=await u(m,f);null!==E&&(g=E)}else y=0}const w=await a("POST",m,{signal:f});return o(v,null),l(w)},p=(e,t,n)=>{const h=`${t.replace(/\/?$/,"/")}sessions/`;e.uploadFiles=t=>{t.forEach(t=>{const r=new AbortController;t.xhr={abort:()=>r.abort()},e.emit("sending",t,null,null),d(t,h,n,{signal:r.signal,onProgress:g=>{t.upload.bytesSent=g,t.upload.progress=t.size?100*g/t.size:100,e.emit("uploadprogress",t,t.upload.progress,g)}}).then(v=>e._finished([t],v,null),v=>{r.signal.aborted||e._errorProcessing([t],v,null)})})}}}},t={};function n(r){var i=t[r];if(void 0!==i)return i.exports;var o=t[r]={id:r,loaded:!1,exports:{}};return e[r].call(o.exports,o,o.exports,n),o.loaded=!0,o.exports}n.n=e=>{var t=e&&e.__esModule?()=>e.default:()=>e;return n.d(t,{a:t}),t},n.d=(e,t)=>{for(var r in t)n.o(t,r)&&!n.o(e,r)&&Object.defineProperty(e,r,{enumerable:!0,get:t[r]})},n.hmd=e=>((e=Object.create(e)).children||(e.children=[]),Object.defineProperty(e,"exports",{enumerable:!0,set:()=>{throw new Error("ES Modules may not assign module.exports or exports.*, Use ESM export syntax, instead: "+e.id)}}),e),n.o=(e,t)=>Object.prototype.hasOwnProperty.call(e,t),(()=>{"use strict";(()=>{const e="filer-dropdown-backdrop",t='[data-toggle="filer-dropdown"]';class n{constructor(e){this.element=e,e.addEventListener("click",()=>this.toggle())}toggle(){const t=this.element,n=r(t),o=n.classList.contains("open"),s={relatedTarget:t};if(t.disabled||t.classList.contains("disabled"))return!1;if(i(),!o){if("ontouchstart"in document.documentElement&&!n.closest(".navbar-nav")){const n=document.createElement("div");n.className=e,t.parentNode.insertBefore(n,t.nextSibling),n.addEventListener("click",i)}const r=new CustomEvent("show.bs.filer-dropdown",{bubbles:!0,cancelable:!0,detail:s});if(n.dispatchEvent(r),r.defaultPrevented)return!1;t.focus(),t.setAttribute("aria-expanded","true"),n.classList.add("open");const o=new CustomEvent("shown.bs.filer-dropdown",{bubbles:!0,detail:s});n.dispatchEvent(o)}return!1}keydown(e){const n=this.element,i=r(n),o=i.classList.contains("open"),s=Array.from(i.querySelectorAll(".filer-dropdown-menu li:not(.disabled):visible a")).filter(e=>null!==e.offsetParent),a=s.indexOf(e.target);if(!/(38|40|27|32)/.test(e.which)||/input|textarea/i.test(e.target.tagName))return;if(e.preventDefault(),e.stopPropagation(),n.disabled||n.classList.contains("disabled"))return;if(!o&&27!==e.which||o&&27===e.which)return 27===e.which&&i.querySelector(t)?.focus(),n.click();if(!s.length)return;let l=a;38===e.which&&a>0&&l--,40===e.which&&a<s.length-1&&l++,-1===l&&(l=0),s[l]?.focus()}}function r(e){let t=e.getAttribute("data-target"),n=t?document.querySelector(t):null;return t||(t=e.getAttribute("href"),t=t&&/#[A-Za-z]/.test(t)&&t.replace(/.*(?=#[^\s]*$)/,""),n=t?document.querySelector(t):null),n&&n.parentNode?n:e.parentNode}function i(n){n&&3===n.which||(document.querySelectorAll(`.${e}`).forEach(e=>e.remove()),document.querySelectorAll(t).forEach(e=>{const t=r(e),i={relatedTarget:e};if(!t.classList.contains("open"))return;if(n&&"click"===n.type&&/input|textarea/i.test(n.target.tagName)&&t.contains(n.target))return;const o=new CustomEvent("hide.bs.filer-dropdown",{bubbles:!0,cancelable:!0,detail:i});if(t.dispatchEvent(o),o.defaultPrevented)return;e.setAttribute("aria-expanded","false"),t.classList.remove("open");const s=new CustomEvent("hidden.bs.filer-dropdown",{bubbles:!0,detail:i});t.dispatchEvent(s)}))}function o(e){return this.forEach(t=>{let r=t._filerDropdownInstance;r||(r=new n(t),t._filerDropdownInstance=r),"string"==typeof e&&r[e].call(t)}),this}NodeList.prototype.dropdown||(NodeList.prototype.dropdown=function(e){return o.call(this,e)}),HTMLCollection.prototype.dropdown||(HTMLCollection.prototype.dropdown=function(e){return o.call(this,e)}),document.addEventListener("click",i),document.addEventListener("click",e=>{e.target.closest(".filer-dropdown form")&&e.stopPropagation()}),document.addEventListener("click",e=>{const r=e.target.closest(t);if(r){const t=r._filerDropdownInstance||new n(r);r._filerDropdownInstance||(r._filerDropdownInstance=t),t.toggle(e)}}),document.addEventListener("keydown",e=>{const r=e.target.closest(t);if(r){const t=r._filerDropdownInstance||new n(r);r._filerDropdownInstance||(r._filerDropdownInstance=t),t.keydown(e)}}),document.addEventListener("keydown",e=>{const r=e.target.closest(".filer-dropdown-menu");if(r){const i=r.parentNode.querySelector(t);if(i){const t=i._filerDropdownInstance||new n(i);i._filerDropdownInstance||(i._filerDropdownInstance=t),t.keydown(e)}}}),window.FilerDropdown=n})()})(),(()=>{"use strict";const e=e=>{const t=(e=(e=e.replace(/__dot__/g,".")).replace(/__dash__/g,"-")).lastIndexOf("__");return-1===t?e:e.substring(0,t)};window.dismissPopupAndReload=e=>{document.location.reload(),e.close()},window.dismissRelatedImageLookupPopup=(t,n,r,i,o)=>{const s=e(t.name),a=document.getElementById(s);if(!a)return;const l=a.closest(".filerFile");if(!l)return;const c=l.querySelector(".edit"),u=l.querySelector(".thumbnail_img"),d=l.querySelector(".description_text"),f=l.querySelector(".filerClearer"),h=l.parentElement.querySelector(".dz-message"),p=l.querySelector("input"),v=p.value;p.value=n;const m=p.closest(".js-filer-dropzone");m&&m.classList.add("js-object-attached"),r&&u&&(u.src=r,u.classList.remove("hidden"),u.removeAttribute("srcset")),d&&(d.textContent=i),f&&f.classList.remove("hidden"),a.classList.add("related-lookup-change"),c&&c.classList.add("related-lookup-change"),o&&c&&c.setAttribute("href",`${o}?_edit_from_widget=1`),h&&h.classList.add("hidden"),v!==n&&p.dispatchEvent(new Event("change",{bubbles:!0})),t.close()},window.dismissRelatedFolderLookupPopup=(t,n,r)=>{const i=e(t.name),o=document.getElementById(i);if(!o)return;const s=o.closest(".filerFile");if(!s)return;const a=s.querySelector(".thumbnail_img"),l=document.getElementById(`id_${i}_clear`),c=document.getElementById(`id_${i}`),u=s.querySelector(".description_text"),d=document.getElementById(i);c&&(c.value=n),a&&a.classList.remove("hidden"),u&&(u.textContent=r),l&&l.classList.remove("hidden"),d&&d.classList.add("hidden"),t.close()},document.addEventListener("DOMContentLoaded",()=>{document.querySelectorAll(".js-dismiss-popup").forEach(e=>{e.addEventListener("click",function(e){e.preventDefault();const t=this.dataset.fileId,n=this.dataset.iconUrl,r=this.dataset.label;if(this.classList.contains("js-dismiss-image")){const e=this.dataset.changeUrl||"";window.opener.dismissRelatedImageLookupPopup(window,t,n,r,e)}else this.classList.contains("js-dismiss-folder")&&window.opener.dismissRelatedFolderLookupPopup(window,t,r)})});const e=document.getElementById("popup-dismiss-data");if(e&&window.opener){const t=e.dataset.pk,n=e.dataset.label;window.opener.dismissRelatedPopup(window,t,n)}})})(),(()=>{"use strict";var e=n(628),t=n.n(e),U=n(417);document.addEventListener("DOMContentLoaded",()=>{let e=0,n=0;const r=[],i=document.querySelector(".js-filer-dropzone-base"),o=".js-filer-dropzone";let s;const a=document.querySelector(".js-filer-dropzone-info-message"),l=document.querySelector(".js-filer-dropzone-folder-name"),c=document.querySelector(".js-filer-dropzone-upload-info-container"),u=document.querySelector(".js-filer-dropzone-upload-info"),d=document.querySelector(".js-filer-dropzone-upload-welcome"),f=document.querySelector(".js-filer-dropzone-upload-number"),h=document.querySelector(".js-filer-upload-count"),p=document.querySelector(".js-filer-upload-text"),v=".js-filer-dropzone-progress",m=document.querySelector(".js-filer-dropzone-upload-success"),g=document.querySelector(".js-filer-dropzone-upload-canceled"),y=document.querySelector(".js-filer-dropzone-cancel"),b="dz-drag-hover",w=document.querySelector(".drag-hover-border"),x="hidden";let E,S,k,L=!1;const A=()=>{f&&(f.textContent=`${n-e}/${n}`),p&&p.classList.remove("hidden"),h&&h.classList.remove("hidden")},C=()=>{r.forEach(e=>{e.destroy()})},_=(e,t)=>document.getElementById(`file-${encodeURIComponent(e.name)}${e.size}${e.lastModified}${t}`);if(i){S=i.dataset.url,k=i.dataset.folderName;const e=document.body;e.dataset.url=S,e.dataset.folderName=k,e.dataset.maxFiles=i.dataset.maxFiles,e.dataset.maxFilesize=i.dataset.maxFiles,e.classList.add("js-filer-dropzone")}Cl.mediator.subscribe("filer-upload-in-progress",C),s=document.querySelectorAll(o),s.length&&t()&&(t().autoDiscover=!1,s.forEach(i=>{const h=i.dataset.url,p=new(t())(i,{url:h,paramName:"file",maxFiles:parseInt(i.dataset.maxFiles)||100,maxFilesize:parseInt(i.dataset.maxFilesize),previewTemplate:"<div></div>",clickable:!1,addRemoveLinks:!1,parallelUploads:i.dataset["max-uploader-connections"]||3,accept:(t,r)=>{let i;if(Cl.mediator.remove("filer-upload-in-progress",C),Cl.mediator.publish("filer-upload-in-progress"),clearTimeout(E),clearTimeout(E),d&&d.classList.add(x),y&&y.classList.remove(x),_(t,h))r("duplicate");else{i=u.cloneNode(!0);const o=i.querySelector(".js-filer-dropzone-file-name");o&&(o.textContent=t.name);const s=i.querySelector(v);s&&(s.style.width="0"),i.setAttribute("id",`file-${encodeURIComponent(t.name)}${t.size}${t.lastModified}${h}`),c&&c.appendChild(i),e++,n++,A(),r()}s.forEach(e=>e.classList.remove("reset-hover")),a&&a.classList.remove(x),s.forEach(e=>e.classList.remove(b))},dragover:e=>{const t=e.target.closest(o),n=t?.dataset.folderName,r=i.classList.contains("js-filer-dropzone-folder"),c=i.getBoundingClientRect(),u=w?window.getComputedStyle(w):null,d=u?u.borderTopWidth:"0px",f=u?u.borderLeftWidth:"0px",h={top:`${c.top}px`,bottom:`${c.bottom}px`,left:`${c.left}px`,right:`${c.right}px`,width:c.width-2*parseInt(f,10)+"px",height:c.height-2*parseInt(d,10)+"px",display:"block"};r&&w&&Object.assign(w.style,h),s.forEach(e=>e.classList.add("reset-hover")),m&&m.classList.add(x),a&&a.classList.remove(x),i.classList.add(b),i.classList.remove("reset-hover"),l&&n&&(l.textContent=n)},dragend:()=>{clearTimeout(E),E=setTimeout(()=>{a&&a.classList.add(x)},1e3),a&&a.classList.remove(x),s.forEach(e=>e.classList.remove(b)),w&&Object.assign(w.style,{top:"0",bottom:"0",width:"0",height:"0"})},dragleave:()=>{clearTimeout(E),E=setTimeout(()=>{a&&a.classList.add(x)},1e3),a&&a.classList.remove(x),s.forEach(e=>e.classList.remove(b)),w&&Object.assign(w.style,{top:"0",bottom:"0",width:"0",height:"0"})},sending:e=>{const t=_(e,h);t&&t.classList.remove(x)},uploadprogress:(e,t)=>{const n=_(e,h);if(n){const e=n.querySelector(v);e&&(e.style.width=`${t}%`)}},success:t=>{e--,A();const n=_(t,h);n&&n.remove()},queuecomplete:()=>{0===e&&(A(),y&&y.classList.add(x),u&&u.classList.add(x),L?(f&&f.classList.add(x),setTimeout(()=>{window.location.reload()},1e3)):(m&&m.classList.remove(x),window.location.reload()))},error:(e,t)=>{A(),"duplicate"!==t&&(L=!0,window.filerShowError&&window.filerShowError(`${e.name}: ${t.message}`))}});const F=parseInt(i.dataset.chunkSize||0,10);F&&(0,U.A)(p,h,1024*F*1024),r.push(p),y&&y.addEventListener("click",e=>{e.preventDefault(),y.classList.add(x),g&&g.classList.remove(x),p.removeAllFiles(!0)})}))})})(),(()=>{"use strict";var e=n(628),t=n.n(e),U=n(417);document.addEventListener("DOMContentLoaded",()=>{let e=0,n=1;const r=document.querySelector(".js-upload-button");if(!r)return;const i=document.querySelector(".js-upload-button-disabled"),o=r.dataset.url,s=document.querySelector(".js-filer-dropzone-upload-welcome"),a=document.querySelector(".js-filer-dropzone-upload-info-container"),l=document.querySelector(".js-filer-dropzone-upload-info"),c=document.querySelector(".js-filer-dropzone-upload-number"),u=".js-filer-dropzone-progress",d=document.querySelector(".js-filer-dropzone-upload-success"),f=document.querySelector(".js-filer-dropzone-upload-canceled"),h=document.querySelector(".js-filer-dropzone-cancel"),p=document.querySelector(".js-filer-dropzone-info-message"),v="hidden",m=parseInt(r.dataset.maxUploaderConnections||3,10),g=parseInt(r.dataset.maxFilesize||0,10),F=parseInt(r.dataset.chunkSize||0,10);let y=!1;const b=()=>{c&&(c.textContent=`${n-e}/${n}`)},w=()=>{r&&r.remove()},x=()=>{const e=window.location.toString();window.location.replace(((e,t,n)=>{const r=new RegExp(`([?&])${t}=.*?(&|$)`,"i"),i=-1!==e.indexOf("?")?"&":"?",o=window.location.hash;return(e=e.replace(/#.*$/,"")).match(r)?e.replace(r,`$1${t}=${n}$2`)+o:e+i+t+"="+n+o})(e,"order_by","-modified_at"))};Cl.mediator.subscribe("filer-upload-in-progress",w),t().autoDiscover=!1;const E=new(t())(r,{url:o,paramName:"file",maxFilesize:g,parallelUploads:m,clickable:r,previewTemplate:"<div></div>",addRemoveLinks:!1,autoProcessQueue:!0});F&&(0,U.A)(E,o,1024*F*1024),E.on("addedfile",()=>{Cl.mediator.remove("filer-upload-in-progress",w),Cl.mediator.publish("filer-upload-in-progress"),e++,n=E.files.length,p&&p.classList.remove(v),s&&s.classList.add(v),d&&d.classList.add(v),a&&a.classList.remove(v),h&&h.classList.remove(v),f&&f.classList.add(v),b()}),E.on("uploadprogress",(e,t)=>{const n=Math.round(t),r=`file-${encodeURIComponent(e.name)}${e.size}${e.lastModified}`,i=document.getElementById(r);let o;if(i){const e=i.querySelector(u);e&&(e.style.width=`${n}%`)}else if(l){o=l.cloneNode(!0);const t=o.querySelector(".js-filer-dropzone-file-name");t&&(t.textContent=e.name);const i=o.querySelector(u);i&&(i.style.width=`${n}%`),o.classList.remove(v),o.setAttribute("id",r),a&&a.appendChild(o)}}),E.on("success",(t,r)=>{const i=`file-${encodeURIComponent(t.name)}${t.size}${t.lastModified}`,o=document.getElementById(i);o&&o.remove(),r.error&&(y=!0,window.filerShowError(`${t.name}: ${r.error}`)),e--,b(),0===e&&(n=1,s&&s.classList.add(v),c&&c.classList.add(v),f&&f.classList.add(v),h&&h.classList.add(v),d&&d.classList.remove(v),y?setTimeout(x,1e3):x())}),E.on("error",(t,r)=>{const i=`file-${encodeURIComponent(t.name)}${t.size}${t.lastModified}`,o=document.getElementById(i);o&&o.remove(),y=!0,window.filerShowError(`${t.name}: ${r}`),e--,b(),0===e&&(n=1,s&&s.classList.add(v),c&&c.classList.add(v),f&&f.classList.add(v),h&&h.classList.add(v),d&&d.classList.remove(v),setTimeout(x,1e3))}),h&&h.addEventListener("click",e=>{e.preventDefault(),h.classList.add(v),c&&c.classList.add(v),a&&a.classList.add(v),f&&f.classList.remove(v),setTimeout(()=>{window.location.reload()},1e3)}),i&&Cl.filerTooltip&&Cl.filerTooltip(),document.dispatchEvent(new Event("filer-upload-scripts-executed"))})})(),(()=>{"use strict";window.Cl=window.Cl||{},Cl.filerTooltip=()=>{const e=".js-filer-tooltip";document.querySelectorAll(e).forEach(t=>{t.addEventListener("mouseover",function(){const t=this.getAttribute("title");if(!t)return;this.dataset.filerTooltip=t,this.removeAttribute("title");const n=document.createElement("p");n.className="filer-tooltip",n.textContent=t;const r=document.querySelector(e);r&&r.appendChild(n)}),t.addEventListener("mouseout",function(){const e=this.dataset.filerTooltip;e&&this.setAttribute("title",e);document.querySelectorAll(".filer-tooltip").forEach(e=>{e.remove()})})})}})(),(()=>{"use strict";var e=n(295),t=n.n(e),r=n(242);window.Cl=window.Cl||{};class i{constructor(e={}){this.options={linksSelector:".js-toggler-link",dataHeaderSelector:"toggler-header-selector",dataContentSelector:"toggler-content-selector",collapsedClass:"js-collapsed",expandedClass:"js-expanded",hiddenClass:"hidden",...e},this.togglerInstances=[];document.querySelectorAll(this.options.linksSelector).forEach(e=>{const t=new o(e,this.options);this.togglerInstances.push(t)})}destroy(){this.links=null,this.togglerInstances.forEach(e=>e.destroy()),this.togglerInstances=[]}}class o{constructor(e,t={}){this.options={...t},this.link=e,this.headerSelector=this.link.dataset[this.options.dataHeaderSelector],this.contentSelector=this.link.dataset[this.options.dataContentSelector],this.header=document.querySelector(this.headerSelector),this.header=this.header||this.link,this.content=document.querySelector(this.contentSelector),this.content&&this._initLink()}_updateClasses(){this.content.classList.contains(this.options.hiddenClass)?(this.header.classList.remove(this.options.expandedClass),this.header.classList.add(this.options.collapsedClass)):(this.header.classList.add(this.options.expandedClass),this.header.classList.remove(this.options.collapsedClass))}_onTogglerClick(e){this.content.classList.toggle(this.options.hiddenClass),this._updateClasses(),e.preventDefault()}_initLink(){this._updateClasses(),this.link.addEventListener("click",e=>this._onTogglerClick(e))}destroy(){this.options=null,this.link=null}}Cl.Toggler=i,Cl.TogglerConstructor=o;const s=i;window.Cl=window.Cl||{},Cl.mediator=new(t()),Cl.FocalPoint=r.A,Cl.Toggler=s,document.addEventListener("DOMContentLoaded",()=>{let e;window.filerShowError=t=>{const n=document.querySelector(".messagelist"),r=document.querySelector("#header"),i="js-filer-error",o=`<ul class="messagelist"><li class="error ${i}">{msg}</li></ul>`.replace("{msg}",t);n?n.outerHTML=o:r&&r.insertAdjacentHTML("afterend",o),e&&clearTimeout(e),e=setTimeout(()=>{const e=document.querySelector(`.${i}`);e&&e.remove()},5e3)};const t=document.querySelector(".js-filter-files");t&&(t.addEventListener("focus",e=>{const t=e.target.closest(".navigator-top-nav");t&&t.classList.add("search-is-focused")}),t.addEventListener("blur",e=>{const t=e.target.closest(".navigator-top-nav");if(t){const n=t.querySelector(".dropdown-container a");n&&e.relatedTarget===n||t.classList.remove("search-is-focused")}})),(()=>{const e=document.querySelector(".js-filter-files"),t=".navigator-top-nav",n=document.querySelector(t),r=n?.querySelector(".filter-search-wrapper .filer-dropdown-container");e&&(e.addEventListener("keydown",function(){const e=this.closest(t);e&&e.classList.add("search-is-focused")}),r&&(r.addEventListener("show.bs.filer-dropdown",()=>{n&&n.classList.add("search-is-focused")}),r.addEventListener("hide.bs.filer-dropdown",()=>{n&&n.classList.remove("search-is-focused")})))})(),(()=>{const e=document.querySelectorAll(".navigator-table tr, .navigator-list .list-item"),t=document.querySelector(".actions-wrapper"),n=document.querySelectorAll(".action-select, #action-toggle, #files-action-toggle, #folders-action-toggle, .actions .clear a");setTimeout(()=>{n.forEach(e=>{if(e.checked){const t=e.closest(".list-item");t&&t.classList.add("selected")}});Array.from(e).some(e=>e.classList.contains("selected"))&&t&&t.classList.add("action-selected")},100),n.forEach(n=>{n.addEventListener("change",function(){const n=this.closest(".list-item");n&&(this.checked?n.classList.add("selected"):n.classList.remove("selected")),setTimeout(()=>{const n=Array.from(e).some(e=>e.classList.contains("selected"));t&&(n?t.classList.add("action-selected"):t.classList.remove("action-selected"))},0)})})})(),(()=>{const e=document.querySelector(".js-actions-menu");if(!e)return;const t=e.querySelector(".filer-dropdown-menu"),n=document.querySelector('.actions select[name="action"]'),r=n?.querySelectorAll("option")||[],i=document.querySelector('.actions button[type="submit"]'),o=document.querySelector(".js-action-delete"),s=document.querySelector(".js-action-copy"),a=document.querySelector(".js-action-move"),l="delete_files_or_folders",c="copy_files_and_folders",u="move_files_and_folders",d=document.querySelectorAll(".navigator-table tr, .navigator-list .list-item"),f=(e,t)=>{t&&r.forEach(r=>{r.value===e&&(t.style.display="",t.addEventListener("click",t=>{t.preventDefault();if(Array.from(d).some(e=>e.classList.contains("selected"))&&n&&i){n.value=e;const t=n.querySelector(`option[value="${e}"]`);t&&(t.selected=!0),i.click()}}))})};f(l,o),f(c,s),f(u,a),r.forEach((e,n)=>{if(0!==n){const n=document.createElement("li"),r=document.createElement("a");r.href="#",r.textContent=e.textContent,e.value!==l&&e.value!==c&&e.value!==u||r.classList.add("hidden"),n.appendChild(r),t&&t.appendChild(n)}}),t&&t.addEventListener("click",e=>{if("A"===e.target.tagName){const r=e.target.closest("li"),o=Array.from(t.querySelectorAll("li")).indexOf(r)+1;if(e.preventDefault(),n&&i){const e=n.querySelectorAll("option");e[o]&&(e[o].selected=!0),i.click()}}}),e.addEventListener("click",e=>{Array.from(d).some(e=>e.classList.contains("selected"))||(e.preventDefault(),e.stopPropagation())})})(),(()=>{const e=document.querySelector(".navigator-top-nav");if(!e)return;const t=document.querySelector(".breadcrumbs-container");if(!t)return;const n=t.querySelector(".navigator-breadcrumbs"),r=t.querySelector(".filer-dropdown-container"),i=document.querySelector(".filter-files-container"),o=document.querySelector(".actions-wrapper"),s=document.querySelector(".navigator-button-wrapper"),a=n?.offsetWidth||0,l=r?.offsetWidth||0,c=i?.offsetWidth||0,u=o?.offsetWidth||0,d=s?.offsetWidth||0,f=window.getComputedStyle(e),h=parseInt(f.paddingLeft,10)+parseInt(f.paddingRight,10);let p=e.offsetWidth;const v=80+a+l+c+u+d+h,m="breadcrumb-min-width",g=()=>{p<v?e.classList.add(m):e.classList.remove(m)};g(),window.addEventListener("resize",()=>{p=e.offsetWidth,g()})})(),(()=>{const e=document.querySelectorAll(".navigator-list .list-item input.action-select"),t=".navigator-list .navigator-folders-body .list-item input.action-select",n=".navigator-list .navigator-files-body .list-item input.action-select",r=document.querySelector("#files-action-toggle"),i=document.querySelector("#folders-action-toggle");i&&i.addEventListener("click",function(){const e=document.querySelectorAll(t);this.checked?e.forEach(e=>{e.checked||e.click()}):e.forEach(e=>{e.checked&&e.click()})}),r&&r.addEventListener("click",function(){const e=document.querySelectorAll(n);this.checked?e.forEach(e=>{e.checked||e.click()}):e.forEach(e=>{e.checked&&e.click()})}),e.forEach(e=>{e.addEventListener("click",function(){const e=document.querySelectorAll(n),o=document.querySelectorAll(t);if(this.checked){const t=Array.from(e).every(e=>e.checked),n=Array.from(o).every(e=>e.checked);t&&r&&(r.checked=!0),n&&i&&(i.checked=!0)}else{const t=Array.from(e).some(e=>!e.checked),n=Array.from(o).some(e=>!e.checked);t&&r&&(r.checked=!1),n&&i&&(i.checked=!1)}})});const o=document.querySelector(".navigator .actions .clear a");o&&o.addEventListener("click",()=>{i&&(i.checked=!1),r&&(r.checked=!1)})})();document.querySelectorAll(".js-copy-url").forEach(e=>{e.addEventListener("click",function(e){const t=new URL(this.dataset.url,document.location.href),n=this.dataset.msg||"URL copied to clipboard",r=document.createElement("template");e.preventDefault();document.querySelectorAll(".info.filer-tooltip").forEach(e=>{e.remove()}),navigator.clipboard.writeText(t.href),r.innerHTML=`<div class="info filer-tooltip">${n}</div>`,this.classList.add("filer-tooltip-wrapper"),this.appendChild(r.content.firstChild);const i=this;setTimeout(()=>{const e=i.querySelector(".info");e&&e.remove()},1200)})});(new r.A).initialize(),new s})})()})();
\ No newline at end of file
@@ -1,6 +1,26 @@
+import errno
+import functools
+import os
+import shutil
+import sys
+
 from django.core.files.storage import FileSystemStorage
 
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # Not available on Windows
+    fcntl = None
+
+
+# The ioctl() cloning a file on Linux file systems with copy-on-write, like Btrfs or XFS
+FICLONE = getattr(fcntl, 'FICLONE', 0x40049409 if sys.platform.startswith('linux') else None) if fcntl else None
+
+# Errors of os.link() if the file cannot be linked to, e.g. on another file system
+LINK_ERRORS = (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP, errno.EACCES)
+
+
 class PublicFileSystemStorage(FileSystemStorage):
     """
     File system storage that saves its files in the filer public directory
@@ -18,3 +38,156 @@ class PrivateFileSystemStorage(FileSystemStorage):
     See ``filer.settings`` for the defaults for ``location`` and ``base_url``.
     """
     is_secure = True
+
+
+def _is_local(*storages):
+    return all(isinstance(storage, FileSystemStorage) for storage in storages)
+
+
+def _makedirs(storage, directory):
+    # As FileSystemStorage does when saving a file
+    mode = getattr(storage, 'directory_permissions_mode', None)
+    if mode is None:
+        os.makedirs(directory, exist_ok=True)
+        return
+    old_umask = os.umask(0o777 & ~mode)
+    try:
+        os.makedirs(directory, mode, exist_ok=True)
+    finally:
+        os.umask(old_umask)
+
+
+def _create_file(storage, name, create):
+    """
+    Creates the file ``name`` in the local ``storage`` with ``create(path)``,
+    which must raise ``FileExistsError`` if ``path`` exists. Like
+    ``FileSystemStorage``, another name is picked if ``name`` is taken.
+    Returns the name of the created file.
+    """
+    name = storage.get_available_name(name)
+    while True:
+        path = storage.path(name)
+        _makedirs(storage, os.path.dirname(path))
+        try:
+            create(path)
+        except FileExistsError:
+            # Created since the name was picked
+            name = storage.get_available_name(name)
+        else:
+            break
+    mode = getattr(storage, 'file_permissions_mode', None)
+    if mode is not None:
+        os.chmod(path, mode)
+    return str(name).replace('\\', '/')
+
+
+def _copy_data(src, dst):
+    if FICLONE is not None:
+        try:
+            # Shares the data of the file until one of them is changed
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            return
+        except OSError:
+            # Not supported by the file system
+            pass
+    if hasattr(os, 'copy_file_range'):
+        size = os.fstat(src.fileno()).st_size
+        offset = 0
+        try:
+            # Copied within the kernel
+            while offset < size:
+                copied = os.copy_file_range(src.fileno(), dst.fileno(), size - offset)
+                if not copied:
+                    break
+                offset += copied
+        except OSError:
+            # e.g. not supported between these file systems
+            pass
+        if offset >= size:
+            return
+        src.seek(offset)
+        dst.seek(offset)
+        dst.truncate()
+    shutil.copyfileobj(src, dst)
+
+
+def _clone_file(src_path, path):
+    with open(src_path, 'rb') as src:
+        dst = open(path, 'xb')
+        try:
+            with dst:
+                _copy_data(src, dst)
+        except BaseException:
+            os.remove(path)
+            raise
+
+
+def _stream_file(src_storage, src_name, dst_storage, dst_name):
+    src_file = src_storage.open(src_name)
+    try:
+        # This is needed because most of the remote File Storage backend do not
+        # open the file. Re-opening would create a value error.
+        src_file.open()
+    except ValueError:  # pragma: no cover
+        pass
+    with src_file:
+        # Saved chunk by chunk, see django.core.files.File.chunks
+        return dst_storage.save(dst_name, src_file)
+
+
+def copy_file(src_storage, src_name, dst_storage, dst_name, link=False):
+    """
+    Copies the file ``src_name`` of ``src_storage`` to ``dst_name`` in
+    ``dst_storage`` and returns the name it was saved as.
+
+    On the local file system, the file is cloned where the file system
+    supports it (e.g. Btrfs or XFS) and copied by the kernel otherwise. With
+    ``link``, the copy is a hard link to the same data instead, which filer
+    does not write to once stored.
+
+    If ``dst_storage`` implements ``filer_copy(src_storage, src_name,
+    dst_name)``, e.g., to copy objects within a cloud storage, it copies the
+    file unless it raises ``NotImplementedError``. Otherwise the file is
+    streamed from one storage to the other without reading it into memory.
+    """
+    if _is_local(src_storage, dst_storage):
+        src_path = src_storage.path(src_name)
+        if link:
+            try:
+                return _create_file(dst_storage, dst_name, functools.partial(os.link, src_path))
+            except OSError as error:
+                if error.errno not in LINK_ERRORS:
+                    raise
+        return _create_file(dst_storage, dst_name, functools.partial(_clone_file, src_path))
+    server_side_copy = getattr(dst_storage, 'filer_copy', None)
+    if server_side_copy is not None:
+        try:
+            return server_side_copy(src_storage, src_name, dst_name)
+        except NotImplementedError:
+            pass
+    return _stream_file(src_storage, src_name, dst_storage, dst_name)
+
+
+def move_file(src_storage, src_name, dst_storage, dst_name):
+    """
+    Moves the file ``src_name`` of ``src_storage`` to ``dst_name`` in
+    ``dst_storage`` and returns the name it was saved as.
+
+    Between directories of the same local file system, the file is renamed
+    without copying its content. Otherwise it is copied (see ``copy_file``)
+    and deleted from ``src_storage``.
+    """
+    if _is_local(src_storage, dst_storage):
+        try:
+            # Unlike os.replace(), this never overwrites another file
+            name = _create_file(dst_storage, dst_name, functools.partial(os.link, src_storage.path(src_name)))
+        except OSError as error:
+            # e.g. another file system, or links are not supported
+            if error.errno not in LINK_ERRORS:
+                raise
+        else:
+            src_storage.delete(src_name)
+            return name
+    name = copy_file(src_storage, src_name, dst_storage, dst_name)
+    src_storage.delete(src_name)
+    return name
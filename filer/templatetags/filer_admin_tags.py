@@ -21,6 +21,8 @@ from filer.models.imagemodels import BaseImage
 from filer.settings import (
     DEFERRED_THUMBNAIL_SIZES, FILER_MAX_SVG_THUMBNAIL_SIZE, FILER_TABLE_ICON_SIZE, FILER_THUMBNAIL_ICON_SIZE,
 )
+from filer.thumbnail_queue import get_placeholder_url, get_thumbnail_queue
+from filer.utils.filer_easy_thumbnails import ThumbnailRenderError
 
 
 logger = logging.getLogger(__name__)
@@ -157,12 +159,26 @@ def file_icon_context(file, detail, width, height):
                 context['alt_text'] = file.default_alt_text
             else:
                 # Try creating thumbnails / take existing ones
+                queue = get_thumbnail_queue()
                 try:
-                    icon_url = thumbnailer.get_thumbnail(thumbnail_options).url
-                    context['alt_text'] = file.default_alt_text
+                    options_list = [thumbnail_options]
                     if mime_subtype != 'svg+xml':
-                        thumbnail_options['size'] = 2 * width, 2 * height
-                        context['highres_url'] = thumbnailer.get_thumbnail(thumbnail_options).url
+                        options_list.append(ThumbnailOptions(dict(thumbnail_options, size=(2 * width, 2 * height))))
+                    try:
+                        # Renders missing thumbnails of both resolutions from one decode of the image
+                        thumbnail, *highres = thumbnailer.render_thumbnails(options_list, generate=queue is None)
+                    except ThumbnailRenderError as error:
+                        logger.warning("Could not render filer thumbnail for %s: %s", file, error)
+                        thumbnail, *highres = error.thumbnails
+                        if thumbnail is None:
+                            return not_available_context
+                    context['alt_text'] = file.default_alt_text
+                    if queue is not None and None in [thumbnail, *highres]:
+                        # Have a worker generate missing thumbnails
+                        queue.enqueue(file, options_list)
+                    icon_url = thumbnail.url if thumbnail else get_placeholder_url()
+                    if thumbnail and highres and highres[0]:
+                        context['highres_url'] = highres[0].url
                 except (InvalidImageFormatError, NoSourceGenerator):
                     # This is caught by file.exists() for file storage systems
                     # For remote storage systems we catch the error to avoid second trip
@@ -0,0 +1,188 @@
+"""
+Locks preventing several workers from rendering the same thumbnail at once.
+
+When a directory listing with many new images is loaded in several browser
+tabs, every tab requests the same missing thumbnails, and each request would
+decode the source image on its own. Instead, a request rendering a thumbnail
+holds a lock keyed by the thumbnail name (see ``FILER_THUMBNAIL_LOCK``).
+Requests for the same thumbnail wait up to ``FILER_THUMBNAIL_LOCK_WAIT``
+seconds for it and then reuse the rendered thumbnail, or get a placeholder.
+
+* ``FileLock`` uses ``flock()`` on lock files, for thumbnails on local storage
+  served by a single machine,
+* ``CacheLock`` uses the default cache, for deployments sharing the thumbnail
+  storage between machines (with a cache shared between them, e.g. Redis or
+  Memcached).
+
+Contention is counted in ``get_lock_stats()`` and reported with the
+``thumbnail_lock_waited`` signal, e.g., to forward it to a metrics system.
+"""
+import functools
+import hashlib
+import os
+import tempfile
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+
+from django.core.cache import cache
+from django.core.files.storage import FileSystemStorage
+from django.dispatch import Signal
+
+from . import settings as filer_settings
+
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # Not available on Windows
+    fcntl = None
+
+
+#: Sent whenever a lock was held by another worker, with the arguments
+#: ``name``, ``waited`` (seconds) and ``acquired`` (``False`` if the wait
+#: timed out)
+thumbnail_lock_waited = Signal()
+
+_stats = Counter()
+_stats_lock = threading.Lock()
+
+
+def get_lock_stats():
+    """
+    Returns the lock statistics of this process: the number of locks
+    ``acquired``, of those ``contended`` (held by another worker at first),
+    of waits which ``timed_out`` and the total ``wait_seconds``.
+    """
+    with _stats_lock:
+        return dict(_stats)
+
+
+def _record(**counts):
+    with _stats_lock:
+        _stats.update(counts)
+
+
+class ThumbnailLock:
+    """
+    Base class of the thumbnail locks. Subclasses implement ``try_acquire``
+    and ``release``.
+    """
+    #: Seconds between two attempts to acquire a lock held by another worker
+    poll_interval = 0.05
+
+    def try_acquire(self, name):
+        """
+        Acquires the lock ``name`` without waiting. Returns a token to release
+        it with, or ``None`` if the lock is held by another worker.
+        """
+        raise NotImplementedError
+
+    def release(self, name, token):
+        raise NotImplementedError
+
+    @contextmanager
+    def hold(self, name, wait=None):
+        """
+        Holds the lock ``name`` within the context, waiting up to ``wait``
+        seconds (``FILER_THUMBNAIL_LOCK_WAIT`` by default) for it. The context
+        value is ``False`` if the lock could not be acquired in time.
+        """
+        if wait is None:
+            wait = filer_settings.FILER_THUMBNAIL_LOCK_WAIT
+        started = time.monotonic()
+        token = self.try_acquire(name)
+        contended = token is None
+        while token is None and time.monotonic() - started < wait:
+            time.sleep(self.poll_interval)
+            token = self.try_acquire(name)
+        if contended:
+            waited = time.monotonic() - started
+            _record(contended=1, timed_out=int(token is None), wait_seconds=waited)
+            thumbnail_lock_waited.send(sender=self.__class__, name=name, waited=waited, acquired=token is not None)
+        if token is None:
+            yield False
+            return
+        _record(acquired=1)
+        try:
+            yield True
+        finally:
+            self.release(name, token)
+
+
+class FileLock(ThumbnailLock):
+    """
+    Locks with ``flock()`` on files in ``directory``, one per thumbnail name.
+    The lock file is removed when the lock is released, so that lock files
+    do not pile up.
+    """
+
+    def __init__(self, directory=None):
+        self.directory = directory or os.path.join(tempfile.gettempdir(), 'filer-thumbnail-locks')
+        os.makedirs(self.directory, exist_ok=True)
+
+    def get_path(self, name):
+        return os.path.join(self.directory, f'{hashlib.sha1(name.encode()).hexdigest()}.lock')
+
+    def try_acquire(self, name):
+        path = self.get_path(name)
+        lock_file = open(path, 'a')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            # The previous holder may have removed the file after we opened it,
+            # then the lock is on a file another worker can no longer lock
+            if os.fstat(lock_file.fileno()).st_ino != os.stat(path).st_ino:
+                raise FileNotFoundError(path)
+        except OSError:
+            lock_file.close()
+            return None
+        return lock_file
+
+    def release(self, name, token):
+        # Remove the file while holding the lock, then closing it releases the lock
+        try:
+            os.remove(token.name)
+        except FileNotFoundError:
+            pass
+        token.close()
+
+
+class CacheLock(ThumbnailLock):
+    """
+    Locks with ``cache.add()``. Locks expire after ``timeout`` seconds, so a
+    crashed worker does not block a thumbnail forever.
+    """
+    timeout = 60
+
+    def get_key(self, name):
+        return f"filer:thumbnail_lock:{hashlib.sha1(name.encode()).hexdigest()}"
+
+    def try_acquire(self, name):
+        token = uuid.uuid4().hex
+        return token if cache.add(self.get_key(name), token, self.timeout) else None
+
+    def release(self, name, token):
+        key = self.get_key(name)
+        # Do not release the lock of another worker if ours expired
+        if cache.get(key) == token:
+            cache.delete(key)
+
+
+def get_thumbnail_lock(storage):
+    """
+    Returns the lock for thumbnails on ``storage`` configured with
+    ``FILER_THUMBNAIL_LOCK``, or ``None`` if thumbnails are not locked.
+    """
+    kind = filer_settings.FILER_THUMBNAIL_LOCK
+    if kind == 'auto':
+        kind = 'file' if fcntl is not None and isinstance(storage, FileSystemStorage) else 'cache'
+    if kind not in ('file', 'cache'):
+        return None
+    return _load_lock(kind)
+
+
+@functools.lru_cache
+def _load_lock(kind):
+    return FileLock() if kind == 'file' else CacheLock()
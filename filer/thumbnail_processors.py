@@ -1,7 +1,9 @@
+import math
 import re
 
 from easy_thumbnails import processors
 
+from . import settings as filer_settings
 from .settings import FILER_SUBJECT_LOCATION_IMAGE_DEBUG, FILER_WHITESPACE_COLOR
 
 
@@ -16,6 +18,10 @@ except ImportError:
 
 RE_SUBJECT_LOCATION = re.compile(r'^(\d+)\s*,\s*(\d+)$')
 
+#: Key of ``Image.info`` under which ``filer.source_generators.pil_image``
+#: records the size of a source image decoded at a reduced scale
+SOURCE_SIZE_INFO = 'filer_source_size'
+
 
 def normalize_subject_location(subject_location):
     if subject_location:
@@ -32,6 +38,89 @@ def normalize_subject_location(subject_location):
     return False
 
 
+def get_required_source_size(thumbnail_options, source_size):
+    """
+    Returns the smallest size the source image can be reduced to without
+    changing the thumbnail rendered with ``thumbnail_options``, or ``None`` if
+    it must not be reduced (e.g., if the thumbnail is upscaled).
+    """
+    source_x, source_y = source_size
+    target_x, target_y = (float(value or 0) for value in thumbnail_options['size'])
+    if not source_x or not source_y or not (target_x or target_y) or thumbnail_options.get('autocrop'):
+        return None
+    if thumbnail_options.get('crop') or not target_x or not target_y:
+        scale = max(target_x / source_x, target_y / source_y)
+    else:
+        scale = min(target_x / source_x, target_y / source_y)
+    if thumbnail_options.get('zoom'):
+        scale *= (100 + int(thumbnail_options['zoom'])) / 100.0
+    if scale >= 1.0:
+        return None
+    # Tolerate floating point noise, e.g. 400 * 0.15 = 60.00000000000001
+    return math.ceil(source_x * scale - 1e-9), math.ceil(source_y * scale - 1e-9)
+
+
+def reduce_image(image, required_size):
+    """
+    Shrinks ``image`` by an integer factor with ``Image.reduce()`` as long as
+    it stays ``FILER_THUMBNAIL_REDUCING_GAP`` times larger than
+    ``required_size``.
+    """
+    reducing_gap = filer_settings.FILER_THUMBNAIL_REDUCING_GAP
+    if not reducing_gap:
+        return image
+    factor = int(min(image.size[0] / required_size[0], image.size[1] / required_size[1]) / reducing_gap)
+    if factor < 2:
+        return image
+    try:
+        return image.reduce(factor)
+    except ValueError:
+        # Not supported for the image mode (e.g., palette images)
+        return image
+
+
+def resize(im, size):
+    """
+    Resamples ``im`` to ``size`` with the LANCZOS filter. Large reductions
+    first shrink the image by an integer factor with ``Image.reduce()``, see
+    ``FILER_THUMBNAIL_REDUCING_GAP``.
+    """
+    try:
+        resample = Image.LANCZOS
+    except AttributeError:  # pragma: no cover
+        resample = Image.ANTIALIAS
+    return im.resize(size, resample=resample, reducing_gap=filer_settings.FILER_THUMBNAIL_REDUCING_GAP or None)
+
+
+def prescale(im, size, crop=False, zoom=None, source_size=None):
+    """
+    Downscales ``im`` to the size ``easy_thumbnails.processors.scale_and_crop``
+    would resize it to, which then only has to crop it. Unlike
+    ``scale_and_crop``, this takes the fast path of ``resize``.
+
+    The size is rounded like in ``scale_and_crop``, so that ``scale_and_crop``
+    computes a scale of exactly 1 for the downscaled image and does not
+    resample it again. If ``im`` was reduced from an image of ``source_size``,
+    the size is computed from that to match the thumbnail of the full image.
+    """
+    source_x, source_y = source_size or im.size
+    target_x, target_y = (int(v) for v in size)
+    if (
+        zoom or not source_x or not source_y or not (target_x or target_y)
+        or getattr(im, 'n_frames', 1) > 1 or not filer_settings.FILER_THUMBNAIL_REDUCING_GAP
+    ):
+        # Animated images are resized frame by frame by ``scale_and_crop``
+        return im
+    if crop or not target_x or not target_y:
+        scale = max(target_x / source_x, target_y / source_y)
+    else:
+        scale = min(target_x / source_x, target_y / source_y)
+    scaled_size = (int(round(source_x * scale)), int(round(source_y * scale)))
+    if scale >= 1.0 or min(scaled_size) < 1:
+        return im
+    return resize(im, scaled_size)
+
+
 def scale_and_crop_with_subject_location(im, size, subject_location=False,
                                          zoom=None, crop=False, upscale=False,
                                          **kwargs):
@@ -44,10 +133,20 @@ def scale_and_crop_with_subject_location(im, size, subject_location=False,
 
     ``crop`` needs to be set for this to work, but any special cropping
     parameters will be ignored.
+
+    Large reductions are sped up with ``Image.reduce()``, see ``resize``.
     """
     subject_location = normalize_subject_location(subject_location)
+    source_size = im.info.get(SOURCE_SIZE_INFO)
+    if subject_location and source_size and tuple(source_size) != im.size:
+        # The source was decoded at a reduced scale, locate the subject on it
+        subject_location = (
+            round(subject_location[0] * im.size[0] / source_size[0]),
+            round(subject_location[1] * im.size[1] / source_size[1]),
+        )
     if not (subject_location and crop):
         # use the normal scale_and_crop
+        im = prescale(im, size, crop=crop, zoom=zoom, source_size=source_size)
         return processors.scale_and_crop(im, size, zoom=zoom, crop=crop,
                                          upscale=upscale, **kwargs)
 
@@ -76,12 +175,7 @@ def scale_and_crop_with_subject_location(im, size, subject_location=False,
         scale *= (100 + int(zoom)) / 100.0
 
     if scale < 1.0 or (scale > 1.0 and upscale):
-        try:
-            im = im.resize((int(source_x * scale), int(source_y * scale)),
-                           resample=Image.LANCZOS)
-        except AttributeError:  # pragma: no cover
-            im = im.resize((int(source_x * scale), int(source_y * scale)),
-                           resample=Image.ANTIALIAS)
+        im = resize(im, (int(source_x * scale), int(source_y * scale)))
 
     # --endsnip-- begin real code
 
@@ -0,0 +1,246 @@
+"""
+Background generation of admin thumbnails.
+
+Without a queue, thumbnails missing in the admin are generated while the
+request is being served, which blocks the worker for as long as decoding the
+source image takes. With ``FILER_THUMBNAIL_QUEUE`` set, the admin enqueues the
+missing thumbnails and shows a placeholder until they exist:
+
+* ``ThreadPoolQueue`` generates thumbnails in a pool of threads of the web
+  server process,
+* ``DatabaseQueue`` stores jobs in the ``ThumbnailJob`` table, which are
+  processed by the ``filer_thumbnail_worker`` management command.
+
+Both queues hold at most one job per file and set of thumbnail options,
+``ThreadPoolQueue`` only within the process though.
+"""
+import functools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.db import close_old_connections, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from easy_thumbnails.files import get_thumbnailer
+
+from . import settings as filer_settings
+from .models import File, ThumbnailJob
+from .utils.filer_easy_thumbnails import ThumbnailRenderError, get_thumbnail_index_key
+from .utils.loader import load_object
+
+
+logger = logging.getLogger(__name__)
+
+PLACEHOLDER_ICON = 'filer/icons/file-picture.svg'
+
+
+def get_thumbnail_queue():
+    """
+    Returns the queue configured with ``FILER_THUMBNAIL_QUEUE``, or ``None`` if
+    thumbnails are generated synchronously.
+    """
+    path = filer_settings.FILER_THUMBNAIL_QUEUE
+    if not path:
+        return None
+    return _load_queue(path)
+
+
+@functools.lru_cache
+def _load_queue(path):
+    return load_object(path)()
+
+
+def get_placeholder_url():
+    """Returns the URL of the icon shown while a thumbnail is being generated."""
+    return staticfiles_storage.url(PLACEHOLDER_ICON)
+
+
+def get_job_options(thumbnail_options):
+    """Returns the thumbnail options in a form which can be stored as JSON."""
+    return {key: list(value) if isinstance(value, tuple) else value for key, value in thumbnail_options.items()}
+
+
+class ThumbnailQueue:
+    """
+    Base class of the thumbnail queues. Subclasses implement ``submit`` which
+    schedules ``run`` for a file and the thumbnail options not yet queued for
+    it.
+    """
+
+    def enqueue(self, file, options_list):
+        """
+        Schedules the generation of the thumbnails of ``file`` for each of the
+        thumbnail options in ``options_list``.
+        """
+        jobs = {get_thumbnail_index_key(options): get_job_options(options) for options in options_list}
+        if jobs:
+            self.submit(file.pk, jobs)
+
+    def submit(self, file_id, jobs):
+        """
+        Schedules the ``{options key: thumbnail options}`` jobs of the file
+        ``file_id`` unless they are already queued.
+        """
+        raise NotImplementedError
+
+    def run(self, file_id, options_list):
+        """
+        Generates the thumbnails of the file ``file_id`` and records them in
+        the thumbnail index. A thumbnail which cannot be generated does not
+        prevent the others from being recorded. Returns the ``{index in
+        options_list: error}`` of the failed thumbnails.
+        """
+        file = File.objects.filter(pk=file_id).first()
+        if file is None:
+            return {}
+        options_list = [dict(options, size=tuple(options['size'])) for options in options_list]
+        try:
+            thumbnails = get_thumbnailer(file).render_thumbnails(options_list, generate=True)
+            errors = {}
+        except ThumbnailRenderError as e:
+            thumbnails, errors = e.thumbnails, e.errors
+        except Exception as e:
+            # A broken source must not stop the remaining jobs
+            if filer_settings.FILER_DEBUG:
+                raise
+            thumbnails, errors = [None] * len(options_list), dict.fromkeys(range(len(options_list)), e)
+        for index, error in errors.items():
+            logger.error(
+                "Could not generate thumbnail %s of file %s: %s",
+                get_thumbnail_index_key(options_list[index]), file_id, error,
+            )
+        file.index_thumbnails({
+            get_thumbnail_index_key(options): thumbnail.name
+            for options, thumbnail in zip(options_list, thumbnails) if thumbnail is not None
+        })
+        return errors
+
+
+class ThreadPoolQueue(ThumbnailQueue):
+    """
+    Generates thumbnails in a pool of ``FILER_THUMBNAIL_QUEUE_WORKERS`` threads
+    of the current process. Jobs are submitted when the current transaction
+    commits, so that the workers see the files the jobs belong to.
+
+    Pending jobs are only known to this process: other server processes may
+    queue and generate the same thumbnails at the same time. Use
+    ``DatabaseQueue`` to deduplicate jobs between processes.
+    """
+
+    def __init__(self, workers=None):
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers or filer_settings.FILER_THUMBNAIL_QUEUE_WORKERS,
+            thread_name_prefix='filer-thumbnails',
+        )
+        self.pending = set()
+        self.lock = threading.Lock()
+
+    def submit(self, file_id, jobs):
+        # Jobs only become pending on commit, jobs of a rolled back transaction are dropped
+        transaction.on_commit(functools.partial(self.schedule, file_id, jobs))
+
+    def schedule(self, file_id, jobs):
+        """
+        Submits the jobs of the file ``file_id`` to the pool of threads unless
+        they are already pending.
+        """
+        with self.lock:
+            keys = [key for key in jobs if (file_id, key) not in self.pending]
+            self.pending.update((file_id, key) for key in keys)
+        if keys:
+            self.executor.submit(self.work, file_id, keys, [jobs[key] for key in keys])
+
+    def work(self, file_id, keys, options_list):
+        # Failed thumbnails are logged by run(); the next request of one enqueues it again
+        try:
+            self.run(file_id, options_list)
+        except Exception:
+            logger.exception("Could not generate thumbnails of file %s", file_id)
+        finally:
+            with self.lock:
+                self.pending.difference_update((file_id, key) for key in keys)
+            close_old_connections()
+
+
+class DatabaseQueue(ThumbnailQueue):
+    """
+    Stores jobs in the ``ThumbnailJob`` table. The jobs are processed by one
+    or more ``filer_thumbnail_worker`` processes, possibly on other machines.
+    """
+    #: Jobs claimed longer ago than this are considered abandoned by a crashed worker
+    claim_timeout = timedelta(minutes=10)
+    #: Number of times the generation of a thumbnail is attempted before its job is dropped
+    max_attempts = 3
+
+    def submit(self, file_id, jobs):
+        ThumbnailJob.objects.bulk_create(
+            [ThumbnailJob(file_id=file_id, key=key, options=options) for key, options in jobs.items()],
+            ignore_conflicts=True,
+        )
+
+    def claim(self, batch_size):
+        """
+        Claims up to ``batch_size`` jobs, the oldest first. A job is claimed
+        with a conditional update, so concurrent workers never process the
+        same job.
+        """
+        now = timezone.now()
+        candidates = ThumbnailJob.objects.filter(
+            Q(claimed_at__isnull=True) | Q(claimed_at__lt=now - self.claim_timeout)
+        ).order_by('created_at', 'pk')[:batch_size]
+        claimed = []
+        for job in candidates:
+            if ThumbnailJob.objects.filter(pk=job.pk, claimed_at=job.claimed_at).update(claimed_at=now):
+                claimed.append(job)
+        return claimed
+
+    def process(self, batch_size=10):
+        """
+        Generates the thumbnails of a batch of jobs. Returns the number of
+        processed jobs.
+
+        The jobs of thumbnails which could not be generated stay claimed, so
+        that they are retried once ``claim_timeout`` has elapsed, up to
+        ``max_attempts`` times.
+        """
+        jobs = self.claim(batch_size)
+        by_file = {}
+        for job in jobs:
+            by_file.setdefault(job.file_id, []).append(job)
+        for file_id, file_jobs in by_file.items():
+            # Until run() returns, every job of the file counts as failed
+            errors = dict.fromkeys(range(len(file_jobs)))
+            try:
+                errors = self.run(file_id, [job.options for job in file_jobs])
+            finally:
+                failed = [job for index, job in enumerate(file_jobs) if index in errors]
+                retried = [job.pk for job in failed if job.attempts + 1 < self.max_attempts]
+                for job in failed:
+                    if job.pk not in retried:
+                        logger.error(
+                            "Dropping thumbnail job %s of file %s after %s attempts",
+                            job.key, file_id, self.max_attempts,
+                        )
+                ThumbnailJob.objects.filter(pk__in=retried).update(attempts=F('attempts') + 1)
+                ThumbnailJob.objects.filter(pk__in=[job.pk for job in file_jobs if job.pk not in retried]).delete()
+        return len(jobs)
+
+    def work(self, batch_size=10, interval=1.0, once=False):
+        """
+        Processes jobs until interrupted, or until no job is left if ``once``
+        is set. Waits ``interval`` seconds whenever the queue is empty.
+        """
+        processed = 0
+        while True:
+            count = self.process(batch_size)
+            processed += count
+            if not count:
+                if once:
+                    return processed
+                time.sleep(interval)
+            close_old_connections()
@@ -0,0 +1,138 @@
+"""
+Trash of files and folders.
+
+With ``FILER_ENABLE_TRASH``, the admin moves deleted files and folders to the
+trash rather than deleting them. Trashing sets ``trashed_at`` on the items and
+on everything below the folders with one update per model, without touching
+the storage; the items are then hidden from the directory listing, the search
+and the serving views, and the folder statistics no longer count them.
+
+Items trashed together are restored together, with the same cheap update.
+Items trashed before their folder stay in the trash when the folder is
+restored. ``filer_purge_trash`` deletes the items which have been in the trash
+for ``FILER_TRASH_RETENTION_DAYS`` days, see ``filer.deletion``.
+"""
+import itertools
+from datetime import timedelta
+
+from django.db import router, transaction
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
+from . import settings as filer_settings
+from .deletion import _get_pks, delete_files_and_folders
+from .models import File, Folder
+from .models.foldermodels import parse_tree_path
+
+
+def trash(files=(), folders=()):
+    """
+    Moves ``files`` and ``folders`` with all their contents to the trash.
+    Both may be querysets or iterables of instances or ids. Items already in
+    the trash are left alone. Returns the number of trashed files and folders.
+    """
+    now = timezone.now()
+    with transaction.atomic(using=router.db_for_write(File)):
+        subtrees = Folder.objects.subtrees_of(
+            Folder.objects.filter(pk__in=_get_pks(folders), trashed_at__isnull=True)
+        ).filter(trashed_at__isnull=True)
+        tree_paths = dict(subtrees.values_list('pk', 'tree_path'))
+        root_ids = [
+            pk for pk, tree_path in tree_paths.items()
+            if not set(parse_tree_path(tree_path)).intersection(tree_paths)
+        ]
+        loose_file_ids = list(
+            File.objects.filter(pk__in=_get_pks(files), trashed_at__isnull=True)
+            .exclude(folder__in=subtrees.values('pk')).values_list('pk', flat=True)
+        )
+        with Folder.objects.deferred_statistics():
+            # The trashed folders keep their own statistics for their restore
+            roots = Folder.objects.filter(pk__in=root_ids).values_list(
+                'parent_id', '_total_file_count', '_total_size', '_total_children_count',
+            )
+            for parent_id, file_count, size, children_count in roots:
+                Folder.objects.update_statistics(
+                    parent_id, children_count=-1, total_file_count=-file_count, total_size=-size,
+                    total_children_count=-children_count - 1,
+                )
+            file_stats = (
+                File.objects.filter(pk__in=loose_file_ids).order_by()
+                .values_list('folder_id').annotate(Count('pk'), Sum('_file_size'))
+            )
+            for folder_id, file_count, size in file_stats:
+                Folder.objects.update_statistics(folder_id, file_count=-file_count, size=-(size or 0))
+            file_count = File.objects.filter(
+                Q(pk__in=loose_file_ids) | Q(folder__in=subtrees.values('pk'), trashed_at__isnull=True)
+            ).update(trashed_at=now)
+            folder_count = Folder.objects.filter(pk__in=subtrees.values('pk')).update(trashed_at=now)
+    return file_count, folder_count
+
+
+def _get_available_name(folder):
+    siblings = Folder.objects.filter(parent_id=folder.parent_id, trashed_at__isnull=True)
+    count = itertools.count(1)
+    name = folder.name
+    while siblings.filter(name=name).exists():
+        name = f"{folder.name}_{next(count)}"
+    return name
+
+
+def restore(files=(), folders=()):
+    """
+    Restores ``files`` and ``folders`` from the trash together with the items
+    trashed along with them. Items in a folder which is in the trash are left
+    alone; the folder has to be restored. A restored folder is renamed if its
+    name has been taken in the meantime. Returns the number of restored files
+    and folders.
+    """
+    file_count = folder_count = 0
+    with transaction.atomic(using=router.db_for_write(File)):
+        roots = Folder.objects.filter(pk__in=_get_pks(folders), trashed_at__isnull=False).filter(
+            Q(parent__isnull=True) | Q(parent__trashed_at__isnull=True)
+        )
+        loose_files = File.objects.filter(pk__in=_get_pks(files), trashed_at__isnull=False)
+        with Folder.objects.deferred_statistics():
+            for folder in roots:
+                folder_ids = Folder.objects.subtrees_of([folder]).filter(trashed_at=folder.trashed_at).values('pk')
+                file_count += File.objects.filter(
+                    folder__in=folder_ids, trashed_at=folder.trashed_at,
+                ).update(trashed_at=None)
+                name = _get_available_name(folder)
+                if name != folder.name:
+                    # Saved to update the search index and the cached paths
+                    folder.name = name
+                    folder.save(update_fields=['name'])
+                folder_count += Folder.objects.filter(pk__in=folder_ids).update(trashed_at=None)
+                Folder.objects.update_statistics(
+                    folder.parent_id, children_count=1, total_file_count=folder._total_file_count,
+                    total_size=folder._total_size, total_children_count=folder._total_children_count + 1,
+                )
+            # Evaluated after the folders, whose files may have been restored with them
+            loose_file_ids = list(
+                loose_files.filter(Q(folder__isnull=True) | Q(folder__trashed_at__isnull=True))
+                .values_list('pk', flat=True)
+            )
+            file_stats = (
+                File.objects.filter(pk__in=loose_file_ids).order_by()
+                .values_list('folder_id').annotate(Count('pk'), Sum('_file_size'))
+            )
+            for folder_id, count, size in file_stats:
+                Folder.objects.update_statistics(folder_id, file_count=count, size=size or 0)
+            file_count += File.objects.filter(pk__in=loose_file_ids).update(trashed_at=None)
+    return file_count, folder_count
+
+
+def purge_trash(days=None, batch_size=500):
+    """
+    Deletes the files and folders which have been in the trash for more than
+    ``days`` days, ``FILER_TRASH_RETENTION_DAYS`` by default, along with their
+    stored files. Returns the number of deleted files and folders.
+    """
+    if days is None:
+        days = filer_settings.FILER_TRASH_RETENTION_DAYS
+    trashed_before = timezone.now() - timedelta(days=days)
+    return delete_files_and_folders(
+        files=File.objects.filter(trashed_at__lt=trashed_before),
+        folders=Folder.objects.filter(trashed_at__lt=trashed_before),
+        batch_size=batch_size,
+    )
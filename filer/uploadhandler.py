@@ -0,0 +1,61 @@
+"""
+Upload handlers computing file data while an upload is being received.
+"""
+import hashlib
+import os
+
+from django.core.files.uploadhandler import FileUploadHandler
+
+
+class Sha1UploadHandler(FileUploadHandler):
+    """
+    Computes the SHA-1 digest and the size of uploaded files chunk by chunk,
+    passing the data on to the next upload handler, which stores it.
+
+    ``annotate`` sets the digest as ``sha1`` on the uploaded file, which
+    ``File`` uses instead of reading the whole file again after the upload.
+    """
+
+    def __init__(self, request=None):
+        super().__init__(request)
+        # (file name, size, digest) of each file received
+        self.digests = []
+
+    @classmethod
+    def install(cls, request):
+        """
+        Makes a new handler the first upload handler of ``request`` and
+        returns it, or ``None`` if the upload has already been processed.
+        """
+        handler = cls(request)
+        try:
+            request.upload_handlers = [handler, *request.upload_handlers]
+        except AttributeError:
+            # The request body has been read, e.g., by a middleware accessing request.POST
+            return None
+        return handler
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.sha = hashlib.sha1()
+        self.size = 0
+
+    def receive_data_chunk(self, raw_data, start):
+        self.sha.update(raw_data)
+        self.size += len(raw_data)
+        return raw_data
+
+    def file_complete(self, file_size):
+        self.digests.append((os.path.basename(self.file_name or ''), self.size, self.sha.hexdigest()))
+        # The next handler returns the uploaded file
+        return None
+
+    def annotate(self, upload):
+        """
+        Sets ``sha1`` on the uploaded file ``upload`` if this handler received
+        its data.
+        """
+        for file_name, size, sha1 in self.digests:
+            if file_name == upload.name and size == upload.size:
+                upload.sha1 = sha1
+                return
@@ -1,6 +1,39 @@
+import math
 import os
+from io import BytesIO
 
-from easy_thumbnails.files import Thumbnailer
+from django.core.files.base import ContentFile
+from django.utils.module_loading import import_string
+
+from easy_thumbnails import engine, exceptions, utils
+from easy_thumbnails.conf import settings
+from easy_thumbnails.files import Thumbnailer, ThumbnailFile
+from easy_thumbnails.options import ThumbnailOptions
+from PIL import Image, ImageFile
+
+from ..source_generators import draft_image
+from ..thumbnail_processors import SOURCE_SIZE_INFO, get_required_source_size, reduce_image
+
+
+#: Processors which only depend on the source image through the scale they
+#: compute from its size. Sources may be downscaled before they run.
+#: ``autocrop`` does not, but thumbnails with the ``autocrop`` option are
+#: always rendered from the full image (see ``get_required_source_size``).
+SCALE_INVARIANT_PROCESSORS = {
+    'easy_thumbnails.processors.colorspace',
+    'easy_thumbnails.processors.autocrop',
+    'easy_thumbnails.processors.scale_and_crop',
+    'easy_thumbnails.processors.filters',
+    'easy_thumbnails.processors.background',
+    'filer.thumbnail_processors.scale_and_crop_with_subject_location',
+}
+
+#: Source generators decoding images with Pillow, which the renderer replaces
+#: by a single decode for all thumbnails
+PIL_SOURCE_GENERATORS = {
+    'easy_thumbnails.source_generators.pil_image',
+    'filer.source_generators.pil_image',
+}
 
 
 def thumbnail_to_original_filename(thumbnail_name):
@@ -9,6 +42,232 @@ def thumbnail_to_original_filename(thumbnail_name):
     return thumbnail_name.rsplit('__', 1)[0]
 
 
+def get_thumbnail_index_key(thumbnail_options):
+    """
+    Returns the key under which thumbnails generated with ``thumbnail_options``
+    are kept in the thumbnail index, e.g., ``"40x40_crop"``.
+
+    Quality, subsampling and subject location are left out: they depend on
+    the storage and change with edits of an image, and callers compare the
+    indexed thumbnail name with the expected one anyway.
+    """
+    thumbnail_options = ThumbnailOptions(thumbnail_options)
+    thumbnail_options.pop('subject_location', None)
+    size, quality, *opts = thumbnail_options.prepared_options()
+    return '_'.join([size] + opts)[:255]
+
+
+class ThumbnailIndexMixin:
+    """
+    Records every thumbnail saved for a filer file in the file's thumbnail
+    index. ``instance`` is the filer file the thumbnails belong to.
+    """
+    instance = None
+
+    def save_thumbnail(self, thumbnail):
+        super().save_thumbnail(thumbnail)
+        if hasattr(self.instance, 'index_thumbnails'):
+            self.instance.index_thumbnails({get_thumbnail_index_key(thumbnail.thumbnail_options): thumbnail.name})
+
+
+class ThumbnailRenderError(exceptions.EasyThumbnailsError):
+    """
+    Raised when some of several thumbnails could not be rendered.
+    ``thumbnails`` holds the thumbnails which were rendered, with ``None`` in
+    place of the failed ones, and ``errors`` maps the indexes of the failed
+    thumbnails to their exceptions.
+    """
+
+    def __init__(self, thumbnails, errors):
+        self.thumbnails = thumbnails
+        self.errors = errors
+        super().__init__("Could not render {} of {} thumbnails: {}".format(
+            len(errors), len(thumbnails), '; '.join(str(error) for error in errors.values()),
+        ))
+
+
+class ThumbnailRenderMixin:
+    """
+    Renders several thumbnails of a source image at once. The source is read
+    and decoded only once: JPEGs are decoded at the smallest DCT scale that is
+    still large enough for all thumbnails, and each thumbnail is resampled
+    from the smallest intermediate image large enough for it, rendering the
+    largest thumbnails first.
+    """
+
+    def render_thumbnails(self, thumbnail_options_list, save=True, generate=None):
+        """
+        Returns a list with a ``ThumbnailFile`` for each of the thumbnail
+        options like ``get_thumbnail``. Missing thumbnails are rendered
+        together, unless ``generate`` is ``False`` in which case they are
+        ``None``. If only some of them fail, the others are saved and
+        ``ThumbnailRenderError`` is raised.
+        """
+        if generate is None:
+            generate = self.generate
+        thumbnail_options_list = [self.get_options(options) for options in thumbnail_options_list]
+        thumbnails = [self.get_existing_thumbnail(options) for options in thumbnail_options_list]
+        missing = [index for index, thumbnail in enumerate(thumbnails) if not thumbnail]
+        if missing and generate:
+            try:
+                rendered = self.generate_thumbnails([thumbnail_options_list[index] for index in missing])
+                errors = {}
+            except ThumbnailRenderError as error:
+                rendered = error.thumbnails
+                errors = {missing[index]: exception for index, exception in error.errors.items()}
+            for index, thumbnail in zip(missing, rendered):
+                if thumbnail is None:
+                    continue
+                if save:
+                    self.save_thumbnail(thumbnail)
+                thumbnails[index] = thumbnail
+            if errors:
+                raise ThumbnailRenderError(thumbnails, errors)
+        return thumbnails
+
+    def generate_thumbnail(self, thumbnail_options, silent_template_exception=False):
+        """
+        Like ``Thumbnailer.generate_thumbnail``, but the source is decoded like
+        in ``render_thumbnails``, i.e., JPEGs at a reduced scale, also with
+        easy-thumbnails' default ``THUMBNAIL_SOURCE_GENERATORS``.
+        """
+        if os.path.splitext(self.name)[1][1:].lower() == 'svg':
+            return super().generate_thumbnail(thumbnail_options, silent_template_exception)
+        try:
+            return self.generate_thumbnails([self.get_options(thumbnail_options)])[0]
+        except ThumbnailRenderError as error:
+            raise error.errors[0]
+
+    def generate_thumbnails(self, thumbnail_options_list):
+        """
+        Returns unsaved ``ThumbnailFile`` objects for the thumbnail options, decoding
+        the source image only once. Raises ``ThumbnailRenderError`` with the
+        other thumbnails if some of them cannot be rendered.
+        """
+        thumbnails = [None] * len(thumbnail_options_list)
+        errors = {}
+        for index, thumbnail_options in enumerate(thumbnail_options_list):
+            if max(float(value or 0) for value in thumbnail_options['size']) <= 0:
+                msg = "The source image has an invalid size ({0}x{1})"
+                errors[index] = exceptions.EasyThumbnailsError(msg.format(*thumbnail_options['size']))
+        pending = [index for index in range(len(thumbnail_options_list)) if index not in errors]
+        if pending and os.path.splitext(self.name)[1][1:].lower() == 'svg':
+            for index in pending:
+                try:
+                    thumbnails[index] = super().generate_thumbnail(thumbnail_options_list[index])
+                except Exception as error:
+                    errors[index] = error
+            pending = []
+        if pending:
+            self.render_from_source(thumbnail_options_list, pending, thumbnails, errors)
+        if errors:
+            raise ThumbnailRenderError(thumbnails, errors)
+        return thumbnails
+
+    def render_from_source(self, thumbnail_options_list, indexes, thumbnails, errors):
+        """
+        Renders the thumbnails ``indexes`` of ``thumbnail_options_list`` into
+        ``thumbnails`` from one decode of the source image. Failures of single
+        thumbnails are recorded in ``errors``; failures to read the source
+        are raised.
+        """
+        thumbnail_options_list = [thumbnail_options_list[index] for index in indexes]
+
+        processors = self.thumbnail_processors or [import_string(name) for name in settings.THUMBNAIL_PROCESSORS]
+        reducible = all(
+            f'{processor.__module__}.{processor.__name__}' in SCALE_INVARIANT_PROCESSORS for processor in processors
+        )
+        source, source_size = self.get_source_image(thumbnail_options_list, reducible)
+        if source is None:
+            msg = "The source file does not appear to be an image: '{name}'"
+            raise exceptions.InvalidImageFormatError(msg.format(name=self.name))
+
+        # Failures of single thumbnails are recorded, the other thumbnails are still rendered
+        required_sizes = {}
+        for index, thumbnail_options in enumerate(thumbnail_options_list):
+            try:
+                required_sizes[index] = get_required_source_size(thumbnail_options, source_size) if reducible else None
+            except Exception as error:
+                errors[indexes[index]] = error
+
+        # Largest first, so that each intermediate image can be reduced further for the next one
+        order = sorted(required_sizes, key=lambda index: -math.prod(required_sizes[index] or source_size))
+        intermediate = source
+        for index in order:
+            size = required_sizes[index]
+            try:
+                if size is None:
+                    image = source
+                else:
+                    image = intermediate = reduce_image(intermediate, size)
+                thumbnails[indexes[index]] = self.render_thumbnail(
+                    image, source_size, thumbnail_options_list[index], processors,
+                )
+            except Exception as error:
+                errors[indexes[index]] = error
+
+    def get_source_image(self, thumbnail_options_list, reducible):
+        """
+        Returns the decoded source image and its full size (after applying the
+        EXIF orientation). JPEGs are decoded with ``draft()`` if all
+        thumbnails allow it.
+        """
+        generators = self.source_generators or [
+            import_string(name) for name in settings.THUMBNAIL_SOURCE_GENERATORS
+        ]
+        if not generators or f'{generators[0].__module__}.{generators[0].__name__}' not in PIL_SOURCE_GENERATORS:
+            image = engine.generate_source_image(self, thumbnail_options_list[0], generators, fail_silently=False)
+            return image, image.size if image else None
+        was_closed = getattr(self, 'closed', False)
+        try:
+            self.open()
+        except Exception:
+            # Not all files can be reopened, and the source may be missing
+            try:
+                self.seek(0)
+            except Exception:
+                return None, None
+        try:
+            data = self.read()
+        finally:
+            if was_closed:
+                self.close()
+        try:
+            image = Image.open(BytesIO(data))
+        except Exception:
+            # Not a bitmap, let the remaining source generators try
+            image = engine.generate_source_image(self, thumbnail_options_list[0], generators[1:])
+            return image, image.size if image else None
+        source_size = draft_image(image, thumbnail_options_list if reducible else [])
+        try:
+            ImageFile.LOAD_TRUNCATED_IMAGES = True
+            image.load()
+        finally:
+            ImageFile.LOAD_TRUNCATED_IMAGES = False
+        return utils.exif_orientation(image), source_size
+
+    def render_thumbnail(self, image, source_size, thumbnail_options, processors=None):
+        """
+        Renders a thumbnail from ``image``, the source image possibly reduced
+        from ``source_size``. ``scale_and_crop_with_subject_location`` sizes
+        the thumbnail and locates the subject relative to ``source_size``.
+        """
+        image.info[SOURCE_SIZE_INFO] = source_size
+        thumbnail_image = engine.process_image(image, thumbnail_options, processors)
+        filename = self.get_thumbnail_name(thumbnail_options, transparent=utils.is_transparent(thumbnail_image))
+        data = engine.save_pil_image(
+            thumbnail_image, filename=filename, quality=thumbnail_options['quality'],
+            subsampling=thumbnail_options['subsampling'],
+            keep_icc_profile=thumbnail_options.get('keep_icc_profile', False),
+        ).read()
+        thumbnail = ThumbnailFile(
+            filename, file=ContentFile(data), storage=self.thumbnail_storage, thumbnail_options=thumbnail_options,
+        )
+        thumbnail.image = thumbnail_image
+        thumbnail._committed = False
+        return thumbnail
+
+
 class ThumbnailerNameMixin:
     thumbnail_basedir = ''
     thumbnail_subdir = ''
@@ -79,9 +338,10 @@ class ActionThumbnailerMixin:
         return False
 
 
-class FilerThumbnailer(ThumbnailerNameMixin, Thumbnailer):
+class FilerThumbnailer(ThumbnailIndexMixin, ThumbnailRenderMixin, ThumbnailerNameMixin, Thumbnailer):
     def __init__(self, *args, **kwargs):
         self.thumbnail_basedir = kwargs.pop('thumbnail_basedir', '')
+        self.instance = kwargs.pop('instance', None)
         super().__init__(*args, **kwargs)
 
 
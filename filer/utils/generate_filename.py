@@ -18,6 +18,16 @@ def randomized(instance, filename):
             get_valid_filename(filename))
 
 
+def content_addressed(instance, filename):
+    """
+    Names the file by the SHA-1 digest of its content, so that files with the
+    same content share a name (see ``FILER_DEDUPLICATE_FILES``).
+    """
+    sha1 = instance.sha1
+    extension = os.path.splitext(get_valid_filename(filename))[1].lower()
+    return os.path.join(sha1[0:2], sha1[2:4], sha1 + extension)
+
+
 class prefixed_factory:
     def __init__(self, upload_to, prefix):
         self.upload_to = upload_to
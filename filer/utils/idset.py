@@ -0,0 +1,99 @@
+import zlib
+from array import array
+from bisect import bisect_right
+
+
+class IdSet:
+    """
+    Compact set of non-negative integer ids, e.g., folder ids.
+
+    The ids are kept as sorted runs of consecutive ids (``[start, end)``), so
+    the memory used depends on the number of runs rather than on the largest
+    id, and membership tests are a binary search over the runs. Ids usually
+    come in runs since folders are numbered in the order they were created and
+    permissions are granted on whole subtrees. When pickled (e.g., for the
+    cache) the runs are delta encoded and compressed.
+
+    An ``inverted`` set contains every id *except* the ones stored. This is how
+    "all folders except the denied ones" is represented without having to
+    enumerate all folders. Inverted sets cannot be iterated or counted.
+    """
+    __slots__ = ('_starts', '_ends', 'inverted')
+
+    # Compares equal to sets, which are not hashable either
+    __hash__ = None
+
+    def __init__(self, ids=(), inverted=False):
+        self._starts = array('q')
+        self._ends = array('q')
+        for pk in sorted(set(ids)):
+            if self._ends and self._ends[-1] == pk:
+                self._ends[-1] = pk + 1
+            else:
+                self._starts.append(pk)
+                self._ends.append(pk + 1)
+        self.inverted = inverted
+
+    def _stored(self, pk):
+        index = bisect_right(self._starts, pk) - 1
+        return index >= 0 and pk < self._ends[index]
+
+    def __contains__(self, pk):
+        if not isinstance(pk, int) or pk < 0:
+            return False
+        return self._stored(pk) != self.inverted
+
+    def __iter__(self):
+        if self.inverted:
+            raise TypeError("An inverted IdSet cannot be iterated.")
+        for start, end in zip(self._starts, self._ends):
+            yield from range(start, end)
+
+    def __len__(self):
+        if self.inverted:
+            raise TypeError("An inverted IdSet has no length.")
+        return sum(self._ends) - sum(self._starts)
+
+    def __bool__(self):
+        return self.inverted or bool(self._starts)
+
+    def __eq__(self, other):
+        if isinstance(other, IdSet):
+            return (
+                self.inverted == other.inverted
+                and self._starts == other._starts
+                and self._ends == other._ends
+            )
+        if isinstance(other, (set, frozenset)) and not self.inverted:
+            return set(self) == other
+        return NotImplemented
+
+    def __repr__(self):
+        runs = ', '.join(
+            str(start) if end == start + 1 else f'{start}-{end - 1}'
+            for start, end in zip(self._starts, self._ends)
+        )
+        return f"<{self.__class__.__name__}: {'all except ' if self.inverted else ''}[{runs}]>"
+
+    def __getstate__(self):
+        # Gaps and run lengths are small numbers which compress well
+        deltas = array('q')
+        previous_end = 0
+        for start, end in zip(self._starts, self._ends):
+            deltas.append(start - previous_end)
+            deltas.append(end - start)
+            previous_end = end
+        return zlib.compress(deltas.tobytes()), self.inverted
+
+    def __setstate__(self, state):
+        data, self.inverted = state
+        deltas = array('q')
+        deltas.frombytes(zlib.decompress(data))
+        self._starts = array('q')
+        self._ends = array('q')
+        end = 0
+        for index in range(0, len(deltas), 2):
+            start = end + deltas[index]
+            end = start + deltas[index + 1]
+            self._starts.append(start)
+            self._ends.append(end)
@@ -1,4 +1,8 @@
+from datetime import datetime
+
+from django.conf import settings
 from django.core.files.storage import default_storage as storage
+from django.utils.timezone import get_current_timezone, make_aware
 
 from ..utils.compatibility import PILExifTags, PILImage
 
@@ -21,6 +25,23 @@ def get_exif_for_file(file_obj):
     return get_exif(im)
 
 
+def get_date_taken(exif_data):
+    """
+    Returns the ``DateTimeOriginal`` of the EXIF data, e.g.
+    ``"2024:05:31 18:30:00"``, as a datetime, or ``None``.
+    """
+    try:
+        d, t = exif_data['DateTimeOriginal'].split(" ")
+        year, month, day = d.split(':')
+        hour, minute, second = t.split(':')
+        date_taken = datetime(int(year), int(month), int(day), int(hour), int(minute), int(second))
+        if getattr(settings, "USE_TZ", False):
+            date_taken = make_aware(date_taken, get_current_timezone())
+    except Exception:
+        return None
+    return date_taken
+
+
 def get_subject_location(exif_data):
     try:
         r = (int(exif_data['SubjectLocation'][0]), int(exif_data['SubjectLocation'][1]),)
@@ -1,24 +1,129 @@
-from zipfile import ZipFile
+import hashlib
+import mimetypes
+from pathlib import PurePosixPath
+from zipfile import BadZipFile, ZipFile
 
-from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.files.uploadedfile import TemporaryUploadedFile
+
+from .. import settings as filer_settings
+from .files import UploadException
+
+
+CHUNK_SIZE = 64 * 1024
+
+
+def is_zip(filename, mime_type=None):
+    return mime_type in ('application/zip', 'application/x-zip-compressed') or filename.lower().endswith('.zip')
+
+
+def _get_member_path(zipinfo):
+    """
+    Returns the folder names and the file name of an archive member, or
+    ``None`` for directories and meta files (e.g. ``__MACOSX/``).
+    """
+    if zipinfo.is_dir() or zipinfo.filename.startswith('__'):  # do not process meta files
+        return None
+    # Neither leave the folder extracted to nor use absolute paths
+    parts = [
+        part for part in PurePosixPath(zipinfo.filename.replace('\\', '/')).parts
+        if part not in ('/', '.', '..')
+    ]
+    if not parts:
+        return None
+    return parts[:-1], parts[-1]
+
+
+def _extract(archive, zipinfo, name, max_file_size, remaining_size):
+    """
+    Decompresses a member into a temporary file, hashing it on the way, and
+    stops as soon as it exceeds the limits, whatever size its header claims.
+    """
+    content_type = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+    upload = TemporaryUploadedFile(name, content_type, 0, None)
+    sha = hashlib.sha1()
+    size = 0
+    try:
+        with archive.open(zipinfo) as member:
+            while True:
+                data = member.read(CHUNK_SIZE)
+                if not data:
+                    break
+                size += len(data)
+                if max_file_size is not None and size > max_file_size:
+                    raise UploadException(f'"{zipinfo.filename}" in the .zip archive exceeds the maximal file size.')
+                if remaining_size is not None and size > remaining_size:
+                    raise UploadException('The .zip archive exceeds the maximal extracted size.')
+                sha.update(data)
+                upload.write(data)
+    except (BadZipFile, RuntimeError, NotImplementedError, EOFError) as error:
+        # Corrupt data, encrypted or unsupported members
+        upload.close()
+        raise UploadException(f'"{zipinfo.filename}" in the .zip archive is corrupt: {error}')
+    except Exception:
+        upload.close()
+        raise
+    upload.seek(0)
+    upload.size = size
+    upload.sha1 = sha.hexdigest()
+    return upload
+
+
+def _iter_members(file_obj, max_members, max_size):
+    if max_members is None:
+        max_members = filer_settings.FILER_ZIP_MAX_MEMBERS
+    if max_size is None:
+        max_size = filer_settings.FILER_ZIP_MAX_SIZE
+    max_size = max_size * 1024 * 1024 if max_size else None
+    max_file_size = filer_settings.FILER_UPLOADER_MAX_FILE_SIZE
+    max_file_size = max_file_size * 1024 * 1024 if max_file_size else None
+
+    try:
+        archive = ZipFile(file_obj)
+    except (BadZipFile, OSError) as error:
+        raise UploadException(f'The .zip archive is corrupt: {error}')
+    with archive:
+        members = []
+        for zipinfo in archive.infolist():
+            path = _get_member_path(zipinfo)
+            if path:
+                members.append((zipinfo, path))
+        # Reject archives announcing too much before extracting anything
+        if max_members and len(members) > max_members:
+            raise UploadException(f'The .zip archive contains more than {max_members} files.')
+        if max_size is not None and sum(zipinfo.file_size for zipinfo, path in members) > max_size:
+            raise UploadException('The .zip archive exceeds the maximal extracted size.')
+        remaining_size = max_size
+        for zipinfo, (folder_names, name) in members:
+            upload = _extract(archive, zipinfo, name, max_file_size, remaining_size)
+            if remaining_size is not None:
+                remaining_size -= upload.size
+            yield upload, folder_names, zipinfo.filename
+
+
+def iter_zip(file_obj, max_members=None, max_size=None):
+    """
+    Extracts the files of the .zip archive ``file_obj`` one at a time and
+    yields them as ``(upload, folder_names)``, where ``upload`` is a temporary
+    file named like the member, with its ``sha1`` set, and ``folder_names``
+    are the directories of the member within the archive.
+
+    Each file is deleted when the next one is extracted, so only one is kept on
+    disk at a time. Archives with more than ``max_members`` files or
+    extracting to more than ``max_size`` MB (``FILER_ZIP_MAX_MEMBERS`` and
+    ``FILER_ZIP_MAX_SIZE`` by default), or with a file larger than
+    ``FILER_UPLOADER_MAX_FILE_SIZE``, raise ``UploadException``.
+    """
+    for upload, folder_names, filename in _iter_members(file_obj, max_members, max_size):
+        try:
+            yield upload, folder_names
+        finally:
+            upload.close()
 
 
 def unzip(file_obj):
     """
     Take a path to a zipfile and checks if it is a valid zip file
-    and returns...
-    """
-    files = []
-    # TODO: implement try-except here
-    zip = ZipFile(file_obj)
-    bad_file = zip.testzip()
-    if bad_file:
-        raise Exception('"%s" in the .zip archive is corrupt.' % bad_file)
-    infolist = zip.infolist()
-    for zipinfo in infolist:
-        if zipinfo.filename.startswith('__'):  # do not process meta files
-            continue
-        file_obj = SimpleUploadedFile(name=zipinfo.filename, content=zip.read(zipinfo))
-        files.append((file_obj, zipinfo.filename))
-    zip.close()
-    return files
+    and returns a list of ``(file, path within the archive)``. The files are
+    extracted to temporary files, see ``iter_zip`` for the limits applied.
+    """
+    return [(upload, filename) for upload, folder_names, filename in _iter_members(file_obj, None, None)]
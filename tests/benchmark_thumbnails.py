@@ -0,0 +1,144 @@
+"""
+Benchmark of the thumbnail generation from large JPEGs, comparing the fast
+path (decoding at a reduced scale and ``Image.reduce()`` before resampling,
+see ``FILER_THUMBNAIL_REDUCING_GAP``) with resampling from the fully decoded
+image:
+
+* ``full``: easy-thumbnails' ``pil_image`` without reduction.
+* ``fast``: ``filer.source_generators.pil_image``.
+* ``default``: filer's thumbnailer with easy-thumbnails' default
+  ``THUMBNAIL_SOURCE_GENERATORS``, one thumbnail at a time like the
+  ``{% thumbnail %}`` template tag.
+
+Each variant runs in a process of its own to measure its peak RSS::
+
+    python tests/benchmark_thumbnails.py --size 6000x4000 --repeat 5
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from tempfile import TemporaryDirectory
+
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROCESSORS = (
+    'easy_thumbnails.processors.colorspace',
+    'easy_thumbnails.processors.autocrop',
+    'filer.thumbnail_processors.scale_and_crop_with_subject_location',
+    'easy_thumbnails.processors.filters',
+)
+
+THUMBNAIL_OPTIONS = (
+    {'size': (40, 40), 'crop': True, 'upscale': True},
+    {'size': (160, 160), 'crop': True, 'upscale': True},
+    {'size': (210, 0), 'upscale': True},
+    {'size': (800, 600), 'crop': True, 'subject_location': '100,100'},
+)
+
+VARIANTS = {
+    # variant: (source generator, FILER_THUMBNAIL_REDUCING_GAP)
+    'full': ('easy_thumbnails.source_generators.pil_image', None),
+    'fast': ('filer.source_generators.pil_image', 2.0),
+    'default': (None, 2.0),
+}
+
+
+def create_jpeg(path, size):
+    from PIL import Image
+
+    detail = Image.effect_mandelbrot(size, (-2.0, -1.2, 1.0, 1.2), 100)
+    gradient = Image.linear_gradient('L').resize(size)
+    Image.merge('RGB', (detail, gradient, gradient.transpose(Image.Transpose.ROTATE_180))).save(
+        path, 'JPEG', quality=90,
+    )
+
+
+def run_variant(variant, path, repeat):
+    """Generates the thumbnails ``repeat`` times, returns the timings."""
+    from django.conf import settings
+
+    source_generator, reducing_gap = VARIANTS[variant]
+    with TemporaryDirectory() as media_root:
+        settings.configure(
+            DATABASES={'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'}},
+            INSTALLED_APPS=['easy_thumbnails'],
+            MEDIA_ROOT=media_root,
+            THUMBNAIL_PROCESSORS=PROCESSORS,
+            FILER_THUMBNAIL_REDUCING_GAP=reducing_gap,
+        )
+        import django
+        django.setup()
+        from django.core.files import File
+        from django.utils.module_loading import import_string
+
+        from easy_thumbnails.engine import process_image
+        from easy_thumbnails.files import Thumbnailer
+
+        from filer.utils.filer_easy_thumbnails import ThumbnailRenderMixin
+
+        class RenderingThumbnailer(ThumbnailRenderMixin, Thumbnailer):
+            pass
+
+        def generate_thumbnail(options):
+            with open(path, 'rb') as source:
+                if source_generator is None:
+                    RenderingThumbnailer(File(source), name='source.jpg').generate_thumbnail(options)
+                else:
+                    process_image(import_string(source_generator)(source, **options), dict(options), processors)
+
+        processors = [import_string(name) for name in PROCESSORS]
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for options in THUMBNAIL_OPTIONS:
+                generate_thumbnail(options)
+            timings.append(time.perf_counter() - started)
+    return {
+        'best': min(timings),
+        'mean': sum(timings) / len(timings),
+        # Kilobytes on Linux, bytes on macOS
+        'max_rss': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--size', default='6000x4000', help="Size of the source JPEG (default: 6000x4000).")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per variant (default: 3).")
+    parser.add_argument('--variant', choices=VARIANTS, help=argparse.SUPPRESS)
+    parser.add_argument('--source', help=argparse.SUPPRESS)
+    parser.add_argument('--create', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.create:
+        create_jpeg(args.source, tuple(int(value) for value in args.size.split('x')))
+        return
+    if args.variant:
+        print(json.dumps(run_variant(args.variant, args.source, args.repeat)))
+        return
+
+    with TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'source.jpg')
+        # The peak RSS of a process is kept across exec(), so the variants
+        # must not be started from a process which created the large image
+        subprocess.run([sys.executable, __file__, '--create', f'--source={path}', f'--size={args.size}'], check=True)
+        print(f"{len(THUMBNAIL_OPTIONS)} thumbnails of a {args.size} JPEG, {args.repeat} run(s) per variant")
+        print(f"{'variant':<8} {'best (s)':>10} {'mean (s)':>10} {'peak RSS (MB)':>14}")
+        for variant in VARIANTS:
+            output = subprocess.run(
+                [sys.executable, __file__, f'--variant={variant}', f'--source={path}', f'--repeat={args.repeat}'],
+                check=True, capture_output=True, text=True, cwd=BASE_DIR,
+                env=dict(os.environ, PYTHONPATH=BASE_DIR),
+            ).stdout
+            result = json.loads(output.splitlines()[-1])
+            max_rss = result['max_rss'] / (1024 ** 2 if sys.platform == 'darwin' else 1024)
+            print(f"{variant:<8} {result['best']:>10.3f} {result['mean']:>10.3f} {max_rss:>14.1f}")
+
+
+if __name__ == '__main__':
+    main()
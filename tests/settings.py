@@ -52,6 +52,7 @@ HELPER_SETTINGS = {
     'FILE_UPLOAD_TEMP_DIR': mkdtemp(),
     'TEMPLATE_DIRS': (os.path.join(BASE_DIR, 'django-filer', 'filer', 'utils', 'templates'),),
     'FILER_CANONICAL_URL': 'test-path/',
+    'FILER_SEARCH_BACKEND': 'auto',
     'FILER_STORAGES': {
         "public": {
             "main": {
@@ -121,12 +121,13 @@ class FilerFolderAdminUrlsTests(TestCase):
                 thumbnail_urls.append(thumbnailer.get_thumbnail(thumbnail_options).url)
 
         self.assertEqual(Image.objects.count(), images)
-        with self.assertNumQueries(7):
+        with self.assertNumQueries(8):
             # Expected queries:
             # 1. Authentication check
             # 2.-5. Loading the user clipboard
-            # 6. Loading directory data and thumbnails (1 query)
-            # 7. Selecting file and owner data
+            # 6. Counting the files for the paginator
+            # 7. Loading directory data and thumbnails of the page (1 query)
+            # 8. Selecting file and owner data
             response = self.client.get(reverse('admin:filer-directory_listing-unfiled_images'))
         self.assertContains(response, "test_image_0.jpg")
         self.assertContains(response, "/media/my-preferred-base-url-for-source-files/")
@@ -288,6 +289,11 @@ class FilerImageAdminUrlsTests(TestCase):
                 self.assertIn("/media/", response["Location"])
                 # Does not redirect to a static file
                 self.assertNotIn("/static/", response["Location"])
+        # The thumbnails are indexed for the directory listing
+        self.assertEqual(
+            set(self.file_object.thumbnail_index.values_list('key', flat=True)),
+            {f'{size}x{size}_crop' for size in DEFERRED_THUMBNAIL_SIZES},
+        )
 
     def test_missing_file(self):
         """Directory shows static icon for missing files"""
@@ -1436,6 +1442,18 @@ class FolderListingTest(TestCase):
                 {self.foo_folder.pk, self.bar_folder.pk, self.baz_folder.pk, self.spam_file.pk}
             )
 
+    def test_listing_does_not_rely_on_folder_statistics(self):
+        Folder.objects.filter(pk=self.parent.pk).update(_children_count=1, _file_count=0)
+        with SettingsOverride(filer_settings, FILER_ENABLE_PERMISSIONS=False):
+            response = self.client.get(
+                reverse('admin:filer-directory_listing',
+                        kwargs={'folder_id': self.parent.id}))
+        item_list = response.context['paginated_items'].object_list
+        self.assertEqual(
+            {item.pk for item in item_list},
+            {self.foo_folder.pk, self.bar_folder.pk, self.baz_folder.pk, self.spam_file.pk}
+        )
+
     def test_folder_ownership(self):
         with SettingsOverride(filer_settings, FILER_ENABLE_PERMISSIONS=True):
             response = self.client.get(
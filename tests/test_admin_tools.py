@@ -1,7 +1,13 @@
 """Tests for filer.admin.tools."""
 
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.core.cache import cache
+from django.core.exceptions import PermissionDenied
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase, RequestFactory
 
+from filer import settings as filer_settings
 from filer.admin.tools import (
     AdminContext,
     admin_url_params,
@@ -10,10 +16,15 @@ from filer.admin.tools import (
     check_files_read_permissions,
     check_folder_edit_permissions,
     check_folder_read_permissions,
+    DirectoryListingItems,
+    check_items_permission,
+    get_denied_items,
+    has_items_permission,
     popup_pick_type,
     popup_status,
     userperms_for_request,
 )
+from filer.models import File, Folder, FolderPermission
 
 
 class CheckPermissionTests(TestCase):
@@ -56,6 +67,95 @@ class CheckPermissionTests(TestCase):
         check_folder_read_permissions(None, [mock_folder])
 
 
+class BulkPermissionTests(TestCase):
+    """Tests for the set-based permission checks of admin actions."""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create(username='user', is_staff=True)
+        self.user.user_permissions.add(*Permission.objects.filter(codename__in=['change_file', 'change_folder']))
+        self.request = RequestFactory().get('/')
+        self.request.user = self.user
+        self.root = Folder.objects.create(name='root')
+        self.child = Folder.objects.create(name='child', parent=self.root)
+        self.grandchild = Folder.objects.create(name='grandchild', parent=self.child)
+        self.other = Folder.objects.create(name='other')
+        self.file = File.objects.create(
+            file=SimpleUploadedFile('deep.txt', b'content'), original_filename='deep.txt', folder=self.grandchild,
+        )
+        FolderPermission.objects.create(folder=self.root, type=FolderPermission.ALL, user=self.user,
+                                        can_read=FolderPermission.ALLOW, can_edit=FolderPermission.ALLOW)
+        self.old_setting = filer_settings.FILER_ENABLE_PERMISSIONS
+        filer_settings.FILER_ENABLE_PERMISSIONS = True
+
+    def tearDown(self):
+        filer_settings.FILER_ENABLE_PERMISSIONS = self.old_setting
+        cache.clear()
+
+    def test_permitted_subtree(self):
+        folders = Folder.objects.filter(pk=self.root.pk)
+        self.user.has_perm('filer.change_folder')  # prime Django's permission cache
+        with self.assertNumQueries(2):
+            self.assertTrue(has_items_permission(self.request, File.objects.none(), folders, 'edit'))
+        check_items_permission(self.request, File.objects.none(), folders, 'read')
+
+    def test_denied_items_in_subtree(self):
+        FolderPermission.objects.create(folder=self.grandchild, type=FolderPermission.THIS, user=self.user,
+                                        can_edit=FolderPermission.DENY)
+        folders = Folder.objects.filter(pk__in=[self.root.pk, self.other.pk])
+        denied_files, denied_folders = get_denied_items(self.request, File.objects.none(), folders, 'edit')
+        self.assertEqual(set(denied_folders), {self.grandchild, self.other})
+        self.assertEqual(list(denied_files), [self.file])
+        with self.assertRaises(PermissionDenied):
+            check_items_permission(self.request, File.objects.none(), folders, 'edit')
+        # Selecting only the permitted part of the tree is fine
+        self.assertTrue(has_items_permission(self.request, [], [self.child.pk], 'read'))
+
+    def test_model_permission_required_for_edit(self):
+        self.user.user_permissions.clear()
+        self.user = get_user_model().objects.get(pk=self.user.pk)
+        self.request.user = self.user
+        files = File.objects.filter(pk=self.file.pk)
+        self.assertFalse(has_items_permission(self.request, files, [], 'edit'))
+        self.assertTrue(has_items_permission(self.request, files, [], 'read'))
+
+
+class DirectoryListingItemsTests(TestCase):
+    """Tests for the lazily paginated directory listing."""
+
+    def setUp(self):
+        self.parent = Folder.objects.create(name='parent')
+        self.folders = [Folder.objects.create(name=f'folder{i}', parent=self.parent) for i in range(3)]
+        self.files = [File.objects.create(original_filename=f'file{i}.txt', folder=self.parent) for i in range(4)]
+        self.parent.refresh_from_db()
+        self.items = DirectoryListingItems(
+            self.parent.children.order_by('name'), self.parent.files.order_by('original_filename'),
+        )
+
+    def test_slices_span_folders_and_files(self):
+        self.assertEqual(len(self.items), 7)
+        self.assertEqual(self.items[2:5], [self.folders[2], self.files[0], self.files[1]])
+        self.assertEqual(self.items[-1], self.files[3])
+        with self.assertRaises(IndexError):
+            self.items[7]
+
+    def test_page_only_fetches_its_items(self):
+        items = DirectoryListingItems(
+            self.parent.children.order_by('name'), self.parent.files.order_by('original_filename'),
+            folder_count=self.parent.children_count, file_count=self.parent.file_count,
+        )
+        with self.assertNumQueries(1):
+            self.assertEqual(len(items[4:6]), 2)
+
+    def test_order_is_unique(self):
+        files = [File.objects.create(original_filename='same.txt', folder=self.parent) for i in range(4)]
+        items = DirectoryListingItems(self.parent.children.all(), File.objects.filter(pk__in=[f.pk for f in files]))
+        self.assertEqual(list(items.folders.query.order_by), ['name', 'pk'])
+        items = DirectoryListingItems(self.parent.children.all(), File.objects.filter(
+            pk__in=[f.pk for f in files]).order_by('original_filename'))
+        self.assertEqual(list(items.files.query.order_by), ['original_filename', 'pk'])
+        self.assertEqual(items[3:5] + items[5:7], files)
+
+
 class UserPermsForRequestTests(TestCase):
     """Tests for userperms_for_request."""
 
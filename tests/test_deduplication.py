@@ -0,0 +1,105 @@
+import os
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.admin import helpers
+from django.core.files import File as DjangoFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+from django.urls import reverse
+
+from filer import settings as filer_settings
+from filer.models import File, Folder
+from filer.settings import FILER_IMAGE_MODEL
+from filer.utils.loader import load_model
+from tests.helpers import create_image, create_superuser
+
+
+Image = load_model(FILER_IMAGE_MODEL)
+
+
+@mock.patch.object(filer_settings, 'FILER_DEDUPLICATE_FILES', True)
+class DeduplicationTests(TestCase):
+
+    def setUp(self):
+        self.superuser = create_superuser()
+        self.client.login(username='admin', password='secret')
+        self.folder = Folder.objects.create(name='uploads')
+        self.filename = os.path.join(settings.FILE_UPLOAD_TEMP_DIR, 'photo.jpg')
+        create_image().save(self.filename, 'JPEG')
+
+    def tearDown(self):
+        os.remove(self.filename)
+        for f in File.objects.all():
+            f.delete()
+
+    def create_image(self, name='photo.jpg', **kwargs):
+        with open(self.filename, 'rb') as upload:
+            return Image.objects.create(original_filename=name, file=DjangoFile(upload, name=name), **kwargs)
+
+    def test_same_content_is_stored_once(self):
+        first = self.create_image()
+        with mock.patch.object(first.file.storage, 'save', side_effect=AssertionError("Stored again")):
+            second = self.create_image(name='copy of photo.JPG')
+        self.assertEqual(first.file.name, second.file.name)
+        self.assertTrue(first.file.name.endswith(f'{first.sha1}.jpg'))
+        self.assertEqual(first.url, second.url)
+
+    def test_uploads_are_deduplicated(self):
+        url = reverse('admin:filer-ajax_upload', kwargs={'folder_id': self.folder.pk})
+        for name in ('a.txt', 'b.txt'):
+            self.client.post(url, {'Filedata': SimpleUploadedFile(name, b'same content', 'text/plain')})
+        self.assertEqual(len(set(File.objects.values_list('file', flat=True))), 1)
+
+    def test_file_is_deleted_with_last_reference(self):
+        first = self.create_image()
+        second = self.create_image()
+        storage, name = first.file.storage, first.file.name
+        first.delete()
+        self.assertTrue(storage.exists(name))
+        second.delete()
+        self.assertFalse(storage.exists(name))
+
+    def test_copy_references_same_file(self):
+        image = self.create_image(folder=self.folder)
+        destination = Folder.objects.create(name='destination')
+        with mock.patch.object(image.file.storage, 'save', side_effect=AssertionError("Copied")):
+            url = reverse('admin:filer-directory_listing', kwargs={'folder_id': self.folder.pk})
+            response = self.client.post(url, {
+                'action': 'copy_files_and_folders',
+                'post': 'yes',
+                'suffix': '',
+                'destination': destination.pk,
+                helpers.ACTION_CHECKBOX_NAME: f'file-{image.pk}',
+            })
+        self.assertEqual(response.status_code, 302)
+        copy = destination.files.get()
+        self.assertEqual(copy.file.name, image.file.name)
+        image.delete()
+        with copy.file.open() as stored, open(self.filename, 'rb') as original:
+            self.assertEqual(stored.read(), original.read())
+
+    def test_making_a_shared_file_private_keeps_it_public(self):
+        first = self.create_image()
+        second = self.create_image()
+        second.is_public = False
+        second.save()
+        public_storage = first.file.storage
+        private_storage = second.file.storage
+        self.assertNotEqual(public_storage, private_storage)
+        self.assertTrue(public_storage.exists(first.file.name))
+        self.assertTrue(private_storage.exists(second.file.name))
+        self.assertTrue(second.file.name.endswith(f'{first.sha1}.jpg'))
+
+        # Back to the public file, which is not stored again
+        with mock.patch.object(public_storage, 'save', side_effect=AssertionError("Stored again")):
+            second.is_public = True
+            second.save()
+        self.assertEqual(second.file.name, first.file.name)
+        self.assertFalse(private_storage.exists(first.file.name))
+
+    def test_disabled_by_default(self):
+        first = self.create_image()
+        with mock.patch.object(filer_settings, 'FILER_DEDUPLICATE_FILES', False):
+            second = self.create_image()
+        self.assertNotEqual(first.file.name, second.file.name)
@@ -0,0 +1,179 @@
+import io
+import threading
+from unittest import mock
+
+from django.contrib.admin import helpers
+from django.contrib.admin.models import DELETION, LogEntry
+from django.core.files.base import ContentFile
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from easy_thumbnails.models import Source
+
+from filer import settings as filer_settings
+from filer.deletion import delete_files_and_folders, wait_for_stored_file_deletions
+from filer.models import File, Folder, SearchIndex
+from filer.utils.loader import load_model
+from tests.helpers import create_image, create_superuser
+
+
+Image = load_model(filer_settings.FILER_IMAGE_MODEL)
+
+
+class DeleteFilesAndFoldersTests(TestCase):
+
+    def setUp(self):
+        self.root = Folder.objects.create(name='root')
+        self.folder = Folder.objects.create(name='folder', parent=self.root)
+        self.subfolder = Folder.objects.create(name='subfolder', parent=self.folder)
+
+    def tearDown(self):
+        for f in File.objects.all():
+            f.delete()
+
+    def create_file(self, folder, name='file.txt', content=b'content'):
+        return File.objects.create(original_filename=name, folder=folder, file=ContentFile(content, name=name))
+
+    def test_deletes_folder_trees(self):
+        files = [self.create_file(folder) for folder in (self.folder, self.subfolder, self.subfolder)]
+        kept = self.create_file(self.root)
+        with self.captureOnCommitCallbacks(execute=True):
+            counts = delete_files_and_folders(folders=[self.folder])
+        wait_for_stored_file_deletions()
+        self.assertEqual(counts, (3, 2))
+        self.assertQuerySetEqual(File.objects.all(), [kept])
+        self.assertQuerySetEqual(Folder.objects.all(), [self.root])
+        for f in files:
+            self.assertFalse(f.file.storage.exists(f.file.name))
+        self.assertTrue(kept.file.storage.exists(kept.file.name))
+        self.assertEqual(
+            Folder.objects.filter(pk=self.root.pk).values_list(
+                '_file_count', '_total_file_count', '_children_count', '_total_children_count', '_total_size',
+            ).get(),
+            (1, 1, 0, 0, kept.size),
+        )
+        self.assertFalse(SearchIndex.objects.exclude(object_id__in=[kept.pk, self.root.pk]).exists())
+
+    def test_keeps_shared_stored_files(self):
+        f = self.create_file(self.subfolder)
+        shared = File.objects.create(original_filename='copy.txt', folder=self.root, file=f.file.name)
+        with self.captureOnCommitCallbacks(execute=True):
+            delete_files_and_folders(files=[f])
+        wait_for_stored_file_deletions()
+        self.assertTrue(shared.file.storage.exists(shared.file.name))
+        self.assertEqual(Folder.objects.filter(pk=self.folder.pk).values_list('_total_file_count', flat=True).get(), 0)
+
+    def test_deletes_thumbnails(self):
+        content = io.BytesIO()
+        create_image().save(content, 'JPEG')
+        image = Image.objects.create(
+            original_filename='photo.jpg', folder=self.subfolder,
+            file=ContentFile(content.getvalue(), name='photo.jpg'),
+        )
+        thumbnail = image.file.get_thumbnail({'size': (32, 32)})
+        self.assertTrue(image.file.thumbnail_storage.exists(thumbnail.name))
+        with self.captureOnCommitCallbacks(execute=True):
+            delete_files_and_folders(folders=[self.folder])
+        wait_for_stored_file_deletions()
+        self.assertFalse(image.file.thumbnail_storage.exists(thumbnail.name))
+        self.assertFalse(Source.objects.filter(name=image.file.name).exists())
+
+    def test_queries_do_not_grow_with_files(self):
+        def count_queries(folder, count):
+            for i in range(count):
+                self.create_file(folder, name=f'{i}.txt')
+            with CaptureQueriesContext(connection) as queries:
+                delete_files_and_folders(folders=[folder])
+            return len(queries)
+
+        few = count_queries(Folder.objects.create(name='few', parent=self.root), 2)
+        many = count_queries(Folder.objects.create(name='many', parent=self.root), 20)
+        self.assertEqual(few, many)
+
+    def test_failed_storage_deletion_is_logged(self):
+        f = self.create_file(self.folder)
+        with mock.patch.object(f.file.storage, 'delete', side_effect=OSError("Unavailable")), \
+                self.assertLogs('filer.deletion', 'ERROR'):
+            with self.captureOnCommitCallbacks(execute=True):
+                delete_files_and_folders(files=[f])
+            wait_for_stored_file_deletions()
+        self.assertFalse(File.objects.exists())
+
+    def test_storage_deletion_does_not_block(self):
+        f = self.create_file(self.folder)
+        deleting = threading.Event()
+        release = threading.Event()
+
+        def delete(name):
+            deleting.set()
+            release.wait(5)
+
+        with mock.patch.object(f.file.storage, 'delete', side_effect=delete):
+            with self.captureOnCommitCallbacks(execute=True):
+                delete_files_and_folders(files=[f])
+            self.assertTrue(deleting.wait(5))
+            release.set()
+            wait_for_stored_file_deletions()
+
+    def test_files_of_models_overriding_delete_are_deleted_one_by_one(self):
+        content = io.BytesIO()
+        create_image().save(content, 'JPEG')
+        image = Image.objects.create(
+            original_filename='photo.jpg', folder=self.subfolder,
+            file=ContentFile(content.getvalue(), name='photo.jpg'),
+        )
+        other = self.create_file(self.subfolder)
+        with mock.patch.object(Image, 'delete', autospec=True, side_effect=File.delete) as delete:
+            self.assertEqual(delete_files_and_folders(folders=[self.folder]), (2, 2))
+        self.assertEqual(delete.call_count, 1)
+        self.assertEqual(delete.call_args.args[0].original_filename, 'photo.jpg')
+        self.assertFalse(File.objects.filter(pk__in=[image.pk, other.pk]).exists())
+
+
+class DeleteActionTests(TestCase):
+
+    def setUp(self):
+        self.superuser = create_superuser()
+        self.client.login(username='admin', password='secret')
+        self.folder = Folder.objects.create(name='folder')
+        self.subfolder = Folder.objects.create(name='subfolder', parent=self.folder)
+        self.files = [
+            File.objects.create(
+                original_filename=f'{i}.txt', folder=self.subfolder, file=ContentFile(b'content', name=f'{i}.txt'),
+            )
+            for i in range(3)
+        ]
+
+    def tearDown(self):
+        for f in File.objects.all():
+            f.delete()
+
+    def test_deletions_are_logged(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse('admin:filer-directory_listing-root'), {
+                'action': 'delete_files_or_folders',
+                'post': 'yes',
+                helpers.ACTION_CHECKBOX_NAME: [f'folder-{self.folder.pk}'],
+            })
+        wait_for_stored_file_deletions()
+        self.assertFalse(Folder.objects.exists())
+        for f in self.files:
+            self.assertFalse(f.file.storage.exists(f.file.name))
+        self.assertCountEqual(
+            LogEntry.objects.filter(action_flag=DELETION).values_list('object_repr', flat=True),
+            ['0.txt', '1.txt', '2.txt', str(self.folder)],
+        )
+
+    def test_deletions_are_logged_in_bulk_before_django_5_1(self):
+        with mock.patch('filer.admin.folderadmin.DJANGO_VERSION', (4, 2)), \
+                mock.patch.object(LogEntry.objects, 'bulk_create', wraps=LogEntry.objects.bulk_create) as bulk_create:
+            self.client.post(reverse('admin:filer-directory_listing-root'), {
+                'action': 'delete_files_or_folders',
+                'post': 'yes',
+                helpers.ACTION_CHECKBOX_NAME: [f'folder-{self.folder.pk}'],
+            })
+        # One for the batch of files and one for the folder
+        self.assertEqual(bulk_create.call_count, 2)
+        self.assertEqual(LogEntry.objects.filter(action_flag=DELETION).count(), 4)
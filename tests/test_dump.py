@@ -61,7 +61,8 @@ class DumpDataTests(TestCase):
         call_command("dumpdata", "filer", stdout=jdata2)
         data = json.loads(jdata.getvalue())
         data2 = json.loads(jdata2.getvalue())
-        self.assertEqual(len(data), 1)
+        # The search index entry of the file is dumped along with it
+        self.assertEqual([obj['model'] for obj in data], ['filer.file', 'filer.searchindex'])
         self.assertEqual(len(data2), 0)
 
     def test_dump_load_data(self):
@@ -1,11 +1,28 @@
 """Tests for filer.utils.filer_easy_thumbnails."""
+import os
+from unittest import mock
 
+from django.conf import settings
+from django.core.files import File as DjangoFile
 from django.test import TestCase
 
+from easy_thumbnails.files import Thumbnailer, get_thumbnailer
+from PIL import Image as PILImage
+from PIL import ImageChops, ImageStat
+from PIL.JpegImagePlugin import JpegImageFile
+
+from filer.models import File, ThumbnailIndex
+from filer.settings import FILER_IMAGE_MODEL
 from filer.utils.filer_easy_thumbnails import (
     ThumbnailerNameMixin,
+    ThumbnailRenderError,
     thumbnail_to_original_filename,
 )
+from filer.utils.loader import load_model
+from tests.helpers import create_image
+
+
+Image = load_model(FILER_IMAGE_MODEL)
 
 
 class ThumbnailToOriginalFilenameTests(TestCase):
@@ -94,3 +111,104 @@ class ThumbnailerNameMixinTests(TestCase):
         """JPG output includes quality in filename; non-JPG does not."""
         name = self.thumbnailer.get_thumbnail_name({'size': (100, 100)})
         self.assertIn('q85', name)
+
+
+class RenderThumbnailsTests(TestCase):
+    """Tests for ThumbnailRenderMixin.render_thumbnails."""
+
+    def setUp(self):
+        self.filename = os.path.join(settings.FILE_UPLOAD_TEMP_DIR, 'render.jpg')
+        create_image(size=(1600, 1200)).save(self.filename, 'JPEG', quality=95)
+        with open(self.filename, 'rb') as upload:
+            self.image = Image.objects.create(
+                original_filename='render.jpg', file=DjangoFile(upload, name='render.jpg'),
+            )
+        self.options_list = [
+            {'size': (40, 40), 'crop': True},
+            {'size': (210, 0), 'upscale': True},
+            {'size': (80, 80), 'crop': True, 'subject_location': '300,900'},
+            {'size': (2000, 2000), 'upscale': True},
+        ]
+
+    def tearDown(self):
+        os.remove(self.filename)
+        for f in File.objects.all():
+            f.delete()
+
+    def assertSimilar(self, image, expected):
+        self.assertEqual(image.size, expected.size)
+        difference = ImageStat.Stat(ImageChops.difference(image.convert('RGB'), expected.convert('RGB')))
+        self.assertLess(max(difference.mean), 4)
+
+    def test_decodes_source_once(self):
+        thumbnailer = get_thumbnailer(self.image)
+        with mock.patch.object(PILImage, 'open', wraps=PILImage.open) as image_open:
+            thumbnails = thumbnailer.render_thumbnails(self.options_list)
+        self.assertEqual(image_open.call_count, 1)
+        for options, thumbnail in zip(self.options_list, thumbnails):
+            self.assertEqual(thumbnail.name, thumbnailer.get_thumbnail_name(thumbnailer.get_options(options)))
+            self.assertTrue(thumbnailer.thumbnail_storage.exists(thumbnail.name))
+        # Existing thumbnails are neither decoded nor rendered again
+        with mock.patch.object(PILImage, 'open', wraps=PILImage.open) as image_open:
+            self.assertEqual(
+                [thumbnail.name for thumbnail in thumbnailer.render_thumbnails(self.options_list)],
+                [thumbnail.name for thumbnail in thumbnails],
+            )
+        self.assertEqual(image_open.call_count, 0)
+
+    def test_matches_separately_generated_thumbnails(self):
+        thumbnailer = get_thumbnailer(self.image)
+        thumbnails = thumbnailer.generate_thumbnails([thumbnailer.get_options(o) for o in self.options_list])
+        for options, thumbnail in zip(self.options_list, thumbnails):
+            # Rendered from the fully decoded source
+            expected = Thumbnailer.generate_thumbnail(thumbnailer, options)
+            self.assertSimilar(thumbnail.image, expected.image)
+
+    def test_single_thumbnails_decoded_at_reduced_scale(self):
+        thumbnailer = get_thumbnailer(self.image)
+        with mock.patch.object(JpegImageFile, 'draft', autospec=True, side_effect=JpegImageFile.draft) as draft:
+            thumbnail = thumbnailer.get_thumbnail({'size': (50, 50), 'crop': True})
+        self.assertEqual(draft.call_args.args[2], (134, 100))
+        expected = Thumbnailer.generate_thumbnail(thumbnailer, {'size': (50, 50), 'crop': True})
+        self.assertSimilar(thumbnail.image, expected.image)
+
+    def test_failed_thumbnails_do_not_block_the_others(self):
+        thumbnailer = get_thumbnailer(self.image)
+        options_list = [self.options_list[0], {'size': (0, 0)}, self.options_list[1], self.options_list[2]]
+        render_thumbnail = thumbnailer.render_thumbnail
+
+        def fail_for_80x80(image, source_size, thumbnail_options, processors=None):
+            if thumbnail_options['size'] == (80, 80):
+                raise OSError("Broken")
+            return render_thumbnail(image, source_size, thumbnail_options, processors)
+
+        with mock.patch.object(thumbnailer, 'render_thumbnail', side_effect=fail_for_80x80), \
+                self.assertRaises(ThumbnailRenderError) as context:
+            thumbnailer.render_thumbnails(options_list)
+        self.assertEqual(set(context.exception.errors), {1, 3})
+        thumbnails = context.exception.thumbnails
+        self.assertIsNone(thumbnails[1])
+        self.assertIsNone(thumbnails[3])
+        for thumbnail in (thumbnails[0], thumbnails[2]):
+            self.assertTrue(thumbnailer.thumbnail_storage.exists(thumbnail.name))
+
+    def test_image_indexes_thumbnails_rendered_despite_failures(self):
+        with self.assertRaises(ThumbnailRenderError):
+            self.image.render_thumbnails([self.options_list[0], {'size': (0, 0)}])
+        self.assertEqual(ThumbnailIndex.objects.filter(file=self.image).count(), 1)
+        # Thumbnails which can be rendered are still returned
+        thumbnails = self.image._generate_thumbnails({'ok': dict(self.options_list[1]), 'bad': {'size': (0, 0)}})
+        self.assertEqual(len(thumbnails), 1)
+
+    def test_missing_thumbnails_without_generate(self):
+        thumbnails = get_thumbnailer(self.image).render_thumbnails(self.options_list[:2], generate=False)
+        self.assertEqual(thumbnails, [None, None])
+
+    def test_image_render_thumbnails(self):
+        self.image.subject_location = '1200,300'
+        thumbnails = self.image.render_thumbnails(self.options_list[:2])
+        self.assertIn('subject_location', thumbnails[0].name)
+        self.assertEqual(
+            set(ThumbnailIndex.objects.filter(file=self.image).values_list('name', flat=True)),
+            {thumbnail.name for thumbnail in thumbnails},
+        )
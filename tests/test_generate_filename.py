@@ -3,7 +3,7 @@
 
 from django.test import TestCase
 
-from filer.utils.generate_filename import by_date, prefixed_factory, randomized
+from filer.utils.generate_filename import by_date, content_addressed, prefixed_factory, randomized
 
 
 class ByDateTests(TestCase):
@@ -37,6 +37,17 @@ class RandomizedTests(TestCase):
         self.assertNotIn(' ', result)
 
 
+class ContentAddressedTests(TestCase):
+    """Tests for content_addressed upload_to function."""
+
+    def test_content_addressed_returns_digest_path(self):
+        instance = type('Instance', (), {'sha1': 'a94a8fe5ccb19ba61c4c0873d391e987982fbbd3'})()
+        self.assertEqual(
+            content_addressed(instance, 'My File.TXT'),
+            'a9/4a/a94a8fe5ccb19ba61c4c0873d391e987982fbbd3.txt',
+        )
+
+
 class PrefixedFactoryTests(TestCase):
     """Tests for prefixed_factory."""
 
@@ -0,0 +1,131 @@
+import json
+import os
+from concurrent.futures import Future
+from io import StringIO
+from unittest import mock
+
+import django
+from django.conf import settings
+from django.core.files import File as DjangoFile
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from filer.models import File, ThumbnailIndex
+from filer.settings import FILER_ADMIN_ICON_SIZES, FILER_IMAGE_MODEL
+from filer.utils.loader import load_model
+from tests.helpers import create_image
+
+
+Image = load_model(FILER_IMAGE_MODEL)
+
+
+class InlineExecutor:
+    def __init__(self, max_workers, initializer):
+        initializer()
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+    def shutdown(self, cancel_futures):
+        pass
+
+
+class GenerateThumbnailsTests(TestCase):
+
+    def setUp(self):
+        self.filename = os.path.join(settings.FILE_UPLOAD_TEMP_DIR, 'generate.jpg')
+        create_image(size=(200, 100)).save(self.filename, 'JPEG')
+        self.images = []
+        for i in range(3):
+            with open(self.filename, 'rb') as upload:
+                self.images.append(Image.objects.create(
+                    original_filename=f'generate{i}.jpg', file=DjangoFile(upload, name=f'generate{i}.jpg'),
+                ))
+        self.checkpoint = os.path.join(settings.FILE_UPLOAD_TEMP_DIR, 'generate_thumbnails.json')
+
+    def tearDown(self):
+        os.remove(self.filename)
+        if os.path.exists(self.checkpoint):
+            os.remove(self.checkpoint)
+        for f in File.objects.all():
+            f.delete()
+
+    def generate(self, **options):
+        out = StringIO()
+        call_command('generate_thumbnails', stdout=out, **options)
+        return out.getvalue()
+
+    def indexed_keys(self, image):
+        return set(ThumbnailIndex.objects.filter(file=image).values_list('key', flat=True))
+
+    def test_generates_icons_and_default_thumbnails(self):
+        output = self.generate(chunk_size=2)
+        self.assertIn("Processed 2 / 3 images", output)
+        self.assertIn("Processed 3 / 3 images", output)
+        self.assertIn("MB/s decoded", output)
+        keys = self.indexed_keys(self.images[0])
+        self.assertIn('210x0_upscale', keys)
+        for size in FILER_ADMIN_ICON_SIZES:
+            self.assertIn(f'{size}x{size}_crop_upscale', keys)
+
+    def test_sizes_and_aliases(self):
+        self.generate(sizes='20')
+        self.assertEqual(self.indexed_keys(self.images[0]), {'20x20_crop_upscale'})
+        self.generate(aliases='admin_sidebar_preview', sizes='24')
+        self.assertEqual(
+            self.indexed_keys(self.images[0]), {'20x20_crop_upscale', '24x24_crop_upscale', '210x0_upscale'},
+        )
+        with self.assertRaises(CommandError):
+            self.generate(aliases='unknown')
+        with self.assertRaises(CommandError):
+            self.generate(sizes='big')
+
+    def test_only_missing(self):
+        self.generate(sizes='20')
+        ThumbnailIndex.objects.filter(file=self.images[1]).delete()
+        self.assertIn("Processed 1 / 1 images", self.generate(sizes='20', only_missing=True))
+        self.assertEqual(self.indexed_keys(self.images[1]), {'20x20_crop_upscale'})
+        self.assertNotIn("Processed", self.generate(sizes='20', only_missing=True))
+
+    def test_since(self):
+        Image.objects.filter(pk=self.images[0].pk).update(modified_at='2000-01-01T00:00:00Z')
+        self.assertIn("Processed 2 / 2 images", self.generate(sizes='20', since='2001-01-01'))
+        self.assertEqual(self.indexed_keys(self.images[0]), set())
+        with self.assertRaises(CommandError):
+            self.generate(since='yesterday')
+
+    def test_resume_from_checkpoint(self):
+        with open(self.checkpoint, 'w') as checkpoint:
+            json.dump({'last_pk': self.images[0].pk}, checkpoint)
+        output = self.generate(sizes='20', checkpoint=self.checkpoint, chunk_size=1)
+        self.assertIn(f"Resuming after image {self.images[0].pk}.", output)
+        self.assertIn("Processed 2 / 2 images", output)
+        self.assertEqual(self.indexed_keys(self.images[0]), set())
+        self.assertEqual(self.indexed_keys(self.images[2]), {'20x20_crop_upscale'})
+        # Completed runs remove their checkpoint
+        self.assertFalse(os.path.exists(self.checkpoint))
+
+    def test_errors_are_counted(self):
+        render_thumbnails = Image.render_thumbnails
+
+        def fail_for_second_image(image, *args, **kwargs):
+            if image.pk == self.images[1].pk:
+                raise OSError("Broken")
+            return render_thumbnails(image, *args, **kwargs)
+
+        err = StringIO()
+        with mock.patch.object(Image, 'render_thumbnails', autospec=True, side_effect=fail_for_second_image):
+            call_command('generate_thumbnails', sizes='20', stdout=StringIO(), stderr=err)
+        self.assertEqual(err.getvalue(), "Failed to generate thumbnails of 1 image(s).\n")
+        self.assertEqual(self.indexed_keys(self.images[1]), set())
+        self.assertEqual(self.indexed_keys(self.images[2]), {'20x20_crop_upscale'})
+
+    def test_worker_processes_set_up_django(self):
+        with mock.patch(
+            'filer.management.commands.generate_thumbnails.ProcessPoolExecutor', side_effect=InlineExecutor,
+        ) as executor:
+            self.assertIn("Processed 3 / 3 images", self.generate(sizes='20', workers=2))
+        executor.assert_called_once_with(max_workers=2, initializer=django.setup)
+        self.assertEqual(self.indexed_keys(self.images[2]), {'20x20_crop_upscale'})
@@ -0,0 +1,118 @@
+import hashlib
+import io
+import os
+from datetime import datetime
+from unittest import mock
+
+from django.apps import apps
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from filer import metadata
+from filer import settings as filer_settings
+from filer.models import File, Folder
+from filer.utils.loader import load_model
+from filer.validation import strip_exif
+from tests.helpers import create_image, create_superuser
+
+
+Image = load_model(filer_settings.FILER_IMAGE_MODEL)
+
+
+def create_jpeg(size=(640, 480), date_taken='2024:05:31 18:30:00'):
+    exif = create_image().getexif()
+    exif.get_ifd(0x8769)[36867] = date_taken  # DateTimeOriginal
+    content = io.BytesIO()
+    create_image(size=size).save(content, 'JPEG', exif=exif)
+    return content.getvalue()
+
+
+class ReadMetadataTests(TestCase):
+
+    def test_image_is_read_once(self):
+        data = create_jpeg()
+        upload = SimpleUploadedFile('photo.jpg', data, 'image/jpeg')
+        upload_metadata = metadata.read_metadata(upload)
+        self.assertEqual(upload_metadata.size, len(data))
+        self.assertEqual(upload_metadata.sha1, hashlib.sha1(data).hexdigest())
+        self.assertEqual(upload.sha1, upload_metadata.sha1)
+        self.assertEqual(upload_metadata.mime_type, 'image/jpeg')
+        self.assertEqual((upload_metadata.width, upload_metadata.height), (640, 480))
+        self.assertFalse(upload_metadata.transparent)
+        self.assertEqual(upload_metadata.exif['DateTimeOriginal'], '2024:05:31 18:30:00')
+        self.assertEqual(upload_metadata.date_taken.replace(tzinfo=None), datetime(2024, 5, 31, 18, 30))
+        self.assertEqual(upload_metadata.bytes_read, len(data))
+        self.assertEqual(upload.tell(), 0)
+
+    def test_only_header_is_read_for_known_digest(self):
+        data = os.urandom(2 * metadata.HEADER_SIZE)
+        upload = SimpleUploadedFile('movie.mp4', data, 'video/mp4')
+        upload.sha1 = 'known'
+        upload_metadata = metadata.read_metadata(upload)
+        self.assertEqual((upload_metadata.sha1, upload_metadata.size), ('known', len(data)))
+        self.assertEqual(upload_metadata.bytes_read, metadata.HEADER_SIZE)
+        self.assertIsNone(upload_metadata.width)
+        self.assertEqual(upload_metadata.mime_type, 'video/mp4')
+
+    def test_mime_type_is_sniffed(self):
+        content = io.BytesIO()
+        create_image(mode='RGBA', size=(20, 10)).save(content, 'PNG')
+        upload = SimpleUploadedFile('upload', content.getvalue())
+        upload_metadata = metadata.read_metadata(upload)
+        self.assertEqual(upload_metadata.mime_type, 'image/png')
+        self.assertEqual((upload_metadata.width, upload_metadata.height), (20, 10))
+        self.assertTrue(upload_metadata.transparent)
+
+    def test_rewritten_upload_is_read_again(self):
+        upload = SimpleUploadedFile('photo.jpg', create_jpeg(), 'image/jpeg')
+        metadata.read_metadata(upload)
+        strip_exif('photo.jpg', upload, None, 'image/jpeg')
+        self.assertIsNone(metadata.get_metadata(upload))
+        upload_metadata = metadata.read_metadata(upload)
+        self.assertEqual(upload_metadata.sha1, hashlib.sha1(upload.read()).hexdigest())
+        self.assertEqual(upload_metadata.exif, {})
+
+
+class UploadMetadataTests(TestCase):
+
+    def setUp(self):
+        create_superuser()
+        self.client.login(username='admin', password='secret')
+        self.folder = Folder.objects.create(name='uploads')
+        self.url = reverse('admin:filer-ajax_upload', kwargs={'folder_id': self.folder.pk})
+
+    def tearDown(self):
+        for f in File.objects.all():
+            f.delete()
+
+    @override_settings(USE_TZ=False)
+    def test_upload_is_read_once(self):
+        data = create_jpeg()
+        receiver = mock.Mock()
+        metadata.upload_read.connect(receiver)
+        self.addCleanup(metadata.upload_read.disconnect, receiver)
+        with mock.patch.object(File, 'generate_sha1', side_effect=AssertionError("Hashed again")), \
+                mock.patch('filer.models.abstract.get_exif_for_file', side_effect=AssertionError("Opened again")):
+            self.client.post(self.url, {'Filedata': SimpleUploadedFile('photo.jpg', data, 'image/jpeg')})
+        image = Image.objects.get()
+        self.assertEqual((image.width, image.height), (640, 480))
+        if filer_settings.FILER_IMAGE_MODEL == 'filer.Image':
+            # Custom image models do not necessarily store the date taken
+            self.assertEqual(image.date_taken, datetime(2024, 5, 31, 18, 30))
+        # Read for the metadata and copied into the storage
+        receiver.assert_called_once_with(
+            signal=metadata.upload_read, sender=mock.ANY, name='photo.jpg', size=len(data), bytes_read=2 * len(data),
+        )
+
+    def test_stripped_upload_is_hashed_again(self):
+        config = apps.get_app_config('filer')
+        with mock.patch.dict(config.FILE_VALIDATORS, {'image/jpeg': [strip_exif]}):
+            self.client.post(self.url, {'Filedata': SimpleUploadedFile('photo.jpg', create_jpeg(), 'image/jpeg')})
+        image = Image.objects.get()
+        with image.file.open() as stored:
+            data = stored.read()
+        self.assertEqual(
+            Image.objects.filter(pk=image.pk).values_list('sha1', '_file_size').get(),
+            (hashlib.sha1(data).hexdigest(), len(data)),
+        )
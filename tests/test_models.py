@@ -2,16 +2,19 @@ import os
 
 from django import VERSION as DJANGO_VERSION
 from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
 from django.core.files import File as DjangoFile
 from django.forms.models import modelform_factory
 from django.test import TestCase
 
 from filer import settings as filer_settings
 from filer.models.clipboardmodels import Clipboard
-from filer.models.filemodels import File
+from filer.models.filemodels import File, ThumbnailIndex
 from filer.models.foldermodels import Folder
 from filer.models.mixins import IconsMixin
 from filer.settings import FILER_IMAGE_MODEL
+from filer.utils.filer_easy_thumbnails import get_thumbnail_index_key
 from filer.utils.loader import load_model
 from tests.helpers import create_clipboard_item, create_folder_structure, create_image, create_superuser
 
@@ -324,3 +327,206 @@ class FilerApiTests(TestCase):
         self.assertEqual(len(User.objects.filter(username="test")), 0)
         # Image remains w/o owner
         self.assertIsNone(File.objects.get(pk=image.pk).owner)
+
+
+class FolderTreePathTests(TestCase):
+
+    def setUp(self):
+        self.root = Folder.objects.create(name='root')
+        self.child = Folder.objects.create(name='child', parent=self.root)
+        self.grandchild = Folder.objects.create(name='grandchild', parent=self.child)
+        self.other = Folder.objects.create(name='other')
+
+    def test_tree_path_on_create(self):
+        self.assertEqual(self.root.tree_path, '/')
+        self.assertEqual(self.child.tree_path, f'/{self.root.pk}/')
+        self.assertEqual(self.grandchild.tree_path, f'/{self.root.pk}/{self.child.pk}/')
+
+    def test_descendants_of(self):
+        with self.assertNumQueries(1):
+            descendants = set(Folder.objects.descendants_of(self.root))
+        self.assertEqual(descendants, {self.child, self.grandchild})
+        self.assertEqual(
+            set(Folder.objects.descendants_of(self.root, include_self=True)),
+            {self.root, self.child, self.grandchild},
+        )
+        self.assertEqual(sorted(self.root.get_descendants_ids()), sorted([self.child.pk, self.grandchild.pk]))
+
+    def test_move_updates_subtree(self):
+        self.child.parent = self.other
+        self.child.save()
+        self.grandchild.refresh_from_db()
+        self.assertEqual(self.grandchild.tree_path, f'/{self.other.pk}/{self.child.pk}/')
+        self.assertEqual(list(Folder.objects.descendants_of(self.root)), [])
+        self.assertEqual(set(Folder.objects.descendants_of(self.other)), {self.child, self.grandchild})
+
+    def test_move_stale_instance(self):
+        great_grandchild = Folder.objects.create(name='great-grandchild', parent=self.grandchild)
+        stale = Folder.objects.get(pk=self.grandchild.pk)
+        self.child.parent = self.other
+        self.child.save()
+        # The stale instance still has the tree path from before the move of its parent
+        stale.parent = self.root
+        stale.save()
+        great_grandchild.refresh_from_db()
+        self.assertEqual(great_grandchild.tree_path, f'/{self.root.pk}/{self.grandchild.pk}/')
+        self.assertEqual(Folder.objects.rebuild_tree_paths(), 0)
+        self.assertEqual(Folder.objects.rebuild_statistics(), 0)
+
+    def test_save_stale_instance_keeps_tree_path(self):
+        stale = Folder.objects.get(pk=self.grandchild.pk)
+        self.child.parent = self.other
+        self.child.save()
+        stale.name = 'renamed'
+        stale.save()
+        self.assertEqual(Folder.objects.rebuild_tree_paths(), 0)
+
+    def test_deferred_parent_is_not_loaded(self):
+        with self.assertNumQueries(1):
+            folders = list(Folder.objects.only('pk', 'name'))
+        self.assertEqual(len(folders), 4)
+        with self.assertNumQueries(2):
+            self.assertEqual(Folder.objects.rebuild_tree_paths(), 0)
+
+    def test_tree_too_deep(self):
+        max_length = Folder._meta.get_field('tree_path').max_length
+        Folder.objects.filter(pk=self.grandchild.pk).update(tree_path='/' * (max_length - 1))
+        with self.assertRaises(ValidationError):
+            Folder.objects.create(name='too deep', parent=self.grandchild)
+        # Moving a subtree checks the paths of all its descendants
+        Folder.objects.filter(pk=self.grandchild.pk).update(tree_path=f'/{self.root.pk}/{self.child.pk}/')
+        # The moved folder itself would fit, its child would not
+        length = max_length + 1 - len(f'{self.other.pk}/{self.child.pk}/')
+        Folder.objects.filter(pk=self.other.pk).update(tree_path='/' * length)
+        self.child.parent = self.other
+        with self.assertRaises(ValidationError):
+            self.child.save()
+
+    def test_rebuild_tree_paths(self):
+        Folder.objects.update(tree_path='/')
+        self.assertEqual(Folder.objects.rebuild_tree_paths(), 2)
+        self.grandchild.refresh_from_db()
+        self.assertEqual(self.grandchild.tree_path, f'/{self.root.pk}/{self.child.pk}/')
+
+    def test_logical_path_single_query(self):
+        grandchild = Folder.objects.get(pk=self.grandchild.pk)
+        cache.clear()
+        with self.assertNumQueries(1):
+            self.assertEqual(grandchild.logical_path, [self.root, self.child])
+        # Ancestors are now served from the cache
+        grandchild = Folder.objects.get(pk=self.grandchild.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(grandchild.pretty_logical_path, '/root/child/grandchild')
+
+    def test_logical_path_invalidated_on_rename(self):
+        self.assertEqual(Folder.objects.get(pk=self.grandchild.pk).pretty_logical_path, '/root/child/grandchild')
+        self.child.name = 'renamed'
+        self.child.save()
+        self.assertEqual(Folder.objects.get(pk=self.grandchild.pk).pretty_logical_path, '/root/renamed/grandchild')
+
+    def test_with_paths(self):
+        cache.clear()
+        with self.assertNumQueries(2):
+            folders = list(Folder.objects.order_by('pk').with_paths())
+            paths = [folder.pretty_logical_path for folder in folders]
+        self.assertEqual(paths, ['/root', '/root/child', '/root/child/grandchild', '/other'])
+
+
+class FolderStatisticsTests(TestCase):
+
+    def setUp(self):
+        self.root = Folder.objects.create(name='root')
+        self.child = Folder.objects.create(name='child', parent=self.root)
+        self.other = Folder.objects.create(name='other')
+
+    def tearDown(self):
+        for f in File.objects.all():
+            f.delete()
+
+    def create_file(self, folder, content=b'0123456789'):
+        from django.core.files.base import ContentFile
+        return File.objects.create(folder=folder, original_filename='test.txt', file=ContentFile(content, 'test.txt'))
+
+    def assertStatistics(self, folder, **expected):
+        folder.refresh_from_db()
+        self.assertEqual({key: getattr(folder, key) for key in expected}, expected)
+
+    def test_folder_create_and_move(self):
+        self.assertStatistics(self.root, children_count=1, total_children_count=1)
+        Folder.objects.create(name='grandchild', parent=self.child)
+        self.assertStatistics(self.root, children_count=1, total_children_count=2)
+        self.child.parent = self.other
+        self.child.save()
+        self.assertStatistics(self.root, children_count=0, total_children_count=0)
+        self.assertStatistics(self.other, children_count=1, total_children_count=2)
+
+    def test_file_create_move_and_delete(self):
+        file_obj = self.create_file(self.child)
+        self.assertStatistics(self.child, file_count=1, size=10, total_file_count=1, total_size=10)
+        self.assertStatistics(self.root, file_count=0, size=0, total_file_count=1, total_size=10)
+        file_obj.folder = self.other
+        file_obj.save()
+        self.assertStatistics(self.root, total_file_count=0, total_size=0)
+        self.assertStatistics(self.other, file_count=1, size=10)
+        File.objects.filter(pk=file_obj.pk).move_to(self.child)
+        self.assertStatistics(self.other, file_count=0, size=0)
+        self.assertStatistics(self.root, total_file_count=1, total_size=10)
+        file_obj.refresh_from_db()
+        file_obj.delete()
+        self.assertStatistics(self.root, total_file_count=0, total_size=0)
+        self.assertStatistics(self.child, file_count=0, size=0)
+
+    def test_subtree_delete(self):
+        self.create_file(self.child)
+        Folder.objects.create(name='grandchild', parent=self.child)
+        Folder.objects.filter(pk=self.child.pk).delete()
+        self.assertStatistics(self.root, children_count=0, total_children_count=0, total_file_count=0, total_size=0)
+
+    def test_rebuild_statistics(self):
+        self.create_file(self.child)
+        Folder.objects.update(_total_file_count=0, _children_count=5)
+        self.assertEqual(Folder.objects.rebuild_statistics(), 3)
+        self.assertStatistics(self.root, children_count=1, total_file_count=1, total_size=10)
+
+
+class ThumbnailIndexTests(TestCase):
+
+    def setUp(self):
+        self.folder = Folder.objects.create(name='folder')
+        self.filename = os.path.join(settings.FILE_UPLOAD_TEMP_DIR, 'indexed.jpg')
+        create_image().save(self.filename, 'JPEG')
+        with open(self.filename, 'rb') as upload:
+            self.image = Image.objects.create(
+                original_filename='indexed.jpg', file=DjangoFile(upload, name='indexed.jpg'),
+            )
+
+    def tearDown(self):
+        os.remove(self.filename)
+        for f in File.objects.all():
+            f.delete()
+
+    def indexed(self):
+        return dict(ThumbnailIndex.objects.filter(file=self.image).values_list('key', 'name'))
+
+    def test_generated_thumbnails_are_indexed(self):
+        icons = self.image.icons
+        key = get_thumbnail_index_key({'size': (32, 32), 'crop': True, 'upscale': True})
+        self.assertEqual(key, '32x32_crop_upscale')
+        self.assertIn(key, self.indexed())
+        self.assertTrue(icons['32'].endswith(self.indexed()[key]))
+        # Generating a thumbnail again updates the entry in place
+        self.image.icons
+        self.assertEqual(ThumbnailIndex.objects.filter(file=self.image, key=key).count(), 1)
+
+    def test_index_invalidated_on_move_and_replace(self):
+        self.image.icons
+        self.assertTrue(self.indexed())
+        File.objects.filter(pk=self.image.pk).move_to(self.folder)
+        self.assertFalse(self.indexed())
+
+        self.image.refresh_from_db()
+        self.image.icons
+        with open(self.filename, 'rb') as upload:
+            self.image.file = DjangoFile(upload, name='replaced.jpg')
+            self.image.save()
+        self.assertFalse(self.indexed())
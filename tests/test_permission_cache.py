@@ -1,7 +1,12 @@
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
 from django.test import TestCase
-from filer.cache import get_folder_perm_cache_key, get_folder_permission_cache, clear_folder_permission_cache, update_folder_permission_cache
+from filer.cache import (
+    bump_folder_permission_version, clear_folder_permission_cache, get_folder_perm_cache_key,
+    get_folder_permission_cache, get_folder_permission_version, get_folder_tree_version,
+    update_folder_permission_cache,
+)
+from filer.models import Folder, FolderPermission
 
 
 User = get_user_model()
@@ -18,10 +23,11 @@ class PermissionCacheTests(TestCase):
 
     def test_get_folder_perm_cache_key_generates_unique_key_for_user_and_permission(self):
         key = get_folder_perm_cache_key(self.user, self.permission)
-        self.assertEqual(key, f"filer:perm:{self.permission}")
+        version = get_folder_permission_version()
+        self.assertEqual(key, f"filer:perm:{version}:{self.permission}:{self.user.pk}")
 
     def test_get_folder_permission_cache_returns_permissions_for_existing_cache(self):
-        cache.set(get_folder_perm_cache_key(self.user, self.permission), {self.user.pk: self.id_list})
+        cache.set(get_folder_perm_cache_key(self.user, self.permission), self.id_list)
         permissions = get_folder_permission_cache(self.user, self.permission)
         self.assertEqual(permissions, self.id_list)
 
@@ -51,3 +57,62 @@ class PermissionCacheTests(TestCase):
         update_folder_permission_cache(self.user, self.permission, self.id_list)
         permissions = get_folder_permission_cache(self.user, self.permission)
         self.assertEqual(permissions, self.id_list)
+
+    def test_update_folder_permission_cache_keeps_other_users(self):
+        other_user = User.objects.create_user(username='otheruser', password='12345')
+        update_folder_permission_cache(other_user, self.permission, {3})
+        update_folder_permission_cache(self.user, self.permission, self.id_list)
+        self.assertEqual(get_folder_permission_cache(other_user, self.permission), {3})
+
+    def test_empty_permissions_are_cached(self):
+        update_folder_permission_cache(self.user, self.permission, set())
+        self.assertEqual(get_folder_permission_cache(self.user, self.permission), set())
+
+    def test_bump_folder_permission_version_invalidates_all_users(self):
+        update_folder_permission_cache(self.user, self.permission, self.id_list)
+        bump_folder_permission_version()
+        self.assertIsNone(get_folder_permission_cache(self.user, self.permission))
+
+    def test_permission_cache_invalidated_by_signals(self):
+        folder = Folder.objects.create(name='folder')
+        update_folder_permission_cache(self.user, self.permission, set())
+        FolderPermission.objects.create(folder=folder, type=FolderPermission.THIS, user=self.user,
+                                        can_read=FolderPermission.ALLOW)
+        self.assertIsNone(get_folder_permission_cache(self.user, self.permission))
+
+        update_folder_permission_cache(self.user, self.permission, set())
+        Folder.objects.create(name='subfolder', parent=folder)
+        self.assertIsNone(get_folder_permission_cache(self.user, self.permission))
+
+        update_folder_permission_cache(self.user, self.permission, set())
+        self.user.groups.create(name='group')
+        self.assertIsNone(get_folder_permission_cache(self.user, self.permission))
+
+    def test_versions_bumped_only_when_the_tree_changes(self):
+        folder = Folder.objects.create(name='folder')
+        subfolder = Folder.objects.create(name='subfolder')
+
+        def get_versions():
+            return get_folder_permission_version(), get_folder_tree_version()
+
+        versions = get_versions()
+        subfolder.owner = self.user
+        subfolder.save()
+        folder._file_count = 1
+        folder.save(update_fields=['_file_count'])
+        self.assertEqual(get_versions(), versions)
+
+        # Renaming only invalidates the ancestor lists
+        folder.name = 'renamed'
+        folder.save()
+        self.assertEqual(get_versions()[0], versions[0])
+        self.assertNotEqual(get_versions()[1], versions[1])
+
+        versions = get_versions()
+        subfolder.parent = folder
+        subfolder.save()
+        self.assertTrue(all(new != old for new, old in zip(get_versions(), versions)))
+
+        versions = get_versions()
+        subfolder.delete()
+        self.assertNotEqual(get_versions()[0], versions[0])
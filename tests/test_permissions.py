@@ -149,10 +149,6 @@ class FolderPermissionsTestCase(TestCase):
 
             self.assertEqual(FolderPermission.objects.count(), 2)
 
-            # We have to invalidate cache
-            delattr(self.folder, 'permission_cache')
-            delattr(self.folder_perm, 'permission_cache')
-
             self.assertEqual(self.folder.has_read_permission(request1), True)
             self.assertEqual(self.folder.has_read_permission(request2), False)
             self.assertEqual(self.folder_perm.has_read_permission(request1), False)
@@ -161,9 +157,6 @@ class FolderPermissionsTestCase(TestCase):
             self.test_user1.groups.add(self.group2)
             self.test_user2.groups.add(self.group1)
 
-            # We have to invalidate cache
-            delattr(self.folder, 'permission_cache')
-            delattr(self.folder_perm, 'permission_cache')
             cache.clear()
 
             self.assertEqual(self.folder.has_read_permission(request1), True)
@@ -196,9 +189,6 @@ class FolderPermissionsTestCase(TestCase):
 
             self.assertEqual(FolderPermission.objects.count(), 2)
 
-            # We have to invalidate cache
-            delattr(self.folder, 'permission_cache')
-
             self.assertEqual(self.test_user1.groups.filter(pk=self.group1.pk).exists(), True)
             self.assertEqual(self.test_user1.groups.filter(pk=self.group2.pk).exists(), False)
 
@@ -211,9 +201,6 @@ class FolderPermissionsTestCase(TestCase):
 
             self.assertEqual(self.test_user1.groups.count(), 2)
 
-            # We have to invalidate cache
-            delattr(self.folder, 'permission_cache')
-
             self.assertEqual(self.folder.has_read_permission(request1), True)
             self.assertEqual(self.folder.has_edit_permission(request1), False)
 
@@ -242,9 +229,6 @@ class FolderPermissionsTestCase(TestCase):
 
             self.assertEqual(FolderPermission.objects.count(), 2)
 
-            # We have to invalidate cache
-            delattr(self.folder_perm, 'permission_cache')
-
             self.assertEqual(self.test_user2.groups.filter(pk=self.group2.pk).exists(), True)
             self.assertEqual(self.test_user2.groups.filter(pk=self.group1.pk).exists(), False)
 
@@ -257,9 +241,6 @@ class FolderPermissionsTestCase(TestCase):
 
             self.assertEqual(self.test_user2.groups.count(), 2)
 
-            # We have to invalidate cache
-            delattr(self.folder_perm, 'permission_cache')
-
             self.assertEqual(self.folder_perm.has_read_permission(request2), True)
             self.assertEqual(self.folder_perm.has_edit_permission(request2), False)
 
@@ -287,9 +268,6 @@ class FolderPermissionsTestCase(TestCase):
 
             self.assertEqual(FolderPermission.objects.count(), 2)
 
-            # We have to invalidate cache
-            delattr(self.folder, 'permission_cache')
-
             self.assertEqual(self.test_user1.groups.filter(pk=self.group1.pk).exists(), True)
             self.assertEqual(self.test_user1.groups.filter(pk=self.group2.pk).exists(), False)
 
@@ -302,9 +280,6 @@ class FolderPermissionsTestCase(TestCase):
 
             self.assertEqual(self.test_user1.groups.count(), 2)
 
-            # We have to invalidate cache
-            delattr(self.folder, 'permission_cache')
-
             self.assertEqual(self.folder.has_read_permission(request1), True)
             self.assertEqual(self.folder.has_edit_permission(request1), True)
 
@@ -333,9 +308,6 @@ class FolderPermissionsTestCase(TestCase):
 
             self.assertEqual(FolderPermission.objects.count(), 2)
 
-            # We have to invalidate cache
-            delattr(self.folder_perm, 'permission_cache')
-
             self.assertEqual(self.test_user2.groups.filter(pk=self.group2.pk).exists(), True)
             self.assertEqual(self.test_user2.groups.filter(pk=self.group1.pk).exists(), False)
 
@@ -348,9 +320,6 @@ class FolderPermissionsTestCase(TestCase):
 
             self.assertEqual(self.test_user2.groups.count(), 2)
 
-            # We have to invalidate cache
-            delattr(self.folder_perm, 'permission_cache')
-
             self.assertEqual(self.folder_perm.has_read_permission(request2), True)
             self.assertEqual(self.folder_perm.has_edit_permission(request2), True)
 
@@ -445,6 +414,34 @@ class FolderPermissionsTestCase(TestCase):
                 target_file.close()
             cache.clear()
 
+    def test_actions_on_unsorted_files_of_others_with_permissions_disabled(self):
+        # Without folder permissions, files in the unsorted uploads still belong
+        # to their owner only, as File.has_edit_permission says.
+        old_setting = filer_settings.FILER_ENABLE_PERMISSIONS
+        try:
+            filer_settings.FILER_ENABLE_PERMISSIONS = False
+            self.test_user1.user_permissions.add(*Permission.objects.filter(
+                codename__in=("change_file", "delete_file", "change_image", "delete_image")
+            ))
+            unsorted = Image.objects.create(owner=self.owner, original_filename="unsorted.jpg", file=self.file)
+            destination = Folder.objects.create(name="destination")
+            self.assertTrue(
+                self.client.login(username=self.test_user1.username, password="secret")
+            )
+            url = reverse('admin:filer-directory_listing-unfiled_images')
+            for data in (
+                {'action': 'delete_files_or_folders', 'post': 'yes'},
+                {'action': 'move_files_and_folders', 'post': 'yes', 'destination': destination.pk},
+            ):
+                data[helpers.ACTION_CHECKBOX_NAME] = ['file-%d' % unsorted.pk]
+                response = self.client.post(url, data)
+                self.assertEqual(response.status_code, 403)
+            unsorted.refresh_from_db()
+            self.assertIsNone(unsorted.folder_id)
+        finally:
+            filer_settings.FILER_ENABLE_PERMISSIONS = old_setting
+            cache.clear()
+
     def test_folderpermission_is_copied(self):
         source_folder = Folder.objects.create(name="source")
         destination_folder = Folder.objects.create(name="destination")
@@ -474,3 +471,112 @@ class FolderPermissionsTestCase(TestCase):
         self.assertEqual(perm.can_edit, new_perm.can_edit)
         self.assertEqual(perm.can_read, new_perm.can_read)
         self.assertEqual(perm.can_add_children, new_perm.can_add_children)
+
+
+class PermissionQuerySetTestCase(TestCase):
+
+    def setUp(self):
+        from django.contrib.auth import get_user_model
+        User = get_user_model()
+
+        self.user = User.objects.create(username='user', is_staff=True)
+        self.group = Group.objects.create(name='group')
+        self.user.groups.add(self.group)
+        self.root = Folder.objects.create(name='root')
+        self.child = Folder.objects.create(name='child', parent=self.root)
+        self.grandchild = Folder.objects.create(name='grandchild', parent=self.child)
+        self.other = Folder.objects.create(name='other')
+        self.owned = Folder.objects.create(name='owned', owner=self.user)
+        self.old_setting = filer_settings.FILER_ENABLE_PERMISSIONS
+        filer_settings.FILER_ENABLE_PERMISSIONS = True
+
+    def tearDown(self):
+        filer_settings.FILER_ENABLE_PERMISSIONS = self.old_setting
+        cache.clear()
+
+    def assertReadable(self, *folders):
+        self.assertEqual(set(Folder.objects.readable_by(self.user)), set(folders))
+        # Same result as the cached id list (which does not include owned folders)
+        id_list = FolderPermission.objects.get_read_id_list(self.user)
+        for folder in Folder.objects.exclude(pk=self.owned.pk):
+            self.assertEqual(folder.pk in id_list, folder in folders)
+
+    def test_no_permissions(self):
+        self.assertReadable(self.owned)
+
+    def test_this_only(self):
+        FolderPermission.objects.create(folder=self.child, type=FolderPermission.THIS, user=self.user,
+                                        can_read=FolderPermission.ALLOW)
+        self.assertReadable(self.child, self.owned)
+
+    def test_children_with_deny(self):
+        FolderPermission.objects.create(folder=self.root, type=FolderPermission.CHILDREN, group=self.group,
+                                        can_read=FolderPermission.ALLOW)
+        FolderPermission.objects.create(folder=self.grandchild, type=FolderPermission.THIS, everybody=True,
+                                        can_read=FolderPermission.DENY)
+        self.assertReadable(self.root, self.child, self.owned)
+
+    def test_subtree_of_nested_folder(self):
+        FolderPermission.objects.create(folder=self.child, type=FolderPermission.ALL, user=self.user,
+                                        can_read=FolderPermission.ALLOW)
+        self.assertReadable(self.child, self.grandchild, self.owned)
+
+    def test_all_folders(self):
+        FolderPermission.objects.create(type=FolderPermission.ALL, everybody=True, can_read=FolderPermission.ALLOW)
+        FolderPermission.objects.create(type=FolderPermission.ALL, everybody=True, can_edit=FolderPermission.DENY)
+        self.assertReadable(self.root, self.child, self.grandchild, self.other, self.owned)
+        self.assertEqual(set(Folder.objects.editable_by(self.user)), {self.owned})
+
+    def test_files_readable_by(self):
+        FolderPermission.objects.create(folder=self.child, type=FolderPermission.THIS, user=self.user,
+                                        can_read=FolderPermission.ALLOW)
+        from filer.models import File
+        readable = File.objects.create(folder=self.child, original_filename='readable.txt')
+        File.objects.create(folder=self.other, original_filename='hidden.txt')
+        owned = File.objects.create(folder=self.other, original_filename='owned.txt', owner=self.user)
+        # Files of others in a folder the user owns, but not in its subfolders
+        in_owned_folder = File.objects.create(folder=self.owned, original_filename='in_owned_folder.txt')
+        subfolder = Folder.objects.create(name='subfolder', parent=self.owned)
+        File.objects.create(folder=subfolder, original_filename='in_subfolder.txt')
+        with self.assertNumQueries(1):
+            files = set(File.objects.readable_by(self.user))
+        self.assertEqual(files, {readable, owned, in_owned_folder})
+
+    def test_permissions_resolved_once_per_request(self):
+        from django.test import RequestFactory
+        FolderPermission.objects.create(folder=self.root, type=FolderPermission.ALL, user=self.user,
+                                        can_read=FolderPermission.ALLOW)
+        request = RequestFactory().get('/')
+        request.user = self.user
+        self.assertTrue(self.root.has_read_permission(request))
+        # Other instances share the permissions resolved for the request
+        folders = list(Folder.objects.filter(pk__in=[self.child.pk, self.grandchild.pk, self.other.pk]))
+        with self.assertNumQueries(0):
+            self.assertEqual([folder.has_read_permission(request) for folder in folders], [True, True, False])
+        # Changes to the permissions are visible within the same request
+        FolderPermission.objects.create(folder=self.other, type=FolderPermission.THIS, user=self.user,
+                                        can_read=FolderPermission.ALLOW)
+        self.assertTrue(folders[2].has_read_permission(request))
+
+    def test_files_without_folder_follow_has_generic_permission(self):
+        from django.contrib.auth import get_user_model
+        from django.test import RequestFactory
+
+        from filer.models import File
+        other = get_user_model().objects.create(username='other', is_staff=True)
+        files = [
+            File.objects.create(original_filename='owned.txt', owner=self.user),
+            File.objects.create(original_filename='other.txt', owner=other),
+            File.objects.create(original_filename='orphan.txt'),
+            File.objects.create(original_filename='in-folder.txt', folder=self.other, owner=other),
+        ]
+        for enabled in (True, False):
+            filer_settings.FILER_ENABLE_PERMISSIONS = enabled
+            request = RequestFactory().get('/')
+            request.user = self.user
+            for permission in ('read', 'edit'):
+                with self.subTest(enabled=enabled, permission=permission):
+                    self.assertEqual(
+                        set(File.objects.with_permission(self.user, permission)),
+                        {f for f in files if f.has_generic_permission(request, permission)},
+                    )
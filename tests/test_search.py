@@ -0,0 +1,142 @@
+from io import StringIO
+from unittest import mock
+
+from django.contrib.admin import site
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+
+from filer import settings as filer_settings
+from filer.admin.folderadmin import FolderAdmin
+from filer.models import File, Folder, SearchIndex, SearchTrigram
+from filer.search import SQLiteSearchBackend, TrigramSearchBackend, build_document, get_search_backend, get_trigrams
+from tests.helpers import SettingsOverride, create_superuser
+
+
+class SearchIndexTests(TestCase):
+
+    def setUp(self):
+        self.superuser = create_superuser()
+        self.client.login(username='admin', password='secret')
+        self.folder = Folder.objects.create(name='Holiday Pictures')
+        self.subfolder = Folder.objects.create(name='Beach', parent=self.folder)
+        self.file = self.create_file('sunset_at_the_beach.txt', self.subfolder, description='Evening Sky')
+        self.other_file = self.create_file('invoice.txt', None)
+
+    def tearDown(self):
+        for f in File.objects.all():
+            f.delete()
+
+    def create_file(self, name, folder, **kwargs):
+        return File.objects.create(
+            owner=self.superuser, original_filename=name, folder=folder,
+            file=ContentFile(b'data', name=name), **kwargs
+        )
+
+    def search(self, kind, *terms, backend=None):
+        backend = backend or get_search_backend()
+        return set(backend.search(kind, terms).values_list('object_id', flat=True))
+
+    def test_helpers(self):
+        self.assertEqual(build_document('Foo', None, '', 'BAR'), 'foo bar')
+        self.assertEqual(get_trigrams('abcd'), {'abc', 'bcd'})
+        self.assertEqual(get_trigrams('ab'), set())
+
+    def test_documents_updated_on_save_and_delete(self):
+        entry = SearchIndex.objects.get(kind=SearchIndex.FILE, object_id=self.file.pk)
+        self.assertIn('sunset_at_the_beach.txt', entry.document)
+        self.assertIn('evening sky', entry.document)
+        self.assertIn('admin@free.fr', entry.document)
+
+        self.file.name = 'Renamed'
+        self.file.save()
+        entry.refresh_from_db()
+        self.assertIn('renamed', entry.document)
+
+        self.file.delete()
+        self.assertFalse(SearchIndex.objects.filter(kind=SearchIndex.FILE, object_id=self.file.pk).exists())
+        self.folder.delete()
+        self.assertFalse(SearchIndex.objects.filter(kind=SearchIndex.FOLDER).exists())
+
+    def test_documents_updated_when_owner_changes(self):
+        folder = Folder.objects.create(name='Owned', owner=self.superuser)
+        self.superuser.email = 'someone@example.com'
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.superuser.save()
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(self.search(SearchIndex.FILE, 'someone@example'), {self.file.pk, self.other_file.pk})
+        self.assertEqual(self.search(SearchIndex.FOLDER, 'someone@example'), {folder.pk})
+        # Saving without changing the indexed fields does not update the documents
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.superuser.save()
+        self.assertEqual(callbacks, [])
+        with self.assertNumQueries(1):
+            self.superuser.save(update_fields=['last_login'])
+
+    def test_auto_backend_matches_substrings(self):
+        with mock.patch.object(connection, 'vendor', 'postgresql'):
+            self.assertIsInstance(get_search_backend(), TrigramSearchBackend)
+
+    def test_sqlite_backend(self):
+        backend = get_search_backend()
+        self.assertIsInstance(backend, SQLiteSearchBackend)
+        self.assertTrue(backend.is_installed())
+        self.assertEqual(self.search(SearchIndex.FILE, 'BEACH'), {self.file.pk})
+        self.assertEqual(self.search(SearchIndex.FILE, 'sunset', 'sky'), {self.file.pk})
+        self.assertEqual(self.search(SearchIndex.FILE, 'sunset', 'invoice'), set())
+        # Terms shorter than a trigram are matched without the index
+        self.assertEqual(self.search(SearchIndex.FILE, 'vo'), {self.other_file.pk})
+        self.assertEqual(self.search(SearchIndex.FOLDER, 'IDAY'), {self.folder.pk})
+        self.assertEqual(self.search(SearchIndex.FOLDER, '"'), set())
+
+    def test_trigram_backend(self):
+        backend = TrigramSearchBackend()
+        self.assertEqual(backend.rebuild(), 0)
+        self.assertTrue(SearchTrigram.objects.filter(entry__object_id=self.file.pk, trigram='sun').exists())
+        self.assertEqual(self.search(SearchIndex.FILE, 'BEACH', backend=backend), {self.file.pk})
+        self.assertEqual(self.search(SearchIndex.FILE, 'sunset', 'sky', backend=backend), {self.file.pk})
+        self.assertEqual(self.search(SearchIndex.FILE, 'beach', 'voice', backend=backend), set())
+        self.assertEqual(self.search(SearchIndex.FILE, 'vo', backend=backend), {self.other_file.pk})
+        # The trigrams of all candidates are present, but not in this order
+        self.assertEqual(self.search(SearchIndex.FILE, 'ceinvo', backend=backend), set())
+
+        with SettingsOverride(filer_settings, FILER_SEARCH_BACKEND='filer.search.TrigramSearchBackend'):
+            self.file.description = 'Morning Sky'
+            self.file.save()
+            self.assertEqual(self.search(SearchIndex.FILE, 'morning', backend=backend), {self.file.pk})
+            self.assertEqual(self.search(SearchIndex.FILE, 'evening', backend=backend), set())
+
+    def test_rebuild_command(self):
+        File.objects.filter(pk=self.file.pk).update(description='Updated in bulk')
+        SearchIndex.objects.filter(kind=SearchIndex.FOLDER, object_id=self.folder.pk).delete()
+        SearchIndex.objects.create(kind=SearchIndex.FILE, object_id=self.other_file.pk + 1000)
+        self.assertEqual(self.search(SearchIndex.FILE, 'bulk'), set())
+
+        out = StringIO()
+        call_command('filer_rebuild_search_index', stdout=out)
+        self.assertEqual(out.getvalue(), "Updated the search index of 2 file(s) and folder(s).\n")
+        self.assertEqual(self.search(SearchIndex.FILE, 'bulk'), {self.file.pk})
+        self.assertEqual(self.search(SearchIndex.FOLDER, 'holiday'), {self.folder.pk})
+        self.assertFalse(SearchIndex.objects.filter(object_id=self.other_file.pk + 1000).exists())
+
+    def test_admin_search(self):
+        url = reverse('admin:filer-directory_listing', kwargs={'folder_id': self.folder.id})
+        response = self.client.get(url, {'q': 'beach'})
+        self.assertEqual(
+            set(response.context['paginated_items'].object_list), {self.subfolder, self.file}
+        )
+        response = self.client.get(url, {'q': 'invoice', 'limit_search_to_folder': 'on'})
+        self.assertEqual(list(response.context['paginated_items'].object_list), [])
+        response = self.client.get(url, {'q': 'invoice'})
+        self.assertEqual(list(response.context['paginated_items'].object_list), [self.other_file])
+
+    def test_admin_search_without_index(self):
+        folderadmin = FolderAdmin(Folder, site)
+        self.assertIsNotNone(folderadmin.get_search_backend())
+        with SettingsOverride(filer_settings, FILER_SEARCH_BACKEND=''):
+            self.assertIsNone(folderadmin.get_search_backend())
+            self.assertEqual(
+                list(folderadmin.filter_file(File.objects.all(), ['sunset'])), [self.file]
+            )
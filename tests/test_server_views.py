@@ -1,15 +1,21 @@
 """Tests for filer.server.views."""
 
 from io import BytesIO
+from unittest import mock
 
+from django.contrib.admin import helpers
+from django.contrib.auth import get_user_model
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase, override_settings
+from django.urls import reverse
 
 from filer import settings as filer_settings
+from filer.models import Folder
 from filer.models.filemodels import File
 from filer.utils.loader import load_model
 from tests.helpers import create_image, create_superuser
 
+
 Image = load_model(filer_settings.FILER_IMAGE_MODEL)
 
 
@@ -150,3 +156,68 @@ class ServeProtectedThumbnailTests(TestCase):
             f"Expected 200, got {response.status_code} for {thumb_url}"
         )
         self.assertIn(response['Content-Type'], ['image/jpeg', 'image/webp'])
+
+
+class ServeSharedStoredFileTests(TestCase):
+    """Private files sharing one stored file, e.g., deduplicated uploads or copies."""
+
+    def setUp(self):
+        User = get_user_model()
+        self.alice = User.objects.create_user('alice', password='secret')
+        self.bob = User.objects.create_user('bob', password='secret')
+        User.objects.create_user('carol', password='secret')
+        buffer = BytesIO()
+        create_image(mode='RGB', size=(200, 100)).save(buffer, format='JPEG')
+        self.content = buffer.getvalue()
+
+    def tearDown(self):
+        for f in File.objects.all():
+            f.delete()
+
+    def create_image(self, owner, **kwargs):
+        return Image.objects.create(
+            owner=owner, is_public=False, original_filename='shared.jpg', mime_type='image/jpeg',
+            file=SimpleUploadedFile('shared.jpg', self.content, 'image/jpeg'), **kwargs
+        )
+
+    def get_thumbnail_url(self, image):
+        thumbnail = image.easy_thumbnails_thumbnailer.get_thumbnail({'size': (100, 100)})
+        return '/' + filer_settings.FILER_PRIVATEMEDIA_THUMBNAIL_STORAGE.base_url.lstrip('/') + thumbnail.name
+
+    def assertServed(self, username, urls, status_code):
+        self.client.login(username=username, password='secret')
+        for url in urls:
+            self.assertEqual(self.client.get(url).status_code, status_code, f"{username}: {url}")
+        self.client.logout()
+
+    @mock.patch.object(filer_settings, 'FILER_DEDUPLICATE_FILES', True)
+    def test_serve_deduplicated_files(self):
+        first = self.create_image(self.alice)
+        second = self.create_image(self.bob)
+        self.assertEqual(first.file.name, second.file.name)
+        urls = [first.file.url, self.get_thumbnail_url(first)]
+        self.assertServed('alice', urls, 200)
+        self.assertServed('bob', urls, 200)
+        self.assertServed('carol', urls, 404)
+
+    @mock.patch.object(filer_settings, 'FILER_ENABLE_PERMISSIONS', True)
+    @mock.patch.object(filer_settings, 'FILER_COPY_MODE', 'reference')
+    def test_serve_copies(self):
+        create_superuser()
+        folder = Folder.objects.create(name='source')
+        destination = Folder.objects.create(name='destination')
+        original = self.create_image(self.alice, folder=folder)
+        self.client.login(username='admin', password='secret')
+        self.client.post(reverse('admin:filer-directory_listing', kwargs={'folder_id': folder.pk}), {
+            'action': 'copy_files_and_folders',
+            'post': 'yes',
+            'suffix': '',
+            'destination': destination.pk,
+            helpers.ACTION_CHECKBOX_NAME: f'file-{original.pk}',
+        })
+        self.client.logout()
+        self.assertEqual(destination.files.get().file.name, original.file.name)
+        urls = [original.file.url, self.get_thumbnail_url(original)]
+        self.assertServed('admin', urls, 200)
+        self.assertServed('alice', urls, 200)
+        self.assertServed('carol', urls, 404)
@@ -0,0 +1,230 @@
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from django.contrib.admin import helpers
+from django.core.files import File as DjangoFile
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage, InMemoryStorage
+from django.test import TestCase
+from django.urls import reverse
+
+from filer import settings as filer_settings
+from filer.models import File, Folder, ThumbnailIndex
+from filer.storage import copy_file, move_file
+from filer.utils.loader import load_model
+from tests.helpers import create_image, create_superuser
+
+
+Image = load_model(filer_settings.FILER_IMAGE_MODEL)
+
+
+class CopyingStorage(InMemoryStorage):
+    """A storage copying files within itself, like a cloud storage does."""
+
+    def filer_copy(self, src_storage, src_name, dst_name):
+        if src_storage is not self:
+            raise NotImplementedError
+        with self.open(src_name) as src_file:
+            # Stands in for a copy by the storage service
+            return self.save(dst_name, ContentFile(src_file.read()))
+
+
+class StorageOperationTests(TestCase):
+
+    def setUp(self):
+        self.location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.location)
+        self.public = FileSystemStorage(location=os.path.join(self.location, 'public'))
+        self.private = FileSystemStorage(location=os.path.join(self.location, 'private'))
+
+    def test_local_move_renames(self):
+        name = self.public.save('a/video.mp4', ContentFile(b'content'))
+        inode = os.stat(self.public.path(name)).st_ino
+        with mock.patch.object(self.public, 'open', side_effect=AssertionError("Read")):
+            moved = move_file(self.public, name, self.private, 'b/video.mp4')
+        self.assertEqual(moved, 'b/video.mp4')
+        self.assertEqual(os.stat(self.private.path(moved)).st_ino, inode)
+        self.assertFalse(self.public.exists(name))
+
+    def test_local_move_keeps_existing_file(self):
+        self.private.save('video.mp4', ContentFile(b'existing'))
+        name = self.public.save('video.mp4', ContentFile(b'content'))
+        moved = move_file(self.public, name, self.private, 'video.mp4')
+        self.assertNotEqual(moved, 'video.mp4')
+        with self.private.open('video.mp4') as existing, self.private.open(moved) as stored:
+            self.assertEqual((existing.read(), stored.read()), (b'existing', b'content'))
+
+    def test_move_across_file_systems_streams(self):
+        name = self.public.save('video.mp4', ContentFile(b'content'))
+        with mock.patch('os.link', side_effect=OSError(18, 'Invalid cross-device link')):
+            moved = move_file(self.public, name, self.private, 'video.mp4')
+        with self.private.open(moved) as stored:
+            self.assertEqual(stored.read(), b'content')
+        self.assertFalse(self.public.exists(name))
+
+    def test_move_to_remote_storage_streams(self):
+        remote = InMemoryStorage()
+        name = self.public.save('video.mp4', ContentFile(b'content' * 100000))
+        with mock.patch.object(remote, 'save', wraps=remote.save) as save:
+            moved = move_file(self.public, name, remote, 'video.mp4')
+        # Saved chunk by chunk from the opened file
+        self.assertNotIsInstance(save.call_args.args[1], ContentFile)
+        with remote.open(moved) as stored:
+            self.assertEqual(stored.read(), b'content' * 100000)
+        self.assertFalse(self.public.exists(name))
+
+    def test_local_copy(self):
+        name = self.public.save('video.mp4', ContentFile(b'content'))
+        with mock.patch.object(self.public, 'open', side_effect=AssertionError("Read")):
+            copied = copy_file(self.public, name, self.public, 'video.mp4')
+            linked = copy_file(self.public, name, self.public, 'video.mp4', link=True)
+        self.assertEqual(len({name, copied, linked}), 3)
+        inode = os.stat(self.public.path(name)).st_ino
+        self.assertNotEqual(os.stat(self.public.path(copied)).st_ino, inode)
+        self.assertEqual(os.stat(self.public.path(linked)).st_ino, inode)
+        for stored_name in (name, copied, linked):
+            with self.public.open(stored_name) as stored:
+                self.assertEqual(stored.read(), b'content')
+
+    def test_local_copy_without_kernel_copy(self):
+        name = self.public.save('video.mp4', ContentFile(b'content' * 100000))
+        with mock.patch('filer.storage.FICLONE', None), \
+                mock.patch('os.copy_file_range', side_effect=OSError(18, 'Invalid cross-device link'), create=True):
+            copied = copy_file(self.public, name, self.private, 'video.mp4')
+        with self.private.open(copied) as stored:
+            self.assertEqual(stored.read(), b'content' * 100000)
+
+    def test_server_side_copy(self):
+        remote = CopyingStorage()
+        name = remote.save('video.mp4', ContentFile(b'content'))
+        with mock.patch('filer.storage._stream_file', side_effect=AssertionError("Streamed")):
+            copied = copy_file(remote, name, remote, 'copy.mp4')
+        with remote.open(copied) as stored:
+            self.assertEqual(stored.read(), b'content')
+        self.assertTrue(remote.exists(name))
+        # Falls back to streaming for other storages
+        copied = copy_file(self.public, self.public.save('a.txt', ContentFile(b'a')), remote, 'a.txt')
+        self.assertTrue(remote.exists(copied))
+
+
+class CopyModeTests(TestCase):
+
+    def setUp(self):
+        self.superuser = create_superuser()
+        self.client.login(username='admin', password='secret')
+        self.folder = Folder.objects.create(name='source')
+        self.destination = Folder.objects.create(name='destination')
+        self.file = File.objects.create(
+            original_filename='video.txt', folder=self.folder, file=ContentFile(b'content', name='video.txt'),
+        )
+
+    def tearDown(self):
+        for f in File.objects.all():
+            f.delete()
+
+    def copy(self):
+        self.client.post(reverse('admin:filer-directory_listing', kwargs={'folder_id': self.folder.pk}), {
+            'action': 'copy_files_and_folders',
+            'post': 'yes',
+            'suffix': '',
+            'destination': self.destination.pk,
+            helpers.ACTION_CHECKBOX_NAME: f'file-{self.file.pk}',
+        })
+        return self.destination.files.get()
+
+    @mock.patch.object(filer_settings, 'FILER_COPY_MODE', 'link')
+    def test_copies_are_linked(self):
+        copy = self.copy()
+        self.assertNotEqual(copy.file.name, self.file.file.name)
+        self.assertEqual(os.stat(copy.file.path).st_ino, os.stat(self.file.file.path).st_ino)
+        self.assertEqual((copy.sha1, copy.size), (self.file.sha1, self.file.size))
+        self.assertEqual(self.folder.files.get(), self.file)
+
+    @mock.patch.object(filer_settings, 'FILER_COPY_MODE', 'reference')
+    def test_copies_reference_the_stored_file(self):
+        copy = self.copy()
+        self.assertEqual(copy.file.name, self.file.file.name)
+        # Until one of them is changed
+        copy._unshare_file()
+        copy.save()
+        self.assertNotEqual(copy.file.name, self.file.file.name)
+        with copy.file.open() as stored:
+            self.assertEqual(stored.read(), b'content')
+        # No longer shared
+        name = self.file.file.name
+        self.file._unshare_file()
+        self.assertEqual(self.file.file.name, name)
+
+
+class ToggleVisibilityTests(TestCase):
+
+    def setUp(self):
+        self.filename = os.path.join(tempfile.mkdtemp(), 'photo.jpg')
+        self.addCleanup(shutil.rmtree, os.path.dirname(self.filename))
+        create_image().save(self.filename, 'JPEG')
+
+    def tearDown(self):
+        for f in File.objects.all():
+            f.delete()
+
+    def test_toggle_moves_file_without_reading_it(self):
+        with open(self.filename, 'rb') as upload:
+            image = Image.objects.create(
+                original_filename='photo.jpg', file=DjangoFile(upload, name='photo.jpg'), is_public=False,
+            )
+        private_path = image.file.path
+        queue = mock.Mock()
+        with mock.patch.object(image.file.storages['private'], 'open', side_effect=AssertionError("Read")), \
+                mock.patch('filer.thumbnail_queue.get_thumbnail_queue', return_value=queue):
+            image.is_public = True
+            image.save()
+        self.assertTrue(image.file.path.startswith(filer_settings.FILER_PUBLICMEDIA_STORAGE.location))
+        self.assertFalse(os.path.exists(private_path))
+        with image.file.open() as stored, open(self.filename, 'rb') as original:
+            self.assertEqual(stored.read(), original.read())
+        # The thumbnails are generated again for the new location
+        queue.enqueue.assert_called_once_with(image, mock.ANY)
+
+    def create_image(self, is_public=False):
+        with open(self.filename, 'rb') as upload:
+            return Image.objects.create(
+                original_filename='photo.jpg', file=DjangoFile(upload, name='photo.jpg'), is_public=is_public,
+            )
+
+    def indexed_names(self, image):
+        return list(ThumbnailIndex.objects.filter(file=image).values_list('name', flat=True))
+
+    @mock.patch('filer.thumbnail_queue.get_thumbnail_queue', return_value=None)
+    def test_toggle_without_queue_removes_thumbnails(self, get_thumbnail_queue):
+        image = self.create_image()
+        image.icons
+        old_storage = image.file.thumbnail_storage
+        old_names = self.indexed_names(image)
+        self.assertTrue(old_names)
+        image.is_public = True
+        image.save()
+        self.assertFalse(any(old_storage.exists(name) for name in old_names))
+        self.assertEqual(self.indexed_names(image), [])
+        # Generated again in the new storage when requested
+        image = Image.objects.get(pk=image.pk)
+        image.icons
+        new_names = self.indexed_names(image)
+        self.assertEqual(len(new_names), len(old_names))
+        self.assertTrue(all(image.file.thumbnail_storage.exists(name) for name in new_names))
+        self.assertNotEqual(set(new_names), set(old_names))
+
+    @mock.patch('filer.thumbnail_queue.get_thumbnail_queue', return_value=None)
+    def test_toggle_keeps_thumbnails_of_referenced_files(self, get_thumbnail_queue):
+        image = self.create_image()
+        other = Image.objects.create(original_filename='photo.jpg', file=image.file.name, is_public=False)
+        image.icons
+        other.icons
+        storage = image.file.thumbnail_storage
+        image.is_public = True
+        image.save()
+        self.assertEqual(self.indexed_names(image), [])
+        other_names = self.indexed_names(other)
+        self.assertTrue(other_names)
+        self.assertTrue(all(storage.exists(name) for name in other_names))
@@ -0,0 +1,149 @@
+import os
+import tempfile
+import threading
+import time
+from unittest import mock
+
+from django.conf import settings
+from django.core.files import File as DjangoFile
+from django.core.files.storage import FileSystemStorage
+from django.test import TestCase
+from django.urls import reverse
+
+from easy_thumbnails.files import get_thumbnailer
+from easy_thumbnails.options import ThumbnailOptions
+
+from filer import settings as filer_settings
+from filer.models import File
+from filer.settings import FILER_IMAGE_MODEL
+from filer.thumbnail_locks import CacheLock, FileLock, get_lock_stats, get_thumbnail_lock, thumbnail_lock_waited
+from filer.thumbnail_queue import get_placeholder_url
+from filer.utils.loader import load_model
+from tests.helpers import create_image, create_superuser
+
+
+Image = load_model(FILER_IMAGE_MODEL)
+
+
+class ThumbnailLockTests(TestCase):
+
+    def setUp(self):
+        self.locks = [FileLock(tempfile.mkdtemp()), CacheLock()]
+
+    def test_lock_is_exclusive(self):
+        for lock in self.locks:
+            with self.subTest(lock=lock.__class__.__name__):
+                with lock.hold('thumbnail.jpg') as acquired:
+                    self.assertTrue(acquired)
+                    self.assertIsNone(lock.try_acquire('thumbnail.jpg'))
+                token = lock.try_acquire('thumbnail.jpg')
+                self.assertIsNotNone(token)
+                lock.release('thumbnail.jpg', token)
+
+    def test_lock_files_are_removed(self):
+        lock = self.locks[0]
+        tokens = [lock.try_acquire(name) for name in ('a.jpg', 'b.jpg')]
+        self.assertEqual(len(os.listdir(lock.directory)), 2)
+        for name, token in zip(('a.jpg', 'b.jpg'), tokens):
+            lock.release(name, token)
+        self.assertEqual(os.listdir(lock.directory), [])
+
+    def test_lock_on_removed_file_is_not_acquired(self):
+        lock = self.locks[0]
+        # The file was removed by the previous holder between open() and flock()
+        with mock.patch('filer.thumbnail_locks.os.stat', side_effect=FileNotFoundError):
+            self.assertIsNone(lock.try_acquire('thumbnail.jpg'))
+        token = lock.try_acquire('thumbnail.jpg')
+        self.assertIsNotNone(token)
+        lock.release('thumbnail.jpg', token)
+
+    def test_wait_times_out(self):
+        waits = []
+
+        def record(sender, name, waited, acquired, **kwargs):
+            waits.append((name, acquired))
+
+        thumbnail_lock_waited.connect(record)
+        try:
+            for lock in self.locks:
+                with self.subTest(lock=lock.__class__.__name__):
+                    stats = get_lock_stats()
+                    token = lock.try_acquire('thumbnail.jpg')
+                    with lock.hold('thumbnail.jpg', wait=0.1) as acquired:
+                        self.assertFalse(acquired)
+                    lock.release('thumbnail.jpg', token)
+                    self.assertEqual(get_lock_stats()['timed_out'], stats.get('timed_out', 0) + 1)
+                    self.assertGreaterEqual(get_lock_stats()['wait_seconds'], stats.get('wait_seconds', 0) + 0.1)
+        finally:
+            thumbnail_lock_waited.disconnect(record)
+        self.assertEqual(waits, [('thumbnail.jpg', False)] * 2)
+
+    def test_waiters_acquire_released_lock(self):
+        for lock in self.locks:
+            with self.subTest(lock=lock.__class__.__name__):
+                stats = get_lock_stats()
+                token = lock.try_acquire('thumbnail.jpg')
+                timer = threading.Timer(0.1, lock.release, ('thumbnail.jpg', token))
+                timer.start()
+                started = time.monotonic()
+                with lock.hold('thumbnail.jpg', wait=5) as acquired:
+                    self.assertTrue(acquired)
+                self.assertGreaterEqual(time.monotonic() - started, 0.1)
+                timer.join()
+                self.assertEqual(get_lock_stats()['contended'], stats.get('contended', 0) + 1)
+                self.assertEqual(get_lock_stats()['acquired'], stats.get('acquired', 0) + 1)
+
+    def test_get_thumbnail_lock(self):
+        self.assertIsInstance(get_thumbnail_lock(FileSystemStorage()), FileLock)
+        self.assertIsInstance(get_thumbnail_lock(object()), CacheLock)
+        with mock.patch.object(filer_settings, 'FILER_THUMBNAIL_LOCK', 'cache'):
+            self.assertIsInstance(get_thumbnail_lock(FileSystemStorage()), CacheLock)
+        with mock.patch.object(filer_settings, 'FILER_THUMBNAIL_LOCK', None):
+            self.assertIsNone(get_thumbnail_lock(FileSystemStorage()))
+
+
+class IconViewLockTests(TestCase):
+
+    def setUp(self):
+        self.superuser = create_superuser()
+        self.client.login(username='admin', password='secret')
+        self.filename = os.path.join(settings.FILE_UPLOAD_TEMP_DIR, 'locked.jpg')
+        create_image().save(self.filename, 'JPEG')
+        with open(self.filename, 'rb') as upload:
+            self.image = Image.objects.create(
+                original_filename='locked.jpg', file=DjangoFile(upload, name='locked.jpg'),
+            )
+        self.url = reverse('admin:filer_file_fileicon', args=(self.image.pk, 80))
+        thumbnailer = get_thumbnailer(self.image)
+        self.lock = get_thumbnail_lock(thumbnailer.thumbnail_storage)
+        self.thumbnail_name = thumbnailer.get_thumbnail_name(ThumbnailOptions({'size': (80, 80), 'crop': True}))
+
+    def tearDown(self):
+        os.remove(self.filename)
+        for f in File.objects.all():
+            f.delete()
+
+    def test_placeholder_while_rendered_by_another_request(self):
+        token = self.lock.try_acquire(self.thumbnail_name)
+        try:
+            with mock.patch.object(filer_settings, 'FILER_THUMBNAIL_LOCK_WAIT', 0):
+                response = self.client.get(self.url)
+        finally:
+            self.lock.release(self.thumbnail_name, token)
+        self.assertRedirects(response, get_placeholder_url(), fetch_redirect_response=False)
+        self.assertIn('no-cache', response['Cache-Control'])
+        self.assertFalse(self.image.thumbnail_index.exists())
+
+        response = self.client.get(self.url)
+        self.assertIn("/media/", response['Location'])
+        self.assertTrue(self.image.thumbnail_index.filter(key='80x80_crop').exists())
+
+    def test_existing_thumbnails_are_not_locked(self):
+        self.client.get(self.url)
+        token = self.lock.try_acquire(self.thumbnail_name)
+        try:
+            with mock.patch.object(filer_settings, 'FILER_THUMBNAIL_LOCK_WAIT', 0):
+                response = self.client.get(self.url)
+        finally:
+            self.lock.release(self.thumbnail_name, token)
+        self.assertIn("/media/", response['Location'])
@@ -1,12 +1,19 @@
 """Tests for filer.thumbnail_processors."""
+from io import BytesIO
+from unittest import mock
 
 from django.test import TestCase, override_settings
 
+from easy_thumbnails import source_generators
+from PIL import Image as PILImage
+from PIL import ImageChops, ImageStat
+
+from filer import settings as filer_settings
+from filer.source_generators import pil_image
 from filer.thumbnail_processors import (
-    normalize_subject_location,
-    whitespace,
+    SOURCE_SIZE_INFO, get_required_source_size, normalize_subject_location, reduce_image,
+    scale_and_crop_with_subject_location, whitespace,
 )
-
 from tests.helpers import create_image
 
 
@@ -136,3 +143,145 @@ class ScaleAndCropWithSubjectLocationTests(TestCase):
             img, size=(100, 50), crop=False, subject_location='100,50',
         )
         self.assertEqual(result.size, (100, 50))
+
+
+class RequiredSourceSizeTests(TestCase):
+    """Tests for get_required_source_size and reduce_image."""
+
+    def test_required_source_size(self):
+        self.assertEqual(get_required_source_size({'size': (40, 40), 'crop': True}, (400, 200)), (80, 40))
+        self.assertEqual(get_required_source_size({'size': (40, 40)}, (400, 200)), (40, 20))
+        self.assertEqual(get_required_source_size({'size': (100, 0)}, (400, 200)), (100, 50))
+        self.assertEqual(get_required_source_size({'size': (40, 40), 'zoom': 50}, (400, 200)), (60, 30))
+
+    def test_no_reduction(self):
+        self.assertIsNone(get_required_source_size({'size': (800, 800), 'upscale': True}, (400, 200)))
+        self.assertIsNone(get_required_source_size({'size': (40, 40), 'autocrop': True}, (400, 200)))
+        self.assertIsNone(get_required_source_size({'size': (0, 0)}, (400, 200)))
+
+    def test_reduce_image(self):
+        image = PILImage.new('RGB', (1000, 500))
+        self.assertEqual(reduce_image(image, (100, 50)).size, (200, 100))
+        self.assertIs(reduce_image(image, (400, 200)), image)
+        # Palette images cannot be reduced
+        palette = image.convert('P')
+        self.assertIs(reduce_image(palette, (100, 50)), palette)
+
+
+def create_photo(mode='RGB', size=(1601, 1203)):
+    """An image with fine detail everywhere, unlike ``create_image``."""
+    detail = PILImage.effect_mandelbrot(size, (-2.0, -1.2, 1.0, 1.2), 100)
+    gradient = PILImage.linear_gradient('L').resize(size)
+    image = PILImage.merge('RGB', (detail, gradient, gradient.transpose(PILImage.Transpose.ROTATE_180)))
+    if mode == 'RGBA':
+        image.putalpha(gradient)
+    return image.convert(mode)
+
+
+class FastDownscalingTests(TestCase):
+    """
+    Thumbnails downscaled with ``Image.reduce()`` first must be equivalent to
+    the ones resampled from the full image.
+    """
+    thumbnail_options = [
+        {'size': (100, 100), 'crop': True},
+        {'size': (120, 80)},
+        {'size': (150, 0)},
+        {'size': (0, 90)},
+        {'size': (64, 64), 'crop': 'smart'},
+        {'size': (300, 200), 'crop': '0,-10'},
+        {'size': (90, 90), 'crop': True, 'zoom': 20},
+        {'size': (100, 100), 'crop': True, 'subject_location': (1400, 200)},
+        {'size': (400, 100), 'crop': True, 'subject_location': '100,1100'},
+    ]
+
+    def process(self, image, reducing_gap, options):
+        with mock.patch.object(filer_settings, 'FILER_THUMBNAIL_REDUCING_GAP', reducing_gap):
+            return scale_and_crop_with_subject_location(image.copy(), **options)
+
+    def assertEquivalent(self, image, expected):
+        self.assertEqual(image.size, expected.size)
+        self.assertEqual(image.mode, expected.mode)
+        difference = ImageStat.Stat(ImageChops.difference(image.convert('RGBA'), expected.convert('RGBA')))
+        self.assertLess(max(difference.mean), 2)
+
+    def test_equivalent_thumbnails(self):
+        for mode in ('RGB', 'RGBA', 'L'):
+            image = create_photo(mode)
+            for options in self.thumbnail_options:
+                with self.subTest(mode=mode, options=options):
+                    self.assertEquivalent(self.process(image, 2.0, options), self.process(image, None, options))
+
+    def test_reduces_before_resampling(self):
+        image = create_photo()
+        for options in self.thumbnail_options[:2] + self.thumbnail_options[-2:]:
+            with self.subTest(options=options):
+                with mock.patch.object(PILImage.Image, 'reduce', autospec=True, side_effect=PILImage.Image.reduce) \
+                        as reduce:
+                    self.process(image, 2.0, options)
+                    self.assertTrue(reduce.called)
+                    reduce.reset_mock()
+                    self.process(image, None, options)
+                    self.assertFalse(reduce.called)
+
+    def test_resamples_once(self):
+        image = create_photo()
+        for options in self.thumbnail_options:
+            with self.subTest(options=options):
+                with mock.patch.object(PILImage.Image, 'resize', autospec=True, side_effect=PILImage.Image.resize) \
+                        as resize:
+                    self.process(image, 2.0, options)
+                self.assertEqual(resize.call_count, 1)
+
+    def test_upscaling_and_palette_images(self):
+        image = create_photo(size=(80, 60))
+        options = {'size': (160, 160), 'crop': True, 'upscale': True}
+        self.assertEquivalent(self.process(image, 2.0, options), self.process(image, None, options))
+        palette = create_photo().convert('P')
+        options = {'size': (100, 100), 'crop': True}
+        self.assertEquivalent(self.process(palette, 2.0, options), self.process(palette, None, options))
+
+    def test_animated_images_keep_their_frames(self):
+        frames = [create_photo(size=(400, 300)), create_photo(size=(400, 300)).rotate(180)]
+        data = BytesIO()
+        frames[0].save(data, 'GIF', save_all=True, append_images=frames[1:])
+        thumbnail = scale_and_crop_with_subject_location(PILImage.open(data), size=(100, 100), crop=True)
+        self.assertEqual(thumbnail.size, (100, 100))
+        self.assertEqual(thumbnail.n_frames, 2)
+
+
+class PilImageSourceGeneratorTests(TestCase):
+    """Tests for filer.source_generators.pil_image."""
+
+    def create_jpeg(self, size=(1600, 1200), orientation=None):
+        data = BytesIO()
+        exif = PILImage.Exif()
+        if orientation:
+            exif[0x0112] = orientation
+        create_photo(size=size).save(data, 'JPEG', quality=95, exif=exif)
+        data.seek(0)
+        return data
+
+    def test_decodes_at_reduced_scale(self):
+        image = pil_image(self.create_jpeg(), size=(100, 100), crop=True)
+        self.assertEqual(image.size, (400, 300))
+        self.assertEqual(image.info[SOURCE_SIZE_INFO], (1600, 1200))
+        # Upscaled and autocropped thumbnails need the full image
+        self.assertEqual(pil_image(self.create_jpeg(), size=(3200, 3200), upscale=True).size, (1600, 1200))
+        self.assertEqual(pil_image(self.create_jpeg(), size=(100, 100), autocrop=True).size, (1600, 1200))
+        with mock.patch.object(filer_settings, 'FILER_THUMBNAIL_REDUCING_GAP', None):
+            self.assertEqual(pil_image(self.create_jpeg(), size=(100, 100)).size, (1600, 1200))
+
+    def test_exif_orientation(self):
+        image = pil_image(self.create_jpeg(orientation=6), size=(100, 100), crop=True)
+        self.assertEqual(image.size, (300, 400))
+        self.assertEqual(image.info[SOURCE_SIZE_INFO], (1200, 1600))
+
+    def test_subject_location(self):
+        options = {'size': (100, 100), 'crop': True, 'subject_location': '1500,100'}
+        thumbnail = scale_and_crop_with_subject_location(pil_image(self.create_jpeg(), **options), **options)
+        image = source_generators.pil_image(self.create_jpeg())
+        expected = scale_and_crop_with_subject_location(image, **options)
+        difference = ImageStat.Stat(ImageChops.difference(thumbnail, expected))
+        self.assertEqual(thumbnail.size, expected.size)
+        self.assertLess(max(difference.mean), 4)
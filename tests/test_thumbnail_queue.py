@@ -0,0 +1,144 @@
+import os
+import threading
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.conf import settings
+from django.core.files import File as DjangoFile
+from django.core.management import call_command
+from django.db import DatabaseError, transaction
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from filer import settings as filer_settings
+from filer.models import File, ThumbnailIndex, ThumbnailJob
+from filer.settings import FILER_IMAGE_MODEL
+from filer.thumbnail_queue import DatabaseQueue, ThreadPoolQueue, get_placeholder_url
+from filer.utils.loader import load_model
+from tests.helpers import create_image, create_superuser
+
+
+Image = load_model(FILER_IMAGE_MODEL)
+
+
+class RecordingQueue(ThreadPoolQueue):
+    def __init__(self):
+        super().__init__(workers=1)
+        self.runs = []
+        # Jobs stay pending until released
+        self.released = threading.Event()
+
+    def run(self, file_id, options_list):
+        self.released.wait(5)
+        self.runs.append((file_id, [options['size'] for options in options_list]))
+
+    def join(self):
+        self.released.set()
+        self.executor.shutdown(wait=True)
+
+
+class ThumbnailQueueTests(TestCase):
+
+    def setUp(self):
+        self.superuser = create_superuser()
+        self.client.login(username='admin', password='secret')
+        self.filename = os.path.join(settings.FILE_UPLOAD_TEMP_DIR, 'queued.jpg')
+        create_image().save(self.filename, 'JPEG')
+        with open(self.filename, 'rb') as upload:
+            self.image = Image.objects.create(
+                original_filename='queued.jpg', file=DjangoFile(upload, name='queued.jpg'),
+            )
+
+    def tearDown(self):
+        os.remove(self.filename)
+        for f in File.objects.all():
+            f.delete()
+
+    def test_database_queue_deduplicates_jobs(self):
+        queue = DatabaseQueue()
+        queue.enqueue(self.image, [{'size': (40, 40), 'crop': True}])
+        queue.enqueue(self.image, [{'size': (40, 40), 'crop': True}, {'size': (80, 80), 'crop': True}])
+        self.assertEqual(
+            sorted(ThumbnailJob.objects.filter(file=self.image).values_list('key', flat=True)),
+            ['40x40_crop', '80x80_crop'],
+        )
+        self.assertEqual(ThumbnailJob.objects.get(key='40x40_crop').options, {'size': [40, 40], 'crop': True})
+
+    def test_database_queue_claims_jobs_once(self):
+        queue = DatabaseQueue()
+        queue.enqueue(self.image, [{'size': (40, 40), 'crop': True}, {'size': (80, 80), 'crop': True}])
+        self.assertEqual(len(queue.claim(10)), 2)
+        self.assertEqual(queue.claim(10), [])
+        # Jobs of a crashed worker are claimed again after a while
+        ThumbnailJob.objects.filter(key='40x40_crop').update(claimed_at=timezone.now() - timedelta(hours=1))
+        self.assertEqual([job.key for job in queue.claim(10)], ['40x40_crop'])
+
+    def test_database_queue_retries_failed_jobs(self):
+        queue = DatabaseQueue()
+        queue.enqueue(self.image, [{'size': (40, 40), 'crop': True}, {'size': (0, 0)}])
+        with self.assertLogs('filer.thumbnail_queue', 'ERROR'):
+            self.assertEqual(queue.process(), 2)
+        # The thumbnail which could be generated is kept
+        self.assertTrue(ThumbnailIndex.objects.filter(file=self.image, key='40x40_crop').exists())
+        job = ThumbnailJob.objects.get(file=self.image)
+        self.assertEqual((job.key, job.attempts), ('0x0', 1))
+        # The failed job is retried once its claim has expired
+        self.assertEqual(queue.process(), 0)
+        for _ in range(1, queue.max_attempts):
+            ThumbnailJob.objects.update(claimed_at=timezone.now() - timedelta(hours=1))
+            with self.assertLogs('filer.thumbnail_queue', 'ERROR'):
+                self.assertEqual(queue.process(), 1)
+        self.assertFalse(ThumbnailJob.objects.exists())
+
+    def test_icon_view_serves_placeholder(self):
+        url = reverse('admin:filer_file_fileicon', args=(self.image.pk, 80))
+        with mock.patch.object(filer_settings, 'FILER_THUMBNAIL_QUEUE', 'filer.thumbnail_queue.DatabaseQueue'):
+            response = self.client.get(url)
+            self.assertRedirects(response, get_placeholder_url(), fetch_redirect_response=False)
+            self.assertIn('no-cache', response['Cache-Control'])
+            self.client.get(url)
+            # The icon and its 1x variant, each queued once
+            self.assertEqual(ThumbnailJob.objects.filter(file=self.image).count(), 2)
+            self.assertFalse(ThumbnailIndex.objects.filter(file=self.image).exists())
+
+            out = StringIO()
+            call_command('filer_thumbnail_worker', once=True, stdout=out)
+            self.assertEqual(out.getvalue(), "Processed 2 thumbnail job(s).\n")
+            self.assertFalse(ThumbnailJob.objects.exists())
+            name = ThumbnailIndex.objects.get(file=self.image, key='80x80_crop').name
+
+            response = self.client.get(url)
+            self.assertTrue(response.url.endswith(name))
+
+    def test_icons_are_deferred(self):
+        with mock.patch.object(filer_settings, 'FILER_THUMBNAIL_QUEUE', 'filer.thumbnail_queue.DatabaseQueue'):
+            icons = self.image.icons
+        self.assertEqual(set(icons.values()), {get_placeholder_url()})
+        self.assertEqual(ThumbnailJob.objects.filter(file=self.image).count(), len(icons))
+        self.assertEqual(DatabaseQueue().work(once=True), len(icons))
+        self.assertNotIn(get_placeholder_url(), self.image.icons.values())
+
+    def test_thread_pool_queue(self):
+        queue = RecordingQueue()
+        with self.captureOnCommitCallbacks(execute=True):
+            queue.enqueue(self.image, [{'size': (40, 40), 'crop': True}])
+            queue.enqueue(self.image, [{'size': (40, 40), 'crop': True}, {'size': (80, 80), 'crop': True}])
+        queue.join()
+        self.assertEqual(queue.runs, [(self.image.pk, [[40, 40]]), (self.image.pk, [[80, 80]])])
+        self.assertEqual(queue.pending, set())
+
+    def test_thread_pool_queue_drops_jobs_of_rolled_back_transactions(self):
+        queue = RecordingQueue()
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    queue.enqueue(self.image, [{'size': (40, 40), 'crop': True}])
+                    raise DatabaseError
+            except DatabaseError:
+                pass
+            self.assertEqual(queue.pending, set())
+            queue.enqueue(self.image, [{'size': (40, 40), 'crop': True}])
+        queue.join()
+        self.assertEqual(queue.runs, [(self.image.pk, [[40, 40]])])
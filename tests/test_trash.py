@@ -0,0 +1,221 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.contrib.admin import helpers
+from django.contrib.messages import get_messages
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.db import IntegrityError, connection, transaction
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from filer import settings as filer_settings
+from filer.deletion import wait_for_stored_file_deletions
+from filer.models import File, Folder
+from filer.trash import purge_trash, restore, trash
+from tests.helpers import create_superuser
+
+
+STATISTICS = ('_file_count', '_size', '_children_count', '_total_file_count', '_total_size', '_total_children_count')
+
+
+class TrashTests(TestCase):
+
+    def setUp(self):
+        self.root = Folder.objects.create(name='root')
+        self.folder = Folder.objects.create(name='folder', parent=self.root)
+        self.subfolder = Folder.objects.create(name='subfolder', parent=self.folder)
+        self.file = self.create_file(self.root)
+        self.nested_file = self.create_file(self.subfolder)
+
+    def tearDown(self):
+        for f in File.objects.all():
+            f.delete()
+
+    def create_file(self, folder, name='file.txt'):
+        return File.objects.create(original_filename=name, folder=folder, file=ContentFile(b'content', name=name))
+
+    def get_statistics(self, folder):
+        return Folder.objects.filter(pk=folder.pk).values_list(*STATISTICS).get()
+
+    def test_trash_and_restore(self):
+        statistics = self.get_statistics(self.root)
+        self.assertEqual(trash(files=[self.file], folders=[self.folder]), (2, 2))
+        self.assertEqual(self.get_statistics(self.root), (0, 0, 0, 0, 0, 0))
+        self.assertEqual(
+            set(Folder.objects.filter(trashed_at__isnull=False).values_list('pk', flat=True)),
+            {self.folder.pk, self.subfolder.pk},
+        )
+        # Stored files are kept
+        self.assertTrue(self.nested_file.file.storage.exists(self.nested_file.file.name))
+        self.assertEqual(restore(files=[self.file], folders=[self.folder]), (2, 2))
+        self.assertFalse(File.objects.filter(trashed_at__isnull=False).exists())
+        self.assertFalse(Folder.objects.filter(trashed_at__isnull=False).exists())
+        self.assertEqual(self.get_statistics(self.root), statistics)
+        self.assertEqual(Folder.objects.rebuild_statistics(), 0)
+
+    def test_items_trashed_before_their_folder_stay_in_the_trash(self):
+        trash(files=[self.nested_file])
+        trash(folders=[self.folder])
+        self.assertEqual(Folder.objects.rebuild_statistics(), 0)
+        # Only the top folder can be restored
+        self.assertEqual(restore(files=[self.nested_file]), (0, 0))
+        self.assertEqual(restore(folders=[self.folder]), (0, 2))
+        self.assertEqual(File.objects.filter(trashed_at__isnull=False).get(), self.nested_file)
+        self.assertEqual(self.get_statistics(self.subfolder)[:2], (0, 0))
+        restore(files=[self.nested_file])
+        self.assertEqual(self.get_statistics(self.root)[3], 2)
+        self.assertEqual(Folder.objects.rebuild_statistics(), 0)
+
+    def test_restored_folder_is_renamed_if_its_name_is_taken(self):
+        trash(folders=[self.folder])
+        Folder.objects.create(name='folder', parent=self.root)
+        restore(folders=[self.folder])
+        self.assertEqual(
+            sorted(Folder.objects.filter(parent=self.root).values_list('name', flat=True)), ['folder', 'folder_1'],
+        )
+
+    def test_unique_names_without_conditional_constraints(self):
+        with mock.patch.object(connection.features, 'supports_partial_indexes', False):
+            with self.assertRaisesMessage(IntegrityError, 'already exists'), transaction.atomic():
+                Folder.objects.create(name='folder', parent=self.root)
+            trash(folders=[self.folder])
+            Folder.objects.create(name='folder', parent=self.root)
+            self.folder.refresh_from_db()
+            self.folder.save()
+
+    def test_purge(self):
+        trash(folders=[self.folder])
+        self.assertEqual(purge_trash(), (0, 0))
+        Folder.objects.filter(pk=self.folder.pk).update(trashed_at=timezone.now() - timedelta(days=31))
+        stdout = StringIO()
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command('filer_purge_trash', stdout=stdout)
+        wait_for_stored_file_deletions()
+        self.assertIn("Deleted 1 file(s) and 2 folder(s)", stdout.getvalue())
+        self.assertFalse(Folder.objects.filter(pk__in=[self.folder.pk, self.subfolder.pk]).exists())
+        self.assertFalse(self.nested_file.file.storage.exists(self.nested_file.file.name))
+        # The statistics were updated when the folder was trashed
+        self.assertEqual(self.get_statistics(self.root)[2:4], (0, 1))
+
+
+@mock.patch.object(filer_settings, 'FILER_ENABLE_TRASH', True)
+class TrashAdminTests(TestCase):
+
+    def setUp(self):
+        self.superuser = create_superuser()
+        self.client.login(username='admin', password='secret')
+        self.folder = Folder.objects.create(name='folder')
+        self.subfolder = Folder.objects.create(name='subfolder', parent=self.folder)
+        self.file = File.objects.create(
+            original_filename='file.txt', folder=self.subfolder, file=ContentFile(b'content', name='file.txt'),
+        )
+
+    def tearDown(self):
+        for f in File.objects.all():
+            f.delete()
+
+    def post_action(self, url, action, *items):
+        return self.client.post(url, {
+            'action': action,
+            'post': 'yes',
+            helpers.ACTION_CHECKBOX_NAME: list(items),
+        })
+
+    def test_delete_confirmation_lists_items_moved_to_trash(self):
+        trash(files=[self.file])
+        response = self.client.post(reverse('admin:filer-directory_listing', args=(self.folder.pk,)), {
+            'action': 'delete_files_or_folders',
+            helpers.ACTION_CHECKBOX_NAME: [f'folder-{self.subfolder.pk}'],
+        })
+        self.assertContains(response, 'move the selected files and/or folders to the trash')
+        self.assertContains(response, 'Folder: /folder/subfolder')
+        self.assertNotContains(response, 'related items will be deleted')
+        self.assertEqual(response.context['deletable_objects'], [])
+
+        response = self.client.post(reverse('admin:filer-directory_listing-trash'), {
+            'action': 'delete_files_or_folders',
+            helpers.ACTION_CHECKBOX_NAME: [f'file-{self.file.pk}'],
+        })
+        self.assertContains(response, 'related items will be deleted')
+        self.assertEqual(response.context['trashable_objects'], [])
+
+    def test_delete_moves_to_trash(self):
+        response = self.post_action(reverse('admin:filer-directory_listing-root'), 'delete_files_or_folders',
+                                    f'folder-{self.folder.pk}')
+        self.assertEqual(
+            [str(message) for message in get_messages(response.wsgi_request)],
+            ['Moved 1 files and/or folders to the trash.'],
+        )
+        self.assertTrue(File.objects.filter(pk=self.file.pk, trashed_at__isnull=False).exists())
+        self.assertTrue(self.file.file.storage.exists(self.file.file.name))
+
+        response = self.client.get(reverse('admin:filer-directory_listing-root'))
+        self.assertNotContains(response, f'folder-{self.folder.pk}')
+        self.assertContains(response, reverse('admin:filer-directory_listing-trash'))
+        response = self.client.get(reverse('admin:filer-directory_listing', args=(self.subfolder.pk,)))
+        self.assertEqual(response.status_code, 404)
+        response = self.client.get(reverse('admin:filer-directory_listing-root'), {'q': 'file'})
+        self.assertNotContains(response, f'file-{self.file.pk}')
+
+        # The trash lists the folder, not its contents
+        response = self.client.get(reverse('admin:filer-directory_listing-trash'))
+        self.assertContains(response, f'folder-{self.folder.pk}')
+        self.assertNotContains(response, f'folder-{self.subfolder.pk}')
+
+        self.post_action(reverse('admin:filer-directory_listing-trash'), 'restore_files_and_folders',
+                         f'folder-{self.folder.pk}')
+        self.assertFalse(File.objects.filter(trashed_at__isnull=False).exists())
+        response = self.client.get(reverse('admin:filer-directory_listing', args=(self.subfolder.pk,)))
+        self.assertContains(response, f'file-{self.file.pk}')
+
+    def test_restore_reports_skipped_items(self):
+        trash(files=[self.file])
+        trash(folders=[self.folder])
+        # A search in the trash also lists the items trashed along with a folder
+        url = reverse('admin:filer-directory_listing-trash') + '?q=file'
+        response = self.post_action(url, 'restore_files_and_folders', f'file-{self.file.pk}')
+        self.assertEqual(
+            [str(message) for message in get_messages(response.wsgi_request)],
+            ['1 files and/or folders were not restored because their folder is in the trash. '
+             'Restore the folder instead.'],
+        )
+        self.assertTrue(File.objects.filter(pk=self.file.pk, trashed_at__isnull=False).exists())
+
+    def test_restore_reports_restored_items(self):
+        trash(files=[self.file])
+        trash(folders=[self.folder])
+        url = reverse('admin:filer-directory_listing-trash')
+        response = self.post_action(url, 'restore_files_and_folders', f'folder-{self.folder.pk}')
+        # The file was trashed on its own and stays in the trash
+        self.assertEqual(
+            [str(message) for message in get_messages(response.wsgi_request)],
+            ['Successfully restored 0 files and 2 folders.'],
+        )
+        self.assertTrue(File.objects.filter(pk=self.file.pk, trashed_at__isnull=False).exists())
+
+        self.client.get(url)  # Displays the messages
+        response = self.post_action(url, 'restore_files_and_folders', f'file-{self.file.pk}')
+        self.assertEqual(
+            [str(message) for message in get_messages(response.wsgi_request)],
+            ['Successfully restored 1 files and 0 folders.'],
+        )
+
+    def test_delete_in_trash_deletes_for_good(self):
+        self.post_action(reverse('admin:filer-directory_listing', args=(self.subfolder.pk,)),
+                         'delete_files_or_folders', f'file-{self.file.pk}')
+        self.assertTrue(File.objects.filter(pk=self.file.pk).exists())
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post_action(reverse('admin:filer-directory_listing-trash'), 'delete_files_or_folders',
+                             f'file-{self.file.pk}')
+        wait_for_stored_file_deletions()
+        self.assertFalse(File.objects.filter(pk=self.file.pk).exists())
+        self.assertFalse(self.file.file.storage.exists(self.file.file.name))
+
+    def test_trashed_files_have_no_canonical_url(self):
+        url = reverse('canonical', args=(self.file.canonical_time, self.file.pk))
+        self.assertEqual(self.client.get(url).status_code, 302)
+        trash(files=[self.file])
+        self.assertEqual(self.client.get(url).status_code, 404)
@@ -0,0 +1,164 @@
+import hashlib
+import io
+import os
+from datetime import timedelta
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from filer import settings as filer_settings
+from filer.models import File, Folder, UploadSession, uploadmodels
+from tests.helpers import create_superuser
+
+
+class BrokenStream(io.BytesIO):
+    """A request body breaking off after ``limit`` bytes."""
+
+    def __init__(self, data, limit):
+        super().__init__(data)
+        self.limit = limit
+
+    def read(self, size=-1):
+        if self.tell() >= self.limit:
+            raise OSError("Connection reset")
+        return super().read(min(size, self.limit - self.tell()))
+
+
+@mock.patch.object(filer_settings, 'FILER_UPLOADER_CHUNK_SIZE', 1)
+class UploadSessionTests(TestCase):
+
+    def setUp(self):
+        self.superuser = create_superuser()
+        self.client.login(username='admin', password='secret')
+        self.folder = Folder.objects.create(name='uploads')
+        self.create_url = reverse('admin:filer-create_upload_session', kwargs={'folder_id': self.folder.pk})
+        self.data = os.urandom(300 * 1024)
+
+    def tearDown(self):
+        for f in File.objects.all():
+            f.delete()
+        for upload_session in UploadSession.objects.all():
+            upload_session.discard()
+
+    def create(self, filename='video.txt', size=None):
+        return self.client.post(self.create_url, {
+            'filename': filename,
+            'size': len(self.data) if size is None else size,
+        })
+
+    def patch(self, url, offset, data):
+        return self.client.generic(
+            'PATCH', url, data, content_type='application/offset+octet-stream', HTTP_UPLOAD_OFFSET=str(offset),
+        )
+
+    def test_chunked_upload(self):
+        response = self.create()
+        self.assertEqual(response.status_code, 201)
+        url = response.json()['url']
+        self.assertEqual(response['Location'], url)
+        upload_session = UploadSession.objects.get()
+        self.assertEqual((upload_session.folder, upload_session.owner), (self.folder, self.superuser))
+
+        for offset in range(0, len(self.data), 100 * 1024):
+            response = self.patch(url, offset, self.data[offset:offset + 100 * 1024])
+            self.assertEqual(response.status_code, 204)
+            self.assertEqual(int(response['Upload-Offset']), offset + len(self.data[offset:offset + 100 * 1024]))
+
+        with mock.patch.object(File, 'generate_sha1', side_effect=AssertionError("File read again")):
+            response = self.client.post(url)
+        file_obj = File.objects.get(original_filename='video.txt')
+        self.assertEqual(response.json()['file_id'], file_obj.pk)
+        self.assertEqual(file_obj.folder, self.folder)
+        # Not instantiated, which would compute a missing digest
+        self.assertEqual(
+            File.objects.filter(pk=file_obj.pk).values_list('sha1', '_file_size').get(),
+            (hashlib.sha1(self.data).hexdigest(), len(self.data)),
+        )
+        with file_obj.file.open() as stored:
+            self.assertEqual(stored.read(), self.data)
+        # Moved into the storage, and the session is gone
+        self.assertFalse(os.path.exists(upload_session.path))
+        self.assertFalse(UploadSession.objects.exists())
+
+    def test_resume_interrupted_upload(self):
+        url = self.create().json()['url']
+        with self.assertRaises(OSError):
+            self.client.generic(
+                'PATCH', url, b'', content_type='application/offset+octet-stream', HTTP_UPLOAD_OFFSET='0',
+                **{'wsgi.input': BrokenStream(self.data, 123456), 'CONTENT_LENGTH': str(len(self.data))},
+            )
+        response = self.client.head(url)
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(response['Upload-Offset'], '123456')
+        self.assertEqual(response['Upload-Length'], str(len(self.data)))
+
+        # The request continuing at an outdated offset is rejected
+        response = self.patch(url, 0, self.data)
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response['Upload-Offset'], '123456')
+
+        # The digest is computed again if the chunk arrives at another process
+        uploadmodels._digests.clear()
+        self.assertEqual(self.patch(url, 123456, self.data[123456:]).status_code, 204)
+        self.client.post(url)
+        self.assertEqual(
+            File.objects.values_list('sha1', flat=True).get(),
+            hashlib.sha1(self.data).hexdigest(),
+        )
+
+    def test_incomplete_upload_is_not_saved(self):
+        url = self.create().json()['url']
+        self.patch(url, 0, self.data[:1000])
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, 409)
+        self.assertFalse(File.objects.exists())
+
+        response = self.client.delete(url)
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(UploadSession.objects.exists())
+
+    def test_chunks_require_upload_permission(self):
+        url = self.create().json()['url']
+        self.assertEqual(self.patch(url, 0, self.data[:1000]).status_code, 204)
+        # The permission is revoked while the file is being uploaded
+        type(self.superuser).objects.filter(pk=self.superuser.pk).update(is_superuser=False)
+        response = self.patch(url, 1000, self.data[1000:])
+        self.assertEqual(response.status_code, 403)
+        self.assertIn('error', response.json())
+        self.assertFalse(UploadSession.objects.exists())
+
+    def test_sessions_of_other_users_are_not_found(self):
+        url = self.create().json()['url']
+        self.client.logout()
+        self.assertEqual(self.client.head(url).status_code, 404)
+        self.assertEqual(self.patch(url, 0, self.data).status_code, 404)
+
+    def test_invalid_sessions_are_rejected(self):
+        self.assertEqual(self.create(filename='').status_code, 400)
+        self.assertEqual(self.create(size=-1).status_code, 400)
+        with mock.patch.object(filer_settings, 'FILER_UPLOADER_MAX_FILE_SIZE', 1):
+            self.assertEqual(self.create(size=2 * 1024 * 1024).status_code, 413)
+        with mock.patch.object(filer_settings, 'FILER_UPLOADER_CHUNK_SIZE', None):
+            self.assertEqual(self.create().status_code, 404)
+        self.assertFalse(UploadSession.objects.exists())
+
+    def test_expired_sessions_are_deleted(self):
+        url = self.create().json()['url']
+        upload_session = UploadSession.objects.get()
+        UploadSession.objects.update(updated_at=timezone.now() - timedelta(days=2))
+        orphan = os.path.join(uploadmodels.get_staging_dir(), 'orphan.part')
+        open(orphan, 'wb').close()
+        os.utime(orphan, (0, 0))
+
+        self.assertEqual(self.client.head(url).status_code, 404)
+        self.assertFalse(UploadSession.objects.exists())
+        self.assertFalse(os.path.exists(upload_session.path))
+
+        self.create()
+        UploadSession.objects.update(updated_at=timezone.now() - timedelta(days=2))
+        call_command('filer_clean_uploads', verbosity=0)
+        self.assertFalse(UploadSession.objects.exists())
+        self.assertFalse(os.path.exists(orphan))
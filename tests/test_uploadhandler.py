@@ -0,0 +1,64 @@
+import hashlib
+import os
+from unittest import mock
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from filer.models import File, Folder
+from filer.uploadhandler import Sha1UploadHandler
+from tests.helpers import create_superuser
+
+
+class Sha1UploadHandlerTests(TestCase):
+
+    def setUp(self):
+        self.superuser = create_superuser()
+        self.client.login(username='admin', password='secret')
+        self.folder = Folder.objects.create(name='uploads')
+        self.url = reverse('admin:filer-ajax_upload', kwargs={'folder_id': self.folder.pk})
+        self.data = os.urandom(300 * 1024)
+
+    def tearDown(self):
+        for f in File.objects.all():
+            f.delete()
+
+    def assertUploaded(self, name):
+        # Not instantiated, which would compute a missing digest
+        self.assertEqual(
+            File.objects.filter(original_filename=name).values_list('sha1', '_file_size').get(),
+            (hashlib.sha1(self.data).hexdigest(), len(self.data)),
+        )
+        file_obj = File.objects.get(original_filename=name)
+        with file_obj.file.open() as stored:
+            self.assertEqual(stored.read(), self.data)
+
+    @override_settings(FILE_UPLOAD_MAX_MEMORY_SIZE=64 * 1024)
+    def test_multipart_upload_is_not_read_again(self):
+        with mock.patch.object(File, 'generate_sha1', side_effect=AssertionError("File read again")):
+            self.client.post(self.url, {'Filedata': SimpleUploadedFile('data.txt', self.data, 'text/plain')})
+        self.assertUploaded('data.txt')
+
+    def test_raw_upload_is_not_read_again(self):
+        with mock.patch.object(File, 'generate_sha1', side_effect=AssertionError("File read again")):
+            self.client.post(
+                f'{self.url}?qqfile=raw.txt', self.data, content_type='application/octet-stream',
+                HTTP_X_REQUESTED_WITH='XMLHttpRequest',
+            )
+        self.assertUploaded('raw.txt')
+
+    def test_annotate_only_received_files(self):
+        handler = Sha1UploadHandler()
+        handler.new_file('Filedata', 'data.bin', 'application/octet-stream', len(self.data))
+        for start in range(0, len(self.data), 64 * 1024):
+            self.assertEqual(handler.receive_data_chunk(self.data[start:start + 64 * 1024], start),
+                             self.data[start:start + 64 * 1024])
+        self.assertIsNone(handler.file_complete(len(self.data)))
+
+        upload = SimpleUploadedFile('data.bin', self.data)
+        handler.annotate(upload)
+        self.assertEqual(upload.sha1, hashlib.sha1(self.data).hexdigest())
+        other = SimpleUploadedFile('other.bin', self.data)
+        handler.annotate(other)
+        self.assertFalse(hasattr(other, 'sha1'))
@@ -1,5 +1,6 @@
 import mimetypes
 import os
+import pickle
 from unittest.mock import MagicMock
 from zipfile import ZipFile
 
@@ -16,6 +17,7 @@ from filer.utils.files import (
     handle_request_files_upload,
     slugify,
 )
+from filer.utils.idset import IdSet
 from filer.utils.loader import load_object
 from filer.utils.zip import unzip
 from tests.helpers import create_image
@@ -192,3 +194,54 @@ class UploadExceptionTests(TestCase):
         exc = UploadException('test error')
         self.assertEqual(str(exc), 'test error')
         self.assertIsInstance(exc, Exception)
+
+
+class IdSetTests(TestCase):
+
+    def test_membership(self):
+        ids = IdSet([1, 5, 64])
+        self.assertIn(5, ids)
+        self.assertNotIn(2, ids)
+        self.assertNotIn(1000, ids)
+        self.assertNotIn(None, ids)
+        self.assertEqual(len(ids), 3)
+        self.assertEqual(list(ids), [1, 5, 64])
+        self.assertEqual(ids, {1, 5, 64})
+        self.assertFalse(IdSet())
+        with self.assertRaises(TypeError):
+            hash(ids)
+
+    def test_runs(self):
+        ids = IdSet([10, 3, 4, 5, 11, 10_000_000])
+        self.assertEqual(list(ids), [3, 4, 5, 10, 11, 10_000_000])
+        self.assertEqual(len(ids), 6)
+        self.assertNotIn(6, ids)
+        self.assertNotIn(9_999_999, ids)
+        self.assertEqual(repr(ids), '<IdSet: [3-5, 10-11, 10000000]>')
+        # The size depends on the number of runs, not on the largest id
+        self.assertEqual(len(IdSet([10_000_000])._starts), 1)
+        self.assertEqual(IdSet(range(1, 50000))._starts.tolist(), [1])
+
+    def test_inverted(self):
+        ids = IdSet([3], inverted=True)
+        self.assertIn(1, ids)
+        self.assertIn(1000, ids)
+        self.assertNotIn(3, ids)
+        self.assertTrue(ids)
+        self.assertNotEqual(ids, IdSet([3]))
+        with self.assertRaises(TypeError):
+            list(ids)
+        with self.assertRaises(TypeError):
+            len(ids)
+
+    def test_pickle_roundtrip_is_compact(self):
+        id_list = list(range(1, 50000))
+        ids = IdSet(id_list)
+        data = pickle.dumps(ids)
+        self.assertLess(len(data), len(pickle.dumps(set(id_list))) // 100)
+        self.assertEqual(pickle.loads(data), ids)
+        sparse = IdSet(range(0, 100000, 3))
+        self.assertEqual(pickle.loads(pickle.dumps(sparse)), sparse)
+        inverted = pickle.loads(pickle.dumps(IdSet([7], inverted=True)))
+        self.assertTrue(inverted.inverted)
+        self.assertNotIn(7, inverted)
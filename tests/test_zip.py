@@ -1,11 +1,20 @@
 """Tests for filer.utils.zip."""
 
+import hashlib
 import io
+import os
 import zipfile
+from unittest import mock
 
 from django.test import TestCase
+from django.urls import reverse
 
-from filer.utils.zip import unzip
+from filer import settings as filer_settings
+from filer.models import File, Folder
+from filer.trash import trash
+from filer.utils.files import UploadException
+from filer.utils.zip import iter_zip, unzip
+from tests.helpers import create_superuser
 
 
 class UnzipTests(TestCase):
@@ -45,3 +54,110 @@ class UnzipTests(TestCase):
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0][1], 'real.txt')
         self.assertEqual(result[0][0].read(), b'real content')
+
+
+class IterZipTests(TestCase):
+    """Tests for the streaming extraction of archives."""
+
+    def _make_zip(self, files, compression=zipfile.ZIP_STORED):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', compression) as zf:
+            for name, content in files.items():
+                zf.writestr(name, content)
+        buffer.seek(0)
+        return buffer
+
+    def test_members_are_extracted_one_at_a_time(self):
+        zip_buf = self._make_zip({'a.txt': 'A', 'docs/2024/b.txt': 'B', 'docs/': ''})
+        extracted = []
+        for upload, folder_names in iter_zip(zip_buf):
+            for previous in extracted:
+                self.assertFalse(os.path.exists(previous))
+            extracted.append(upload.temporary_file_path())
+            self.assertEqual(upload.sha1, hashlib.sha1(upload.read()).hexdigest())
+            self.assertEqual((folder_names, upload.name, upload.size), {
+                'a.txt': ([], 'a.txt', 1),
+                'b.txt': (['docs', '2024'], 'b.txt', 1),
+            }[upload.name])
+        self.assertEqual(len(extracted), 2)
+        self.assertFalse(os.path.exists(extracted[-1]))
+
+    def test_paths_stay_within_the_archive(self):
+        zip_buf = self._make_zip({'../../etc/passwd': 'x', '/abs/file.txt': 'y'})
+        self.assertEqual(
+            [(folder_names, upload.name) for upload, folder_names in iter_zip(zip_buf)],
+            [(['etc'], 'passwd'), (['abs'], 'file.txt')],
+        )
+
+    def test_member_count_is_limited(self):
+        zip_buf = self._make_zip({f'{i}.txt': 'x' for i in range(3)})
+        with self.assertRaises(UploadException):
+            list(iter_zip(zip_buf, max_members=2))
+
+    def test_extracted_size_is_limited(self):
+        # Compresses to a few kilobytes
+        zip_buf = self._make_zip({'bomb.txt': b'\0' * (2 * 1024 * 1024)}, zipfile.ZIP_DEFLATED)
+        with self.assertRaises(UploadException):
+            list(iter_zip(zip_buf, max_size=1))
+        zip_buf.seek(0)
+        with mock.patch.object(filer_settings, 'FILER_UPLOADER_MAX_FILE_SIZE', 1):
+            with self.assertRaises(UploadException):
+                list(iter_zip(zip_buf))
+
+    def test_corrupt_member_raises(self):
+        data = bytearray(self._make_zip({'a.txt': 'content'}).getvalue())
+        offset = data.index(b'content')
+        data[offset:offset + 7] = b'CONTENT'
+        with self.assertRaises(UploadException):
+            list(iter_zip(io.BytesIO(bytes(data))))
+
+
+class ZipUploadTests(TestCase):
+
+    def setUp(self):
+        self.superuser = create_superuser()
+        self.client.login(username='admin', password='secret')
+        self.folder = Folder.objects.create(name='uploads')
+        self.url = reverse('admin:filer-ajax_upload', kwargs={'folder_id': self.folder.pk})
+
+    def tearDown(self):
+        for f in File.objects.all():
+            f.delete()
+
+    def upload(self):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w') as zf:
+            zf.writestr('a.txt', 'A')
+            zf.writestr('sub/dir/b.txt', 'B')
+            zf.writestr('sub/page.html', '<html></html>')
+        buffer.seek(0)
+        buffer.name = 'archive.zip'
+        return self.client.post(self.url, {'Filedata': buffer})
+
+    @mock.patch.object(filer_settings, 'FILER_UPLOADER_EXTRACT_ZIP', True)
+    def test_upload_is_extracted_into_folders(self):
+        data = self.upload().json()
+        self.assertEqual(data['file_count'], 2)
+        self.assertIn('page.html', data['error'])
+        self.assertEqual(self.folder.files.get().original_filename, 'a.txt')
+        sub_dir = Folder.objects.get(name='dir', parent__name='sub', parent__parent=self.folder)
+        b = sub_dir.files.get()
+        self.assertEqual(b.original_filename, 'b.txt')
+        self.assertEqual(b.owner, self.superuser)
+        self.assertEqual(
+            File.objects.filter(pk=b.pk).values_list('sha1', flat=True).get(), hashlib.sha1(b'B').hexdigest(),
+        )
+
+    @mock.patch.object(filer_settings, 'FILER_UPLOADER_EXTRACT_ZIP', True)
+    def test_upload_is_not_extracted_into_the_trash(self):
+        trashed = Folder.objects.create(name='sub', parent=self.folder)
+        trash(folders=[trashed])
+        self.upload()
+        sub = Folder.objects.get(name='sub', parent=self.folder, trashed_at__isnull=True)
+        self.assertNotEqual(sub, trashed)
+        self.assertEqual(Folder.objects.get(name='dir').parent, sub)
+        self.assertFalse(trashed.children.exists())
+
+    def test_upload_is_kept_as_archive_by_default(self):
+        self.upload()
+        self.assertEqual(File.objects.get().original_filename, 'archive.zip')